@@ -0,0 +1,283 @@
+"""Asset Cache Module
+
+This module is a shared on-disk cache for a page's static assets (scripts,
+stylesheets and whatever else the request blocker lets through). Browser
+contexts are incognito and start with an empty HTTP cache, so without it
+every scrape downloads the same bundles again. Requests are served from
+the cache through a Playwright route; entries honour Cache-Control, expire
+after a TTL, are isolated per user-agent profile and size-bounded.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from pathlib import Path
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+
+from playwright.async_api import Page, Route, Request
+
+from request_blocker import RequestBlocker
+from storage_state import user_agent_key
+
+logger = logging.getLogger(__name__)
+
+
+# Resource types served from the cache (blocked types never reach it)
+CACHEABLE_RESOURCE_TYPES = frozenset({'script', 'stylesheet', 'font', 'image'})
+
+# Headers describing the wire encoding, not the decoded body we store
+DROPPED_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'set-cookie'})
+
+MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+
+def cache_lifetime(headers: Dict[str, str], ttl_seconds: float) -> float:
+    """Seconds a response may be cached (0 = not cacheable).
+
+    Args:
+        headers: Response headers (lower-case names)
+        ttl_seconds: Upper bound of the lifetime
+
+    Returns:
+        min(ttl, Cache-Control max-age), or 0 for no-store/no-cache/private
+    """
+    cache_control = headers.get('cache-control', '').lower()
+    if any(directive in cache_control for directive in ('no-store', 'no-cache', 'private')):
+        return 0.0
+    match = MAX_AGE_RE.search(cache_control)
+    if match:
+        return min(float(match.group(1)), ttl_seconds)
+    return ttl_seconds
+
+
+@dataclass
+class CachedAsset:
+    """A cached response."""
+
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+@dataclass
+class AssetCacheStats:
+    """Per-scrape cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    bytes_served: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert stats to dictionary format."""
+        return {"hits": self.hits, "misses": self.misses, "bytes_served": self.bytes_served}
+
+
+class AssetCacheSession:
+    """Route handler attached to one page, collecting stats for one scrape."""
+
+    def __init__(self, cache: 'AssetCache', page: Page, user_agent: str, blocker: Optional[RequestBlocker] = None):
+        self.cache = cache
+        self.page = page
+        self.user_agent = user_agent
+        self.blocker = blocker
+        self.stats = AssetCacheStats()
+
+    def _cacheable(self, request: Request) -> bool:
+        if request.method != 'GET' or request.resource_type not in CACHEABLE_RESOURCE_TYPES:
+            return False
+        return self.blocker is None or self.blocker.block_reason(request.url, request.resource_type) is None
+
+    async def handle(self, route: Route, request: Request):
+        """Serve a cached asset, or fetch, store and serve it; anything else goes to the next handler."""
+        if not self._cacheable(request):
+            await route.fallback()
+            return
+
+        cached = await asyncio.to_thread(self.cache.get, self.user_agent, request.url)
+        if cached is not None:
+            self.stats.hits += 1
+            self.stats.bytes_served += len(cached.body)
+            await route.fulfill(status=cached.status, headers=cached.headers, body=cached.body)
+            return
+
+        self.stats.misses += 1
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except Exception as e:
+            logger.debug(f"Asset fetch failed for {request.url}, passing through: {e}")
+            await route.fallback()
+            return
+
+        headers = {name.lower(): value for name, value in response.headers.items() if name.lower() not in DROPPED_HEADERS}
+        await route.fulfill(status=response.status, headers=headers, body=body)
+        if response.status == 200:
+            await asyncio.to_thread(self.cache.put, self.user_agent, request.url, headers, body)
+
+    async def detach(self):
+        """Remove the route handler from the page."""
+        try:
+            await self.page.unroute('**/*', self.handle)
+        except Exception as e:
+            logger.debug(f"Failed to remove asset cache route (page closed?): {e}")
+
+
+class AssetCache:
+    """Shared, size-bounded on-disk cache of static page assets.
+
+    Features:
+    - One file per (user-agent profile, URL): a JSON header line, then the body
+    - Lifetime is the smaller of the TTL and Cache-Control max-age
+    - Uncacheable responses (no-store, no-cache, private, non-200, oversized) are passed through
+    - Least recently written entries are evicted to stay under max_bytes
+    """
+
+    def __init__(
+        self,
+        root_dir: str,
+        ttl_seconds: float = 12 * 3600,
+        max_bytes: int = 200 * 1024 * 1024,
+        max_entry_bytes: int = 5 * 1024 * 1024
+    ):
+        """Initialize the cache. Nothing is created on disk until the first asset is stored.
+
+        Args:
+            root_dir: Directory holding the cached assets
+            ttl_seconds: Longest time an asset is served from the cache
+            max_bytes: Upper bound on cached bytes kept on disk
+            max_entry_bytes: Larger responses are not cached
+        """
+        self.root_dir = Path(root_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._lock = threading.Lock()
+        self._total: Optional[int] = None  # Bytes on disk, scanned on first write
+        self.hits = 0
+        self.misses = 0
+        logger.info(f"AssetCache initialized (root={root_dir}, ttl={ttl_seconds}s, max_bytes={max_bytes})")
+
+    def _path(self, user_agent: str, url: str) -> Path:
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.root_dir / user_agent_key(user_agent) / digest[:2] / f"{digest}.asset"
+
+    def get(self, user_agent: str, url: str) -> Optional[CachedAsset]:
+        """Get a fresh cached asset.
+
+        Args:
+            user_agent: User agent of the requesting context
+            url: Asset URL
+
+        Returns:
+            CachedAsset, or None on a miss (expired entries are deleted)
+        """
+        path = self._path(user_agent, url)
+        try:
+            with open(path, 'rb') as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError):
+            meta, body = {'expires': 0}, b''
+
+        if meta.get('expires', 0) <= time.time() or meta.get('url') != url:
+            self._remove(path)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return CachedAsset(meta['status'], meta['headers'], body)
+
+    def put(self, user_agent: str, url: str, headers: Dict[str, str], body: bytes):
+        """Store an asset if its headers allow caching.
+
+        Args:
+            user_agent: User agent of the requesting context
+            url: Asset URL
+            headers: Response headers to replay (lower-case names, wire-encoding headers removed)
+            body: Decoded response body
+        """
+        lifetime = cache_lifetime(headers, self.ttl_seconds)
+        if lifetime <= 0 or len(body) > self.max_entry_bytes:
+            return
+
+        path = self._path(user_agent, url)
+        meta = json.dumps({'url': url, 'status': 200, 'headers': headers, 'expires': time.time() + lifetime})
+        data = meta.encode('utf-8') + b'\n' + body
+        with self._lock:
+            if self._total is None:
+                self._total = sum(p.stat().st_size for p in self.root_dir.glob('*/*/*.asset'))
+            previous = path.stat().st_size if path.exists() else 0
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a concurrent reader never sees a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as tmp:
+                tmp.write(data)
+            os.replace(tmp_path, path)
+            self._total += len(data) - previous
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _remove(self, path: Path):
+        with self._lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                return
+            if self._total is not None:
+                self._total -= size
+
+    def _evict(self):
+        """Delete the oldest entries until the cache is 10% below max_bytes (lock held)."""
+        entries: List[Tuple[float, int, Path]] = []
+        for path in self.root_dir.glob('*/*/*.asset'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        evicted = 0
+        for _, size, path in entries[:-1]:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        self._total = total
+        if evicted:
+            logger.info(f"Evicted {evicted} cached assets, cache size now {total} bytes")
+
+    async def attach(self, page: Page, user_agent: str, blocker: Optional[RequestBlocker] = None) -> AssetCacheSession:
+        """Start serving a page's asset requests from the cache.
+
+        Attach after the request blocker: Playwright runs the newest route
+        first, and requests the blocker would abort are handed on to it.
+
+        Args:
+            page: Page to intercept
+            user_agent: User agent of the page's context (selects the cache profile)
+            blocker: Request blocker whose decisions are respected
+
+        Returns:
+            AssetCacheSession holding the stats; call detach() when done
+        """
+        session = AssetCacheSession(self, page, user_agent, blocker)
+        await page.route('**/*', session.handle)
+        return session
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters."""
+        return {"hits": self.hits, "misses": self.misses, "bytes": self._total or 0}
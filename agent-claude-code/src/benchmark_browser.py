@@ -0,0 +1,167 @@
+"""Browser Start-up Benchmark
+
+Measures, per browser profile, the costs an autoscaled worker pays before
+its first useful scrape:
+
+- cold launch: Playwright driver start + Chromium launch
+- warm context: creating a stealth context and page on the running browser
+- first navigation: loading a local fixture page up to domcontentloaded
+
+A local HTTP server serves the fixture, so network latency does not hide
+start-up differences.
+
+Usage:
+    python src/benchmark_browser.py                      # all profiles, 3 runs
+    python src/benchmark_browser.py --profiles fast --runs 5 --json
+"""
+
+from typing import Dict, List
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import threading
+import time
+
+from browser_profiles import BROWSER_PROFILES
+from scraper import ScraperService
+
+logger = logging.getLogger(__name__)
+
+
+def build_fixture_html(headlines: int = 60) -> str:
+    """A news homepage-like document with headlines, teasers and some inline script."""
+    items = "\n".join(
+        f'<article><h2><a href="/news/{i}">Fixture headline number {i} about local events</a></h2>'
+        f'<time datetime="2025-10-07T10:{i % 60:02d}:00">10:{i % 60:02d}</time>'
+        f'<p>Short teaser text for the fixture article number {i}, long enough to look real.</p></article>'
+        for i in range(headlines)
+    )
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Fixture News</title>"
+        "<style>article{margin:8px 0}</style></head><body><main>"
+        f"{items}</main><script>document.body.dataset.ready = '1';</script></body></html>"
+    )
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    body = build_fixture_html().encode('utf-8')
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_server() -> ThreadingHTTPServer:
+    """Serve the fixture page on a free localhost port in a daemon thread."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FixtureHandler)
+    threading.Thread(target=server.serve_forever, name="fixture-server", daemon=True).start()
+    return server
+
+
+async def measure_profile(profile: str, url: str, headless: bool = True, contexts: int = 3) -> Dict[str, float]:
+    """Measure one cold start of a profile.
+
+    Args:
+        profile: Browser profile name
+        url: Fixture URL for the first navigation
+        headless: Whether to run headless
+        contexts: Warm contexts created (their mean is reported)
+
+    Returns:
+        Seconds for cold_launch, warm_context and first_navigation
+    """
+    scraper = ScraperService(browser_profile=profile, headless=headless, context_pool_size=0, block_resources=False)
+    try:
+        start = time.perf_counter()
+        await scraper._init_browser()
+        cold_launch = time.perf_counter() - start
+
+        context_times = []
+        page = None
+        for _ in range(max(1, contexts)):
+            if page is not None:
+                await page.context.close()
+            start = time.perf_counter()
+            page = await scraper._setup_stealth_page()
+            context_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await page.goto(url, wait_until='domcontentloaded')
+        first_navigation = time.perf_counter() - start
+        await page.context.close()
+    finally:
+        await scraper.close()
+
+    return {
+        'cold_launch': cold_launch,
+        'warm_context': statistics.mean(context_times),
+        'first_navigation': first_navigation,
+    }
+
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Median, min and max of each metric over runs."""
+    return {
+        metric: {
+            'median': statistics.median(sample[metric] for sample in samples),
+            'min': min(sample[metric] for sample in samples),
+            'max': max(sample[metric] for sample in samples),
+        }
+        for metric in samples[0]
+    }
+
+
+async def run_benchmark(profiles: List[str], runs: int, headless: bool = True) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Benchmark each profile `runs` times (profiles are interleaved to spread noise)."""
+    server = start_fixture_server()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    samples: Dict[str, List[Dict[str, float]]] = {profile: [] for profile in profiles}
+    try:
+        for run in range(runs):
+            for profile in profiles:
+                sample = await measure_profile(profile, url, headless=headless)
+                samples[profile].append(sample)
+                logger.info(f"Run {run + 1}/{runs} {profile}: {sample}")
+    finally:
+        server.shutdown()
+    return {profile: summarize(profile_samples) for profile, profile_samples in samples.items()}
+
+
+def format_table(results: Dict[str, Dict[str, Dict[str, float]]]) -> str:
+    """Render results as a fixed-width table (milliseconds)."""
+    lines = [f"{'profile':<10} {'metric':<18} {'median ms':>10} {'min ms':>10} {'max ms':>10}"]
+    for profile, metrics in results.items():
+        for metric, values in metrics.items():
+            lines.append(
+                f"{profile:<10} {metric:<18} {values['median'] * 1000:>10.1f} "
+                f"{values['min'] * 1000:>10.1f} {values['max'] * 1000:>10.1f}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark browser cold start per launch profile")
+    parser.add_argument('--profiles', nargs='+', default=list(BROWSER_PROFILES), choices=list(BROWSER_PROFILES))
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--headed', action='store_true', help="Run with a visible browser window")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    results = asyncio.run(run_benchmark(args.profiles, max(1, args.runs), headless=not args.headed))
+    print(json.dumps(results, indent=2) if args.json else format_table(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""Content Scoring Report
+
+Shows how many prompt characters boilerplate removal and deduplication
+save: for every page the LLM input text is built twice, once from the
+content container alone (content scoring and dedup off) and once with both,
+and the characters, kept blocks, duplicate characters removed and time are
+compared.
+
+Without arguments a synthetic ~64 KB news homepage without a content
+container (so the whole body is used), with a menu, a cookie banner, a
+top-stories strip repeating the first headlines, a related-links sidebar and
+a footer is used; pass saved pages (e.g. a
+gazeta.ru snapshot) to measure real ones.
+
+Usage:
+    python src/benchmark_content_scoring.py
+    python src/benchmark_content_scoring.py page.html other.html --json
+"""
+
+from typing import Dict, List, Optional
+from pathlib import Path
+import argparse
+import json
+import logging
+import sys
+import time
+
+from benchmark_html_cleaner import build_news_page
+from html_cleaner import HtmlCleaner
+
+logger = logging.getLogger(__name__)
+
+
+def build_boilerplate_page(target_bytes: int = 64 * 1024) -> str:
+    """The synthetic news page without <main>/news containers, wrapped in typical boilerplate
+    and with its first headlines repeated in a top-stories strip."""
+    menu = "<div class='top-menu'><ul>" + "".join(
+        f"<li><a href='/rubric/{i}'>Рубрика {i}</a></li>" for i in range(40)
+    ) + "</ul></div>"
+    cookie = (
+        "<div id='cookie-consent'><p>Мы используем файлы cookie, чтобы сайт работал лучше. Продолжая "
+        "пользоваться сайтом, вы соглашаетесь с политикой конфиденциальности и условиями обработки "
+        "персональных данных.</p><a href='/privacy'>Подробнее</a></div>"
+    )
+    sidebar = "<aside class='related'><h3>Популярное</h3>" + "".join(
+        f"<p><a href='/popular/{i}'>Самое читаемое за неделю, материал {i}</a></p>" for i in range(60)
+    ) + "</aside>"
+    footer = "<div class='site-footer'>" + "".join(
+        f"<a href='/about/{i}'>О проекте {i}</a> " for i in range(50)
+    ) + "<p>&copy; 2025 Fixture Media. Все права защищены.</p></div>"
+    top_stories = "<div class='top-stories'>" + "".join(
+        f"<p><a href='/news/{i}'>Правительство обсудило бюджет на {2025 + i % 3} год, новость {i}</a></p>"
+        for i in range(10)
+    ) + "</div>"
+    page = build_news_page(target_bytes)
+    page = page.replace("<main>", "<div class='page'>" + top_stories, 1).replace("</main>", "</div>" + sidebar + footer, 1)
+    page = page.replace("news-feed", "feed").replace("news-item", "item")
+    return page.replace("<body>", "<body>" + cookie + menu, 1)
+
+
+def measure_page(html_content: str) -> Dict[str, object]:
+    """Build the LLM text with and without content scoring and dedup.
+
+    Returns:
+        chars_before (container text), chars_after (scored, deduplicated text), blocks kept/total,
+        duplicate_chars and scoring ms
+    """
+    plain = HtmlCleaner(content_scoring=False)
+    scored = HtmlCleaner(content_scoring=True, dedup=True)
+    before = plain.clean(html_content)
+    start = time.perf_counter()
+    result = scored.clean_with_reports(html_content)
+    elapsed = time.perf_counter() - start
+    after, report = result.text, result.scoring
+    return {
+        'chars_before': len(before),
+        'chars_after': len(after),
+        'reduction': round(1 - len(after) / len(before), 3) if before else 0.0,
+        'blocks_kept': report.blocks_kept if report else 0,
+        'blocks_total': report.blocks_total if report else 0,
+        'duplicate_chars': result.dedup.duplicate_chars if result.dedup else 0,
+        'scoring_ms': round(elapsed * 1000, 1),
+    }
+
+
+def run_report(pages: Dict[str, str]) -> Dict[str, Dict[str, object]]:
+    """Measure every page.
+
+    Returns:
+        {page: measure_page result}
+    """
+    results = {}
+    for page_name, html_content in pages.items():
+        results[page_name] = measure_page(html_content)
+        logger.info(f"{page_name}: {results[page_name]}")
+    return results
+
+
+def format_table(results: Dict[str, Dict[str, object]]) -> str:
+    """Render results as a fixed-width table."""
+    lines = [
+        f"{'page':<24} {'chars before':>12} {'chars after':>12} {'saved':>7} {'blocks kept':>13} "
+        f"{'dup chars':>10} {'ms':>8}"
+    ]
+    for page_name, values in results.items():
+        blocks = f"{values['blocks_kept']}/{values['blocks_total']}"
+        lines.append(
+            f"{page_name[-24:]:<24} {values['chars_before']:>12} {values['chars_after']:>12} "
+            f"{values['reduction']:>7.1%} {blocks:>13} {values['duplicate_chars']:>10} {values['scoring_ms']:>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report prompt characters before/after content scoring and dedup")
+    parser.add_argument('pages', nargs='*', help="Saved HTML pages (default: synthetic page with boilerplate)")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    if args.pages:
+        pages = {path: Path(path).read_text(encoding='utf-8', errors='replace') for path in args.pages}
+    else:
+        pages = {'synthetic-boilerplate': build_boilerplate_page()}
+    results = run_report(pages)
+    print(json.dumps(results, indent=2) if args.json else format_table(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""HTML Cleaner Benchmark
+
+Measures how fast each installed parser backend cleans a page (MB of HTML
+per second) and its peak Python heap use, and checks that its output is
+identical to the html.parser reference. The heap peak comes from tracemalloc:
+it covers BeautifulSoup and the streaming backend fully, but not the native
+trees that lexbor and libxml2 allocate.
+
+Without arguments a synthetic ~3 MB news homepage is used (scripts, inline
+JSON state, styles, SVG icons, forms, comments, Cyrillic teasers); pass
+saved pages (e.g. a gazeta.ru snapshot) to measure real ones.
+
+Usage:
+    python src/benchmark_html_cleaner.py                       # synthetic page, all backends
+    python src/benchmark_html_cleaner.py page.html --runs 10 --json
+"""
+
+from typing import Dict, List, Optional
+from pathlib import Path
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+import tracemalloc
+
+from html_cleaner import HtmlCleaner, available_backends
+
+logger = logging.getLogger(__name__)
+
+
+def build_news_page(target_bytes: int = 3 * 1024 * 1024) -> str:
+    """A large news homepage-like document of about target_bytes (UTF-8)."""
+    head = (
+        "<!DOCTYPE html><html lang='ru'><head><meta charset='utf-8'><title>Новости дня</title>"
+        "<link rel='stylesheet' href='/main.css'><style>.news-item{margin:8px 0}.hidden{display:none}</style>"
+        "<script>window.__STATE__ = " + json.dumps({"items": [{"id": i, "t": "x" * 40} for i in range(300)]}) +
+        ";</script></head><body><header><nav>"
+        + "".join(f"<a href='/section/{i}'>Раздел {i}</a>" for i in range(30)) +
+        "</nav><form action='/search'><input name='q'><button>Найти</button></form></header>"
+        "<main><div class='news-feed'>"
+    )
+    tail = "</div></main><footer><p>&copy; 2025 Fixture Media &mdash; все права защищены</p></footer></body></html>"
+
+    parts = [head]
+    size = len(head.encode('utf-8')) + len(tail.encode('utf-8'))
+    i = 0
+    while size < target_bytes:
+        item = (
+            f"<div class='news-item' data-id='{i}'><!-- teaser {i} -->"
+            f"<svg class='icon'><use href='#clock'></use></svg>"
+            f"<h2><a href='/news/{i}'>Правительство обсудило бюджет на {2025 + i % 3} год, новость {i}</a></h2>"
+            f"<time datetime='2025-10-07T10:{i % 60:02d}:00'>10:{i % 60:02d}</time>"
+            f"<p class='lead'>Депутаты &laquo;одобрили&raquo; поправки &amp; отправили их дальше. Teaser {i}.</p>"
+            f"<script>trackImpression({i});</script><noscript><img src='/pixel/{i}.gif'></noscript>"
+            f"<span class='tags'> <b>экономика</b> <i>политика</i> </span></div>\n"
+        )
+        parts.append(item)
+        size += len(item.encode('utf-8'))
+        i += 1
+    parts.append(tail)
+    return "".join(parts)
+
+
+def measure_backend(backend: str, html_content: str, runs: int) -> Dict[str, float]:
+    """Clean a page `runs` times with one backend.
+
+    Returns:
+        Median seconds per clean, MB/s (MB of input HTML per second) and
+        peak_mb (Python heap high-water mark of one extra, traced clean)
+    """
+    cleaner = HtmlCleaner(backend)
+    megabytes = len(html_content.encode('utf-8')) / (1024 * 1024)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        cleaner.clean(html_content)
+        timings.append(time.perf_counter() - start)
+    median = statistics.median(timings)
+
+    tracemalloc.start()
+    try:
+        cleaner.clean(html_content)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        'seconds': median,
+        'mb_per_s': megabytes / median if median else float('inf'),
+        'peak_mb': peak / (1024 * 1024),
+    }
+
+
+def run_benchmark(pages: Dict[str, str], backends: List[str], runs: int) -> Dict[str, Dict[str, Dict[str, object]]]:
+    """Benchmark every backend on every page and compare outputs with html.parser.
+
+    Returns:
+        {page: {backend: {seconds, mb_per_s, peak_mb, identical}}}
+    """
+    reference = HtmlCleaner('html.parser')
+    results = {}
+    for page_name, html_content in pages.items():
+        expected = reference.clean(html_content)
+        results[page_name] = {}
+        for backend in backends:
+            result: Dict[str, object] = measure_backend(backend, html_content, runs)
+            result['identical'] = HtmlCleaner(backend).clean(html_content) == expected
+            results[page_name][backend] = result
+            logger.info(f"{page_name} {backend}: {result}")
+    return results
+
+
+def format_table(results: Dict[str, Dict[str, Dict[str, object]]]) -> str:
+    """Render results as a fixed-width table."""
+    lines = [f"{'page':<24} {'backend':<12} {'median ms':>10} {'MB/s':>8} {'peak MB':>8} {'identical':>10}"]
+    for page_name, backends in results.items():
+        for backend, values in backends.items():
+            lines.append(
+                f"{page_name[-24:]:<24} {backend:<12} {values['seconds'] * 1000:>10.1f} "
+                f"{values['mb_per_s']:>8.2f} {values['peak_mb']:>8.2f} {str(values['identical']):>10}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    installed = available_backends()
+    parser = argparse.ArgumentParser(description="Benchmark HTML cleaning per parser backend")
+    parser.add_argument('pages', nargs='*', help="Saved HTML pages (default: synthetic ~3 MB homepage)")
+    parser.add_argument('--backends', nargs='+', default=installed, choices=installed)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    if args.pages:
+        pages = {path: Path(path).read_text(encoding='utf-8', errors='replace') for path in args.pages}
+    else:
+        pages = {'synthetic-3mb': build_news_page()}
+    results = run_benchmark(pages, args.backends, max(1, args.runs))
+    print(json.dumps(results, indent=2) if args.json else format_table(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
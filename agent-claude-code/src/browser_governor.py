@@ -0,0 +1,209 @@
+"""Browser Governor Module
+
+This module keeps a long-running Chromium from growing without bound. It
+counts pages served by the current browser, samples the resident memory of
+the browser process tree, and notices renderer crashes; ScraperService asks
+it before every attempt whether the browser should be recycled, then drains
+in-flight pages and relaunches. Recycle events are kept as metrics.
+"""
+
+from typing import Dict, Iterable, List, Optional
+from collections import Counter
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+
+# Process names of the Chromium binaries launched by Playwright
+BROWSER_PROCESS_NAMES = ('chrome', 'chromium', 'headless_shell')
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def _read_proc_stat(pid: int):
+    """Read (name, parent pid, rss bytes) of a process from /proc, or None."""
+    try:
+        with open(f'/proc/{pid}/stat', 'r') as f:
+            data = f.read()
+    except OSError:
+        return None
+    # Format: pid (comm) state ppid ... ; comm may contain spaces and parentheses
+    name = data[data.find('(') + 1:data.rfind(')')]
+    fields = data[data.rfind(')') + 2:].split()
+    try:
+        return name, int(fields[1]), int(fields[21]) * _PAGE_SIZE
+    except (IndexError, ValueError):
+        return None
+
+
+def browser_rss_bytes(root_pid: Optional[int] = None, names: Iterable[str] = BROWSER_PROCESS_NAMES) -> Optional[int]:
+    """Sum the resident memory of browser processes started by this process.
+
+    Chromium runs as many processes (browser, GPU, one renderer per site),
+    all descendants of the Playwright driver, which is our child.
+
+    Args:
+        root_pid: Process whose descendants are inspected (current process by default)
+        names: Substrings identifying browser process names
+
+    Returns:
+        RSS in bytes, or None where /proc is not available
+    """
+    if not os.path.isdir('/proc'):
+        return None
+
+    root_pid = root_pid or os.getpid()
+    processes = {}
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        stat = _read_proc_stat(int(entry))
+        if stat is None:
+            continue
+        processes[int(entry)] = stat
+        children.setdefault(stat[1], []).append(int(entry))
+
+    total = 0
+    stack = list(children.get(root_pid, []))
+    while stack:
+        pid = stack.pop()
+        name, _, rss = processes[pid]
+        if any(part in name.lower() for part in names):
+            total += rss
+        stack.extend(children.get(pid, []))
+    return total
+
+
+class BrowserGovernor:
+    """Decides when the shared browser should be recycled.
+
+    Features:
+    - Recycle after `max_pages` pages served by one browser
+    - Recycle when the browser process tree exceeds `max_rss_mb`
+    - Recycle after a renderer crash
+    - Counters for recycles by reason, peak RSS and open contexts
+    """
+
+    def __init__(
+        self,
+        max_pages: int = 200,
+        max_rss_mb: int = 1024,
+        sample_interval: float = 10.0,
+        drain_timeout: float = 60.0
+    ):
+        """Initialize the governor.
+
+        Args:
+            max_pages: Pages after which the browser is recycled (0 disables)
+            max_rss_mb: Browser RSS in MB above which it is recycled (0 disables)
+            sample_interval: Minimum seconds between two RSS samples
+            drain_timeout: Longest wait for in-flight pages before a recycle
+        """
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.sample_interval = sample_interval
+        self.drain_timeout = drain_timeout
+        self.pages_since_launch = 0
+        self.pages_total = 0
+        self.launches = 0
+        self.renderer_crashes = 0
+        self.last_rss_bytes: Optional[int] = None
+        self.peak_rss_bytes = 0
+        self.open_contexts = 0
+        self.recycles: Counter = Counter()
+        self.last_recycle_at: Optional[float] = None
+        self._crash_pending = False
+        self._last_sample_at = 0.0
+        logger.info(f"BrowserGovernor initialized (max_pages={max_pages}, max_rss_mb={max_rss_mb})")
+
+    def record_launch(self):
+        """Reset per-browser counters after a (re)launch."""
+        self.launches += 1
+        self.pages_since_launch = 0
+        self._crash_pending = False
+        self._last_sample_at = 0.0
+
+    def record_page(self):
+        """Count a page navigation on the current browser."""
+        self.pages_since_launch += 1
+        self.pages_total += 1
+
+    def record_crash(self, *_):
+        """Renderer crash handler (page 'crash' event)."""
+        self.renderer_crashes += 1
+        self._crash_pending = True
+        logger.warning("Renderer crash detected - browser will be recycled")
+
+    def sample(self, open_contexts: int = 0, force: bool = False) -> Optional[int]:
+        """Sample browser RSS (at most once per sample_interval unless forced).
+
+        Args:
+            open_contexts: Number of contexts currently open on the browser
+            force: Ignore sample_interval
+
+        Returns:
+            Latest RSS in bytes (None if it cannot be measured)
+        """
+        self.open_contexts = open_contexts
+        now = time.monotonic()
+        if force or now - self._last_sample_at >= self.sample_interval:
+            self._last_sample_at = now
+            try:
+                self.last_rss_bytes = browser_rss_bytes()
+            except Exception as e:
+                logger.debug(f"Failed to sample browser RSS: {e}")
+                self.last_rss_bytes = None
+            if self.last_rss_bytes:
+                self.peak_rss_bytes = max(self.peak_rss_bytes, self.last_rss_bytes)
+                logger.debug(
+                    "Browser RSS %.1f MB, %d contexts, %d pages since launch",
+                    self.last_rss_bytes / (1024 * 1024), open_contexts, self.pages_since_launch
+                )
+        return self.last_rss_bytes
+
+    def recycle_reason(self) -> Optional[str]:
+        """Check whether the current browser should be recycled.
+
+        Returns:
+            "renderer_crash", "max_pages" or "max_rss", or None to keep it
+        """
+        if self._crash_pending:
+            return "renderer_crash"
+        if self.max_pages and self.pages_since_launch >= self.max_pages:
+            return "max_pages"
+        if self.max_rss_mb and self.last_rss_bytes and self.last_rss_bytes > self.max_rss_mb * 1024 * 1024:
+            return "max_rss"
+        return None
+
+    def record_recycle(self, reason: str):
+        """Count a browser recycle (or a restart after the browser died)."""
+        self.recycles[reason] += 1
+        self.last_recycle_at = time.time()
+        logger.info(
+            "Recycling browser (reason=%s, pages=%d, rss=%s MB)",
+            reason,
+            self.pages_since_launch,
+            f"{self.last_rss_bytes / (1024 * 1024):.1f}" if self.last_rss_bytes else "n/a"
+        )
+
+    def metrics(self) -> Dict[str, object]:
+        """Get governor counters.
+
+        Returns:
+            Dictionary with page, memory, crash and recycle counters
+        """
+        return {
+            "launches": self.launches,
+            "pages_total": self.pages_total,
+            "pages_since_launch": self.pages_since_launch,
+            "open_contexts": self.open_contexts,
+            "rss_bytes": self.last_rss_bytes,
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "renderer_crashes": self.renderer_crashes,
+            "recycles_total": sum(self.recycles.values()),
+            "recycles_by_reason": dict(self.recycles),
+            "last_recycle_at": self.last_recycle_at,
+        }
@@ -0,0 +1,91 @@
+"""Browser Profiles Module
+
+This module defines how Chromium is launched. The "default" profile is the
+long-standing configuration; the "fast" profile trims start-up work that a
+scraper never needs (GPU, extensions, background networking, component
+updates, first-run tasks) and uses a smaller viewport. Autoscaled workers
+pay the cold start on every scale-up, so this matters more than per-page
+cost there. Use src/benchmark_browser.py to compare profiles.
+
+Headless launches of Playwright's bundled Chromium already run in headless
+shell mode; executable_path can point at a standalone headless_shell build
+where one is installed.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Flags every profile uses
+BASE_ARGS = (
+    '--no-sandbox',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    # '--disable-web-security' is intentionally not used (security compliance)
+)
+
+FAST_ARGS = (
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-breakpad',
+    '--disable-client-side-phishing-detection',
+    '--disable-domain-reliability',
+    '--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication',
+    '--metrics-recording-only',
+    '--no-default-browser-check',
+    '--no-first-run',
+    '--no-pings',
+    '--mute-audio',
+    '--password-store=basic',
+)
+
+
+@dataclass(frozen=True)
+class BrowserProfile:
+    """Chromium launch arguments and page viewport."""
+
+    name: str
+    args: Tuple[str, ...] = BASE_ARGS
+    viewport: Dict[str, int] = field(default_factory=lambda: {'width': 1920, 'height': 1080})
+
+    def launch_options(self, headless: bool, executable_path: Optional[str] = None) -> Dict[str, Any]:
+        """Keyword arguments for playwright.chromium.launch().
+
+        Args:
+            headless: Whether to run headless
+            executable_path: Chromium binary to use instead of the bundled one
+                (e.g. a separately installed headless_shell)
+
+        Returns:
+            Launch keyword arguments
+        """
+        options: Dict[str, Any] = {'headless': headless, 'args': list(self.args)}
+        if executable_path:
+            options['executable_path'] = executable_path
+        return options
+
+
+BROWSER_PROFILES: Dict[str, BrowserProfile] = {
+    'default': BrowserProfile('default'),
+    'fast': BrowserProfile('fast', args=BASE_ARGS + FAST_ARGS, viewport={'width': 1280, 'height': 800}),
+}
+
+
+def get_profile(name: str) -> BrowserProfile:
+    """Look up a browser profile by name.
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    try:
+        return BROWSER_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Invalid browser profile: {name} (expected one of {tuple(BROWSER_PROFILES)})")
@@ -0,0 +1,270 @@
+"""Circuit Breaker Module
+
+This module decides whether a failed scrape is worth another attempt and
+whether a domain is worth trying at all.
+
+- classify_error() sorts failures into timeout, blocked (403 / anti-bot
+  page), rate_limited (429), server_error (5xx), dns and other.
+- RetryPolicy gives each class its own attempt limit: a bot block is not
+  retried (a new user agent rarely gets past it), a 5xx is.
+- RetryBudget caps retries process-wide to a fraction of scrapes, so a
+  broad outage does not multiply the load.
+- CircuitBreaker opens a domain after consecutive failed scrapes, fails
+  fast with CircuitOpenError during a cooldown, then lets a half-open
+  probe through; the cooldown doubles each time a probe fails.
+"""
+
+from typing import Dict
+from dataclasses import dataclass
+from urllib.parse import urlparse
+import logging
+import time
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from politeness import RateLimitedError
+
+logger = logging.getLogger(__name__)
+
+
+# Error classes
+TIMEOUT = "timeout"
+BLOCKED = "blocked"
+RATE_LIMITED = "rate_limited"
+SERVER_ERROR = "server_error"
+DNS = "dns"
+OTHER = "other"
+
+# Browser / resolver messages of a failed name lookup
+DNS_MARKERS = ('err_name_not_resolved', 'name or service not known', 'nodename nor servname', 'getaddrinfo failed')
+
+# Circuit states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class BotBlockedError(RuntimeError):
+    """Raised on a 403 response or an anti-bot challenge page."""
+
+
+class ServerError(RuntimeError):
+    """Raised on a 5xx response."""
+
+    def __init__(self, status: int):
+        super().__init__(f"Server error: {status}")
+        self.status = status
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of scraping while a domain's circuit is open."""
+
+    def __init__(self, domain: str, retry_in: float):
+        super().__init__(f"Circuit open for {domain} - not scraping for another {retry_in:.0f} seconds")
+        self.domain = domain
+        self.retry_in = retry_in
+
+
+def classify_error(error: BaseException) -> str:
+    """Sort a failed scrape attempt into an error class.
+
+    Args:
+        error: Exception raised by the attempt
+
+    Returns:
+        One of TIMEOUT, BLOCKED, RATE_LIMITED, SERVER_ERROR, DNS, OTHER
+    """
+    if isinstance(error, (PlaywrightTimeoutError, TimeoutError)):
+        return TIMEOUT
+    if isinstance(error, BotBlockedError):
+        return BLOCKED
+    if isinstance(error, RateLimitedError):
+        return RATE_LIMITED
+    if isinstance(error, ServerError):
+        return SERVER_ERROR
+    message = str(error).lower()
+    if any(marker in message for marker in DNS_MARKERS):
+        return DNS
+    return OTHER
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Attempt limit of one error class (further capped by the scraper's max_retries)."""
+
+    max_attempts: int
+    backoff: bool = True  # Push the domain back before the next attempt
+
+
+DEFAULT_RETRY_POLICIES: Dict[str, RetryPolicy] = {
+    TIMEOUT: RetryPolicy(2),
+    BLOCKED: RetryPolicy(1),
+    RATE_LIMITED: RetryPolicy(2),
+    SERVER_ERROR: RetryPolicy(3),
+    DNS: RetryPolicy(1),
+    OTHER: RetryPolicy(3),
+}
+
+
+class RetryBudget:
+    """Process-wide retry allowance.
+
+    Every scrape deposits `ratio` tokens and every retry withdraws one, so
+    retries stay below `ratio` of the traffic; `min_per_minute` tokens trickle
+    in regardless, so a quiet process can still retry.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_minute: float = 10, max_tokens: float = 20):
+        """Initialize the budget (it starts full).
+
+        Args:
+            ratio: Retries allowed per scrape (0 = only the time-based allowance)
+            min_per_minute: Retries allowed per minute on top of the ratio
+            max_tokens: Largest number of retries that can be saved up
+        """
+        self.ratio = ratio
+        self.min_per_minute = min_per_minute
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+        self.granted = 0
+        self.denied = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.min_per_minute / 60)
+        self._updated = now
+
+    def record_request(self):
+        """Deposit the share of one scrape."""
+        self._refill()
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Withdraw one retry.
+
+        Returns:
+            True if the retry may run
+        """
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            self.granted += 1
+            return True
+        self.denied += 1
+        return False
+
+    def metrics(self) -> Dict[str, float]:
+        """Remaining tokens and granted/denied retry counts."""
+        self._refill()
+        return {"tokens": round(self._tokens, 2), "granted": self.granted, "denied": self.denied}
+
+
+@dataclass
+class _Circuit:
+    state: str = CLOSED
+    failures: int = 0
+    last_error: str = ""
+    opened_at: float = 0.0
+    cooldown: float = 0.0
+    probing: bool = False
+
+
+class CircuitBreaker:
+    """Per-domain circuit breaker."""
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 120, max_cooldown: float = 1800):
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failed scrapes that open a domain's circuit (0 = never open)
+            cooldown: Seconds an opened circuit fails fast before a probe is let through
+            max_cooldown: Upper bound of the cooldown, which doubles after each failed probe
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def _domain(self, url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def before_request(self, url: str):
+        """Check the URL's domain before scraping it.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its probe already running
+        """
+        domain = self._domain(url)
+        circuit = self._circuits.get(domain)
+        if circuit is None or circuit.state == CLOSED:
+            return
+
+        if circuit.state == OPEN:
+            retry_in = circuit.opened_at + circuit.cooldown - time.monotonic()
+            if retry_in > 0:
+                raise CircuitOpenError(domain, retry_in)
+            circuit.state = HALF_OPEN
+            logger.info(f"Circuit for {domain} half-open - sending a probe")
+
+        if circuit.probing:
+            raise CircuitOpenError(domain, 0)
+        circuit.probing = True
+
+    def record_success(self, url: str):
+        """Close the domain's circuit after a successful scrape."""
+        domain = self._domain(url)
+        circuit = self._circuits.pop(domain, None)
+        if circuit is not None and circuit.state != CLOSED:
+            logger.info(f"Circuit for {domain} closed")
+
+    def record_failure(self, url: str, error_class: str = OTHER):
+        """Count a failed scrape (after its retries) against the domain."""
+        if self.failure_threshold <= 0:
+            return
+        domain = self._domain(url)
+        circuit = self._circuits.setdefault(domain, _Circuit())
+        circuit.failures += 1
+        circuit.last_error = error_class
+        circuit.probing = False
+
+        if circuit.state == HALF_OPEN:
+            circuit.cooldown = min(circuit.cooldown * 2, self.max_cooldown)
+        elif circuit.failures >= self.failure_threshold:
+            circuit.cooldown = self.cooldown
+        else:
+            return
+        circuit.state = OPEN
+        circuit.opened_at = time.monotonic()
+        logger.warning(
+            f"Circuit for {domain} open for {circuit.cooldown:.0f} seconds "
+            f"after {circuit.failures} failed scrapes (last: {error_class})"
+        )
+
+    def release(self, url: str):
+        """Free the probe slot of a scrape that ended without an outcome (e.g. cancelled)."""
+        circuit = self._circuits.get(self._domain(url))
+        if circuit is not None:
+            circuit.probing = False
+
+    def state(self, url: str) -> str:
+        """Current state of the URL's domain circuit."""
+        circuit = self._circuits.get(self._domain(url))
+        return self._current_state(circuit) if circuit is not None else CLOSED
+
+    def _current_state(self, circuit: _Circuit) -> str:
+        if circuit.state == OPEN and time.monotonic() >= circuit.opened_at + circuit.cooldown:
+            return HALF_OPEN
+        return circuit.state
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """State, failure count, last error class and cooldown of every tracked domain."""
+        return {
+            domain: {
+                "state": self._current_state(circuit),
+                "failures": circuit.failures,
+                "last_error": circuit.last_error,
+                "cooldown": circuit.cooldown,
+            }
+            for domain, circuit in self._circuits.items()
+        }
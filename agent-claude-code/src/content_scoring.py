@@ -0,0 +1,203 @@
+"""Content Scoring Module
+
+This module removes boilerplate (menus, footers, cookie banners, link
+lists) from the text sent to the LLM. The page's text blocks (see
+text_blocks) are scored from per-block features computed as NumPy arrays
+over the whole page:
+
+- text length: longer blocks are more likely to be content
+- link density: short, link-only blocks are navigation
+- punctuation ratio: prose and timestamps have punctuation, menus do not
+- tag depth: distance from the page's median block depth
+- class-name hints: tag/class/id keywords on the path (nav, footer, cookie...
+  count against a block; article, story, news... count for it)
+
+Blocks scoring at or above the threshold are kept in document order. The
+weights are tuned so that a block without any evidence either way is kept:
+scoring only drops what looks like boilerplate. Headings and long headline
+links (a news homepage's real content) are never penalized for being links.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from text_blocks import PathNode, TextBlock
+
+logger = logging.getLogger(__name__)
+
+
+# Class/id substrings and tags marking boilerplate containers
+NEGATIVE_HINTS = (
+    'nav', 'menu', 'footer', 'cookie', 'consent', 'gdpr', 'banner', 'sidebar', 'share', 'social',
+    'comment', 'promo', 'advert', 'sponsor', 'subscribe', 'newsletter', 'breadcrumb', 'popup',
+    'modal', 'copyright', 'login', 'signup', 'pagination',
+)
+NEGATIVE_TAGS = frozenset({'nav', 'footer', 'aside'})
+
+# Class/id substrings and tags marking content containers
+POSITIVE_HINTS = ('article', 'content', 'story', 'post', 'news', 'text', 'entry', 'headline', 'lead', 'teaser')
+POSITIVE_TAGS = frozenset({'article', 'main'})
+
+PUNCTUATION = frozenset('.,;:!?«»"()—–-')
+
+# Blocks shorter than this lose score, longer ones gain (log scale)
+NEUTRAL_LENGTH = 20
+
+# Link-only blocks shorter than this count as navigation
+SHORT_LINK_CHARS = 40
+
+
+@dataclass
+class BlockFeatures:
+    """Per-block feature arrays for one page (index i is the page's i-th block)."""
+
+    chars: np.ndarray
+    link_density: np.ndarray
+    punctuation_ratio: np.ndarray
+    depth: np.ndarray
+    heading: np.ndarray
+    positive_hints: np.ndarray
+    negative_hints: np.ndarray
+
+    @classmethod
+    def from_blocks(cls, blocks: Sequence[TextBlock]) -> "BlockFeatures":
+        """Compute the features of every block.
+
+        Args:
+            blocks: Text blocks of one page
+
+        Returns:
+            BlockFeatures with one entry per block
+        """
+        hints: Dict[int, Tuple[bool, bool]] = {}
+        rows = []
+        for block in blocks:
+            text = block.text
+            positive = negative = 0
+            for node in block.path:
+                if node.serial not in hints:
+                    hints[node.serial] = _node_hints(node)
+                is_positive, is_negative = hints[node.serial]
+                positive += is_positive
+                negative += is_negative
+            rows.append((
+                len(text),
+                block.link_density,
+                sum(1 for char in text if char in PUNCTUATION) / len(text) if text else 0.0,
+                len(block.path),
+                block.heading_level > 0,
+                positive,
+                negative,
+            ))
+        columns = np.array(rows, dtype=float).reshape(-1, 7).T
+        return cls(*columns)
+
+
+def _node_hints(node: PathNode) -> Tuple[bool, bool]:
+    """(positive, negative) hint flags of one path element."""
+    names = f"{node.classes} {node.id}".lower()
+    positive = node.tag in POSITIVE_TAGS or any(hint in names for hint in POSITIVE_HINTS)
+    negative = node.tag in NEGATIVE_TAGS or any(hint in names for hint in NEGATIVE_HINTS)
+    return positive, negative
+
+
+@dataclass
+class ScoringReport:
+    """Prompt characters before and after boilerplate removal."""
+
+    blocks_total: int = 0
+    blocks_kept: int = 0
+    chars_before: int = 0
+    chars_after: int = 0
+
+    @property
+    def reduction(self) -> float:
+        """Share of characters removed (0.0-1.0)."""
+        return 1 - self.chars_after / self.chars_before if self.chars_before else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "blocks_total": self.blocks_total,
+            "blocks_kept": self.blocks_kept,
+            "chars_before": self.chars_before,
+            "chars_after": self.chars_after,
+            "reduction": round(self.reduction, 3),
+        }
+
+
+class ContentScorer:
+    """Scores a page's text blocks and keeps the content ones.
+
+    Features:
+    - One vectorized pass over the page's feature arrays
+    - Page-relative depth feature (distance from the median block depth)
+    - ScoringReport with blocks and characters before/after
+    """
+
+    # Feature weights (see score())
+    LENGTH_WEIGHT = 0.6
+    PUNCTUATION_WEIGHT = 1.0
+    SHORT_LINK_PENALTY = 2.0
+    HEADING_BONUS = 0.8
+    POSITIVE_HINT_BONUS = 0.5
+    NEGATIVE_HINT_PENALTY = 3.0
+    DEPTH_PENALTY = 0.05
+
+    def __init__(self, threshold: float = 0.0):
+        """Initialize the scorer.
+
+        Args:
+            threshold: Minimum score of a kept block (higher removes more)
+        """
+        self.threshold = threshold
+
+    def score(self, features: BlockFeatures) -> np.ndarray:
+        """Score every block of a page.
+
+        Args:
+            features: Feature arrays of the page
+
+        Returns:
+            Array of scores, one per block
+        """
+        if features.chars.size == 0:
+            return np.zeros(0)
+        length = self.LENGTH_WEIGHT * (np.log1p(features.chars) - np.log1p(NEUTRAL_LENGTH))
+        punctuation = self.PUNCTUATION_WEIGHT * np.minimum(features.punctuation_ratio * 20, 1.0)
+        shortness = np.clip(1 - features.chars / SHORT_LINK_CHARS, 0, 1)
+        links = self.SHORT_LINK_PENALTY * features.link_density * shortness * (1 - features.heading)
+        heading = self.HEADING_BONUS * features.heading
+        hints = (self.POSITIVE_HINT_BONUS * np.minimum(features.positive_hints, 2)
+                 - self.NEGATIVE_HINT_PENALTY * (features.negative_hints > 0))
+        depth = np.minimum(self.DEPTH_PENALTY * np.abs(features.depth - np.median(features.depth)), 0.5)
+        return length + punctuation - links + heading + hints - depth
+
+    def select(self, blocks: Sequence[TextBlock]) -> Tuple[List[TextBlock], ScoringReport]:
+        """Keep the blocks scoring at or above the threshold.
+
+        Args:
+            blocks: Text blocks of one page, in document order
+
+        Returns:
+            Kept blocks (document order) and the ScoringReport
+        """
+        blocks = [block for block in blocks if block.lines]
+        scores = self.score(BlockFeatures.from_blocks(blocks))
+        kept = [block for block, keep in zip(blocks, scores >= self.threshold) if keep]
+        report = ScoringReport(
+            blocks_total=len(blocks),
+            blocks_kept=len(kept),
+            chars_before=_text_chars(blocks),
+            chars_after=_text_chars(kept),
+        )
+        logger.debug(f"Content scoring: {report.to_dict()}")
+        return kept, report
+
+
+def _text_chars(blocks: Sequence[TextBlock]) -> int:
+    """Length of the blocks' lines joined one per line."""
+    lines = sum(len(block.lines) for block in blocks)
+    return sum(block.chars for block in blocks) + max(lines - 1, 0)
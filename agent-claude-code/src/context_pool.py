@@ -0,0 +1,195 @@
+"""Browser Context Pool Module
+
+This module keeps a bounded set of pre-configured stealth browser contexts
+(each with one open page) ready, so that scrapes do not pay context setup
+on their critical path.
+
+A context keeps the cookies and localStorage of the sites it loaded, so
+leases are keyed by domain: a used context is only handed out again for the
+same domain, and other domains get a fresh one.
+"""
+
+from typing import Awaitable, Callable, Deque, Dict, Optional, Set
+from dataclasses import dataclass, field
+from collections import deque
+import logging
+import asyncio
+
+from playwright.async_api import BrowserContext, Page
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledPage:
+    """A stealth context with its page, as handed out by the pool."""
+
+    context: BrowserContext
+    page: Page
+    user_agent: str
+    uses: int = 0
+    domain: Optional[str] = None  # Domain whose cookies/storage the context holds (None = unused)
+    seeded_origins: Set[str] = field(default_factory=set)  # Origins whose localStorage seed script is installed
+
+
+class ContextPool:
+    """Bounded pool of pre-warmed stealth contexts and pages.
+
+    Features:
+    - Background refill up to `size` idle entries
+    - Falls back to on-demand creation when the pool is empty (miss)
+    - Recycles a context after `max_uses` navigations or on error
+    - Reuses a context only for the domain it was used for
+    - Hit/miss/recycle counters
+
+    A pool with size 0 keeps nothing warm: every acquire creates a fresh
+    context and every release closes it.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[PooledPage]],
+        size: int = 2,
+        max_uses: int = 20
+    ):
+        """Initialize the context pool.
+
+        Args:
+            factory: Coroutine function creating a new configured PooledPage
+            size: Maximum number of idle entries kept ready
+            max_uses: Navigations after which a context is recycled
+        """
+        self.factory = factory
+        self.size = max(0, size)
+        self.max_uses = max(1, max_uses)
+        self._idle: Deque[PooledPage] = deque()
+        self._refill_task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self.created = 0
+        self.recycled = 0
+        logger.info(f"ContextPool initialized (size={self.size}, max_uses={self.max_uses})")
+
+    async def acquire(self, domain: Optional[str] = None) -> PooledPage:
+        """Take a ready page for a domain from the pool, creating one if none is idle.
+
+        Args:
+            domain: Domain the page will load; only a context unused so far or
+                used for the same domain is handed out
+
+        Returns:
+            PooledPage entry for exclusive use until released
+        """
+        entry = self._take_idle(domain)
+        if entry is not None:
+            self.hits += 1
+            logger.debug("Context pool hit (idle=%d)", len(self._idle))
+        else:
+            self.misses += 1
+            logger.debug("Context pool miss - creating context on demand")
+            if len(self._idle) >= self.size > 0:
+                # Idle contexts all belong to other domains: drop the oldest so a fresh one is refilled
+                self.recycled += 1
+                await self._close_entry(self._idle.popleft())
+            entry = await self._create()
+
+        entry.domain = domain
+        self.schedule_refill()
+        return entry
+
+    def _take_idle(self, domain: Optional[str]) -> Optional[PooledPage]:
+        """Remove and return the idle entry of this domain, else an unused one."""
+        for wanted in (domain, None):
+            for entry in self._idle:
+                if entry.domain == wanted:
+                    self._idle.remove(entry)
+                    return entry
+        return None
+
+    async def release(self, entry: PooledPage, failed: bool = False):
+        """Return a page after use, or recycle its context.
+
+        Args:
+            entry: Entry obtained from acquire()
+            failed: Whether the navigation on this entry failed
+        """
+        entry.uses += 1
+        if failed or entry.uses >= self.max_uses or len(self._idle) >= self.size:
+            reason = "error" if failed else ("max uses" if entry.uses >= self.max_uses else "pool full")
+            if self.size:
+                logger.debug("Recycling context after %d use(s) (%s)", entry.uses, reason)
+                self.recycled += 1
+            await self._close_entry(entry)
+            self.schedule_refill()
+            return
+
+        try:
+            # Drop the previous document so idle pages do not hold on to memory
+            await entry.page.goto("about:blank")
+        except Exception as e:
+            logger.debug(f"Failed to reset pooled page, recycling: {e}")
+            self.recycled += 1
+            await self._close_entry(entry)
+            self.schedule_refill()
+            return
+
+        self._idle.append(entry)
+
+    def schedule_refill(self):
+        """Start a background task topping the pool up to its size."""
+        if self.size == 0 or len(self._idle) >= self.size:
+            return
+        if self._refill_task is not None and not self._refill_task.done():
+            return
+        self._refill_task = asyncio.get_running_loop().create_task(self._refill())
+
+    async def _refill(self):
+        """Create entries until the idle set reaches the pool size."""
+        while len(self._idle) < self.size:
+            try:
+                entry = await self._create()
+            except Exception as e:
+                logger.warning(f"Context pool refill failed: {str(e)}")
+                return
+            self._idle.append(entry)
+        logger.debug("Context pool refilled (idle=%d)", len(self._idle))
+
+    async def _create(self) -> PooledPage:
+        """Create a new entry through the factory."""
+        entry = await self.factory()
+        self.created += 1
+        return entry
+
+    async def _close_entry(self, entry: PooledPage):
+        """Close an entry's context, ignoring errors from dead browsers."""
+        try:
+            await entry.context.close()
+        except Exception as e:
+            logger.debug(f"Ignoring error while closing pooled context: {e}")
+
+    async def clear(self):
+        """Close all idle entries (e.g. before the browser is restarted or closed)."""
+        if self._refill_task is not None and not self._refill_task.done():
+            self._refill_task.cancel()
+            try:
+                await self._refill_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._refill_task = None
+
+        while self._idle:
+            await self._close_entry(self._idle.popleft())
+
+    def stats(self) -> Dict[str, int]:
+        """Get pool counters.
+
+        Returns:
+            Dictionary with hits, misses, created, recycled and idle counts
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "created": self.created,
+            "recycled": self.recycled,
+            "idle": len(self._idle),
+        }
@@ -23,6 +23,7 @@ class DatabaseService:
     - CRUD operations for news articles
     - Bulk insert operations
     - Query by URL for export
+    - Per-URL page fingerprints for skipping unchanged pages
     - Connection pooling and management
     """
 
@@ -90,7 +91,8 @@ class DatabaseService:
         - created_at: TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         - updated_at: TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 
-        Also creates indexes on url and created_at columns for efficient queries.
+        Also creates indexes on url and created_at columns for efficient queries,
+        and the page_state table holding the last content fingerprint per URL.
         """
         logger.info("Initializing database schema...")
 
@@ -119,6 +121,15 @@ class DatabaseService:
                 ON news(created_at)
             """)
 
+            # Last processed content fingerprint per source URL
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS page_state (
+                    url TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
             logger.info("Database schema initialized successfully")
 
     def save_news(self, url: str, news_items: List[Dict[str, Any]]) -> int:
@@ -306,6 +317,40 @@ class DatabaseService:
             logger.debug(f"News count: {count} (url={url})")
             return count
 
+    def get_page_fingerprint(self, url: str) -> Optional[str]:
+        """Get the content fingerprint stored for a URL by the last processed scrape.
+
+        Args:
+            url: Source URL
+
+        Returns:
+            Fingerprint string or None if the URL was never processed
+        """
+        with self._get_cursor() as cursor:
+            cursor.execute("SELECT fingerprint FROM page_state WHERE url = ?", (url,))
+            row = cursor.fetchone()
+            return row["fingerprint"] if row else None
+
+    def save_page_fingerprint(self, url: str, fingerprint: str):
+        """Store the content fingerprint of the last processed scrape of a URL.
+
+        Args:
+            url: Source URL
+            fingerprint: Normalized content fingerprint
+        """
+        if not url:
+            raise ValueError("URL is required")
+
+        with self._get_cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO page_state (url, fingerprint, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(url) DO UPDATE SET
+                    fingerprint = excluded.fingerprint,
+                    updated_at = excluded.updated_at
+            """, (url, fingerprint))
+            logger.debug(f"Stored page fingerprint for {url}: {fingerprint[:12]}")
+
     def delete_news_by_url(self, url: str) -> int:
         """Delete all news articles for a given URL.
 
@@ -320,6 +365,8 @@ class DatabaseService:
         with self._get_cursor() as cursor:
             cursor.execute("DELETE FROM news WHERE url = ?", (url,))
             deleted_count = cursor.rowcount
+            # Forget the fingerprint so the next scrape re-extracts the page
+            cursor.execute("DELETE FROM page_state WHERE url = ?", (url,))
             logger.info(f"Deleted {deleted_count} news items")
             return deleted_count
 
@@ -334,6 +381,7 @@ class DatabaseService:
         with self._get_cursor() as cursor:
             cursor.execute("DELETE FROM news")
             deleted_count = cursor.rowcount
+            cursor.execute("DELETE FROM page_state")
             logger.info(f"Cleared {deleted_count} news items")
             return deleted_count
 
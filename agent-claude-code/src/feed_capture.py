@@ -0,0 +1,320 @@
+"""Feed Capture Module
+
+This module finds headlines in the JSON responses a page loads while it
+renders. Many homepages hydrate from their own API; when one of those
+responses contains an array of headline-like records, the records are mapped
+straight to NewsItem objects and no HTML cleaning or LLM call is needed.
+The endpoint is remembered per domain so later scrapes can fetch it directly.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+import html as html_lib
+import logging
+import re
+import threading
+import time
+
+import requests
+
+from llm_service import NewsItem
+
+logger = logging.getLogger(__name__)
+
+
+# Field names used by news APIs, in order of preference
+TITLE_KEYS = ('title', 'headline', 'name', 'header', 'text')
+DESCRIPTION_KEYS = ('description', 'summary', 'lead', 'teaser', 'subtitle', 'announce', 'excerpt', 'abstract', 'snippet')
+DATE_KEYS = (
+    'publication_date', 'published_at', 'publishedAt', 'pubDate', 'published', 'datePublished',
+    'date', 'datetime', 'created_at', 'createdAt', 'time', 'timestamp', 'updated_at', 'updatedAt'
+)
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+JsonPath = Tuple[Union[str, int], ...]
+
+
+def _text(value: Any) -> str:
+    """Plain text of a JSON field (WordPress-style {"rendered": ...} included)."""
+    if isinstance(value, dict):
+        value = value.get('rendered') or value.get('text') or ''
+    if not isinstance(value, str):
+        return ''
+    return ' '.join(html_lib.unescape(_TAG_RE.sub(' ', value)).split())
+
+
+def _is_headline(text: str) -> bool:
+    """Same length rule as headline candidates in HTML, plus a word break."""
+    return 20 < len(text) <= 300 and ' ' in text
+
+
+def _date(value: Any) -> str:
+    """Normalize a JSON date field (ISO string or Unix seconds/milliseconds)."""
+    if isinstance(value, bool):
+        return ''
+    if isinstance(value, (int, float)):
+        seconds = value / 1000 if value > 10 ** 11 else value
+        try:
+            return datetime.fromtimestamp(seconds, tz=timezone.utc).isoformat()
+        except (OverflowError, OSError, ValueError):
+            return ''
+    return _text(value)
+
+
+@dataclass
+class FeedEndpoint:
+    """Where a page's headlines live in one of its JSON responses."""
+
+    url: str
+    path: JsonPath
+    title_key: str
+    description_key: Optional[str] = None
+    date_key: Optional[str] = None
+    learned_at: float = field(default_factory=time.monotonic)
+
+
+def _match_records(records: List[Any], min_records: int) -> Optional[Tuple[str, Optional[str], Optional[str], int]]:
+    """Check whether a JSON array holds headline-like records.
+
+    Returns:
+        (title_key, description_key, date_key, headline_count) or None
+    """
+    items = [item for item in records if isinstance(item, dict)]
+    if len(items) < min_records or len(items) < len(records) * 0.8:
+        return None
+
+    for title_key in TITLE_KEYS:
+        headlines = sum(1 for item in items if _is_headline(_text(item.get(title_key))))
+        if headlines >= min_records and headlines >= len(items) * 0.6:
+            description_key = next(
+                (key for key in DESCRIPTION_KEYS
+                 if sum(1 for item in items if _text(item.get(key))) >= len(items) * 0.5),
+                None
+            )
+            date_key = next(
+                (key for key in DATE_KEYS
+                 if sum(1 for item in items if item.get(key) not in (None, '')) >= len(items) * 0.5),
+                None
+            )
+            return title_key, description_key, date_key, headlines
+    return None
+
+
+def find_headline_array(
+    data: Any,
+    min_records: int = 5,
+    max_depth: int = 6
+) -> Optional[Tuple[JsonPath, str, Optional[str], Optional[str]]]:
+    """Find the JSON array that looks most like a list of headlines.
+
+    Args:
+        data: Parsed JSON response
+        min_records: Minimum number of headline-like records
+        max_depth: How deep to search nested objects
+
+    Returns:
+        (path, title_key, description_key, date_key) of the best array, or None
+    """
+    best = None
+    best_count = 0
+    stack: List[Tuple[Any, JsonPath]] = [(data, ())]
+
+    while stack:
+        node, path = stack.pop()
+        if len(path) > max_depth:
+            continue
+        if isinstance(node, list):
+            match = _match_records(node, min_records)
+            if match and match[3] > best_count:
+                best = (path, match[0], match[1], match[2])
+                best_count = match[3]
+            stack.extend((item, path + (index,)) for index, item in enumerate(node[:50]) if isinstance(item, (dict, list)))
+        elif isinstance(node, dict):
+            stack.extend((value, path + (key,)) for key, value in node.items() if isinstance(value, (dict, list)))
+
+    return best
+
+
+def resolve_path(data: Any, path: JsonPath) -> Any:
+    """Follow a JSON path; returns None if the structure changed."""
+    for step in path:
+        try:
+            data = data[step]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return data
+
+
+def map_records(records: List[Any], endpoint: FeedEndpoint) -> List[NewsItem]:
+    """Map JSON records to NewsItem objects using the endpoint's field choice."""
+    items = []
+    seen = set()
+    for record in records or []:
+        if not isinstance(record, dict):
+            continue
+        title = _text(record.get(endpoint.title_key))
+        if not _is_headline(title) or title in seen:
+            continue
+        seen.add(title)
+        items.append(NewsItem(
+            title=title,
+            description=_text(record.get(endpoint.description_key)) if endpoint.description_key else "",
+            publication_date=_date(record.get(endpoint.date_key)) if endpoint.date_key else ""
+        ))
+    return items
+
+
+class FeedCapture:
+    """Records JSON responses of one page load and picks the best headline feed."""
+
+    # Response bodies larger than this are not parsed
+    MAX_BODY_BYTES = 2 * 1024 * 1024
+
+    # At most this many JSON responses are inspected per page
+    MAX_RESPONSES = 20
+
+    def __init__(self, min_records: int = 5):
+        """Initialize the capture.
+
+        Args:
+            min_records: Minimum headline-like records for a response to qualify
+        """
+        self.min_records = min_records
+        self._responses = []
+        self.endpoint: Optional[FeedEndpoint] = None
+        self.items: List[NewsItem] = []
+
+    def on_response(self, response):
+        """Playwright 'response' listener: keep XHR/fetch JSON responses."""
+        try:
+            if response.request.resource_type not in ('xhr', 'fetch'):
+                return
+            headers = response.headers
+            if 'json' not in headers.get('content-type', '').lower():
+                return
+            if int(headers.get('content-length', '0') or 0) > self.MAX_BODY_BYTES:
+                return
+        except Exception:
+            return
+        if len(self._responses) < self.MAX_RESPONSES:
+            self._responses.append(response)
+
+    def attach(self, page):
+        """Start listening to the page's responses (drops anything from a previous attempt)."""
+        self._responses = []
+        self.endpoint = None
+        self.items = []
+        page.on('response', self.on_response)
+
+    def detach(self, page):
+        """Stop listening (pages are reused from the context pool)."""
+        try:
+            page.remove_listener('response', self.on_response)
+        except Exception as e:
+            logger.debug(f"Failed to remove response listener: {e}")
+
+    async def evaluate(self) -> List[NewsItem]:
+        """Parse captured responses and select the feed with the most headlines.
+
+        Returns:
+            NewsItems from the best feed (empty if no response qualified)
+        """
+        best_count = 0
+        for response in self._responses:
+            try:
+                data = await response.json()
+            except Exception:
+                continue
+            found = find_headline_array(data, self.min_records)
+            if not found:
+                continue
+            path, title_key, description_key, date_key = found
+            endpoint = FeedEndpoint(response.url, path, title_key, description_key, date_key)
+            items = map_records(resolve_path(data, path), endpoint)
+            if len(items) > best_count:
+                self.endpoint, self.items, best_count = endpoint, items, len(items)
+
+        if self.endpoint:
+            logger.info(f"Captured headline feed {self.endpoint.url} ({len(self.items)} items)")
+        return self.items
+
+
+class FeedRegistry:
+    """Per-domain memory of headline feed endpoints, with direct fetching."""
+
+    def __init__(self, ttl: float = 24 * 3600, timeout: float = 15.0, min_records: int = 5):
+        """Initialize the registry.
+
+        Args:
+            ttl: Seconds an endpoint is trusted before it has to be captured again
+            timeout: Request timeout for direct feed fetches
+            min_records: Minimum headlines a direct fetch must return
+        """
+        self.ttl = ttl
+        self.timeout = timeout
+        self.min_records = min_records
+        self.session = requests.Session()
+        self.session.headers.update({'Accept': 'application/json, text/plain, */*'})
+        self._endpoints: Dict[str, FeedEndpoint] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _domain(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def get(self, url: str) -> Optional[FeedEndpoint]:
+        """Get the remembered endpoint for the URL's domain, if still valid."""
+        domain = self._domain(url)
+        with self._lock:
+            endpoint = self._endpoints.get(domain)
+            if endpoint and time.monotonic() - endpoint.learned_at > self.ttl:
+                del self._endpoints[domain]
+                return None
+            return endpoint
+
+    def remember(self, url: str, endpoint: FeedEndpoint):
+        """Store the endpoint for the URL's domain."""
+        with self._lock:
+            self._endpoints[self._domain(url)] = endpoint
+        logger.info(f"Remembered headline feed for {self._domain(url)}: {endpoint.url}")
+
+    def forget(self, url: str):
+        """Drop the endpoint for the URL's domain (e.g. after a failed fetch)."""
+        with self._lock:
+            self._endpoints.pop(self._domain(url), None)
+
+    def fetch(self, url: str) -> Optional[List[NewsItem]]:
+        """Fetch the remembered feed of the URL's domain directly.
+
+        Args:
+            url: Page URL whose domain feed should be fetched
+
+        Returns:
+            NewsItems, or None if no endpoint is known or it stopped working
+        """
+        endpoint = self.get(url)
+        if endpoint is None:
+            return None
+
+        try:
+            response = self.session.get(endpoint.url, timeout=self.timeout, headers={'Referer': url})
+            response.raise_for_status()
+            items = map_records(resolve_path(response.json(), endpoint.path), endpoint)
+        except (requests.RequestException, ValueError) as e:
+            logger.info(f"Direct feed fetch failed for {endpoint.url}: {e}")
+            items = []
+
+        if len(items) < self.min_records:
+            # Endpoint changed shape or went away: learn it again on the next browser scrape
+            self.forget(url)
+            return None
+
+        logger.info(f"Fetched {len(items)} items directly from feed {endpoint.url}")
+        return items
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
@@ -0,0 +1,307 @@
+"""Feed Discovery Module
+
+This module provides the syndication fast path. Many news sites publish
+RSS/Atom feeds (<link rel="alternate">) or Google News sitemaps (listed in
+robots.txt); both already contain title, description and publication date,
+so no browser, HTML cleaning or LLM call is needed. Feeds are parsed with a
+streaming XML parser and discovery results are cached per domain.
+"""
+
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin, urlparse
+import html as html_lib
+import logging
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+import requests
+
+from llm_service import NewsItem
+
+logger = logging.getLogger(__name__)
+
+
+_LINK_TAG_RE = re.compile(r'<link\b[^>]*>', re.IGNORECASE)
+_ATTR_RE = re.compile(r'([a-zA-Z:-]+)\s*=\s*("([^"]*)"|\'([^\']*)\'|([^\s>]+))')
+_TAG_RE = re.compile(r'<[^>]+>')
+
+FEED_TYPES = ('application/rss+xml', 'application/atom+xml')
+
+# Probed on homepages that link no feed and list no news sitemap
+WELL_KNOWN_PATHS = ('/feed', '/rss')
+
+# Only the document head is needed to find <link> tags
+HEAD_BYTES = 128 * 1024
+
+
+def _local(tag: str) -> str:
+    """Element name without namespace ('{ns}title' -> 'title')."""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _clean(text: Optional[str]) -> str:
+    """Plain text of a feed field (descriptions often carry escaped HTML)."""
+    if not text:
+        return ''
+    return ' '.join(_TAG_RE.sub(' ', html_lib.unescape(text)).split())
+
+
+def _normalize_date(value: str) -> str:
+    """Convert RFC 822 dates (RSS pubDate) to ISO 8601; other formats are kept."""
+    if not value:
+        return ''
+    try:
+        return parsedate_to_datetime(value).isoformat()
+    except (TypeError, ValueError, IndexError):
+        return value
+
+
+def find_feed_links(html_content: str, base_url: str) -> List[str]:
+    """Find RSS/Atom feeds advertised with <link rel="alternate"> in a page.
+
+    Args:
+        html_content: Page HTML (the head is enough)
+        base_url: Page URL for resolving relative hrefs
+
+    Returns:
+        Absolute feed URLs in document order
+    """
+    feeds = []
+    for tag in _LINK_TAG_RE.findall(html_content):
+        attrs = {
+            match.group(1).lower(): html_lib.unescape(match.group(3) or match.group(4) or match.group(5) or '')
+            for match in _ATTR_RE.finditer(tag)
+        }
+        if 'alternate' not in attrs.get('rel', '').lower().split():
+            continue
+        if attrs.get('type', '').lower() not in FEED_TYPES or not attrs.get('href'):
+            continue
+        feed_url = urljoin(base_url, attrs['href'])
+        if feed_url not in feeds:
+            feeds.append(feed_url)
+    return feeds
+
+
+def find_news_sitemaps(robots_txt: str) -> List[str]:
+    """List sitemaps from robots.txt that look like news sitemaps."""
+    sitemaps = []
+    for line in robots_txt.splitlines():
+        key, _, value = line.partition(':')
+        value = value.strip()
+        if key.strip().lower() == 'sitemap' and 'news' in value.lower() and value not in sitemaps:
+            sitemaps.append(value)
+    return sitemaps
+
+
+def parse_feed(source, max_items: int = 200) -> List[NewsItem]:
+    """Parse an RSS, Atom or Google News sitemap document incrementally.
+
+    Items are converted as soon as their end tag is read and then cleared,
+    so large feeds and sitemaps are never held in memory as a whole tree.
+
+    Args:
+        source: File-like object with the XML bytes
+        max_items: Stop after this many items
+
+    Returns:
+        NewsItems in feed order
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the document is not well-formed XML
+    """
+    items = []
+    for _, element in ET.iterparse(source, events=('end',)):
+        name = _local(element.tag)
+        if name not in ('item', 'entry', 'url'):
+            continue
+
+        fields: Dict[str, str] = {}
+        for child in element.iter():
+            child_name = _local(child.tag)
+            # First occurrence wins (e.g. <title> of an entry, not of a nested <source>)
+            if child is not element and child_name not in fields:
+                fields[child_name] = (child.text or '').strip()
+
+        if name == 'url':
+            # Google News sitemap: <url><news:news><news:title/><news:publication_date/></news:news></url>
+            title = _clean(fields.get('title'))
+            description = _clean(fields.get('keywords'))
+            publication_date = fields.get('publication_date', '')
+        else:
+            title = _clean(fields.get('title'))
+            description = _clean(fields.get('description') or fields.get('summary') or fields.get('content'))
+            publication_date = _normalize_date(
+                fields.get('pubDate') or fields.get('published') or fields.get('date') or fields.get('updated') or ''
+            )
+        element.clear()
+
+        if title:
+            items.append(NewsItem(title=title, description=description, publication_date=publication_date))
+            if len(items) >= max_items:
+                break
+    return items
+
+
+@dataclass
+class _DomainFeeds:
+    """Discovery result cached for one domain."""
+
+    page_feeds: Dict[str, List[str]] = field(default_factory=dict)
+    site_feeds: Optional[List[str]] = None
+    checked_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class FeedResult:
+    """Items read from a syndication feed."""
+
+    feed_url: str
+    items: List[NewsItem]
+
+
+class FeedDiscovery:
+    """Finds and reads RSS/Atom feeds and news sitemaps for a page.
+
+    A feed covers a page when the page links to it, or when the page is the
+    site's homepage and the feed is a site-wide news sitemap or well-known
+    feed path. Results (including "no feed") are cached per domain.
+    """
+
+    def __init__(self, ttl: float = 6 * 3600, timeout: float = 10.0, min_items: int = 3, max_items: int = 200):
+        """Initialize the discovery service.
+
+        Args:
+            ttl: Seconds a domain's discovery result is reused
+            timeout: Request timeout in seconds
+            min_items: Minimum items a feed must have to replace scraping
+            max_items: Maximum items read from one feed
+        """
+        self.ttl = ttl
+        self.timeout = timeout
+        self.min_items = min_items
+        self.max_items = max_items
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (compatible; NewsAggregator/1.0; +feed-reader)',
+            'Accept': 'application/rss+xml, application/atom+xml, application/xml;q=0.9, text/xml;q=0.9, */*;q=0.5'
+        })
+        self._domains: Dict[str, _DomainFeeds] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _domain(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    @staticmethod
+    def _is_homepage(url: str) -> bool:
+        return urlparse(url).path in ('', '/')
+
+    def _domain_feeds(self, url: str) -> _DomainFeeds:
+        domain = self._domain(url)
+        with self._lock:
+            cached = self._domains.get(domain)
+            if cached is None or time.monotonic() - cached.checked_at > self.ttl:
+                cached = _DomainFeeds()
+                self._domains[domain] = cached
+            return cached
+
+    def _get_text(self, url: str, limit: Optional[int] = None) -> Optional[str]:
+        """GET a text resource, reading at most `limit` bytes."""
+        try:
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                if response.status_code != 200:
+                    return None
+                raw = b''
+                for chunk in response.iter_content(chunk_size=16384):
+                    raw += chunk
+                    if limit is not None and len(raw) >= limit:
+                        break
+                return raw.decode(response.encoding or 'utf-8', errors='replace')
+        except requests.RequestException as e:
+            logger.debug(f"Discovery request failed for {url}: {e}")
+            return None
+
+    def discover(self, url: str) -> List[str]:
+        """Find feeds covering a page (cached per domain).
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Candidate feed URLs, best first (empty if the site has none)
+        """
+        cached = self._domain_feeds(url)
+
+        if url not in cached.page_feeds:
+            head = self._get_text(url, limit=HEAD_BYTES)
+            cached.page_feeds[url] = find_feed_links(head, url) if head else []
+
+        feeds = list(cached.page_feeds[url])
+        if not self._is_homepage(url):
+            return feeds
+
+        if cached.site_feeds is None:
+            root = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
+            robots = self._get_text(f"{root}/robots.txt")
+            site_feeds = find_news_sitemaps(robots) if robots else []
+            if not site_feeds and not feeds:
+                site_feeds = [root + path for path in WELL_KNOWN_PATHS]
+            cached.site_feeds = site_feeds
+
+        return feeds + [feed for feed in cached.site_feeds if feed not in feeds]
+
+    def read_feed(self, feed_url: str) -> List[NewsItem]:
+        """Download and stream-parse one feed.
+
+        Returns:
+            NewsItems (empty if the feed is unavailable or not valid XML)
+        """
+        try:
+            with self.session.get(feed_url, timeout=self.timeout, stream=True) as response:
+                if response.status_code != 200:
+                    return []
+                response.raw.decode_content = True  # Let urllib3 undo gzip while streaming
+                return parse_feed(response.raw, self.max_items)
+        except (requests.RequestException, ET.ParseError) as e:
+            logger.debug(f"Failed to read feed {feed_url}: {e}")
+            return []
+
+    def fetch(self, url: str) -> Optional[FeedResult]:
+        """Get news for a page from the first working feed that covers it.
+
+        Feeds that fail or have fewer than min_items items are dropped from
+        the domain cache, so they are not requested again until the TTL expires.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            FeedResult or None if no feed covers the page
+        """
+        for feed_url in self.discover(url):
+            items = self.read_feed(feed_url)
+            if len(items) >= self.min_items:
+                logger.info(f"Read {len(items)} items from feed {feed_url} for {url}")
+                return FeedResult(feed_url=feed_url, items=items)
+            self._drop(url, feed_url)
+
+        logger.debug(f"No usable feed covers {url}")
+        return None
+
+    def _drop(self, url: str, feed_url: str):
+        """Remove a feed that did not work from the domain cache."""
+        cached = self._domain_feeds(url)
+        with self._lock:
+            for feeds in cached.page_feeds.values():
+                if feed_url in feeds:
+                    feeds.remove(feed_url)
+            if cached.site_feeds and feed_url in cached.site_feeds:
+                cached.site_feeds.remove(feed_url)
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
@@ -0,0 +1,443 @@
+"""HTML Cleaner Module
+
+This module turns a scraped page into the plain text sent to the LLM: it
+drops scripts, styles, forms and other non-content elements, picks the main
+content container and normalizes its text. The parsing work is done by a
+pluggable backend:
+
+- "lexbor": selectolax's lexbor engine (fastest, C)
+- "lxml": libxml2 through lxml (C)
+- "streaming": text_blocks' incremental tokenizer (no tree, bounded memory)
+- "html.parser": BeautifulSoup with the pure-Python html.parser (reference)
+
+"auto" picks the fastest installed backend. "streaming" never holds a parse
+tree: it keeps at most max_chars of text per candidate container and stops
+reading once the "main" container is complete, so its memory does not grow
+with the page (apart from the HTML string itself). The C backends produce the
+same text as the reference backend on well-formed pages; on badly broken
+markup their parse trees (and so the text order) can differ slightly. If a
+backend raises, the cleaner falls back to the reference backend.
+src/benchmark_html_cleaner.py reports MB/s per backend and checks that
+outputs match.
+
+With content scoring enabled, the cleaner ignores the content container and
+keeps only the body blocks that content_scoring rates as content (menus,
+footers and cookie banners are dropped); it falls back to the backend when
+scoring keeps nothing. With dedup enabled, repeated texts (a headline in its heading,
+link and teaser) are removed before truncation (see text_dedup).
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Type
+import logging
+import re
+
+from bs4 import BeautifulSoup
+
+from content_scoring import ContentScorer, ScoringReport
+from text_blocks import iter_text_blocks
+from text_dedup import DedupReport, dedup_texts
+
+logger = logging.getLogger(__name__)
+
+
+# Elements removed before the content container is picked (their text never reaches the LLM)
+REMOVED_TAGS = (
+    'script', 'style', 'meta', 'link', 'noscript', 'iframe', 'svg',
+    'form', 'input', 'button', 'select', 'textarea',
+)
+
+# Main content containers, most specific first
+CONTENT_SELECTORS = [
+    'main',
+    'div[class*="news"]',
+    'div[class*="article"]',
+    'section[class*="news"]',
+    'div[id*="news"]',
+    'div[class*="content"]',
+    'body'
+]
+
+# Backends only synthesize <body>; without a literal one the whole document is used
+BODY_TAG_RE = re.compile(r'<body[\s/>]', re.IGNORECASE)
+
+CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]')
+
+# Free models support up to ~100k tokens; gazeta.ru-like homepages have 10-30+ articles
+DEFAULT_MAX_CHARS = 80000
+
+# Content scoring reads at most this many times max_chars of page text
+SCORING_SCAN_FACTOR = 4
+
+
+def normalize_text(text: str, max_chars: int = DEFAULT_MAX_CHARS) -> str:
+    """Strip control characters and blank lines, then truncate to max_chars.
+
+    Args:
+        text: Newline-separated text of the content container
+        max_chars: Length limit of the result (before the truncation note)
+
+    Returns:
+        Normalized text
+    """
+    # Remove control characters except newline and tab (they break JSON in the LLM response)
+    text = CONTROL_CHARS_RE.sub('', text)
+    text = '\n'.join(line.strip() for line in text.split('\n') if line.strip())
+
+    if len(text) > max_chars:
+        logger.info(f"Text truncated from {len(text)} to {max_chars} chars to fit LLM limits")
+        text = text[:max_chars] + f"\n\n[Content truncated - showing first {max_chars} characters]"
+    else:
+        logger.debug(f"Text length: {len(text)} chars (within {max_chars} limit)")
+    return text
+
+
+class ParserBackend(ABC):
+    """Extracts the text of a page's main content container."""
+
+    name = ""
+
+    @abstractmethod
+    def main_text(self, html_content: str, max_chars: Optional[int] = None) -> str:
+        """Text strings of the main content container, stripped and newline-joined.
+
+        Args:
+            html_content: Raw HTML
+            max_chars: Length the caller will truncate to; backends that read
+                incrementally may stop once they have more than this
+
+        Returns:
+            Text of the first CONTENT_SELECTORS match (whole document if none matches)
+        """
+
+
+class HtmlParserBackend(ParserBackend):
+    """BeautifulSoup with html.parser: the reference behaviour."""
+
+    name = "html.parser"
+
+    def main_text(self, html_content: str, max_chars: Optional[int] = None) -> str:
+        soup = BeautifulSoup(html_content, 'html.parser')
+        for tag in soup(list(REMOVED_TAGS)):
+            tag.decompose()
+
+        for selector in CONTENT_SELECTORS:
+            main_content = soup.select_one(selector)
+            if main_content:
+                logger.debug(f"Found main content using selector: {selector}")
+                return main_content.get_text(separator='\n', strip=True)
+        return soup.get_text(separator='\n', strip=True)
+
+
+class LxmlBackend(ParserBackend):
+    """libxml2 HTML parser through lxml."""
+
+    name = "lxml"
+
+    # XPath equivalents of CONTENT_SELECTORS
+    XPATHS = {
+        'main': '//main',
+        'div[class*="news"]': '//div[contains(@class, "news")]',
+        'div[class*="article"]': '//div[contains(@class, "article")]',
+        'section[class*="news"]': '//section[contains(@class, "news")]',
+        'div[id*="news"]': '//div[contains(@id, "news")]',
+        'div[class*="content"]': '//div[contains(@class, "content")]',
+        'body': '//body',
+    }
+
+    def __init__(self):
+        import lxml.html
+        from lxml import etree
+
+        self._html = lxml.html
+        self._etree = etree
+        self._queries = [(selector, etree.XPath(f"({self.XPATHS[selector]})[1]")) for selector in CONTENT_SELECTORS]
+
+    def main_text(self, html_content: str, max_chars: Optional[int] = None) -> str:
+        etree = self._etree
+        doc = self._html.document_fromstring(html_content)
+
+        removed = (*REMOVED_TAGS, etree.Comment, etree.ProcessingInstruction)
+        for node in doc.iter(*removed):
+            # Removal merges the tail into the preceding text; keep the string boundary
+            if node.tail:
+                node.tail = '\n' + node.tail
+        etree.strip_elements(doc, *removed, with_tail=False)
+
+        has_body = BODY_TAG_RE.search(html_content) is not None
+        for selector, query in self._queries:
+            if selector == 'body' and not has_body:
+                break
+            found = query(doc)
+            if found:
+                logger.debug(f"Found main content using selector: {selector}")
+                return '\n'.join(s.strip() for s in found[0].itertext() if s.strip())
+        return '\n'.join(s.strip() for s in doc.itertext() if s.strip())
+
+
+class LexborBackend(ParserBackend):
+    """selectolax's lexbor HTML5 parser."""
+
+    name = "lexbor"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._parser = LexborHTMLParser
+
+    def main_text(self, html_content: str, max_chars: Optional[int] = None) -> str:
+        tree = self._parser(html_content)
+        tree.strip_tags(list(REMOVED_TAGS))
+
+        has_body = BODY_TAG_RE.search(html_content) is not None
+        for selector in CONTENT_SELECTORS:
+            if selector == 'body' and not has_body:
+                break
+            found = tree.css_first(selector)
+            if found is not None:
+                logger.debug(f"Found main content using selector: {selector}")
+                return found.text(separator='\n', strip=True)
+        return tree.root.text(separator='\n', strip=True) if tree.root is not None else ''
+
+
+class StreamingBackend(ParserBackend):
+    """Incremental html.parser tokenizer from text_blocks (stdlib only, no parse tree).
+
+    Every CONTENT_SELECTORS candidate (the first element matching each selector)
+    collects its lines while the page streams past, up to max_chars each. Elements
+    without any text are never candidates, and badly nested markup can produce a
+    different container than the tree-building backends.
+    """
+
+    name = "streaming"
+
+    # Predicates equivalent to CONTENT_SELECTORS
+    MATCHERS = {
+        'main': lambda node: node.tag == 'main',
+        'div[class*="news"]': lambda node: node.tag == 'div' and 'news' in node.classes,
+        'div[class*="article"]': lambda node: node.tag == 'div' and 'article' in node.classes,
+        'section[class*="news"]': lambda node: node.tag == 'section' and 'news' in node.classes,
+        'div[id*="news"]': lambda node: node.tag == 'div' and 'news' in node.id,
+        'div[class*="content"]': lambda node: node.tag == 'div' and 'content' in node.classes,
+        'body': lambda node: node.tag == 'body',
+    }
+
+    def main_text(self, html_content: str, max_chars: Optional[int] = None) -> str:
+        matchers = [self.MATCHERS[selector] for selector in CONTENT_SELECTORS]
+        # One line buffer per selector plus one for the whole document (the last)
+        serials: List[Optional[int]] = [None] * len(matchers)
+        lines: List[List[str]] = [[] for _ in range(len(matchers) + 1)]
+        sizes = [0] * (len(matchers) + 1)
+        done = [False] * (len(matchers) + 1)
+
+        for block in iter_text_blocks(html_content, skipped_tags=REMOVED_TAGS):
+            block_lines = [
+                line.strip()
+                for text in block.lines
+                for line in CONTROL_CHARS_RE.sub('', text).split('\n')
+                if line.strip()
+            ]
+            in_path = {node.serial for node in block.path}
+            for index, matcher in enumerate(matchers):
+                if serials[index] is None:
+                    match = next((node for node in block.path if matcher(node)), None)
+                    serials[index] = match.serial if match is not None else None
+                if serials[index] is None or done[index]:
+                    continue
+                if serials[index] in in_path:
+                    self._extend(lines[index], sizes, index, block_lines, max_chars, done)
+                else:
+                    # Blocks arrive in document order: the container has ended
+                    done[index] = True
+            if not done[-1]:
+                self._extend(lines[-1], sizes, len(matchers), block_lines, max_chars, done)
+            if done[0]:
+                # "main" is complete and nothing later can outrank it
+                break
+
+        for index, selector in enumerate(CONTENT_SELECTORS):
+            if serials[index] is not None:
+                logger.debug(f"Found main content using selector: {selector}")
+                return '\n'.join(lines[index])
+        return '\n'.join(lines[-1])
+
+    @staticmethod
+    def _extend(target: List[str], sizes: List[int], index: int, new_lines: List[str],
+                max_chars: Optional[int], done: List[bool]) -> None:
+        for line in new_lines:
+            sizes[index] += len(line) + (1 if target else 0)
+            target.append(line)
+            if max_chars is not None and sizes[index] > max_chars:
+                # Enough for normalize_text to truncate (and add its note)
+                done[index] = True
+                return
+
+
+BACKENDS: Dict[str, Type[ParserBackend]] = {
+    'lexbor': LexborBackend,
+    'lxml': LxmlBackend,
+    'streaming': StreamingBackend,
+    'html.parser': HtmlParserBackend,
+}
+
+
+def available_backends() -> List[str]:
+    """Names of the backends whose parser library is installed, fastest first."""
+    names = []
+    for name, backend in BACKENDS.items():
+        try:
+            backend()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_backend(name: str = "auto") -> ParserBackend:
+    """Create a parser backend.
+
+    Args:
+        name: Backend name from BACKENDS, or "auto" for the fastest installed one
+
+    Returns:
+        ParserBackend instance
+
+    Raises:
+        ValueError: If the backend is unknown
+        ImportError: If the named backend's library is not installed
+    """
+    if name == "auto":
+        for backend in BACKENDS.values():
+            try:
+                return backend()
+            except ImportError:
+                continue
+    if name not in BACKENDS:
+        raise ValueError(f"Invalid HTML parser: {name} (expected 'auto' or one of {tuple(BACKENDS)})")
+    return BACKENDS[name]()
+
+
+@dataclass
+class CleanResult:
+    """Cleaned text with the reports of the stages that ran on it."""
+
+    text: str
+    scoring: Optional[ScoringReport] = None  # Set when content scoring produced the text
+    dedup: Optional[DedupReport] = None  # Set when dedup is enabled
+
+
+class HtmlCleaner:
+    """Cleans scraped HTML into LLM input text with a pluggable parser backend."""
+
+    def __init__(
+        self,
+        backend: str = "auto",
+        max_chars: int = DEFAULT_MAX_CHARS,
+        content_scoring: bool = False,
+        dedup: bool = False
+    ):
+        """Initialize the cleaner.
+
+        Args:
+            backend: Parser backend name (see get_backend)
+            max_chars: Length limit of the cleaned text
+            content_scoring: Keep only the blocks content_scoring rates as content
+            dedup: Drop repeated texts before truncation (see text_dedup)
+        """
+        self.backend = get_backend(backend)
+        self.reference: Optional[ParserBackend] = None if isinstance(self.backend, HtmlParserBackend) else HtmlParserBackend()
+        self.max_chars = max_chars
+        # Shared by concurrent extractions: per-page reports are returned, never stored here
+        self.scorer: Optional[ContentScorer] = ContentScorer() if content_scoring else None
+        self.dedup = dedup
+        logger.info(
+            f"HtmlCleaner initialized (backend={self.backend.name}, max_chars={max_chars}, "
+            f"content_scoring={content_scoring}, dedup={dedup})"
+        )
+
+    def scored_text(self, html_content: str) -> Tuple[str, ScoringReport]:
+        """Text of the body blocks that content scoring keeps, one string per line.
+
+        Args:
+            html_content: Raw HTML
+
+        Returns:
+            Newline-joined text (not yet normalized) and the ScoringReport
+        """
+        blocks = [
+            block for block in iter_text_blocks(
+                html_content, max_chars=self.max_chars * SCORING_SCAN_FACTOR, skipped_tags=REMOVED_TAGS
+            )
+            if not any(node.tag == 'head' for node in block.path)
+        ]
+        kept, report = self.scorer.select(blocks)
+        logger.info(
+            f"Content scoring kept {report.blocks_kept}/{report.blocks_total} blocks, "
+            f"{report.chars_before} -> {report.chars_after} chars"
+        )
+        return '\n'.join(line for block in kept for line in block.lines), report
+
+    def clean(self, html_content: str) -> str:
+        """Clean HTML to reduce token usage and improve extraction.
+
+        Args:
+            html_content: Raw HTML content
+
+        Returns:
+            Cleaned text of the main content only
+        """
+        return self.clean_with_reports(html_content).text
+
+    def clean_with_reports(self, html_content: str) -> CleanResult:
+        """Clean HTML like clean() and also return the reports of this page.
+
+        Args:
+            html_content: Raw HTML content
+
+        Returns:
+            CleanResult with the cleaned text, the ScoringReport (when scoring was used)
+            and the DedupReport (when dedup is enabled)
+        """
+        if self.scorer is not None:
+            try:
+                text, report = self.scored_text(html_content)
+                if text:
+                    text, dedup_report = self._dedup(text)
+                    return CleanResult(normalize_text(text, self.max_chars), scoring=report, dedup=dedup_report)
+                logger.warning("Content scoring kept no text, using the content container")
+            except Exception as e:
+                logger.warning(f"Content scoring failed ({str(e)}), using the content container")
+
+        try:
+            try:
+                text = self.backend.main_text(html_content, self.max_chars)
+            except Exception as e:
+                if self.reference is None:
+                    raise
+                logger.warning(f"{self.backend.name} failed to clean HTML ({str(e)}), using html.parser")
+                text = self.reference.main_text(html_content)
+            text, dedup_report = self._dedup(text)
+            return CleanResult(normalize_text(text, self.max_chars), dedup=dedup_report)
+
+        except Exception as e:
+            logger.warning(f"Error cleaning HTML: {str(e)}, using original content")
+            # Fallback to simple text extraction
+            return CleanResult(html_content[:20000])
+
+    def _dedup(self, text: str) -> Tuple[str, Optional[DedupReport]]:
+        """Drop repeated lines when dedup is enabled.
+
+        Returns:
+            The text and its DedupReport (None when dedup is disabled)
+        """
+        if not self.dedup:
+            return text, None
+        lines = (line.strip() for line in text.split('\n'))
+        kept, report = dedup_texts((line for line in lines if line), max_chars=self.max_chars)
+        if report.duplicate_chars:
+            logger.info(
+                f"Dedup removed {report.duplicate_chars} duplicate chars "
+                f"({report.texts_before - report.texts_after} texts)"
+            )
+        return '\n'.join(kept), report
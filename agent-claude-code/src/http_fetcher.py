@@ -0,0 +1,259 @@
+"""HTTP Fetcher Module
+
+This module provides the fast, browser-free fetch path. Many news homepages
+render their headlines server-side; for those a plain HTTP GET returns
+everything the LLM needs at a fraction of the cost of a Chromium page.
+"""
+
+from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from urllib.parse import urlparse
+import logging
+import html as html_lib
+import re
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+# Same heuristics as the headline candidates used for extraction:
+# headings with more than 20 characters, links with more than 30
+_HEADING_RE = re.compile(r'<h[1-3]\b[^>]*>(.*?)</h[1-3]\s*>', re.IGNORECASE | re.DOTALL)
+_LINK_RE = re.compile(r'<a\b[^>]*>(.*?)</a\s*>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+_SPACE_RE = re.compile(r'\s+')
+
+# <meta charset="..."> or <meta http-equiv="Content-Type" content="text/html; charset=...">
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([A-Za-z0-9_.:-]+)', re.IGNORECASE)
+_HEADER_CHARSET_RE = re.compile(r'charset\s*=', re.IGNORECASE)
+META_SNIFF_BYTES = 4096
+
+
+def _node_text(fragment: str) -> str:
+    """Strip inner tags and entities from an HTML fragment."""
+    return _SPACE_RE.sub(' ', html_lib.unescape(_TAG_RE.sub(' ', fragment))).strip()
+
+
+def count_headline_candidates(html_content: str) -> int:
+    """Count headline-like nodes in raw (non-rendered) HTML.
+
+    Args:
+        html_content: HTML as returned by the server
+
+    Returns:
+        Number of headings longer than 20 chars plus links longer than 30 chars
+    """
+    headings = sum(1 for match in _HEADING_RE.finditer(html_content) if len(_node_text(match.group(1))) > 20)
+    links = sum(1 for match in _LINK_RE.finditer(html_content) if len(_node_text(match.group(1))) > 30)
+    return headings + links
+
+
+def decode_html(response: requests.Response) -> str:
+    """Decode an HTML response body.
+
+    requests falls back to ISO-8859-1 for text/html without a charset in the
+    Content-Type header, which garbles UTF-8 pages (Cyrillic news sites often
+    send no charset). Without a header charset the encoding is taken from the
+    page's <meta> charset, else UTF-8 if the body is valid UTF-8, else guessed
+    from the content.
+
+    Args:
+        response: Response with the HTML body
+
+    Returns:
+        The decoded HTML
+    """
+    if _HEADER_CHARSET_RE.search(response.headers.get('Content-Type', '')):
+        return response.text
+    content = response.content
+    match = _META_CHARSET_RE.search(content[:META_SNIFF_BYTES])
+    if match:
+        try:
+            return content.decode(match.group(1).decode('ascii'), errors='replace')
+        except LookupError:
+            logger.debug("Unknown meta charset %r, ignoring", match.group(1))
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        return content.decode(response.apparent_encoding or 'utf-8', errors='replace')
+
+
+@dataclass
+class StaticFetchResult:
+    """Outcome of a plain HTTP fetch."""
+
+    url: str
+    status: int
+    html: str = ""
+    candidates: int = 0
+    sufficient: bool = False
+    not_modified: bool = False
+    retry_after: Optional[str] = None
+
+
+@dataclass
+class _CachedPage:
+    """Validators and body of the last usable response for a URL."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    html: str
+    candidates: int
+
+
+class HttpFetcher:
+    """Plain HTTP fetcher with per-domain "static OK" / "needs JS" memory.
+
+    Features:
+    - Pooled keep-alive connections (requests.Session)
+    - Compressed transfers (gzip/deflate, brotli when available)
+    - Headline candidate check on the static HTML
+    - Per-domain decision cache with TTL, so JS-only sites skip straight to the browser
+    - ETag / Last-Modified revalidation (304 responses reuse the cached body)
+    """
+
+    STATIC = "static"
+    NEEDS_JS = "needs_js"
+
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+    }
+
+    def __init__(
+        self,
+        timeout: float = 15.0,
+        min_candidates: int = 10,
+        decision_ttl: float = 6 * 3600,
+        pool_size: int = 20,
+        max_cached_pages: int = 128
+    ):
+        """Initialize the HTTP fetcher.
+
+        Args:
+            timeout: Request timeout in seconds
+            min_candidates: Headline candidates needed to accept the static HTML
+            decision_ttl: Seconds a per-domain decision is remembered
+            pool_size: Maximum pooled connections per host
+            max_cached_pages: Pages kept for conditional GET revalidation
+        """
+        self.timeout = timeout
+        self.min_candidates = min_candidates
+        self.decision_ttl = decision_ttl
+        self.max_cached_pages = max_cached_pages
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        self._decisions: Dict[str, Tuple[str, float]] = {}
+        self._pages: "OrderedDict[str, _CachedPage]" = OrderedDict()
+        self._lock = threading.Lock()
+        logger.info(f"HttpFetcher initialized (timeout={timeout}s, min_candidates={min_candidates})")
+
+    @staticmethod
+    def _domain(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def get_decision(self, url: str) -> Optional[str]:
+        """Get the remembered decision for the URL's domain, if still valid.
+
+        Args:
+            url: Any URL on the domain
+
+        Returns:
+            STATIC, NEEDS_JS or None if unknown/expired
+        """
+        domain = self._domain(url)
+        with self._lock:
+            entry = self._decisions.get(domain)
+            if entry is None:
+                return None
+            decision, decided_at = entry
+            if time.monotonic() - decided_at > self.decision_ttl:
+                del self._decisions[domain]
+                return None
+            return decision
+
+    def remember(self, url: str, decision: str):
+        """Store the decision for the URL's domain."""
+        domain = self._domain(url)
+        with self._lock:
+            previous = self._decisions.get(domain, (None, 0))[0]
+            self._decisions[domain] = (decision, time.monotonic())
+        if previous != decision:
+            logger.info("Domain %s marked as %s", domain, decision)
+
+    def fetch(self, url: str) -> StaticFetchResult:
+        """Fetch a URL over plain HTTP and judge whether the HTML is sufficient.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            StaticFetchResult (sufficient=False means the browser is needed)
+
+        Raises:
+            requests.RequestException: On network errors
+        """
+        start = time.monotonic()
+        with self._lock:
+            cached = self._pages.get(url)
+
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+
+        response = self.session.get(url, timeout=self.timeout, headers=headers)
+        result = StaticFetchResult(url=url, status=response.status_code)
+
+        if response.status_code == 304 and cached is not None:
+            result.html = cached.html
+            result.candidates = cached.candidates
+            result.sufficient = cached.candidates >= self.min_candidates
+            result.not_modified = True
+            logger.info("Static fetch of %s: not modified (304) in %.2fs", url, time.monotonic() - start)
+            return result
+
+        if response.status_code == 429:
+            result.retry_after = response.headers.get('Retry-After')
+
+        content_type = response.headers.get('Content-Type', '')
+        if response.status_code != 200 or 'html' not in content_type.lower():
+            logger.info("Static fetch of %s not usable (status=%d, type=%s)", url, response.status_code, content_type)
+            return result
+
+        result.html = decode_html(response)
+        result.candidates = count_headline_candidates(result.html)
+        result.sufficient = result.candidates >= self.min_candidates
+        logger.info(
+            "Static fetch of %s: %d chars, %d headline candidates in %.2fs (sufficient=%s)",
+            url, len(result.html), result.candidates, time.monotonic() - start, result.sufficient
+        )
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if result.sufficient and (etag or last_modified):
+            self._cache_page(url, _CachedPage(etag, last_modified, result.html, result.candidates))
+        return result
+
+    def _cache_page(self, url: str, page: _CachedPage):
+        """Keep the page for revalidation, evicting the least recently fetched."""
+        with self._lock:
+            self._pages[url] = page
+            self._pages.move_to_end(url)
+            while len(self._pages) > self.max_cached_pages:
+                self._pages.popitem(last=False)
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
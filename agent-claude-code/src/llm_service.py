@@ -10,7 +10,8 @@ import logging
 import json
 import time
 import requests
-from bs4 import BeautifulSoup
+
+from html_cleaner import HtmlCleaner
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +58,10 @@ class OpenRouterService:
         api_key: str,
         model: str = "qwen/qwen3-coder:free",
         max_retries: int = 3,
-        timeout: int = 120
+        timeout: int = 120,
+        html_parser: str = "auto",
+        content_scoring: bool = False,
+        text_dedup: bool = False
     ):
         """Initialize the OpenRouter service.
 
@@ -66,9 +70,12 @@ class OpenRouterService:
             model: Model identifier to use for extraction
             max_retries: Maximum number of retry attempts
             timeout: Request timeout in seconds
+            html_parser: HTML cleaning backend ("auto", "lexbor", "lxml", "streaming" or "html.parser")
+            content_scoring: Drop boilerplate blocks (menus, footers, banners) from the LLM input
+            text_dedup: Drop repeated headlines and teasers from the LLM input
 
         Raises:
-            ValueError: If API key is invalid or missing
+            ValueError: If API key is invalid or missing, or html_parser is unknown
         """
         # Validate API key
         if not api_key:
@@ -93,7 +100,8 @@ class OpenRouterService:
         self.api_url = "https://openrouter.ai/api/v1/chat/completions"
         self.max_retries = max_retries
         self.timeout = timeout
-        logger.info(f"OpenRouterService initialized with model: {model}")
+        self.html_cleaner = HtmlCleaner(html_parser, content_scoring=content_scoring, dedup=text_dedup)
+        logger.info(f"OpenRouterService initialized with model: {model}, html_parser: {self.html_cleaner.backend.name}")
 
     def extract_news(self, html_content: str, url: str) -> List[NewsItem]:
         """Extract news items from HTML content using LLM.
@@ -146,69 +154,9 @@ class OpenRouterService:
             html_content: Raw HTML content
 
         Returns:
-            Cleaned HTML with main content only
+            Cleaned text with main content only
         """
-        try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-
-            # Remove unwanted elements
-            for tag in soup(['script', 'style', 'meta', 'link', 'noscript', 'iframe', 'svg']):
-                tag.decompose()
-
-            # Remove comments
-            for comment in soup.find_all(string=lambda text: isinstance(text, str) and text.strip().startswith('<!--')):
-                comment.extract()
-
-            # Remove form elements and inputs (often have malformed data)
-            for tag in soup(['form', 'input', 'button', 'select', 'textarea']):
-                tag.decompose()
-
-            # Get text with some structure preserved
-            # Try to find main content areas - prioritize news/article containers
-            main_content = None
-            for selector in [
-                'main',
-                'div[class*="news"]',
-                'div[class*="article"]',
-                'section[class*="news"]',
-                'div[id*="news"]',
-                'div[class*="content"]',
-                'body'
-            ]:
-                main_content = soup.select_one(selector)
-                if main_content:
-                    logger.debug(f"Found main content using selector: {selector}")
-                    break
-
-            if main_content:
-                # Get text with line breaks preserved
-                text = main_content.get_text(separator='\n', strip=True)
-            else:
-                text = soup.get_text(separator='\n', strip=True)
-
-            # Sanitize text to prevent JSON parsing issues
-            # Remove control characters except newline and tab
-            import re
-            text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]', '', text)
-
-            # Normalize whitespace
-            text = '\n'.join(line.strip() for line in text.split('\n') if line.strip())
-
-            # Increased limit to capture more news articles (free models support up to ~100k tokens)
-            # Gazeta.ru and similar sites may have 10-30+ articles on main page
-            max_chars = 80000
-            if len(text) > max_chars:
-                logger.info(f"Text truncated from {len(text)} to {max_chars} chars to fit LLM limits")
-                text = text[:max_chars] + "\n\n[Content truncated - showing first 80000 characters]"
-            else:
-                logger.debug(f"Text length: {len(text)} chars (within {max_chars} limit)")
-
-            return text
-
-        except Exception as e:
-            logger.warning(f"Error cleaning HTML: {str(e)}, using original content")
-            # Fallback to simple text extraction
-            return html_content[:20000]
+        return self.html_cleaner.clean(html_content)
 
     def _build_extraction_prompt(self, cleaned_html: str, url: str) -> str:
         """Build the prompt for news extraction.
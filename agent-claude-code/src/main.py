@@ -89,7 +89,32 @@ def load_config() -> dict:
     export_path = os.getenv('EXPORT_PATH', 'exports/')
     log_level = os.getenv('LOG_LEVEL', 'INFO')
     scraper_timeout = int(os.getenv('SCRAPER_TIMEOUT', '30000'))
+    context_pool_size = int(os.getenv('SCRAPER_CONTEXT_POOL_SIZE', '2'))
+    context_max_uses = int(os.getenv('SCRAPER_CONTEXT_MAX_USES', '20'))
+    block_resources = os.getenv('SCRAPER_BLOCK_RESOURCES', 'true').lower() == 'true'
+    http_first = os.getenv('SCRAPER_HTTP_FIRST', 'true').lower() == 'true'
+    extraction_mode = os.getenv('SCRAPER_EXTRACTION_MODE', 'html').lower()
+    capture_feeds = os.getenv('SCRAPER_CAPTURE_FEEDS', 'true').lower() == 'true'
+    discover_feeds = os.getenv('SCRAPER_DISCOVER_FEEDS', 'true').lower() == 'true'
+    recycle_after_pages = int(os.getenv('SCRAPER_RECYCLE_PAGES', '200'))
+    recycle_rss_mb = int(os.getenv('SCRAPER_RECYCLE_RSS_MB', '1024'))
+    browser_profile = os.getenv('SCRAPER_BROWSER_PROFILE', 'fast').lower()
+    browser_executable = os.getenv('SCRAPER_BROWSER_EXECUTABLE') or None
+    retry_budget_ratio = float(os.getenv('SCRAPER_RETRY_BUDGET_RATIO', '0.2'))
+    circuit_failure_threshold = int(os.getenv('SCRAPER_CIRCUIT_FAILURES', '3'))
+    circuit_cooldown = float(os.getenv('SCRAPER_CIRCUIT_COOLDOWN', '120'))
+    snapshot_dir = os.getenv('SNAPSHOT_DIR', 'data/snapshots') or None
+    snapshot_ttl = int(os.getenv('SNAPSHOT_TTL_SECONDS', '120'))
+    snapshot_max_mb = int(os.getenv('SNAPSHOT_MAX_MB', '200'))
+    browser_state_dir = os.getenv('BROWSER_STATE_DIR', 'data/browser_state') or None
+    browser_state_ttl = int(os.getenv('BROWSER_STATE_TTL_SECONDS', '86400'))
+    asset_cache_dir = os.getenv('ASSET_CACHE_DIR', 'data/asset_cache') or None
+    asset_cache_ttl = int(os.getenv('ASSET_CACHE_TTL_SECONDS', '43200'))
+    asset_cache_max_mb = int(os.getenv('ASSET_CACHE_MAX_MB', '200'))
     llm_model = os.getenv('OPENROUTER_MODEL', 'qwen/qwen3-coder:free')
+    html_parser = os.getenv('HTML_PARSER', 'auto').lower()
+    content_scoring = os.getenv('CONTENT_SCORING', 'false').lower() == 'true'
+    text_dedup = os.getenv('TEXT_DEDUP', 'false').lower() == 'true'
 
     config = {
         'api_key': api_key,
@@ -97,7 +122,32 @@ def load_config() -> dict:
         'export_path': export_path,
         'log_level': log_level,
         'scraper_timeout': scraper_timeout,
-        'llm_model': llm_model
+        'context_pool_size': context_pool_size,
+        'context_max_uses': context_max_uses,
+        'block_resources': block_resources,
+        'http_first': http_first,
+        'extraction_mode': extraction_mode,
+        'capture_feeds': capture_feeds,
+        'discover_feeds': discover_feeds,
+        'recycle_after_pages': recycle_after_pages,
+        'recycle_rss_mb': recycle_rss_mb,
+        'browser_profile': browser_profile,
+        'browser_executable': browser_executable,
+        'retry_budget_ratio': retry_budget_ratio,
+        'circuit_failure_threshold': circuit_failure_threshold,
+        'circuit_cooldown': circuit_cooldown,
+        'snapshot_dir': snapshot_dir,
+        'snapshot_ttl': snapshot_ttl,
+        'snapshot_max_mb': snapshot_max_mb,
+        'browser_state_dir': browser_state_dir,
+        'browser_state_ttl': browser_state_ttl,
+        'asset_cache_dir': asset_cache_dir,
+        'asset_cache_ttl': asset_cache_ttl,
+        'asset_cache_max_mb': asset_cache_max_mb,
+        'llm_model': llm_model,
+        'html_parser': html_parser,
+        'content_scoring': content_scoring,
+        'text_dedup': text_dedup
     }
 
     logger.info(f"Configuration loaded: db_path={db_path}, export_path={export_path}, log_level={log_level}, llm_model={llm_model}")
@@ -119,7 +169,29 @@ def initialize_services(config: dict) -> tuple:
     scraper = ScraperService(
         timeout=config['scraper_timeout'],
         headless=True,
-        max_retries=3
+        max_retries=3,
+        context_pool_size=config['context_pool_size'],
+        context_max_uses=config['context_max_uses'],
+        block_resources=config['block_resources'],
+        http_first=config['http_first'],
+        extraction_mode=config['extraction_mode'],
+        capture_feeds=config['capture_feeds'],
+        discover_feeds=config['discover_feeds'],
+        recycle_after_pages=config['recycle_after_pages'],
+        recycle_rss_mb=config['recycle_rss_mb'],
+        browser_profile=config['browser_profile'],
+        browser_executable=config['browser_executable'],
+        retry_budget_ratio=config['retry_budget_ratio'],
+        circuit_failure_threshold=config['circuit_failure_threshold'],
+        circuit_cooldown=config['circuit_cooldown'],
+        snapshot_dir=config['snapshot_dir'],
+        snapshot_ttl=config['snapshot_ttl'],
+        snapshot_max_bytes=config['snapshot_max_mb'] * 1024 * 1024,
+        storage_state_dir=config['browser_state_dir'],
+        storage_state_ttl=config['browser_state_ttl'],
+        asset_cache_dir=config['asset_cache_dir'],
+        asset_cache_ttl=config['asset_cache_ttl'],
+        asset_cache_max_bytes=config['asset_cache_max_mb'] * 1024 * 1024
     )
 
     # Initialize LLM service with FREE model
@@ -127,7 +199,10 @@ def initialize_services(config: dict) -> tuple:
         api_key=config['api_key'],
         model=config['llm_model'],
         max_retries=3,
-        timeout=120
+        timeout=120,
+        html_parser=config['html_parser'],
+        content_scoring=config['content_scoring'],
+        text_dedup=config['text_dedup']
     )
 
     # Initialize database
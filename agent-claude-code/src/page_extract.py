@@ -0,0 +1,161 @@
+"""In-Page Extraction Module
+
+This module collects headline records inside the browser instead of
+serializing the whole DOM with page.content(). A script picks the main
+content container with the same selectors as html_cleaner.CONTENT_SELECTORS,
+gathers headline/link/time/teaser records and returns a small JSON payload.
+The records are rendered into a compact HTML document, so the rest of the
+pipeline (fingerprint, snapshots, LLM cleaning) works unchanged.
+"""
+
+from typing import List, Optional
+from dataclasses import dataclass
+import html as html_lib
+import logging
+
+from playwright.async_api import Page
+
+logger = logging.getLogger(__name__)
+
+
+# Same container priority as html_cleaner.CONTENT_SELECTORS
+CONTAINER_SELECTORS = [
+    'main',
+    'div[class*="news"]',
+    'div[class*="article"]',
+    'section[class*="news"]',
+    'div[id*="news"]',
+    'div[class*="content"]',
+    'body'
+]
+
+# Headings longer than 20 chars and links longer than 30 chars, like the static candidate check
+EXTRACT_SCRIPT = """
+({ maxRecords, containerSelectors }) => {
+    const root = containerSelectors.map((s) => document.querySelector(s)).find(Boolean) || document.body;
+    if (!root) return [];
+    const clean = (t) => (t || '').replace(/\\s+/g, ' ').trim();
+    const skip = 'script, style, noscript, form, template';
+    const seen = new Set();
+    const records = [];
+
+    const add = (el, minLength) => {
+        if (el.closest(skip)) return;
+        const title = clean(el.textContent);
+        if (title.length <= minLength || seen.has(title)) return;
+        seen.add(title);
+
+        const link = el.tagName === 'A' ? el : (el.querySelector('a[href]') || el.closest('a[href]'));
+        const block = el.closest('article, li, [class*="news"], [class*="item"], [class*="card"]') || el.parentElement;
+        const timeEl = block ? block.querySelector('time') : null;
+        const teaserEl = block
+            ? Array.from(block.querySelectorAll('p')).find((p) => {
+                const text = clean(p.textContent);
+                return text.length > 40 && text !== title;
+            })
+            : null;
+
+        records.push({
+            title: title.slice(0, 500),
+            url: link && link.href ? link.href : '',
+            time: timeEl ? (timeEl.getAttribute('datetime') || clean(timeEl.textContent)) : '',
+            teaser: teaserEl ? clean(teaserEl.textContent).slice(0, 500) : ''
+        });
+    };
+
+    for (const el of root.querySelectorAll('h1, h2, h3')) {
+        if (records.length >= maxRecords) break;
+        add(el, 20);
+    }
+    for (const el of root.querySelectorAll('a')) {
+        if (records.length >= maxRecords) break;
+        // Links wrapping a heading were already recorded through the heading
+        if (el.querySelector('h1, h2, h3')) continue;
+        add(el, 30);
+    }
+    return records;
+}
+"""
+
+# Small text sample for anti-bot checks without serializing the DOM
+BOT_PROBE_SCRIPT = """
+() => {
+    const text = document.body ? document.body.innerText.slice(0, 20000) : '';
+    const marker = document.querySelector('#cf-browser-verification, .cf-browser-verification');
+    return (document.title || '') + '\\n' + text + (marker ? '\\ncf-browser-verification' : '');
+}
+"""
+
+
+@dataclass
+class PageRecord:
+    """A headline candidate collected inside the page."""
+
+    title: str
+    url: str = ""
+    time: str = ""
+    teaser: str = ""
+
+
+async def extract_page_records(page: Page, max_records: int = 200) -> List[PageRecord]:
+    """Collect headline records inside the page.
+
+    Args:
+        page: Loaded page
+        max_records: Maximum number of records returned
+
+    Returns:
+        Records in document order (headings first, then links)
+    """
+    data = await page.evaluate(EXTRACT_SCRIPT, {
+        'maxRecords': max_records,
+        'containerSelectors': CONTAINER_SELECTORS
+    })
+    records = [
+        PageRecord(
+            title=item.get('title', ''),
+            url=item.get('url', ''),
+            time=item.get('time', ''),
+            teaser=item.get('teaser', '')
+        )
+        for item in (data or [])
+        if isinstance(item, dict) and item.get('title')
+    ]
+    logger.debug(f"Extracted {len(records)} records in page")
+    return records
+
+
+async def probe_bot_text(page: Page) -> str:
+    """Get the page title and visible text sample used for anti-bot checks."""
+    text = await page.evaluate(BOT_PROBE_SCRIPT)
+    return text if isinstance(text, str) else ""
+
+
+def render_records_html(records: List[PageRecord], url: Optional[str] = None) -> str:
+    """Render records as a compact HTML document.
+
+    Args:
+        records: Records from extract_page_records
+        url: Source URL (kept as <base> for relative links)
+
+    Returns:
+        HTML with one <article> per record
+    """
+    escape = html_lib.escape
+    parts = ['<html><head>']
+    if url:
+        parts.append(f'<base href="{escape(url)}">')
+    parts.append('</head><body><main>')
+    for record in records:
+        parts.append('<article>')
+        if record.url:
+            parts.append(f'<h2><a href="{escape(record.url)}">{escape(record.title)}</a></h2>')
+        else:
+            parts.append(f'<h2>{escape(record.title)}</h2>')
+        if record.time:
+            parts.append(f'<time datetime="{escape(record.time)}">{escape(record.time)}</time>')
+        if record.teaser:
+            parts.append(f'<p>{escape(record.teaser)}</p>')
+        parts.append('</article>')
+    parts.append('</main></body></html>')
+    return '\n'.join(parts)
@@ -0,0 +1,85 @@
+"""Page Fingerprint Module
+
+This module computes a normalized fingerprint of a page's visible content.
+Volatile parts (timestamps, counters, ad slots) are removed first, so two
+scrapes of a homepage whose news did not change produce the same fingerprint
+and the LLM extraction can be skipped.
+"""
+
+import hashlib
+import logging
+import re
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+
+# Elements that never carry headlines
+_NOISE_TAGS = ['script', 'style', 'meta', 'link', 'noscript', 'iframe', 'svg', 'ins', 'template']
+
+# class/id tokens used for ad slots and banners
+_AD_SLOT_RE = re.compile(
+    r'(^|[-_\s])(ad|ads|adv|advert|advertisement|banner|sponsor|sponsored|promo|adfox|begun)([-_\s\d]|$)',
+    re.IGNORECASE
+)
+
+# 12:45, 12:45:10, 2025-10-07, 07.10.2025, 07/10/25
+_TIME_RE = re.compile(r'\b\d{1,2}:\d{2}(:\d{2})?\b')
+_DATE_RE = re.compile(r'\b\d{1,4}[-./]\d{1,2}[-./]\d{1,4}\b')
+# Remaining numbers are counters (views, comments, "5 minutes ago")
+_NUMBER_RE = re.compile(r'\d+([.,]\d+)*')
+
+
+def _is_ad_slot(tag) -> bool:
+    """Check whether an element's class or id marks it as an ad slot."""
+    if tag.attrs is None:
+        return False
+    classes = tag.get('class') or []
+    names = ' '.join(classes) if isinstance(classes, list) else str(classes)
+    names = f"{names} {tag.get('id') or ''}"
+    return bool(_AD_SLOT_RE.search(names))
+
+
+def normalize_page_text(html_content: str) -> str:
+    """Extract the page's visible text with volatile parts removed.
+
+    Args:
+        html_content: Page HTML
+
+    Returns:
+        Sorted unique text lines, so rotating blocks do not change the result
+    """
+    soup = BeautifulSoup(html_content, 'html.parser')
+
+    for tag in soup(_NOISE_TAGS):
+        tag.decompose()
+    for tag in soup.find_all(_is_ad_slot):
+        tag.decompose()
+
+    lines = set()
+    for line in soup.get_text(separator='\n').split('\n'):
+        line = _TIME_RE.sub('', line)
+        line = _DATE_RE.sub('', line)
+        line = _NUMBER_RE.sub('#', line)
+        line = ' '.join(line.split()).lower()
+        # Lines that were only numbers/punctuation carry no news
+        if any(ch.isalpha() for ch in line):
+            lines.add(line)
+
+    return '\n'.join(sorted(lines))
+
+
+def compute_fingerprint(html_content: str) -> str:
+    """Compute the normalized content fingerprint of a page.
+
+    Args:
+        html_content: Page HTML
+
+    Returns:
+        Hex SHA-256 digest of the normalized page text
+    """
+    normalized = normalize_page_text(html_content)
+    fingerprint = hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+    logger.debug(f"Page fingerprint {fingerprint[:12]} over {len(normalized)} chars of normalized text")
+    return fingerprint
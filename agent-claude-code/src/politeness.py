@@ -0,0 +1,203 @@
+"""Politeness Scheduler Module
+
+This module spaces out requests per domain. Every request to a domain takes
+a token from that domain's bucket and respects a minimum spacing after the
+previous request; rate-limit responses (429 with Retry-After) and failed
+attempts push the domain's next slot further out. Domains are independent,
+so requests to different sites go out back to back.
+
+One logical scrape may send several requests to its domain (feed discovery,
+the static fetch, the browser load). A PolitenessTurn passed to acquire()
+makes only the first of them wait; the follow-ups reuse the turn until a
+backoff ends it.
+"""
+
+from typing import Dict, Optional, Set
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+import asyncio
+import logging
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitedError(RuntimeError):
+    """Raised when a site answers 429; carries the parsed Retry-After delay."""
+
+    def __init__(self, message: str = "Rate limited", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+
+    Returns:
+        Delay in seconds (never negative) or None if missing/invalid
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class _DomainState:
+    """Token bucket and next allowed request time of one domain."""
+
+    tokens: float
+    updated_at: float
+    next_allowed: float = 0.0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+@dataclass
+class PolitenessTurn:
+    """Domains one scrape has already waited for."""
+
+    domains: Set[str] = field(default_factory=set)
+    backed_off: Set[str] = field(default_factory=set)  # Domains whose next wait is a backoff
+    backoff_waited: float = 0.0  # Seconds actually spent waiting out backoffs
+
+
+class PolitenessScheduler:
+    """Per-domain token bucket scheduler shared by concurrent scrapes.
+
+    Features:
+    - Token bucket per domain (sustained rate with a small burst)
+    - Minimum spacing (plus jitter) between requests to the same domain
+    - Retry-After and exponential backoff applied to the whole domain
+    - No waiting across domains
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = 0.5,
+        burst: int = 2,
+        min_interval: float = 1.0,
+        jitter: float = 0.5,
+        max_backoff: float = 30.0,
+        max_retry_after: float = 300.0
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            rate_per_second: Sustained requests per second per domain
+            burst: Bucket capacity (requests allowed back to back after idle time)
+            min_interval: Minimum seconds between two requests to the same domain
+            jitter: Random extra spacing added after each request (seconds, upper bound)
+            max_backoff: Cap on the exponential backoff after failed attempts
+            max_retry_after: Cap on honoured Retry-After delays
+        """
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self._domains: Dict[str, _DomainState] = {}
+
+    @staticmethod
+    def _domain(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def _state(self, domain: str) -> _DomainState:
+        state = self._domains.get(domain)
+        if state is None:
+            state = _DomainState(tokens=float(self.burst), updated_at=time.monotonic())
+            self._domains[domain] = state
+        return state
+
+    def _refill(self, state: _DomainState, now: float):
+        state.tokens = min(self.burst, state.tokens + (now - state.updated_at) * self.rate_per_second)
+        state.updated_at = now
+
+    async def acquire(self, url: str, turn: Optional[PolitenessTurn] = None) -> float:
+        """Wait until a request to the URL's domain is allowed.
+
+        Args:
+            url: URL about to be requested
+            turn: The scrape's turn; no wait if it already holds the domain
+
+        Returns:
+            Seconds spent waiting
+        """
+        domain = self._domain(url)
+        if turn is not None and domain in turn.domains:
+            return 0.0
+        state = self._state(domain)
+        start = time.monotonic()
+
+        # Waiters of one domain queue up in order; other domains are not affected
+        async with state.lock:
+            while True:
+                now = time.monotonic()
+                self._refill(state, now)
+                token_wait = 0.0 if state.tokens >= 1 else (1 - state.tokens) / self.rate_per_second
+                wait = max(state.next_allowed - now, token_wait)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+
+            state.tokens -= 1
+            state.next_allowed = now + self.min_interval + random.uniform(0, self.jitter)
+
+        waited = time.monotonic() - start
+        if turn is not None:
+            turn.domains.add(domain)
+            if domain in turn.backed_off:
+                turn.backed_off.discard(domain)
+                turn.backoff_waited += waited
+        if waited > 0.01:
+            logger.debug(f"Politeness wait for {domain}: {waited:.2f}s")
+        return waited
+
+    def backoff(
+        self,
+        url: str,
+        attempt: int,
+        retry_after: Optional[float] = None,
+        turn: Optional[PolitenessTurn] = None
+    ) -> float:
+        """Push back the next request to the URL's domain after a failed attempt.
+
+        Only the domain's next slot moves; the delay is spent by whoever
+        acquires the domain next.
+
+        Args:
+            url: URL whose request failed
+            attempt: Attempt number (1-based) for the exponential delay
+            retry_after: Server-provided delay from a 429 response (takes precedence)
+            turn: The failed scrape's turn; it gives up the domain so its retry waits
+
+        Returns:
+            Delay in seconds applied to the domain
+        """
+        if retry_after is not None:
+            delay = min(retry_after, self.max_retry_after)
+        else:
+            delay = min(2 ** attempt, self.max_backoff) + random.uniform(0, 1)
+
+        domain = self._domain(url)
+        state = self._state(domain)
+        state.next_allowed = max(state.next_allowed, time.monotonic() + delay)
+        if turn is not None:
+            turn.domains.discard(domain)
+            turn.backed_off.add(domain)
+        logger.info(f"Backing off {domain} for {delay:.2f} seconds")
+        return delay
@@ -0,0 +1,120 @@
+"""Content Readiness Module
+
+This module decides when a page is ready to be captured. Instead of fixed
+sleeps, a script running inside the page watches DOM mutations and the
+number of headline nodes, and resolves as soon as the DOM has been quiet
+for a configurable window (or a hard cap is reached).
+"""
+
+from dataclasses import dataclass
+import logging
+import asyncio
+import time
+
+from playwright.async_api import Page
+
+logger = logging.getLogger(__name__)
+
+
+# Nodes counted as "headline candidates" while waiting for content
+HEADLINE_SELECTOR = 'h1, h2, h3, article'
+
+# Resolves once no mutation / headline count change happened for quietMs, or after maxWaitMs
+READINESS_SCRIPT = """
+({ quietMs, maxWaitMs, selector }) => new Promise((resolve) => {
+    const start = performance.now();
+    let lastChange = start;
+    let mutations = 0;
+    const countHeadlines = () => document.querySelectorAll(selector).length;
+    let headlines = countHeadlines();
+
+    const observer = new MutationObserver((records) => {
+        mutations += records.length;
+        lastChange = performance.now();
+    });
+    observer.observe(document.documentElement || document, {
+        childList: true,
+        subtree: true,
+        characterData: true
+    });
+
+    const timer = setInterval(() => {
+        const now = performance.now();
+        const current = countHeadlines();
+        if (current !== headlines) {
+            headlines = current;
+            lastChange = now;
+        }
+        const quiet = now - lastChange >= quietMs;
+        if (quiet || now - start >= maxWaitMs) {
+            clearInterval(timer);
+            observer.disconnect();
+            resolve({
+                elapsedMs: Math.round(now - start),
+                mutations: mutations,
+                headlineCount: headlines,
+                timedOut: !quiet
+            });
+        }
+    }, Math.max(25, Math.min(100, quietMs / 2)));
+})
+"""
+
+
+@dataclass
+class ReadinessResult:
+    """Outcome of waiting for page content to settle."""
+
+    elapsed_ms: int = 0
+    mutations: int = 0
+    headline_count: int = 0
+    timed_out: bool = False
+
+
+async def wait_for_content_ready(
+    page: Page,
+    quiet_ms: int = 500,
+    max_wait_ms: int = 5000,
+    headline_selector: str = HEADLINE_SELECTOR
+) -> ReadinessResult:
+    """Wait until the page DOM has been quiet for `quiet_ms`, up to `max_wait_ms`.
+
+    Args:
+        page: Page to watch
+        quiet_ms: Required window without DOM mutations or headline count changes
+        max_wait_ms: Hard cap on the wait
+        headline_selector: CSS selector for headline candidate nodes
+
+    Returns:
+        ReadinessResult describing how long the wait took and why it ended
+    """
+    start = time.monotonic()
+    try:
+        # Python-side guard in case the page script never resolves (e.g. frozen renderer)
+        data = await asyncio.wait_for(
+            page.evaluate(READINESS_SCRIPT, {
+                'quietMs': quiet_ms,
+                'maxWaitMs': max_wait_ms,
+                'selector': headline_selector
+            }),
+            timeout=max_wait_ms / 1000 + 2
+        )
+    except Exception as e:
+        # Navigation or a closed page interrupts the script; report quiet as unconfirmed
+        logger.debug(f"Readiness check interrupted: {e}")
+        data = None
+
+    if not isinstance(data, dict):
+        return ReadinessResult(elapsed_ms=int((time.monotonic() - start) * 1000), timed_out=True)
+
+    result = ReadinessResult(
+        elapsed_ms=int(data.get('elapsedMs', 0)),
+        mutations=int(data.get('mutations', 0)),
+        headline_count=int(data.get('headlineCount', 0)),
+        timed_out=bool(data.get('timedOut', False))
+    )
+    logger.debug(
+        "Content ready after %dms (mutations=%d, headlines=%d, timed_out=%s)",
+        result.elapsed_ms, result.mutations, result.headline_count, result.timed_out
+    )
+    return result
@@ -0,0 +1,205 @@
+"""Request Blocking Module
+
+This module intercepts browser requests during scraping and aborts the ones
+the LLM never needs: images, fonts, media and ad/analytics trackers.
+"""
+
+from typing import Dict, Iterable, Optional
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+import logging
+
+from playwright.async_api import Page, Route, Request
+
+logger = logging.getLogger(__name__)
+
+
+# Resource types blocked by default (Playwright request.resource_type values)
+DEFAULT_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+
+# Built-in ad / tracker / analytics domains (subdomains match too)
+AD_TRACKER_DOMAINS = frozenset({
+    # Google ads and analytics
+    'doubleclick.net',
+    'googlesyndication.com',
+    'googleadservices.com',
+    'googletagmanager.com',
+    'googletagservices.com',
+    'google-analytics.com',
+    'adservice.google.com',
+    # Ad exchanges and content recommendation
+    'adnxs.com',
+    'amazon-adsystem.com',
+    'criteo.com',
+    'criteo.net',
+    'taboola.com',
+    'outbrain.com',
+    'pubmatic.com',
+    'rubiconproject.com',
+    'openx.net',
+    'smartadserver.com',
+    'moatads.com',
+    'doubleverify.com',
+    'adsafeprotected.com',
+    'adfox.ru',
+    'an.yandex.ru',
+    'yandexadexchange.net',
+    'adriver.ru',
+    # Analytics, counters and session recording
+    'mc.yandex.ru',
+    'top-fwz1.mail.ru',
+    'tns-counter.ru',
+    'mediametrics.ru',
+    'counter.yadro.ru',
+    'scorecardresearch.com',
+    'quantserve.com',
+    'chartbeat.com',
+    'chartbeat.net',
+    'hotjar.com',
+    'mixpanel.com',
+    'segment.io',
+    'nr-data.net',
+    'connect.facebook.net',
+    'bat.bing.com',
+})
+
+# Rough transfer sizes per resource type, used to estimate bytes saved
+ESTIMATED_RESOURCE_BYTES = {
+    'image': 60_000,
+    'media': 500_000,
+    'font': 40_000,
+    'script': 50_000,
+    'stylesheet': 20_000,
+    'xhr': 5_000,
+    'fetch': 5_000,
+}
+DEFAULT_ESTIMATED_BYTES = 10_000
+
+
+def _domain_matches(host: str, domains: Iterable[str]) -> bool:
+    """Check whether a host equals or is a subdomain of any listed domain."""
+    return any(host == domain or host.endswith('.' + domain) for domain in domains)
+
+
+@dataclass
+class BlockingStats:
+    """Per-scrape counters for intercepted requests."""
+
+    allowed_requests: int = 0
+    blocked_requests: int = 0
+    estimated_bytes_saved: int = 0
+    blocked_by_reason: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, object]:
+        """Convert stats to dictionary format."""
+        return {
+            "allowed_requests": self.allowed_requests,
+            "blocked_requests": self.blocked_requests,
+            "estimated_bytes_saved": self.estimated_bytes_saved,
+            "blocked_by_reason": dict(self.blocked_by_reason),
+        }
+
+
+class BlockingSession:
+    """Route handler attached to one page, collecting stats for one scrape."""
+
+    def __init__(self, blocker: 'RequestBlocker', page: Page):
+        self.blocker = blocker
+        self.page = page
+        self.stats = BlockingStats()
+
+    async def handle(self, route: Route, request: Request):
+        """Abort or continue an intercepted request."""
+        reason = self.blocker.block_reason(request.url, request.resource_type)
+        if reason is None:
+            self.stats.allowed_requests += 1
+            await route.continue_()
+            return
+
+        self.stats.blocked_requests += 1
+        self.stats.blocked_by_reason[reason] = self.stats.blocked_by_reason.get(reason, 0) + 1
+        self.stats.estimated_bytes_saved += ESTIMATED_RESOURCE_BYTES.get(
+            request.resource_type, DEFAULT_ESTIMATED_BYTES
+        )
+        await route.abort('blockedbyclient')
+
+    async def detach(self):
+        """Remove the route handler from the page."""
+        try:
+            await self.page.unroute('**/*', self.handle)
+        except Exception as e:
+            logger.debug(f"Failed to remove request route (page closed?): {e}")
+
+
+class RequestBlocker:
+    """Configurable request blocking layer for scraping pages.
+
+    Features:
+    - Block by Playwright resource type (image, media, font, ...)
+    - Per-domain allow list (always loaded) and deny list (always blocked)
+    - Built-in ad/tracker domain list
+    - Per-scrape counters of blocked requests and estimated bytes saved
+
+    The main document is never blocked.
+    """
+
+    def __init__(
+        self,
+        blocked_resource_types: Iterable[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
+        allow_domains: Iterable[str] = (),
+        deny_domains: Iterable[str] = (),
+        block_trackers: bool = True
+    ):
+        """Initialize the request blocker.
+
+        Args:
+            blocked_resource_types: Resource types to abort
+            allow_domains: Domains whose requests are never blocked
+            deny_domains: Domains whose requests are always blocked
+            block_trackers: Whether to block the built-in AD_TRACKER_DOMAINS list
+        """
+        self.blocked_resource_types = frozenset(blocked_resource_types)
+        self.allow_domains = frozenset(d.lower() for d in allow_domains)
+        self.deny_domains = frozenset(d.lower() for d in deny_domains)
+        self.block_trackers = block_trackers
+        logger.info(
+            f"RequestBlocker initialized (types={sorted(self.blocked_resource_types)}, "
+            f"allow={len(self.allow_domains)}, deny={len(self.deny_domains)}, trackers={block_trackers})"
+        )
+
+    def block_reason(self, url: str, resource_type: str) -> Optional[str]:
+        """Decide whether a request should be blocked.
+
+        Args:
+            url: Request URL
+            resource_type: Playwright resource type
+
+        Returns:
+            Reason string if the request should be blocked, None otherwise
+        """
+        if resource_type == 'document':
+            return None
+
+        host = (urlparse(url).hostname or '').lower()
+        if _domain_matches(host, self.allow_domains):
+            return None
+        if _domain_matches(host, self.deny_domains):
+            return 'deny-list'
+        if self.block_trackers and _domain_matches(host, AD_TRACKER_DOMAINS):
+            return 'tracker'
+        if resource_type in self.blocked_resource_types:
+            return resource_type
+        return None
+
+    async def attach(self, page: Page) -> BlockingSession:
+        """Start intercepting requests on a page.
+
+        Args:
+            page: Page to intercept
+
+        Returns:
+            BlockingSession holding the stats; call detach() when done
+        """
+        session = BlockingSession(self, page)
+        await page.route('**/*', session.handle)
+        return session
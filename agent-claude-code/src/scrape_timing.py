@@ -0,0 +1,196 @@
+"""Scrape Timing Module
+
+This module records where the time of a scrape goes. A ScrapeTiming holds
+per-phase wall time (browser acquire, context setup, politeness wait,
+navigation, load milestones, bot check, readiness, scroll, content), retry
+and backoff figures and traffic counters for one URL, and carries the
+scrape's politeness turn so its follow-up requests do not wait again. TimingHistograms
+aggregates finished timings per domain and phase, so the dominant phase of
+each site can be read off without digging through logs.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+import logging
+
+from politeness import PolitenessTurn
+
+logger = logging.getLogger(__name__)
+
+
+# Histogram bucket upper bounds in seconds (last bucket is +Inf)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+@dataclass
+class ScrapeTiming:
+    """Timing and traffic record of one scrape."""
+
+    url: str
+    source: str = ""  # "browser", "static", "snapshot", "feed" or "json_feed"
+    phases: Dict[str, float] = field(default_factory=dict)
+    attempts: int = 0
+    bytes_transferred: int = 0
+    requests: int = 0
+    blocked_requests: int = 0
+    cached_requests: int = 0
+    records: int = 0  # Headline records extracted in the page (records mode; 0 = real page HTML)
+    total: float = 0.0
+    # Politeness turn shared by the scrape's requests (not part of the report)
+    turn: PolitenessTurn = field(default_factory=PolitenessTurn, repr=False, compare=False)
+
+    @property
+    def backoff_seconds(self) -> float:
+        """Time spent waiting out backoffs before retries."""
+        return self.turn.backoff_waited
+
+    @property
+    def retries(self) -> int:
+        """Attempts after the first one."""
+        return max(0, self.attempts - 1)
+
+    def add_phase(self, name: str, seconds: float):
+        """Add time to a phase (phases of retried attempts are summed)."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def merge_phases(self, phases: Dict[str, float]):
+        """Add all phases of one attempt."""
+        for name, seconds in phases.items():
+            self.add_phase(name, seconds)
+
+    def dominant_phase(self) -> Optional[str]:
+        """Name of the phase that took the most time."""
+        return max(self.phases, key=self.phases.get) if self.phases else None
+
+    def to_dict(self) -> Dict[str, object]:
+        """Convert timing to dictionary format."""
+        return {
+            "url": self.url,
+            "source": self.source,
+            "total": round(self.total, 4),
+            "phases": {name: round(seconds, 4) for name, seconds in self.phases.items()},
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "backoff_seconds": round(self.backoff_seconds, 4),
+            "bytes_transferred": self.bytes_transferred,
+            "requests": self.requests,
+            "blocked_requests": self.blocked_requests,
+            "cached_requests": self.cached_requests,
+            "records": self.records,
+        }
+
+
+class TrafficMeter:
+    """Counts responses and their transferred bytes on one page.
+
+    Bytes are taken from Content-Length, i.e. the compressed size on the
+    wire; chunked responses without the header are counted as requests only.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.bytes = 0
+
+    def on_response(self, response):
+        """Playwright 'response' listener."""
+        self.requests += 1
+        try:
+            self.bytes += int(response.headers.get('content-length', '0') or 0)
+        except (AttributeError, TypeError, ValueError):
+            pass
+
+    def attach(self, page):
+        """Start counting the page's responses."""
+        page.on('response', self.on_response)
+
+    def detach(self, page):
+        """Stop counting (pages are reused from the context pool)."""
+        try:
+            page.remove_listener('response', self.on_response)
+        except Exception as e:
+            logger.debug(f"Failed to remove traffic listener: {e}")
+
+
+@dataclass
+class _Histogram:
+    """Per-bucket (non-cumulative) counts of one metric."""
+
+    counts: List[int]
+    total: float = 0.0
+    count: int = 0
+
+
+class TimingHistograms:
+    """Per-domain, per-phase duration histograms of finished scrapes."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """Initialize the histograms.
+
+        Args:
+            buckets: Increasing bucket upper bounds in seconds
+        """
+        self.buckets = tuple(buckets)
+        self._data: Dict[str, Dict[str, _Histogram]] = {}
+
+    def _observe(self, domain: str, name: str, seconds: float):
+        histograms = self._data.setdefault(domain, {})
+        histogram = histograms.get(name)
+        if histogram is None:
+            histogram = _Histogram(counts=[0] * (len(self.buckets) + 1))
+            histograms[name] = histogram
+        histogram.counts[bisect_left(self.buckets, seconds)] += 1
+        histogram.total += seconds
+        histogram.count += 1
+
+    def record(self, timing: ScrapeTiming):
+        """Add a finished scrape (every phase plus the "total" duration)."""
+        domain = urlparse(timing.url).netloc.lower()
+        for name, seconds in timing.phases.items():
+            self._observe(domain, name, seconds)
+        self._observe(domain, 'total', timing.total)
+
+    def _quantile(self, histogram: _Histogram, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile."""
+        rank = q * histogram.count
+        seen = 0
+        for index, count in enumerate(histogram.counts):
+            seen += count
+            if seen >= rank and count:
+                return self.buckets[index] if index < len(self.buckets) else float('inf')
+        return 0.0
+
+    def summary(self, domain: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, object]]]:
+        """Summarize histograms.
+
+        Args:
+            domain: Only this domain (all domains when None)
+
+        Returns:
+            {domain: {phase: {count, sum, mean, p50, p95, buckets}}}
+        """
+        domains = [domain] if domain is not None else sorted(self._data)
+        result = {}
+        for name in domains:
+            phases = {}
+            for phase, histogram in self._data.get(name, {}).items():
+                phases[phase] = {
+                    "count": histogram.count,
+                    "sum": round(histogram.total, 4),
+                    "mean": round(histogram.total / histogram.count, 4) if histogram.count else 0.0,
+                    "p50": self._quantile(histogram, 0.5),
+                    "p95": self._quantile(histogram, 0.95),
+                    "buckets": dict(zip([*map(str, self.buckets), '+Inf'], histogram.counts)),
+                }
+            result[name] = phases
+        return result
+
+    def dominant_phases(self) -> Dict[str, str]:
+        """Phase with the largest summed time per domain."""
+        result = {}
+        for domain, histograms in self._data.items():
+            phases = {name: h.total for name, h in histograms.items() if name != 'total'}
+            if phases:
+                result[domain] = max(phases, key=phases.get)
+        return result
@@ -4,15 +4,56 @@ This module handles web scraping with JavaScript rendering and anti-bot bypass f
 Uses Playwright for robust scraping with stealth mode.
 """
 
-from typing import Optional
+from typing import AsyncIterator, Dict, Iterable, List, Optional
+from dataclasses import dataclass
+from urllib.parse import urlparse
 import logging
 import asyncio
 import random
+import time
 from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
 
+from context_pool import ContextPool, PooledPage
+from request_blocker import RequestBlocker
+from readiness import wait_for_content_ready
+from http_fetcher import HttpFetcher
+from snapshot_store import SnapshotStore
+from politeness import PolitenessScheduler, RateLimitedError, parse_retry_after
+from page_extract import extract_page_records, probe_bot_text, render_records_html
+from feed_capture import FeedCapture, FeedRegistry
+from feed_discovery import FeedDiscovery
+from browser_governor import BrowserGovernor
+from browser_profiles import get_profile
+from scrape_timing import ScrapeTiming, TimingHistograms, TrafficMeter
+from storage_state import StorageStateStore, local_storage_script
+from asset_cache import AssetCache
+from circuit_breaker import (
+    BotBlockedError, CircuitBreaker, DEFAULT_RETRY_POLICIES, OTHER, RetryBudget, RetryPolicy, ServerError,
+    TIMEOUT, classify_error
+)
+from llm_service import NewsItem
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ScrapeResult:
+    """Outcome of scraping a single URL (used by batch scraping and scrape_page)."""
+
+    url: str
+    html: str = ""
+    error: Optional[Exception] = None
+    duration: float = 0.0
+    feed_items: Optional[List[NewsItem]] = None  # Headlines taken from an RSS/Atom feed or the site's JSON API
+    feed_url: Optional[str] = None
+    timing: Optional[ScrapeTiming] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the URL was scraped successfully."""
+        return self.error is None
+
+
 class ScraperService:
     """Service for scraping web content with anti-bot capabilities.
 
@@ -20,9 +61,24 @@ class ScraperService:
     - JavaScript rendering using Playwright
     - Stealth mode to bypass anti-bot detection
     - User-agent rotation
-    - Random delays
+    - Per-domain politeness scheduling (token bucket, Retry-After aware)
     - Cookie handling
-    - Retry logic with exponential backoff
+    - Retry logic with exponential backoff, limited per error class and by a global retry budget
+    - Per-domain circuit breaker that fails fast for sites that keep failing
+    - Optional cookies/localStorage kept per domain and user agent across scrapes
+    - Optional shared on-disk cache of scripts, stylesheets and other static assets
+    - Optional pool of pre-warmed stealth contexts
+    - Concurrent multi-URL scraping on one shared browser
+    - Blocking of images, fonts, media and ad/tracker requests
+    - Adaptive content-readiness waits instead of fixed sleeps
+    - Optional HTTP-first fetch with automatic escalation to the browser
+    - Optional on-disk HTML snapshots reused within a TTL
+    - Optional in-page record extraction instead of full DOM serialization
+    - Optional RSS/Atom and news-sitemap fast path (see scrape_page)
+    - Optional capture of the site's JSON headline feed (see scrape_page)
+    - Browser recycling after N pages, above an RSS limit or on renderer crash
+    - Per-phase timing of every scrape, aggregated into per-domain histograms
+    - Selectable browser launch profile ("default" or start-up optimized "fast")
     """
 
     # User agents for rotation
@@ -34,51 +90,271 @@ class ScraperService:
         'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
     ]
 
-    def __init__(self, timeout: int = 30000, headless: bool = True, max_retries: int = 3):
+    # "html": return page.content(); "records": collect headline records in the page
+    EXTRACTION_MODES = ("html", "records")
+
+    # Hard cap for the readiness wait after each scroll step
+    SCROLL_SETTLE_MAX_MS = 1500
+
+    # Longest wait for 'networkidle' after the page has loaded (inside the navigation deadline)
+    NETWORKIDLE_MAX_MS = 5000
+
+    def __init__(
+        self,
+        timeout: int = 30000,
+        headless: bool = True,
+        max_retries: int = 3,
+        context_pool_size: int = 0,
+        context_max_uses: int = 20,
+        block_resources: bool = True,
+        request_blocker: Optional[RequestBlocker] = None,
+        readiness_quiet_ms: int = 500,
+        readiness_max_wait_ms: int = 5000,
+        http_first: bool = False,
+        http_fetcher: Optional[HttpFetcher] = None,
+        snapshot_dir: Optional[str] = None,
+        snapshot_ttl: float = 120,
+        snapshot_max_bytes: int = 200 * 1024 * 1024,
+        snapshot_store: Optional[SnapshotStore] = None,
+        scheduler: Optional[PolitenessScheduler] = None,
+        extraction_mode: str = "html",
+        capture_feeds: bool = False,
+        feed_registry: Optional[FeedRegistry] = None,
+        discover_feeds: bool = False,
+        feed_discovery: Optional[FeedDiscovery] = None,
+        recycle_after_pages: int = 200,
+        recycle_rss_mb: int = 1024,
+        governor: Optional[BrowserGovernor] = None,
+        browser_profile: str = "default",
+        browser_executable: Optional[str] = None,
+        retry_policies: Optional[Dict[str, RetryPolicy]] = None,
+        retry_budget_ratio: float = 0.2,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_failure_threshold: int = 3,
+        circuit_cooldown: float = 120,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        storage_state_dir: Optional[str] = None,
+        storage_state_ttl: float = 24 * 3600,
+        storage_state_store: Optional[StorageStateStore] = None,
+        asset_cache_dir: Optional[str] = None,
+        asset_cache_ttl: float = 12 * 3600,
+        asset_cache_max_bytes: int = 200 * 1024 * 1024,
+        asset_cache: Optional[AssetCache] = None
+    ):
         """Initialize the scraper service.
 
         Args:
             timeout: Page load timeout in milliseconds
             headless: Whether to run browser in headless mode
             max_retries: Maximum number of retry attempts
+            context_pool_size: Number of stealth contexts kept warm (0 = fresh context per attempt)
+            context_max_uses: Navigations after which a pooled context is recycled
+            block_resources: Whether to block images, fonts, media and trackers while scraping
+            request_blocker: Custom RequestBlocker (default blocker used when not given)
+            readiness_quiet_ms: DOM quiet window that marks the page as ready
+            readiness_max_wait_ms: Hard cap on the post-load readiness wait
+            http_first: Try a plain HTTP fetch before launching a browser page
+            http_fetcher: Custom HttpFetcher (default fetcher used when not given)
+            snapshot_dir: Directory for HTML snapshots (None disables snapshots)
+            snapshot_ttl: Seconds a snapshot is reused instead of scraping again (0 = store only)
+            snapshot_max_bytes: Size bound of the snapshot store
+            snapshot_store: Custom SnapshotStore (overrides snapshot_dir)
+            scheduler: Shared per-domain PolitenessScheduler (default scheduler used when not given)
+            extraction_mode: "html" for the full DOM, "records" for compact in-page extracted records
+            capture_feeds: Look for headline arrays in the page's XHR/fetch JSON responses
+            feed_registry: Custom FeedRegistry of learned feed endpoints (default registry used when not given)
+            discover_feeds: Read RSS/Atom feeds and news sitemaps covering the page instead of scraping it
+            feed_discovery: Custom FeedDiscovery (default discovery used when not given)
+            recycle_after_pages: Pages after which the browser is relaunched (0 = never)
+            recycle_rss_mb: Browser memory (RSS) in MB above which it is relaunched (0 = no limit)
+            governor: Custom BrowserGovernor (overrides the recycle_* limits)
+            browser_profile: Launch profile name from browser_profiles.BROWSER_PROFILES
+            browser_executable: Chromium binary to launch instead of the bundled one
+            retry_policies: Attempt limits per error class (merged over circuit_breaker.DEFAULT_RETRY_POLICIES)
+            retry_budget_ratio: Retries allowed per scrape across all domains
+            retry_budget: Custom RetryBudget (overrides retry_budget_ratio)
+            circuit_failure_threshold: Consecutive failed scrapes that open a domain's circuit (0 = never)
+            circuit_cooldown: Seconds a domain fails fast once its circuit is open
+            circuit_breaker: Custom CircuitBreaker (overrides the circuit_* settings)
+            storage_state_dir: Directory for per-domain cookies/localStorage (None disables them)
+            storage_state_ttl: Seconds a domain's saved state is reused
+            storage_state_store: Custom StorageStateStore (overrides storage_state_dir)
+            asset_cache_dir: Directory for the shared static asset cache (None disables it)
+            asset_cache_ttl: Longest time an asset is served from the cache
+            asset_cache_max_bytes: Size bound of the asset cache
+            asset_cache: Custom AssetCache (overrides the asset_cache_* settings)
+
+        Raises:
+            ValueError: If extraction_mode or browser_profile is unknown
         """
+        if extraction_mode not in self.EXTRACTION_MODES:
+            raise ValueError(f"Invalid extraction_mode: {extraction_mode} (expected one of {self.EXTRACTION_MODES})")
+        self.profile = get_profile(browser_profile)
+
         self.timeout = timeout
         self.headless = headless
         self.max_retries = max_retries
+        self.context_pool_size = context_pool_size
+        self.context_max_uses = context_max_uses
+        self.block_resources = block_resources
+        self.request_blocker = (request_blocker or RequestBlocker()) if block_resources else None
+        self.readiness_quiet_ms = readiness_quiet_ms
+        self.readiness_max_wait_ms = readiness_max_wait_ms
+        self.http_first = http_first
+        self.http_fetcher = (http_fetcher or HttpFetcher()) if http_first else None
+        self.snapshot_dir = snapshot_dir
+        self.snapshot_ttl = snapshot_ttl
+        self.snapshot_max_bytes = snapshot_max_bytes
+        if snapshot_store is None and snapshot_dir:
+            snapshot_store = SnapshotStore(snapshot_dir, ttl_seconds=snapshot_ttl, max_bytes=snapshot_max_bytes)
+        self.snapshot_store = snapshot_store
+        self.scheduler = scheduler or PolitenessScheduler()
+        self.extraction_mode = extraction_mode
+        self.capture_feeds = capture_feeds
+        self.feed_registry = (feed_registry or FeedRegistry()) if capture_feeds else None
+        self.discover_feeds = discover_feeds
+        self.feed_discovery = (feed_discovery or FeedDiscovery()) if discover_feeds else None
+        self.recycle_after_pages = recycle_after_pages
+        self.recycle_rss_mb = recycle_rss_mb
+        self.governor = governor or BrowserGovernor(max_pages=recycle_after_pages, max_rss_mb=recycle_rss_mb)
+        self.browser_profile = browser_profile
+        self.browser_executable = browser_executable
+        self.retry_policies = {**DEFAULT_RETRY_POLICIES, **(retry_policies or {})}
+        self.retry_budget_ratio = retry_budget_ratio
+        self.retry_budget = retry_budget or RetryBudget(ratio=retry_budget_ratio)
+        self.circuit_failure_threshold = circuit_failure_threshold
+        self.circuit_cooldown = circuit_cooldown
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            failure_threshold=circuit_failure_threshold,
+            cooldown=circuit_cooldown
+        )
+        self.storage_state_dir = storage_state_dir
+        self.storage_state_ttl = storage_state_ttl
+        if storage_state_store is None and storage_state_dir:
+            storage_state_store = StorageStateStore(storage_state_dir, ttl_seconds=storage_state_ttl)
+        self.storage_state_store = storage_state_store
+        self.asset_cache_dir = asset_cache_dir
+        self.asset_cache_ttl = asset_cache_ttl
+        self.asset_cache_max_bytes = asset_cache_max_bytes
+        if asset_cache is None and asset_cache_dir:
+            asset_cache = AssetCache(asset_cache_dir, ttl_seconds=asset_cache_ttl, max_bytes=asset_cache_max_bytes)
+        self.asset_cache = asset_cache
         self.browser: Optional[Browser] = None
         self.playwright = None
-        logger.info(f"ScraperService initialized (timeout={timeout}ms, headless={headless}, retries={max_retries})")
+        self._browser_lock = asyncio.Lock()  # Serializes launch/restart across concurrent scrapes
+        self._inflight_pages = 0
+        self._pages_drained = asyncio.Event()  # Set while no page is using the browser
+        self._pages_drained.set()
+        self.timing_histograms = TimingHistograms()
+        self.context_pool = ContextPool(
+            self._create_pooled_page,
+            size=context_pool_size,
+            max_uses=context_max_uses
+        )
+        logger.info(
+            f"ScraperService initialized (timeout={timeout}ms, headless={headless}, retries={max_retries}, "
+            f"context_pool_size={context_pool_size}, browser_profile={browser_profile})"
+        )
 
     async def _init_browser(self):
-        """Initialize Playwright browser instance."""
-        if self.browser is None:
-            logger.info("Initializing Playwright browser (headless=%s)...", self.headless)
-            self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage'
-                    # Removed '--disable-web-security' for security compliance
-                ]
-            )
-            logger.info("Browser initialized successfully")
+        """Initialize Playwright browser instance.
+
+        Safe to call before every attempt: a running browser is reused, a
+        browser that has crashed or lost its connection is relaunched, and a
+        browser the governor wants recycled is relaunched once its in-flight
+        pages have finished.
+        """
+        async with self._browser_lock:
+            if self.browser is not None and not self.browser.is_connected():
+                logger.warning("Browser connection lost (crash?) - restarting browser")
+                self.governor.record_recycle("browser_crash")
+                await self._reset_browser()
+            elif self.browser is not None:
+                self.governor.sample(self._open_contexts())
+                reason = self.governor.recycle_reason()
+                if reason:
+                    self.governor.record_recycle(reason)
+                    await self._drain_pages()
+                    await self._reset_browser()
+
+            if self.browser is None:
+                logger.info(
+                    "Initializing Playwright browser (headless=%s, profile=%s)...", self.headless, self.profile.name
+                )
+                if self.playwright is None:
+                    self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.chromium.launch(
+                    **self.profile.launch_options(self.headless, self.browser_executable)
+                )
+                self.governor.record_launch()
+                logger.info("Browser initialized successfully")
+                # Warm up stealth contexts in the background
+                self.context_pool.schedule_refill()
+
+    async def _reset_browser(self):
+        """Drop a dead browser instance so the next attempt launches a fresh one."""
+        await self.context_pool.clear()
+        browser, self.browser = self.browser, None
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.debug(f"Ignoring error while closing dead browser: {e}")
 
-    async def _setup_stealth_page(self) -> Page:
+    async def _drain_pages(self):
+        """Wait for pages still loading on the current browser (bounded by the drain timeout)."""
+        if self._pages_drained.is_set():
+            return
+        logger.info("Waiting for %d in-flight page(s) before recycling the browser", self._inflight_pages)
+        try:
+            await asyncio.wait_for(self._pages_drained.wait(), timeout=self.governor.drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("In-flight pages did not finish within %.0fs - recycling anyway", self.governor.drain_timeout)
+
+    def _open_contexts(self) -> int:
+        """Number of contexts open on the current browser."""
+        contexts = getattr(self.browser, 'contexts', None)
+        return len(contexts) if isinstance(contexts, list) else 0
+
+    def browser_metrics(self) -> Dict[str, object]:
+        """Get browser memory/recycle metrics together with context pool counters.
+
+        Returns:
+            Governor metrics plus "in_flight_pages" and "context_pool"
+        """
+        metrics = self.governor.metrics()
+        metrics["in_flight_pages"] = self._inflight_pages
+        metrics["context_pool"] = self.context_pool.stats()
+        if self.asset_cache is not None:
+            metrics["asset_cache"] = self.asset_cache.stats()
+        return metrics
+
+    async def _create_pooled_page(self) -> PooledPage:
+        """Create a stealth context and page for the context pool.
+
+        Returns:
+            PooledPage with a randomly selected user agent
+        """
+        user_agent = random.choice(self.USER_AGENTS)
+        page = await self._setup_stealth_page(user_agent)
+        return PooledPage(context=page.context, page=page, user_agent=user_agent)
+
+    async def _setup_stealth_page(self, user_agent: Optional[str] = None) -> Page:
         """Create a new page with stealth configurations.
 
+        Args:
+            user_agent: User agent to use (random from USER_AGENTS if not given)
+
         Returns:
             Configured page instance
         """
         logger.info("Setting up stealth page with anti-bot protection...")
         # Create new context with random user agent
-        user_agent = random.choice(self.USER_AGENTS)
+        user_agent = user_agent or random.choice(self.USER_AGENTS)
         logger.debug("Selected user agent: %s", user_agent[:80])
 
         context = await self.browser.new_context(
             user_agent=user_agent,
-            viewport={'width': 1920, 'height': 1080},
+            viewport=dict(self.profile.viewport),
             locale='en-US',
             timezone_id='America/New_York',
             # Add some common browser features
@@ -101,6 +377,7 @@ class ScraperService:
         logger.debug("Browser headers configured")
 
         page = await context.new_page()
+        page.on("crash", self.governor.record_crash)
 
         # Hide webdriver flag
         await page.add_init_script("""
@@ -135,88 +412,452 @@ class ScraperService:
         logger.info("Stealth page created successfully")
         return page
 
-    async def _random_delay(self, min_seconds: float = 0.5, max_seconds: float = 2.0):
-        """Add a random delay to mimic human behavior.
+    async def scrape(self, url: str) -> str:
+        """Scrape content from a URL with retry logic.
 
         Args:
-            min_seconds: Minimum delay in seconds
-            max_seconds: Maximum delay in seconds
+            url: The URL to scrape
+
+        Returns:
+            The HTML content as a string
+
+        Raises:
+            ValueError: If the URL is invalid
+            TimeoutError: If page load exceeds timeout after all retries
+            RuntimeError: If scraping fails after all retries
         """
-        delay = random.uniform(min_seconds, max_seconds)
-        logger.debug(f"Random delay: {delay:.2f}s")
-        await asyncio.sleep(delay)
+        self._validate_url(url)
+        logger.info("Starting scrape for URL: %s (max_retries=%d)", url, self.max_retries)
+        timing = ScrapeTiming(url)
+        start = time.monotonic()
+        try:
+            return await self._scrape_html(url, timing=timing)
+        finally:
+            self._finish_timing(timing, start)
 
-    async def scrape(self, url: str) -> str:
-        """Scrape content from a URL with retry logic.
+    async def scrape_page(self, url: str) -> ScrapeResult:
+        """Scrape a URL, preferring structured feeds over the rendered page.
+
+        With discover_feeds enabled, an RSS/Atom feed or news sitemap covering
+        the page is read first. With capture_feeds enabled, a JSON feed endpoint
+        learned on an earlier scrape of the domain is fetched directly (no
+        browser); otherwise the page is scraped while its JSON responses are
+        inspected, and a qualifying feed is remembered for the next time. When
+        feed_items is set, the headlines need no LLM extraction.
 
         Args:
             url: The URL to scrape
 
         Returns:
-            The HTML content as a string
+            ScrapeResult with html, timing and, when a feed was found, feed_items/feed_url
 
         Raises:
             ValueError: If the URL is invalid
             TimeoutError: If page load exceeds timeout after all retries
             RuntimeError: If scraping fails after all retries
         """
+        self._validate_url(url)
+        logger.info("Starting page scrape for URL: %s (capture_feeds=%s)", url, self.capture_feeds)
+        timing = ScrapeTiming(url)
+        start = time.monotonic()
+        try:
+            return await self._scrape_page_timed(url, timing, start)
+        finally:
+            self._finish_timing(timing, start)
+
+    async def _scrape_page_timed(self, url: str, timing: ScrapeTiming, start: float) -> ScrapeResult:
+        """scrape_page body; fills `timing` as it goes."""
+        if self.feed_discovery is not None:
+            await self._wait_turn(url, timing)
+            phase_start = time.monotonic()
+            try:
+                feed = await asyncio.to_thread(self.feed_discovery.fetch, url)
+            except Exception as e:
+                logger.info("Feed discovery failed for %s: %s - scraping the page", url, str(e))
+                feed = None
+            timing.add_phase('feed_discovery', time.monotonic() - phase_start)
+            if feed is not None:
+                timing.source = "feed"
+                return ScrapeResult(
+                    url=url, feed_items=feed.items, feed_url=feed.feed_url,
+                    duration=time.monotonic() - start, timing=timing
+                )
+
+        if self.feed_registry is None:
+            html_content = await self._scrape_html(url, timing=timing)
+            return ScrapeResult(url=url, html=html_content, duration=time.monotonic() - start, timing=timing)
+
+        endpoint = self.feed_registry.get(url)
+        if endpoint is not None:
+            await self._wait_turn(endpoint.url, timing)
+            phase_start = time.monotonic()
+            items = await asyncio.to_thread(self.feed_registry.fetch, url)
+            timing.add_phase('feed_fetch', time.monotonic() - phase_start)
+            if items:
+                timing.source = "json_feed"
+                timing.requests += 1
+                return ScrapeResult(
+                    url=url, feed_items=items, feed_url=endpoint.url,
+                    duration=time.monotonic() - start, timing=timing
+                )
+
+        feed_capture = FeedCapture()
+        html_content = await self._scrape_html(url, feed_capture, timing)
+        result = ScrapeResult(url=url, html=html_content, duration=time.monotonic() - start, timing=timing)
+        if feed_capture.endpoint is not None:
+            self.feed_registry.remember(url, feed_capture.endpoint)
+            result.feed_items = feed_capture.items
+            result.feed_url = feed_capture.endpoint.url
+        return result
+
+    async def _wait_turn(self, url: str, timing: ScrapeTiming):
+        """Wait for the domain's politeness slot once per scrape (timed as the 'politeness' phase).
+
+        Follow-up requests of the same scrape reuse the slot; after a backoff
+        the retry waits again and that wait is recorded as backoff time.
+        """
+        phase_start = time.monotonic()
+        await self.scheduler.acquire(url, timing.turn)
+        timing.add_phase('politeness', time.monotonic() - phase_start)
+
+    def _finish_timing(self, timing: ScrapeTiming, start: float):
+        """Close a scrape's timing record, add it to the histograms and log it."""
+        timing.total = time.monotonic() - start
+        self.timing_histograms.record(timing)
+        logger.info("Scrape timing for %s: %s", timing.url, timing.to_dict())
+
+    def timing_summary(self, domain: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, object]]]:
+        """Per-domain, per-phase timing histograms of finished scrapes (see TimingHistograms.summary)."""
+        return self.timing_histograms.summary(domain)
+
+    def retry_metrics(self) -> Dict[str, object]:
+        """Circuit state per tracked domain and retry budget counters."""
+        return {
+            "circuits": self.circuit_breaker.snapshot(),
+            "retry_budget": self.retry_budget.metrics(),
+        }
+
+    def _validate_url(self, url: str):
+        """Raise ValueError for URLs that are not http(s)."""
         if not url or not url.startswith(('http://', 'https://')):
             logger.error("Invalid URL provided: %s", url)
             raise ValueError(f"Invalid URL: {url}")
 
-        logger.info("Starting scrape for URL: %s (max_retries=%d)", url, self.max_retries)
+    async def _scrape_html(
+        self,
+        url: str,
+        feed_capture: Optional[FeedCapture] = None,
+        timing: Optional[ScrapeTiming] = None
+    ) -> str:
+        """Get the page HTML from a fresh snapshot or a live scrape (page HTML is stored afterwards).
+
+        Args:
+            url: The URL to scrape
+            feed_capture: Collects JSON feed responses during browser attempts
+            timing: Timing record filled in by the scrape (optional)
+
+        Returns:
+            The HTML content as a string
+        """
+        if self.snapshot_store is not None:
+            try:
+                snapshot_html = await asyncio.to_thread(self.snapshot_store.get_fresh, url)
+            except Exception as e:
+                logger.warning("Snapshot lookup failed for %s: %s", url, str(e))
+                snapshot_html = None
+            if snapshot_html is not None:
+                if timing is not None:
+                    timing.source = "snapshot"
+                return snapshot_html
+
+        timing = timing or ScrapeTiming(url)
+        html_content = await self._scrape_live(url, feed_capture, timing)
+
+        # Records mode returns a rendered summary, not the page: it is never stored as page HTML
+        if self.snapshot_store is not None and not timing.records:
+            try:
+                await asyncio.to_thread(self.snapshot_store.put, url, html_content)
+            except Exception as e:
+                # A full disk must not fail an otherwise successful scrape
+                logger.warning("Failed to store snapshot of %s: %s", url, str(e))
+
+        return html_content
+
+    async def _scrape_live(
+        self,
+        url: str,
+        feed_capture: Optional[FeedCapture] = None,
+        timing: Optional[ScrapeTiming] = None
+    ) -> str:
+        """Fetch the page over HTTP or in the browser, retrying browser attempts.
+
+        Args:
+            url: The URL to scrape
+            feed_capture: Collects JSON feed responses during browser attempts
+            timing: Timing record filled in by the scrape (optional)
+
+        Returns:
+            The HTML content as a string
 
-        for attempt in range(1, self.max_retries + 1):
+        Raises:
+            CircuitOpenError: If the URL's domain is failing fast after repeated failures
+        """
+        timing = timing or ScrapeTiming(url)
+        self.circuit_breaker.before_request(url)
+        try:
+            html_content = await self._scrape_with_retries(url, feed_capture, timing)
+        finally:
+            # No-op once the outcome was recorded; frees the probe slot of a cancelled scrape
+            self.circuit_breaker.release(url)
+        self.circuit_breaker.record_success(url)
+        return html_content
+
+    async def _scrape_with_retries(
+        self,
+        url: str,
+        feed_capture: Optional[FeedCapture],
+        timing: ScrapeTiming
+    ) -> str:
+        """Static fetch, then browser attempts retried per error-class policy and retry budget."""
+        if self.http_fetcher is not None:
+            phase_start = time.monotonic()
+            static_html = await self._try_static_fetch(url, timing)
+            timing.add_phase('static_fetch', time.monotonic() - phase_start)
+            timing.requests += 1
+            if static_html is not None:
+                timing.source = "static"
+                timing.bytes_transferred += len(static_html.encode('utf-8'))
+                return static_html
+
+        timing.source = "browser"
+        self.retry_budget.record_request()
+        attempt = 1
+        while True:
+            timing.attempts = attempt
             try:
-                result = await self._scrape_attempt(url, attempt)
+                result = await self._scrape_attempt(url, attempt, feed_capture, timing)
                 logger.info("Scrape completed successfully for %s on attempt %d", url, attempt)
                 return result
-            except PlaywrightTimeoutError as e:
-                logger.warning("Attempt %d/%d timed out for %s: %s", attempt, self.max_retries, url, str(e))
-                if attempt == self.max_retries:
-                    logger.error("All %d attempts failed for %s: timeout", self.max_retries, url)
-                    raise TimeoutError(f"Failed to scrape {url} after {self.max_retries} attempts: timeout")
-                await self._exponential_backoff(attempt)
             except Exception as e:
-                logger.warning("Attempt %d/%d failed for %s: %s", attempt, self.max_retries, url, str(e))
-                if attempt == self.max_retries:
-                    logger.error("All %d attempts failed for %s: %s", self.max_retries, url, str(e))
-                    raise RuntimeError(f"Failed to scrape {url} after {self.max_retries} attempts: {str(e)}")
-                await self._exponential_backoff(attempt)
+                error_class = classify_error(e)
+                policy = self.retry_policies.get(error_class, self.retry_policies[OTHER])
+                max_attempts = min(policy.max_attempts, self.max_retries)
+                logger.warning(
+                    "Attempt %d/%d failed for %s (%s): %s", attempt, max_attempts, url, error_class, str(e)
+                )
+                retry = attempt < max_attempts and self.retry_budget.try_spend()
+                if attempt < max_attempts and not retry:
+                    logger.warning("Retry budget exhausted - not retrying %s", url)
+                retry_after = e.retry_after if isinstance(e, RateLimitedError) else None
+                if retry_after is not None or (retry and policy.backoff):
+                    # Later scrapes of the domain honour Retry-After even when we give up now;
+                    # the wait itself is recorded when the retry acquires the domain
+                    self.scheduler.backoff(url, attempt, retry_after, timing.turn)
+                if not retry:
+                    logger.error("All %d attempts failed for %s: %s", attempt, url, str(e))
+                    self.circuit_breaker.record_failure(url, error_class)
+                    if error_class == TIMEOUT:
+                        raise TimeoutError(f"Failed to scrape {url} after {attempt} attempts: timeout")
+                    raise RuntimeError(f"Failed to scrape {url} after {attempt} attempts: {str(e)}")
+                attempt += 1
+
+    async def _try_static_fetch(self, url: str, timing: Optional[ScrapeTiming] = None) -> Optional[str]:
+        """Try the plain HTTP path and decide whether the browser is needed.
+
+        Args:
+            url: The URL to scrape
+            timing: Timing record of the scrape, whose politeness turn is used (optional)
+
+        Returns:
+            Server-rendered HTML if it has enough headline candidates, None to use the browser
+        """
+        if self.http_fetcher.get_decision(url) == HttpFetcher.NEEDS_JS:
+            logger.debug("Domain of %s is known to need JavaScript - skipping static fetch", url)
+            return None
+
+        timing = timing or ScrapeTiming(url)
+        try:
+            # Its wait is part of the static_fetch phase
+            await self.scheduler.acquire(url, timing.turn)
+            result = await asyncio.to_thread(self.http_fetcher.fetch, url)
+        except Exception as e:
+            # Network problems are not a property of the site: do not remember a decision
+            logger.info("Static fetch failed for %s: %s - falling back to browser", url, str(e))
+            return None
+
+        if result.status == 429:
+            self.scheduler.backoff(url, 1, parse_retry_after(result.retry_after), timing.turn)
+
+        if result.html and self._detect_bot_block(result.html):
+            logger.info("Static fetch of %s hit an anti-bot page - using browser", url)
+            self.http_fetcher.remember(url, HttpFetcher.NEEDS_JS)
+            return None
+
+        if result.sufficient:
+            self.http_fetcher.remember(url, HttpFetcher.STATIC)
+            logger.info("Using static HTML for %s (%d headline candidates, no browser)", url, result.candidates)
+            return result.html
+
+        if result.status in (200, 403):
+            self.http_fetcher.remember(url, HttpFetcher.NEEDS_JS)
+        logger.info("Static HTML for %s insufficient - escalating to browser", url)
+        return None
+
+    async def scrape_many(
+        self,
+        urls: Iterable[str],
+        concurrency: int = 5,
+        per_domain_limit: int = 2
+    ) -> AsyncIterator[ScrapeResult]:
+        """Scrape many URLs in parallel tabs on the shared browser.
+
+        Each URL goes through the scrape_page path (feeds, snapshots, timing).
+        Results are yielded in completion order. A failing URL is reported as a
+        ScrapeResult with `error` set and does not cancel the rest of the batch.
+
+        Args:
+            urls: URLs to scrape
+            concurrency: Maximum number of pages loading at the same time
+            per_domain_limit: Maximum number of concurrent pages per domain
+
+        Yields:
+            ScrapeResult for each URL as soon as it finishes
+        """
+        urls = list(urls)
+        logger.info(
+            "Starting batch scrape of %d URLs (concurrency=%d, per_domain_limit=%d)",
+            len(urls), concurrency, per_domain_limit
+        )
+        global_semaphore = asyncio.Semaphore(max(1, concurrency))
+        domain_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        async def scrape_one(url: str) -> ScrapeResult:
+            domain = urlparse(url or "").netloc.lower()
+            domain_semaphore = domain_semaphores.setdefault(domain, asyncio.Semaphore(max(1, per_domain_limit)))
+            # Take the domain slot first so a backlog for one site does not hold global slots
+            async with domain_semaphore:
+                async with global_semaphore:
+                    timing = ScrapeTiming(url)
+                    start = time.monotonic()
+                    try:
+                        self._validate_url(url)
+                        return await self._scrape_page_timed(url, timing, start)
+                    except Exception as e:
+                        logger.warning("Batch scrape failed for %s: %s", url, str(e))
+                        return ScrapeResult(url=url, error=e, duration=time.monotonic() - start, timing=timing)
+                    finally:
+                        self._finish_timing(timing, start)
+
+        tasks = [asyncio.ensure_future(scrape_one(url)) for url in urls]
+        succeeded = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                succeeded += result.ok
+                yield result
+        finally:
+            # Consumer stopped early (or was cancelled): do not leave pages loading
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            logger.info("Batch scrape finished: %d/%d URLs succeeded", succeeded, len(urls))
 
-    async def _scrape_attempt(self, url: str, attempt: int) -> str:
+    async def _scrape_attempt(
+        self,
+        url: str,
+        attempt: int,
+        feed_capture: Optional[FeedCapture] = None,
+        timing: Optional[ScrapeTiming] = None
+    ) -> str:
         """Single scraping attempt.
 
         Args:
             url: The URL to scrape
             attempt: Current attempt number
+            feed_capture: Collects JSON feed responses of this page load (optional)
+            timing: Timing record the attempt's phases are added to (optional)
 
         Returns:
             The HTML content as a string
         """
         logger.info("Scrape attempt %d/%d for %s", attempt, self.max_retries, url)
+        timing = timing or ScrapeTiming(url)
 
         # Initialize browser if needed
+        phase_start = time.monotonic()
         await self._init_browser()
+        timing.add_phase('browser_acquire', time.monotonic() - phase_start)
 
-        # Create stealth page
-        page = await self._setup_stealth_page()
+        # Count the page as in flight before the next await, so a recycle waits for it
+        self._inflight_pages += 1
+        self._pages_drained.clear()
+        try:
+            return await self._load_page(url, feed_capture, timing)
+        finally:
+            self._inflight_pages -= 1
+            if self._inflight_pages == 0:
+                self._pages_drained.set()
+
+    async def _load_page(
+        self,
+        url: str,
+        feed_capture: Optional[FeedCapture] = None,
+        timing: Optional[ScrapeTiming] = None
+    ) -> str:
+        """Load a URL on a pooled page of the current browser and return its content.
+
+        Args:
+            url: The URL to scrape
+            feed_capture: Collects JSON feed responses of this page load (optional)
+            timing: Timing record the phases and traffic are added to (optional)
+
+        Returns:
+            The HTML content as a string
+        """
+        phases = {}  # Per-phase wall time in seconds, logged at the end
 
+        # Take a stealth page from the pool (created on demand on a miss); contexts
+        # are only reused for the same domain so cookies and storage do not leak across sites
+        phase_start = time.monotonic()
+        lease = await self.context_pool.acquire((urlparse(url).hostname or '').lower())
+        phases['context_setup'] = time.monotonic() - phase_start
+        page = lease.page
+        failed = True
+        blocking = None
+        caching = None
+        traffic = TrafficMeter()
+
+        # Everything after acquire runs under the try, so the lease is always released
         try:
-            # Add random delay before navigation
-            logger.debug("Adding random delay before navigation...")
-            await self._random_delay(0.5, 1.5)
+            self.governor.record_page()
+            blocking = await self.request_blocker.attach(page) if self.request_blocker else None
+            # Attached after the blocker so it sees requests first and hands blocked ones on
+            caching = await self.asset_cache.attach(page, lease.user_agent, self.request_blocker) if self.asset_cache else None
+            traffic.attach(page)
+            if feed_capture is not None:
+                feed_capture.attach(page)
+
+            if self.storage_state_store is not None:
+                phase_start = time.monotonic()
+                await self._restore_storage_state(lease, url)
+                phases['storage_state'] = time.monotonic() - phase_start
+
+            # Wait for this domain's turn unless this scrape already has it (other domains are not delayed)
+            phase_start = time.monotonic()
+            await self.scheduler.acquire(url, timing.turn if timing else None)
+            phases['politeness'] = time.monotonic() - phase_start
 
-            # Navigate to URL - wait for network to be idle for better content loading
+            # Navigate once: commit at domcontentloaded, then wait for later load milestones
+            # within the same deadline instead of reloading the page on a networkidle timeout
             logger.info("Navigating to %s (timeout=%dms)...", url, self.timeout)
-            try:
-                # Try networkidle first for full page load
-                response = await page.goto(url, timeout=self.timeout, wait_until='networkidle')
-                logger.debug("Page loaded with networkidle")
-            except Exception:
-                # Fallback to domcontentloaded if networkidle times out
-                logger.debug("Networkidle timed out, falling back to domcontentloaded")
-                response = await page.goto(url, timeout=self.timeout, wait_until='domcontentloaded')
+            phase_start = time.monotonic()
+            deadline = phase_start + self.timeout / 1000
+            response = await page.goto(url, timeout=self.timeout, wait_until='domcontentloaded')
+            phases['navigation'] = time.monotonic() - phase_start
+
+            phase_start = time.monotonic()
+            await self._wait_for_load_milestones(page, deadline)
+            phases['load_state'] = time.monotonic() - phase_start
 
             if response is None:
                 raise RuntimeError("No response received from page")
@@ -228,45 +869,171 @@ class ScraperService:
             if status >= 400:
                 logger.warning("HTTP error status: %d", status)
                 if status == 403:
-                    raise RuntimeError("Access forbidden - possible anti-bot block")
+                    raise BotBlockedError("Access forbidden - possible anti-bot block")
                 elif status == 429:
-                    raise RuntimeError("Rate limited")
+                    retry_after = parse_retry_after((response.headers or {}).get('retry-after'))
+                    raise RateLimitedError("Rate limited", retry_after=retry_after)
                 elif status >= 500:
-                    raise RuntimeError(f"Server error: {status}")
+                    raise ServerError(status)
 
             # Check for anti-bot indicators
             logger.debug("Checking for anti-bot indicators...")
-            content = await page.content()
+            phase_start = time.monotonic()
+            if self.extraction_mode == "records":
+                # Title and visible text are enough to spot block pages
+                content = await probe_bot_text(page)
+            else:
+                content = await page.content()
             if self._detect_bot_block(content):
-                logger.warning("Detected potential bot blocking - retrying")
-                raise RuntimeError("Anti-bot detection triggered")
+                logger.warning("Detected potential bot blocking")
+                raise BotBlockedError("Anti-bot detection triggered")
             logger.debug("No anti-bot indicators detected")
+            phases['bot_check'] = time.monotonic() - phase_start
 
-            # Wait for dynamic content to load (longer delay for news sites with lazy loading)
-            logger.debug("Waiting for dynamic content to fully load (images, scripts, etc)...")
-            await self._random_delay(3.0, 5.0)
+            # Wait until dynamic content stops changing instead of sleeping a fixed time
+            logger.debug("Waiting for dynamic content to settle...")
+            phase_start = time.monotonic()
+            readiness = await wait_for_content_ready(
+                page,
+                quiet_ms=self.readiness_quiet_ms,
+                max_wait_ms=self.readiness_max_wait_ms
+            )
+            phases['readiness'] = time.monotonic() - phase_start
 
-            # Scroll down to trigger lazy-loaded content
+            # Scroll down to trigger lazy-loaded content, waiting for each step to settle
             logger.debug("Scrolling page to trigger lazy-loaded content...")
+            phase_start = time.monotonic()
+            scroll_wait_ms = min(self.readiness_max_wait_ms, self.SCROLL_SETTLE_MAX_MS)
             try:
                 await page.evaluate("window.scrollTo(0, document.body.scrollHeight / 2)")
-                await asyncio.sleep(1)
+                await wait_for_content_ready(page, quiet_ms=self.readiness_quiet_ms, max_wait_ms=scroll_wait_ms)
                 await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(1)
+                await wait_for_content_ready(page, quiet_ms=self.readiness_quiet_ms, max_wait_ms=scroll_wait_ms)
             except Exception as e:
                 logger.debug(f"Scroll failed (may not be needed): {e}")
+            phases['scroll'] = time.monotonic() - phase_start
 
             # Get final HTML content
             logger.debug("Extracting final HTML content...")
-            html_content = await page.content()
+            phase_start = time.monotonic()
+            html_content = None
+            if self.extraction_mode == "records":
+                records = await extract_page_records(page)
+                if records:
+                    html_content = render_records_html(records, url)
+                    if timing is not None:
+                        timing.records = len(records)
+                    logger.info("Extracted %d headline records in page for %s", len(records), url)
+                else:
+                    logger.info("No records extracted in page for %s - using full HTML", url)
+            if html_content is None:
+                html_content = await page.content()
+            phases['content'] = time.monotonic() - phase_start
+
+            if feed_capture is not None:
+                phase_start = time.monotonic()
+                await feed_capture.evaluate()
+                phases['feed_capture'] = time.monotonic() - phase_start
+
+            if self.storage_state_store is not None:
+                phase_start = time.monotonic()
+                await self._save_storage_state(lease, url)
+                phases['storage_state'] = phases.get('storage_state', 0.0) + time.monotonic() - phase_start
 
+            logger.info(
+                "Scrape phases for %s: %s (headlines=%d, dom_quiet=%s)",
+                url,
+                ", ".join(f"{name}={seconds:.2f}s" for name, seconds in phases.items()),
+                readiness.headline_count,
+                not readiness.timed_out
+            )
             logger.info("Successfully scraped %s (content_length=%d chars, status=%d)", url, len(html_content), status)
+            if blocking:
+                logger.info(
+                    "Blocked %d of %d requests for %s (~%d KB saved): %s",
+                    blocking.stats.blocked_requests,
+                    blocking.stats.blocked_requests + blocking.stats.allowed_requests,
+                    url,
+                    blocking.stats.estimated_bytes_saved // 1024,
+                    blocking.stats.blocked_by_reason
+                )
+            if caching:
+                logger.info("Asset cache for %s: %s", url, caching.stats.to_dict())
+            failed = False
             return html_content
 
         finally:
-            # Clean up page and context
-            logger.debug("Cleaning up page and context...")
-            await page.context.close()
+            logger.debug("Releasing page and context...")
+            try:
+                if caching:
+                    await caching.detach()
+                if blocking:
+                    await blocking.detach()
+                traffic.detach(page)
+                if feed_capture is not None:
+                    feed_capture.detach(page)
+                if timing is not None:
+                    # Failed attempts count too: their time is part of the scrape
+                    timing.merge_phases(phases)
+                    timing.requests += traffic.requests
+                    timing.bytes_transferred += traffic.bytes
+                    if blocking:
+                        timing.blocked_requests += blocking.stats.blocked_requests
+                    if caching:
+                        timing.cached_requests += caching.stats.hits
+            finally:
+                # Return page to the pool, or close its context after an error / when pooling is off
+                await self.context_pool.release(lease, failed=failed)
+                logger.debug("Context pool stats: %s", self.context_pool.stats())
+
+    async def _restore_storage_state(self, lease: PooledPage, url: str):
+        """Give the lease's context the cookies and localStorage saved for the URL's domain."""
+        try:
+            state = await asyncio.to_thread(self.storage_state_store.load, lease.user_agent, url)
+            if state is None:
+                return
+            if state['cookies']:
+                await lease.context.add_cookies(state['cookies'])
+            for origin in state['origins']:
+                # Init scripts cannot be removed: install each origin's seed once per context
+                if origin['origin'] not in lease.seeded_origins:
+                    await lease.context.add_init_script(local_storage_script(origin))
+                    lease.seeded_origins.add(origin['origin'])
+            logger.debug("Restored %d cookies for %s", len(state['cookies']), url)
+        except Exception as e:
+            logger.warning("Failed to restore storage state for %s: %s", url, str(e))
+
+    async def _save_storage_state(self, lease: PooledPage, url: str):
+        """Save the context's cookies and localStorage of the URL's domain after a successful load."""
+        try:
+            state = await lease.context.storage_state()
+            await asyncio.to_thread(self.storage_state_store.save, lease.user_agent, url, state)
+        except Exception as e:
+            logger.warning("Failed to save storage state for %s: %s", url, str(e))
+
+    async def _wait_for_load_milestones(self, page: Page, deadline: float):
+        """Wait for 'load' and then 'networkidle' without exceeding the navigation deadline.
+
+        Pages with long-polling ads or websockets never go idle; in that case the
+        DOM is taken as it is (the readiness engine handles late content).
+
+        Args:
+            page: Page that has already committed at domcontentloaded
+            deadline: time.monotonic() value shared with the navigation
+        """
+        for state, cap_ms in (('load', None), ('networkidle', self.NETWORKIDLE_MAX_MS)):
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if cap_ms is not None:
+                remaining_ms = min(remaining_ms, cap_ms)
+            if remaining_ms <= 0:
+                logger.debug("Navigation deadline reached before '%s', using DOM as is", state)
+                return
+            try:
+                await page.wait_for_load_state(state, timeout=remaining_ms)
+                logger.debug("Page reached '%s'", state)
+            except PlaywrightTimeoutError:
+                logger.debug("Page did not reach '%s' within %dms, using DOM as is", state, remaining_ms)
+                return
 
     def _detect_bot_block(self, html_content: str) -> bool:
         """Detect if page contains anti-bot blocking indicators.
@@ -303,20 +1070,22 @@ class ScraperService:
 
         return False
 
-    async def _exponential_backoff(self, attempt: int):
-        """Wait with exponential backoff before retry.
-
-        Args:
-            attempt: Current attempt number
-        """
-        wait_time = min(2 ** attempt, 30)  # Max 30 seconds
-        jitter = random.uniform(0, 1)  # Add jitter
-        total_wait = wait_time + jitter
-        logger.info(f"Backing off for {total_wait:.2f} seconds before retry...")
-        await asyncio.sleep(total_wait)
-
     async def close(self):
         """Clean up resources and close browser instance."""
+        await self.context_pool.clear()
+
+        if self.http_fetcher is not None:
+            self.http_fetcher.close()
+
+        if self.snapshot_store is not None:
+            self.snapshot_store.close()
+
+        if self.feed_registry is not None:
+            self.feed_registry.close()
+
+        if self.feed_discovery is not None:
+            self.feed_discovery.close()
+
         if self.browser:
             logger.debug("Closing browser...")
             await self.browser.close()
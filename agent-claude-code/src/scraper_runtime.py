@@ -0,0 +1,232 @@
+"""Scraper Runtime Module
+
+This module keeps one warm ScraperService alive for the whole process.
+A background thread owns a dedicated asyncio event loop and the browser;
+synchronous callers (such as Gradio event handlers) submit coroutines to it.
+"""
+
+from typing import Any, Awaitable, Dict, Iterable, Iterator, Optional
+import logging
+import asyncio
+import queue
+import threading
+import concurrent.futures
+
+from scraper import ScraperService, ScrapeResult
+
+logger = logging.getLogger(__name__)
+
+
+class ScraperRuntime:
+    """Process-wide owner of a long-lived ScraperService.
+
+    Features:
+    - Dedicated asyncio event loop running in a daemon thread
+    - Single warm browser shared by all scrape requests
+    - Thread-safe submission from any number of worker threads
+    - Overlapping scrapes (each request gets its own page and context)
+    - Browser crash recovery (handled by ScraperService on the next attempt)
+    """
+
+    def __init__(self, scraper_config: Dict[str, Any]):
+        """Initialize the runtime. The loop thread is started lazily.
+
+        Args:
+            scraper_config: Keyword arguments for ScraperService
+        """
+        self.scraper_config = dict(scraper_config)
+        self.scraper: Optional[ScraperService] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        logger.info(f"ScraperRuntime initialized with config: {self.scraper_config}")
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background loop thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the background event loop thread (no-op if already running)."""
+        with self._lock:
+            if self.is_running:
+                return
+
+            logger.info("Starting scraper runtime loop thread...")
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(
+                target=self._run_loop,
+                args=(loop, ready),
+                name="scraper-runtime",
+                daemon=True
+            )
+            thread.start()
+            ready.wait()
+
+            self._loop = loop
+            self._thread = thread
+            self.scraper = ScraperService(**self.scraper_config)
+            logger.info("Scraper runtime started")
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop, ready: threading.Event):
+        """Thread target: run the event loop until close() stops it."""
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+            logger.debug("Scraper runtime loop closed")
+
+    def submit(self, coro: Awaitable) -> concurrent.futures.Future:
+        """Schedule a coroutine on the runtime loop.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Future resolving to the coroutine result
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the runtime loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Optional timeout in seconds
+
+        Returns:
+            The coroutine result (exceptions are re-raised in the caller)
+        """
+        return self.submit(coro).result(timeout)
+
+    def scrape(self, url: str, timeout: Optional[float] = None) -> str:
+        """Scrape a URL using the shared warm browser.
+
+        Args:
+            url: The URL to scrape
+            timeout: Optional timeout in seconds for the whole scrape
+
+        Returns:
+            The HTML content as a string
+        """
+        self.start()
+        return self.run(self.scraper.scrape(url), timeout)
+
+    def scrape_page(self, url: str, timeout: Optional[float] = None) -> ScrapeResult:
+        """Scrape a URL, preferring the site's JSON headline feed (see ScraperService.scrape_page).
+
+        Args:
+            url: The URL to scrape
+            timeout: Optional timeout in seconds for the whole scrape
+
+        Returns:
+            ScrapeResult with html and, when a feed was found, feed_items
+        """
+        self.start()
+        return self.run(self.scraper.scrape_page(url), timeout)
+
+    def scrape_many(
+        self,
+        urls: Iterable[str],
+        concurrency: int = 5,
+        per_domain_limit: int = 2
+    ) -> Iterator[ScrapeResult]:
+        """Scrape many URLs on the shared browser, yielding results as they complete.
+
+        Args:
+            urls: URLs to scrape
+            concurrency: Maximum number of pages loading at the same time
+            per_domain_limit: Maximum number of concurrent pages per domain
+
+        Yields:
+            ScrapeResult for each URL in completion order
+        """
+        self.start()
+        results: "queue.Queue[Optional[ScrapeResult]]" = queue.Queue()
+
+        async def pump():
+            try:
+                async for result in self.scraper.scrape_many(urls, concurrency, per_domain_limit):
+                    results.put(result)
+            finally:
+                results.put(None)
+
+        future = self.submit(pump())
+        try:
+            while True:
+                result = results.get()
+                if result is None:
+                    break
+                yield result
+            future.result()
+        finally:
+            if not future.done():
+                future.cancel()
+
+    def browser_metrics(self) -> Dict[str, Any]:
+        """Get browser memory/recycle metrics of the shared scraper.
+
+        Returns:
+            ScraperService.browser_metrics() (empty dict when the runtime is not running)
+        """
+        if not self.is_running:
+            return {}
+
+        async def collect():
+            return self.scraper.browser_metrics()
+
+        return self.run(collect(), timeout=5)
+
+    def timing_summary(self, domain: Optional[str] = None) -> Dict[str, Any]:
+        """Get per-domain, per-phase scrape timing histograms of the shared scraper.
+
+        Args:
+            domain: Only this domain (all domains when None)
+
+        Returns:
+            ScraperService.timing_summary() (empty dict when the runtime is not running)
+        """
+        if not self.is_running:
+            return {}
+
+        async def collect():
+            return self.scraper.timing_summary(domain)
+
+        return self.run(collect(), timeout=5)
+
+    def retry_metrics(self) -> Dict[str, Any]:
+        """Get circuit breaker states and retry budget counters of the shared scraper.
+
+        Returns:
+            ScraperService.retry_metrics() (empty dict when the runtime is not running)
+        """
+        if not self.is_running:
+            return {}
+
+        async def collect():
+            return self.scraper.retry_metrics()
+
+        return self.run(collect(), timeout=5)
+
+    def close(self, timeout: float = 30.0):
+        """Close the shared browser and stop the loop thread."""
+        with self._lock:
+            if not self.is_running:
+                return
+
+            logger.info("Stopping scraper runtime...")
+            try:
+                asyncio.run_coroutine_threadsafe(self.scraper.close(), self._loop).result(timeout)
+            except Exception as e:
+                logger.warning(f"Error while closing shared scraper: {str(e)}")
+
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+            self._loop = None
+            self._thread = None
+            self.scraper = None
+            logger.info("Scraper runtime stopped")
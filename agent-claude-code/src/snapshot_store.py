@@ -0,0 +1,242 @@
+"""Snapshot Store Module
+
+This module keeps raw HTML of scraped pages on disk so extraction can be
+re-run (other model, other prompt, retries, debugging) without opening a
+browser again. Blobs are content-addressed and zstd-compressed; a small
+SQLite index maps URL + fetch time to the blob.
+"""
+
+from typing import List, Optional
+from dataclasses import dataclass
+from pathlib import Path
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+import zstandard
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Snapshot:
+    """Index entry of a stored page snapshot."""
+
+    url: str
+    fetched_at: float
+    digest: str
+    raw_size: int
+    stored_size: int
+
+
+class SnapshotStore:
+    """Content-addressed, zstd-compressed HTML snapshot store.
+
+    Features:
+    - Identical pages are stored once (blob name is the SHA-256 of the HTML)
+    - Index keyed by URL and fetch time
+    - TTL-based lookup of the latest snapshot for a URL
+    - Size-bounded eviction of the least recently fetched blobs
+    """
+
+    def __init__(
+        self,
+        root_dir: str,
+        ttl_seconds: float = 120,
+        max_bytes: int = 200 * 1024 * 1024,
+        compression_level: int = 3
+    ):
+        """Initialize the snapshot store.
+
+        Nothing is created on disk until the first snapshot is written.
+
+        Args:
+            root_dir: Directory holding the index and the blobs
+            ttl_seconds: Maximum age of a snapshot returned by get_fresh (0 disables lookups)
+            max_bytes: Upper bound on compressed blob bytes kept on disk
+            compression_level: zstd compression level
+        """
+        self.root_dir = Path(root_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()  # Index and blob writes come from several threads
+        logger.info(f"SnapshotStore initialized (root={root_dir}, ttl={ttl_seconds}s, max_bytes={max_bytes})")
+
+    @property
+    def _index_path(self) -> Path:
+        return self.root_dir / 'index.db'
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root_dir / 'blobs' / digest[:2] / f"{digest}.html.zst"
+
+    def _get_connection(self, create: bool) -> Optional[sqlite3.Connection]:
+        """Get the index connection, creating the index only when asked to."""
+        if self._connection is None:
+            if not create and not self._index_path.exists():
+                return None
+            self.root_dir.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self._index_path), check_same_thread=False)
+            self._connection.row_factory = sqlite3.Row
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    url TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    digest TEXT NOT NULL,
+                    raw_size INTEGER NOT NULL,
+                    stored_size INTEGER NOT NULL
+                )
+            """)
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_snapshots_url_time ON snapshots(url, fetched_at)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_snapshots_digest ON snapshots(digest)"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def put(self, url: str, html_content: str) -> Snapshot:
+        """Store a snapshot of a page.
+
+        Args:
+            url: Source URL
+            html_content: Raw page HTML
+
+        Returns:
+            The index entry of the stored snapshot
+        """
+        raw = html_content.encode('utf-8')
+        digest = hashlib.sha256(raw).hexdigest()
+        blob_path = self._blob_path(digest)
+
+        with self._lock:
+            conn = self._get_connection(create=True)
+
+            if blob_path.exists():
+                stored_size = blob_path.stat().st_size
+            else:
+                compressed = zstandard.ZstdCompressor(level=self.compression_level).compress(raw)
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                # Write-then-rename so readers never see a partial blob
+                fd, tmp_path = tempfile.mkstemp(dir=blob_path.parent, suffix='.tmp')
+                with os.fdopen(fd, 'wb') as tmp:
+                    tmp.write(compressed)
+                os.replace(tmp_path, blob_path)
+                stored_size = len(compressed)
+
+            snapshot = Snapshot(url, time.time(), digest, len(raw), stored_size)
+            conn.execute(
+                "INSERT INTO snapshots (url, fetched_at, digest, raw_size, stored_size) VALUES (?, ?, ?, ?, ?)",
+                (snapshot.url, snapshot.fetched_at, snapshot.digest, snapshot.raw_size, snapshot.stored_size)
+            )
+            conn.commit()
+            self._evict(conn)
+
+        logger.debug(f"Stored snapshot of {url}: {len(raw)} -> {stored_size} bytes ({digest[:12]})")
+        return snapshot
+
+    def latest(self, url: str, max_age: Optional[float] = None) -> Optional[Snapshot]:
+        """Get the most recent snapshot entry for a URL.
+
+        Args:
+            url: Source URL
+            max_age: Maximum age in seconds (None = any age)
+
+        Returns:
+            Snapshot entry or None
+        """
+        with self._lock:
+            conn = self._get_connection(create=False)
+            if conn is None:
+                return None
+            min_time = time.time() - max_age if max_age is not None else 0
+            row = conn.execute(
+                "SELECT * FROM snapshots WHERE url = ? AND fetched_at >= ? ORDER BY fetched_at DESC LIMIT 1",
+                (url, min_time)
+            ).fetchone()
+        if row is None:
+            return None
+        return Snapshot(row['url'], row['fetched_at'], row['digest'], row['raw_size'], row['stored_size'])
+
+    def history(self, url: str) -> List[Snapshot]:
+        """List all stored snapshots of a URL, newest first."""
+        with self._lock:
+            conn = self._get_connection(create=False)
+            if conn is None:
+                return []
+            rows = conn.execute(
+                "SELECT * FROM snapshots WHERE url = ? ORDER BY fetched_at DESC", (url,)
+            ).fetchall()
+        return [Snapshot(r['url'], r['fetched_at'], r['digest'], r['raw_size'], r['stored_size']) for r in rows]
+
+    def load(self, digest: str) -> Optional[str]:
+        """Read and decompress a blob.
+
+        Args:
+            digest: Content digest of the snapshot
+
+        Returns:
+            HTML content or None if the blob is gone
+        """
+        try:
+            compressed = self._blob_path(digest).read_bytes()
+        except FileNotFoundError:
+            return None
+        return zstandard.ZstdDecompressor().decompress(compressed).decode('utf-8')
+
+    def get_fresh(self, url: str) -> Optional[str]:
+        """Get the HTML of the latest snapshot of a URL if it is within the TTL.
+
+        Args:
+            url: Source URL
+
+        Returns:
+            HTML content or None if there is no fresh snapshot
+        """
+        if self.ttl_seconds <= 0:
+            return None
+
+        snapshot = self.latest(url, max_age=self.ttl_seconds)
+        if snapshot is None:
+            return None
+
+        html_content = self.load(snapshot.digest)
+        if html_content is not None:
+            logger.info(f"Using snapshot of {url} from {time.time() - snapshot.fetched_at:.0f}s ago")
+        return html_content
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Delete the least recently fetched blobs until the store fits max_bytes."""
+        rows = conn.execute("""
+            SELECT digest, MAX(stored_size) AS size, MAX(fetched_at) AS last_fetched
+            FROM snapshots GROUP BY digest ORDER BY last_fetched ASC
+        """).fetchall()
+        total = sum(row['size'] for row in rows)
+
+        evicted = 0
+        # Never evict the newest blob, even if it alone exceeds the bound
+        for row in rows[:-1]:
+            if total <= self.max_bytes:
+                break
+            self._blob_path(row['digest']).unlink(missing_ok=True)
+            conn.execute("DELETE FROM snapshots WHERE digest = ?", (row['digest'],))
+            total -= row['size']
+            evicted += 1
+
+        if evicted:
+            conn.commit()
+            logger.info(f"Evicted {evicted} snapshot blobs, store size now {total} bytes")
+
+    def close(self):
+        """Close the index connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,172 @@
+"""Storage State Module
+
+This module keeps a site's cookies and localStorage between scrapes. Every
+browser context starts empty, so without it each scrape sees the cookie
+banner, consent wall or bot interstitial again. State is stored per domain
+and per user-agent profile (a clearance cookie issued to one user agent is
+not replayed with another), expires after a TTL and is size-bounded.
+"""
+
+from typing import Any, Dict, List, Optional
+from pathlib import Path
+from urllib.parse import urlparse
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def user_agent_key(user_agent: str) -> str:
+    """Short stable key of a user agent, used to isolate per-profile state on disk."""
+    return hashlib.sha1(user_agent.encode('utf-8')).hexdigest()[:12]
+
+
+def _host_matches(host: str, domain: str) -> bool:
+    """Whether a cookie/origin domain belongs to the scraped host (parent or subdomain)."""
+    domain = domain.lstrip('.').lower()
+    return bool(domain) and (host == domain or host.endswith('.' + domain) or domain.endswith('.' + host))
+
+
+def filter_state(state: Dict[str, Any], host: str, now: Optional[float] = None) -> Dict[str, List[Any]]:
+    """Keep the unexpired cookies and the localStorage origins of one host.
+
+    Args:
+        state: Playwright storage state ({"cookies": [...], "origins": [...]})
+        host: Scraped host name
+        now: Current Unix time (defaults to time.time())
+
+    Returns:
+        Filtered storage state
+    """
+    now = time.time() if now is None else now
+    cookies = [
+        cookie for cookie in state.get('cookies', [])
+        if _host_matches(host, cookie.get('domain', '')) and not (0 < cookie.get('expires', -1) <= now)
+    ]
+    origins = [
+        origin for origin in state.get('origins', [])
+        if _host_matches(host, urlparse(origin.get('origin', '')).hostname or '') and origin.get('localStorage')
+    ]
+    return {'cookies': cookies, 'origins': origins}
+
+
+def local_storage_script(origin: Dict[str, Any]) -> str:
+    """Init script seeding one origin's localStorage (keys the page already has are kept)."""
+    seed = json.dumps({'origin': origin['origin'], 'items': [[i['name'], i['value']] for i in origin['localStorage']]})
+    return f"""
+        (seed => {{
+            if (location.origin !== seed.origin) return;
+            try {{
+                for (const [name, value] of seed.items) {{
+                    if (localStorage.getItem(name) === null) localStorage.setItem(name, value);
+                }}
+            }} catch (e) {{}}
+        }})({seed});
+    """
+
+
+class StorageStateStore:
+    """Per-domain, per-user-agent cookies and localStorage on disk.
+
+    Features:
+    - One JSON file per (user-agent profile, domain)
+    - Expired cookies are dropped on load, whole entries after `ttl_seconds`
+    - Size-bounded eviction of the least recently saved entries
+    """
+
+    def __init__(self, root_dir: str, ttl_seconds: float = 24 * 3600, max_bytes: int = 20 * 1024 * 1024):
+        """Initialize the store. Nothing is created on disk until the first save.
+
+        Args:
+            root_dir: Directory holding the state files
+            ttl_seconds: Age after which a domain's state is discarded
+            max_bytes: Upper bound on state bytes kept on disk
+        """
+        self.root_dir = Path(root_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        logger.info(f"StorageStateStore initialized (root={root_dir}, ttl={ttl_seconds}s, max_bytes={max_bytes})")
+
+    def _path(self, user_agent: str, url: str) -> Path:
+        host = (urlparse(url).hostname or '').lower()
+        return self.root_dir / user_agent_key(user_agent) / f"{host}.json"
+
+    def load(self, user_agent: str, url: str) -> Optional[Dict[str, List[Any]]]:
+        """Get the stored state of the URL's domain for a user agent.
+
+        Args:
+            user_agent: User agent of the context the state is applied to
+            url: URL about to be scraped
+
+        Returns:
+            Storage state, or None if there is none (or it expired)
+        """
+        path = self._path(user_agent, url)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                logger.debug(f"Storage state of {url} expired")
+                return None
+            state = json.loads(path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable storage state {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        state = filter_state(state, (urlparse(url).hostname or '').lower())
+        return state if state['cookies'] or state['origins'] else None
+
+    def save(self, user_agent: str, url: str, state: Dict[str, Any]):
+        """Store a context's state for the URL's domain.
+
+        Args:
+            user_agent: User agent of the context
+            url: Scraped URL
+            state: Playwright storage state of the context (filtered to the domain)
+        """
+        state = filter_state(state, (urlparse(url).hostname or '').lower())
+        if not state['cookies'] and not state['origins']:
+            return
+
+        path = self._path(user_agent, url)
+        data = json.dumps(state, separators=(',', ':')).encode('utf-8')
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a concurrent load never sees a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as tmp:
+                tmp.write(data)
+            os.replace(tmp_path, path)
+            self._evict()
+        logger.debug(f"Stored storage state of {url}: {len(state['cookies'])} cookies, {len(state['origins'])} origins")
+
+    def _evict(self):
+        """Delete expired entries, then the oldest ones until the store fits max_bytes."""
+        now = time.time()
+        entries = []
+        for path in self.root_dir.glob('*/*.json'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if now - stat.st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        # Never evict the newest entry, even if it alone exceeds the bound
+        for _, size, path in entries[:-1]:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
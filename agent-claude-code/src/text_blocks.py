@@ -0,0 +1,283 @@
+"""Streaming Text Block Extractor
+
+This module reads HTML incrementally with the standard library tokenizer
+(html.parser.HTMLParser) and yields the page text as blocks without ever
+building a document tree:
+
+- a block is the text between two block-level tag boundaries (p, h1-h6,
+  li, div, ...), so all of its strings share one innermost block element
+- every block carries its tag path, heading level, link density and the
+  links and <time> values that ended inside it
+- the content of skipped elements (scripts, styles, ...) is dropped as it
+  streams past
+
+The tokenizer only keeps the unparsed tail of the current chunk and the
+stack of open elements, so memory is bounded by what the consumer keeps.
+With max_chars set, reading stops as soon as that much text has been yielded.
+"""
+
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+import itertools
+
+# Tags that start a new block; container tags used for content selection are all here
+BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'body', 'caption', 'dd', 'details', 'dialog',
+    'div', 'dl', 'dt', 'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3',
+    'h4', 'h5', 'h6', 'head', 'header', 'hgroup', 'hr', 'html', 'li', 'main', 'nav', 'ol', 'p',
+    'pre', 'section', 'summary', 'table', 'tbody', 'td', 'tfoot', 'th', 'thead', 'title', 'tr', 'ul',
+})
+
+# Elements without content or end tag (never pushed on the open-element stack)
+VOID_TAGS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link', 'meta',
+    'param', 'source', 'track', 'wbr',
+})
+
+DEFAULT_SKIPPED_TAGS = ('script', 'style', 'noscript', 'template')
+
+HEADING_LEVELS = {f'h{level}': level for level in range(1, 7)}
+
+# Link and <time> texts longer than this are cut (a link wrapping a whole page must not grow unbounded)
+MAX_INLINE_CHARS = 2000
+
+CHUNK_SIZE = 64 * 1024
+
+
+class PathNode(NamedTuple):
+    """An open element on a block's tag path."""
+
+    tag: str
+    id: str
+    classes: str
+    href: str
+    serial: int  # Position of the start tag in the document (unique per element)
+
+    def __str__(self) -> str:
+        name = self.tag + (f"#{self.id}" if self.id else '')
+        return name + ''.join(f".{cls}" for cls in self.classes.split())
+
+
+@dataclass
+class TextBlock:
+    """Text strings sharing one innermost block element."""
+
+    path: Tuple[PathNode, ...]
+    lines: List[str] = field(default_factory=list)
+    link_chars: int = 0
+    links: List[Tuple[str, str]] = field(default_factory=list)  # (text, href) of <a> closed in the block
+    times: List[str] = field(default_factory=list)  # datetime (or text) of <time> closed in the block
+
+    @property
+    def text(self) -> str:
+        return ' '.join(self.lines)
+
+    @property
+    def chars(self) -> int:
+        return sum(len(line) for line in self.lines)
+
+    @property
+    def tag_path(self) -> str:
+        return ' > '.join(str(node) for node in self.path)
+
+    @property
+    def heading_level(self) -> int:
+        """Level of the nearest enclosing h1-h6 (0 outside headings)."""
+        for node in reversed(self.path):
+            if node.tag in HEADING_LEVELS:
+                return HEADING_LEVELS[node.tag]
+        return 0
+
+    @property
+    def link_density(self) -> float:
+        """Share of the block's characters that are link text."""
+        chars = self.chars
+        return self.link_chars / chars if chars else 0.0
+
+
+class _Inline:
+    """Text collector of an open <a> or <time> element."""
+
+    __slots__ = ('value', 'parts', 'size')
+
+    def __init__(self, value: str):
+        self.value = value
+        self.parts: List[str] = []
+        self.size = 0
+
+    def add(self, text: str) -> None:
+        if self.size < MAX_INLINE_CHARS:
+            self.parts.append(text)
+            self.size += len(text) + 1
+
+    def text(self) -> str:
+        return ' '.join(self.parts)[:MAX_INLINE_CHARS]
+
+
+class TextBlockExtractor(HTMLParser):
+    """Incremental tokenizer that turns fed HTML chunks into TextBlocks.
+
+    Features:
+    - Unclosed and stray end tags are handled like BeautifulSoup's html.parser tree
+      builder: an end tag closes up to the most recent open element of that name
+    - Text split across chunk boundaries is merged back into one string
+    - Completed blocks are collected until drain() is called
+    """
+
+    def __init__(self, skipped_tags: Iterable[str] = DEFAULT_SKIPPED_TAGS):
+        """Initialize the extractor.
+
+        Args:
+            skipped_tags: Elements whose content is dropped
+        """
+        super().__init__(convert_charrefs=True)
+        self.skipped_tags = frozenset(skipped_tags)
+        self._stack: List[PathNode] = []
+        self._skipping = 0
+        self._serial = 0
+        self._pending: List[str] = []
+        self._block: Optional[TextBlock] = None
+        self._inline: Dict[int, _Inline] = {}
+        self._links: List[_Inline] = []
+        self._times: List[_Inline] = []
+        self._ready: List[TextBlock] = []
+
+    def drain(self) -> List[TextBlock]:
+        """Return and forget the blocks completed so far."""
+        ready, self._ready = self._ready, []
+        return ready
+
+    def close(self) -> None:
+        super().close()
+        self._flush_text()
+        while self._stack:
+            self._pop()
+        self._end_block()
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if tag in VOID_TAGS:
+            return
+        values = dict(attrs)
+        node = PathNode(tag, values.get('id') or '', values.get('class') or '', values.get('href') or '', self._serial)
+        self._serial += 1
+        self._stack.append(node)
+        if tag in self.skipped_tags:
+            self._skipping += 1
+        if self._skipping:
+            return
+        if tag in BLOCK_TAGS:
+            self._end_block()
+        if tag == 'a':
+            self._inline[node.serial] = link = _Inline(node.href)
+            self._links.append(link)
+        elif tag == 'time':
+            self._inline[node.serial] = time_el = _Inline(values.get('datetime') or '')
+            self._times.append(time_el)
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag in VOID_TAGS:
+            return
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index].tag == tag:
+                while len(self._stack) > index:
+                    self._pop()
+                return
+
+    def handle_data(self, data):
+        if not self._skipping:
+            self._pending.append(data)
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+    def handle_decl(self, decl):
+        self._flush_text()
+
+    def handle_pi(self, data):
+        self._flush_text()
+
+    def unknown_decl(self, data):
+        self._flush_text()
+
+    def _pop(self) -> None:
+        node = self._stack.pop()
+        inline = self._inline.pop(node.serial, None)
+        if inline is not None:
+            block = self._current_block()
+            if node.tag == 'a':
+                self._links.remove(inline)
+                block.links.append((inline.text(), inline.value))
+            else:
+                self._times.remove(inline)
+                block.times.append(inline.value or inline.text())
+        if node.tag in self.skipped_tags:
+            self._skipping -= 1
+        elif not self._skipping and node.tag in BLOCK_TAGS:
+            self._end_block()
+
+    def _current_block(self) -> TextBlock:
+        if self._block is None:
+            depth = 0
+            for index, node in enumerate(self._stack):
+                if node.tag in BLOCK_TAGS:
+                    depth = index + 1
+            self._block = TextBlock(path=tuple(self._stack[:depth]))
+        return self._block
+
+    def _end_block(self) -> None:
+        block, self._block = self._block, None
+        if block is not None and (block.lines or block.links or block.times):
+            self._ready.append(block)
+
+    def _flush_text(self) -> None:
+        if not self._pending:
+            return
+        text = ''.join(self._pending).strip()
+        self._pending = []
+        if not text:
+            return
+        block = self._current_block()
+        block.lines.append(text)
+        if self._links:
+            block.link_chars += len(text)
+        for inline in itertools.chain(self._links, self._times):
+            inline.add(text)
+
+
+def iter_text_blocks(
+    source: Union[str, Iterable[str]],
+    max_chars: Optional[int] = None,
+    skipped_tags: Iterable[str] = DEFAULT_SKIPPED_TAGS,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[TextBlock]:
+    """Yield the text blocks of a page in document order while reading it.
+
+    Args:
+        source: HTML string, or an iterable of HTML chunks (e.g. a streamed response)
+        max_chars: Stop reading once this many block characters were yielded (None reads everything)
+        skipped_tags: Elements whose content is dropped
+        chunk_size: Chunk length used to feed a string source
+
+    Yields:
+        TextBlock objects; closing the generator stops reading the source
+    """
+    if isinstance(source, str):
+        html = source
+        chunks: Iterable[str] = (html[start:start + chunk_size] for start in range(0, len(html), chunk_size))
+    else:
+        chunks = source
+    extractor = TextBlockExtractor(skipped_tags)
+    yielded = 0
+    for chunk in itertools.chain(chunks, [None]):
+        if chunk is None:
+            extractor.close()
+        else:
+            extractor.feed(chunk)
+        for block in extractor.drain():
+            yield block
+            yielded += block.chars
+            if max_chars is not None and yielded >= max_chars:
+                return
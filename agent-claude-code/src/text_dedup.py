@@ -0,0 +1,146 @@
+"""Text Deduplication Module
+
+This module removes repeated text from the LLM input so the character
+budget goes to distinct stories. News homepages repeat themselves: the same
+headline appears in a heading, its link and the teaser block, and teasers
+are repeated in "most read" lists.
+
+Deduplication is order-preserving:
+
+- exact duplicates are detected by a hash of the normalized text (case,
+  punctuation and whitespace differences are ignored)
+- near duplicates by containment: a text whose words appear, contiguously,
+  inside an already kept text is dropped, and a text that contains earlier
+  kept texts (an article block after its headline) replaces them
+- texts shorter than MIN_DEDUP_CHARS (times, tags, bylines) are always kept,
+  since the same "10:15" belongs to different stories
+
+Word n-gram indexes find containment candidates, so texts are not compared
+pairwise.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import hashlib
+import re
+
+# Normalized texts shorter than this are never deduplicated
+MIN_DEDUP_CHARS = 20
+
+# Word n-gram length used by the containment indexes
+GRAM_WORDS = 3
+
+NON_WORD_RE = re.compile(r'[\W_]+')
+
+
+def normalize_for_dedup(text: str) -> str:
+    """Casefolded words of a text separated by single spaces."""
+    return NON_WORD_RE.sub(' ', text.casefold()).strip()
+
+
+def _grams(words: List[str]) -> List[Tuple[str, ...]]:
+    return [tuple(words[i:i + GRAM_WORDS]) for i in range(len(words) - GRAM_WORDS + 1)]
+
+
+@dataclass
+class DedupReport:
+    """What deduplication removed."""
+
+    texts_before: int = 0
+    texts_after: int = 0
+    duplicate_chars: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "texts_before": self.texts_before,
+            "texts_after": self.texts_after,
+            "duplicate_chars": self.duplicate_chars,
+        }
+
+
+@dataclass
+class _Kept:
+    text: str
+    padded: str  # " normalized text " for whole-word containment checks
+    alive: bool = True
+
+
+@dataclass
+class _Index:
+    """Kept texts with their hash set and containment indexes."""
+
+    kept: List[_Kept] = field(default_factory=list)
+    digests: Set[bytes] = field(default_factory=set)
+    any_gram: Dict[Tuple[str, ...], Set[int]] = field(default_factory=dict)  # Finds texts containing a new one
+    first_gram: Dict[Tuple[str, ...], Set[int]] = field(default_factory=dict)  # Finds texts a new one contains
+    few_words: List[int] = field(default_factory=list)  # Kept texts shorter than GRAM_WORDS words
+
+    def is_contained(self, padded: str, grams: List[Tuple[str, ...]]) -> bool:
+        ids: Iterable[int] = self.any_gram.get(grams[0], ()) if grams else range(len(self.kept))
+        return any(self.kept[i].alive and padded in self.kept[i].padded for i in ids)
+
+    def contained_in(self, padded: str, grams: List[Tuple[str, ...]]) -> List[int]:
+        ids = set(self.few_words)
+        for gram in set(grams):
+            ids.update(self.first_gram.get(gram, ()))
+        return [i for i in sorted(ids) if self.kept[i].alive and self.kept[i].padded in padded]
+
+    def add(self, text: str, padded: str, digest: bytes, grams: List[Tuple[str, ...]]) -> int:
+        kept_id = len(self.kept)
+        self.kept.append(_Kept(text, padded))
+        self.digests.add(digest)
+        for gram in grams:
+            self.any_gram.setdefault(gram, set()).add(kept_id)
+        if grams:
+            self.first_gram.setdefault(grams[0], set()).add(kept_id)
+        else:
+            self.few_words.append(kept_id)
+        return kept_id
+
+
+def dedup_texts(
+    texts: Iterable[str],
+    min_chars: int = MIN_DEDUP_CHARS,
+    max_chars: Optional[int] = None,
+) -> Tuple[List[str], DedupReport]:
+    """Drop repeated texts, keeping document order.
+
+    Args:
+        texts: Texts (e.g. lines of the cleaned page) in document order
+        min_chars: Normalized texts shorter than this are always kept
+        max_chars: Stop reading texts once the kept ones exceed this many
+            characters (the caller truncates there anyway)
+
+    Returns:
+        Kept texts and the DedupReport
+    """
+    index = _Index()
+    report = DedupReport()
+    order: List[Tuple[int, str]] = []  # (kept id, or -1 for short texts, text)
+    kept_chars = 0
+    for text in texts:
+        if max_chars is not None and kept_chars > max_chars:
+            break
+        report.texts_before += 1
+        norm = normalize_for_dedup(text)
+        if len(norm) < min_chars:
+            order.append((-1, text))
+            kept_chars += len(text) + 1
+            continue
+
+        digest = hashlib.blake2b(norm.encode('utf-8'), digest_size=8).digest()
+        grams = _grams(norm.split())
+        padded = f" {norm} "
+        if digest in index.digests or index.is_contained(padded, grams):
+            report.duplicate_chars += len(text)
+            continue
+        for i in index.contained_in(padded, grams):
+            index.kept[i].alive = False
+            report.duplicate_chars += len(index.kept[i].text)
+            kept_chars -= len(index.kept[i].text) + 1
+        order.append((index.add(text, padded, digest, grams), text))
+        kept_chars += len(text) + 1
+
+    result = [text for kept_id, text in order if kept_id < 0 or index.kept[kept_id].alive]
+    report.texts_after = len(result)
+    return result, report
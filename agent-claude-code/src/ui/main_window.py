@@ -5,16 +5,17 @@ Built with Gradio for cross-platform compatibility and easy Docker deployment.
 """
 
 import logging
-import asyncio
 import os
 from typing import Tuple
 
 import gradio as gr
 
 from scraper import ScraperService
+from scraper_runtime import ScraperRuntime
 from llm_service import OpenRouterService
 from database import DatabaseService
 from csv_exporter import CSVExporter
+from page_fingerprint import compute_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -29,8 +30,13 @@ class MainWindow:
     - Status/log display area
     - Progress feedback
     - Error display
+    - Concurrent scrapes on one shared, warm browser
+    - Unchanged pages skip LLM extraction (content fingerprint)
     """
 
+    # Number of scrape requests Gradio may run at the same time
+    MAX_CONCURRENT_SCRAPES = 4
+
     def __init__(
         self,
         scraper: ScraperService,
@@ -46,12 +52,37 @@ class MainWindow:
             database: DatabaseService instance
             csv_exporter: CSVExporter instance
         """
-        # Store scraper config, not instance (to avoid event loop issues)
+        # Store scraper config, not instance: the shared browser lives on the runtime's own loop
         self.scraper_config = {
             'timeout': scraper.timeout,
             'headless': scraper.headless,
-            'max_retries': scraper.max_retries
+            'max_retries': scraper.max_retries,
+            'context_pool_size': scraper.context_pool_size,
+            'context_max_uses': scraper.context_max_uses,
+            'block_resources': scraper.block_resources,
+            'readiness_quiet_ms': scraper.readiness_quiet_ms,
+            'readiness_max_wait_ms': scraper.readiness_max_wait_ms,
+            'http_first': scraper.http_first,
+            'extraction_mode': scraper.extraction_mode,
+            'capture_feeds': scraper.capture_feeds,
+            'discover_feeds': scraper.discover_feeds,
+            'recycle_after_pages': scraper.recycle_after_pages,
+            'recycle_rss_mb': scraper.recycle_rss_mb,
+            'browser_profile': scraper.browser_profile,
+            'browser_executable': scraper.browser_executable,
+            'retry_budget_ratio': scraper.retry_budget_ratio,
+            'circuit_failure_threshold': scraper.circuit_failure_threshold,
+            'circuit_cooldown': scraper.circuit_cooldown,
+            'snapshot_dir': scraper.snapshot_dir,
+            'snapshot_ttl': scraper.snapshot_ttl,
+            'snapshot_max_bytes': scraper.snapshot_max_bytes,
+            'storage_state_dir': scraper.storage_state_dir,
+            'storage_state_ttl': scraper.storage_state_ttl,
+            'asset_cache_dir': scraper.asset_cache_dir,
+            'asset_cache_ttl': scraper.asset_cache_ttl,
+            'asset_cache_max_bytes': scraper.asset_cache_max_bytes
         }
+        self.scraper_runtime = ScraperRuntime(self.scraper_config)
         self.llm_service = llm_service
         self.database = database
         self.csv_exporter = csv_exporter
@@ -103,7 +134,8 @@ class MainWindow:
             scrape_btn.click(
                 fn=self.handle_scrape,
                 inputs=[url_input],
-                outputs=[status_output]
+                outputs=[status_output],
+                concurrency_limit=self.MAX_CONCURRENT_SCRAPES
             )
 
             export_btn.click(
@@ -163,27 +195,57 @@ class MainWindow:
             logger.info("Step 1/4: Starting web scraper...")
             scrape_start = time.time()
 
-            # Create new scraper instance for each request to avoid event loop issues
-            async def scrape_with_new_instance():
-                async with ScraperService(**self.scraper_config) as scraper:
-                    return await scraper.scrape(url)
-
-            html_content = asyncio.run(scrape_with_new_instance())
+            # Scrape on the shared runtime loop (browser stays warm between requests)
+            feed_items = None
+            timing = None
+            if self.scraper_config.get('capture_feeds') or self.scraper_config.get('discover_feeds'):
+                page = self.scraper_runtime.scrape_page(url)
+                html_content, feed_items, timing = page.html, page.feed_items, page.timing
+            else:
+                html_content = self.scraper_runtime.scrape(url)
             scrape_duration = time.time() - scrape_start
 
-            status_messages.append(f"  Success: Retrieved {len(html_content)} characters of HTML content")
-            logger.info(f"Scraping completed in {scrape_duration:.2f}s, HTML length: {len(html_content)} chars")
+            if timing is not None and timing.phases:
+                slowest = sorted(timing.phases.items(), key=lambda phase: phase[1], reverse=True)[:3]
+                status_messages.append(
+                    f"  Timing ({timing.source}): "
+                    + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in slowest)
+                )
+
+            if feed_items:
+                status_messages.append(f"  Success: Read {len(feed_items)} headlines from the site's feed")
+                logger.info(f"Scraping completed in {scrape_duration:.2f}s, {len(feed_items)} feed items")
+                # Headline list is the content; page chrome around it does not matter
+                fingerprint = compute_fingerprint("\n".join(item.title for item in feed_items))
+            else:
+                status_messages.append(f"  Success: Retrieved {len(html_content)} characters of HTML content")
+                logger.info(f"Scraping completed in {scrape_duration:.2f}s, HTML length: {len(html_content)} chars")
+                fingerprint = compute_fingerprint(html_content)
+
+            # Same normalized content as the last processed scrape: nothing new for the LLM
+            if fingerprint == self.database.get_page_fingerprint(url):
+                total_duration = time.time() - start_time
+                status_messages.append("\nUnchanged: page content is the same as the last scrape.")
+                status_messages.append("  Skipped AI extraction; news in the database is up to date.")
+                status_messages.append(f"\nTotal time: {total_duration:.2f}s")
+                logger.info(f"Page unchanged (fingerprint {fingerprint[:12]}), pipeline ended in {total_duration:.2f}s")
+                return "\n".join(status_messages)
 
             # Step 2: LLM Extraction
-            status_messages.append("\nStep 2/4: Extracting news with AI...")
-            logger.info("Step 2/4: Sending HTML to LLM for extraction...")
-            llm_start = time.time()
+            if feed_items:
+                news_items = feed_items
+                status_messages.append("\nStep 2/4: Skipped AI extraction (structured feed)")
+                logger.info("Step 2/4: Using feed items, no LLM call")
+            else:
+                status_messages.append("\nStep 2/4: Extracting news with AI...")
+                logger.info("Step 2/4: Sending HTML to LLM for extraction...")
+                llm_start = time.time()
 
-            news_items = self.llm_service.extract_news(html_content, url)
-            llm_duration = time.time() - llm_start
+                news_items = self.llm_service.extract_news(html_content, url)
+                llm_duration = time.time() - llm_start
 
-            status_messages.append(f"  Success: Extracted {len(news_items)} news articles")
-            logger.info(f"LLM extraction completed in {llm_duration:.2f}s, extracted {len(news_items)} items")
+                status_messages.append(f"  Success: Extracted {len(news_items)} news articles")
+                logger.info(f"LLM extraction completed in {llm_duration:.2f}s, extracted {len(news_items)} items")
 
             if not news_items:
                 status_messages.append("\nWarning: No news articles found on this page.")
@@ -197,6 +259,7 @@ class MainWindow:
             # Convert NewsItem objects to dicts
             news_dicts = [item.to_dict() for item in news_items]
             saved_count = self.database.save_news(url, news_dicts)
+            self.database.save_page_fingerprint(url, fingerprint)
             db_duration = time.time() - db_start
 
             status_messages.append(f"  Success: Saved {saved_count} articles to database")
@@ -371,3 +434,9 @@ You can start scraping new websites.
         except Exception as e:
             logger.error(f"Failed to launch interface: {str(e)}")
             raise
+        finally:
+            self.close()
+
+    def close(self):
+        """Release the shared browser and stop the scraper runtime."""
+        self.scraper_runtime.close()
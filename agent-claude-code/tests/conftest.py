@@ -30,6 +30,9 @@ def mock_playwright_page():
     page.goto = AsyncMock(return_value=AsyncMock(status=200))
     page.content = AsyncMock(return_value="<html><body><h1>Test Page</h1></body></html>")
     page.add_init_script = AsyncMock()
+    # Event registration is synchronous in Playwright
+    page.on = Mock()
+    page.remove_listener = Mock()
 
     # Mock context
     context = AsyncMock()
@@ -50,6 +53,7 @@ def mock_playwright_browser(mock_playwright_page):
     context = mock_playwright_page.context
     browser.new_context = AsyncMock(return_value=context)
     browser.close = AsyncMock()
+    browser.is_connected = Mock(return_value=True)
 
     return browser
 
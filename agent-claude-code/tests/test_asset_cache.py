@@ -0,0 +1,128 @@
+"""Unit tests for the shared on-disk asset cache.
+
+Routes and requests are mocked; no browser or network is used.
+"""
+
+import os
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from asset_cache import AssetCache, cache_lifetime
+from request_blocker import RequestBlocker
+
+CHROME = "Mozilla/5.0 (X11; Linux x86_64) Chrome/120.0.0.0"
+FIREFOX = "Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0"
+JS = {'content-type': 'application/javascript'}
+
+
+def make_route(url="https://cdn.example.com/app.js", resource_type="script", method="GET", body=b"console.log(1)",
+               headers=None):
+    request = MagicMock()
+    request.url = url
+    request.resource_type = resource_type
+    request.method = method
+    response = MagicMock()
+    response.status = 200
+    response.headers = headers if headers is not None else {
+        'Content-Type': 'application/javascript', 'Content-Encoding': 'gzip', 'Content-Length': '30'
+    }
+    response.body = AsyncMock(return_value=body)
+    route = MagicMock()
+    route.fetch = AsyncMock(return_value=response)
+    route.fulfill = AsyncMock()
+    route.fallback = AsyncMock()
+    return route, request
+
+
+@pytest.mark.unit
+def test_cache_lifetime_honours_cache_control():
+    """Test max-age shortens the TTL and no-store/private disable caching."""
+    assert cache_lifetime({}, 3600) == 3600
+    assert cache_lifetime({'cache-control': 'public, max-age=600'}, 3600) == 600
+    assert cache_lifetime({'cache-control': 'max-age=86400'}, 3600) == 3600
+    assert cache_lifetime({'cache-control': 'no-store'}, 3600) == 0
+    assert cache_lifetime({'cache-control': 'private, max-age=600'}, 3600) == 0
+
+
+@pytest.mark.unit
+def test_put_get_is_isolated_per_user_agent(tmp_path):
+    """Test an asset stored for one user agent is a miss for another."""
+    cache = AssetCache(str(tmp_path))
+    cache.put(CHROME, "https://cdn.example.com/app.js", JS, b"body")
+
+    assert cache.get(CHROME, "https://cdn.example.com/app.js").body == b"body"
+    assert cache.get(FIREFOX, "https://cdn.example.com/app.js") is None
+
+
+@pytest.mark.unit
+def test_expired_entry_is_deleted(tmp_path, monkeypatch):
+    """Test an entry past its lifetime is a miss and is removed."""
+    cache = AssetCache(str(tmp_path), ttl_seconds=60)
+    cache.put(CHROME, "https://cdn.example.com/app.js", JS, b"body")
+    now = time.time()
+    monkeypatch.setattr('asset_cache.time.time', lambda: now + 61)
+
+    assert cache.get(CHROME, "https://cdn.example.com/app.js") is None
+    assert list(tmp_path.glob('*/*/*.asset')) == []
+
+
+@pytest.mark.unit
+def test_eviction_keeps_cache_under_bound(tmp_path):
+    """Test the oldest entries are evicted once the cache exceeds max_bytes."""
+    cache = AssetCache(str(tmp_path), max_bytes=3000)
+    for i in range(5):
+        cache.put(CHROME, f"https://cdn.example.com/{i}.js", JS, b"x" * 900)
+        path = cache._path(CHROME, f"https://cdn.example.com/{i}.js")
+        os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+
+    assert cache.get(CHROME, "https://cdn.example.com/0.js") is None
+    assert cache.get(CHROME, "https://cdn.example.com/4.js") is not None
+    assert sum(p.stat().st_size for p in tmp_path.glob('*/*/*.asset')) <= 3000
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_session_fetches_then_serves_from_cache(tmp_path):
+    """Test a miss is fetched, stored and served; the next request is a hit without network."""
+    cache = AssetCache(str(tmp_path))
+    page = MagicMock()
+    page.route = AsyncMock()
+    session = await cache.attach(page, CHROME)
+
+    route, request = make_route()
+    await session.handle(route, request)
+    route.fetch.assert_awaited_once()
+    headers = route.fulfill.await_args.kwargs['headers']
+    assert 'content-encoding' not in headers and 'content-length' not in headers
+
+    route, request = make_route()
+    await session.handle(route, request)
+    route.fetch.assert_not_awaited()
+    assert route.fulfill.await_args.kwargs['body'] == b"console.log(1)"
+    assert session.stats.to_dict() == {"hits": 1, "misses": 1, "bytes_served": 14}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_session_hands_on_uncacheable_and_blocked_requests(tmp_path):
+    """Test documents, POSTs and requests the blocker aborts go to the next route handler."""
+    cache = AssetCache(str(tmp_path))
+    page = MagicMock()
+    page.route = AsyncMock()
+    session = await cache.attach(page, CHROME, RequestBlocker())
+
+    for route, request in (
+        make_route(resource_type="document"),
+        make_route(method="POST"),
+        make_route(resource_type="image"),
+        make_route(url="https://www.googletagmanager.com/gtm.js"),
+    ):
+        await session.handle(route, request)
+        route.fallback.assert_awaited_once()
+        route.fetch.assert_not_awaited()
@@ -0,0 +1,151 @@
+"""Unit tests for the browser governor and browser recycling in ScraperService."""
+
+import asyncio
+import os
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from browser_governor import BrowserGovernor, browser_rss_bytes
+from politeness import PolitenessScheduler
+from scraper import ScraperService
+
+
+def fast_scheduler():
+    return PolitenessScheduler(rate_per_second=1000, burst=100, min_interval=0, jitter=0)
+
+
+@pytest.mark.unit
+def test_recycle_reasons():
+    """Test page, memory and crash limits each trigger a recycle."""
+    governor = BrowserGovernor(max_pages=2, max_rss_mb=100)
+    governor.record_launch()
+    assert governor.recycle_reason() is None
+
+    governor.record_page()
+    governor.record_page()
+    assert governor.recycle_reason() == "max_pages"
+
+    governor.record_launch()
+    governor.last_rss_bytes = 101 * 1024 * 1024
+    assert governor.recycle_reason() == "max_rss"
+
+    governor.last_rss_bytes = None
+    governor.record_crash()
+    assert governor.recycle_reason() == "renderer_crash"
+    governor.record_launch()
+    assert governor.recycle_reason() is None
+
+
+@pytest.mark.unit
+def test_limits_can_be_disabled():
+    """Test zero limits never trigger a recycle."""
+    governor = BrowserGovernor(max_pages=0, max_rss_mb=0)
+    for _ in range(1000):
+        governor.record_page()
+    governor.last_rss_bytes = 10 * 1024 ** 3
+
+    assert governor.recycle_reason() is None
+
+
+@pytest.mark.unit
+def test_sample_is_throttled():
+    """Test RSS is sampled at most once per interval unless forced."""
+    governor = BrowserGovernor(sample_interval=60)
+
+    with patch('browser_governor.browser_rss_bytes', side_effect=[100, 200, 300]) as mock_rss:
+        assert governor.sample(open_contexts=2) == 100
+        assert governor.sample(open_contexts=3) == 100
+        assert governor.sample(force=True) == 200
+
+    assert mock_rss.call_count == 2
+    assert governor.metrics()["peak_rss_bytes"] == 200
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not os.path.isdir('/proc'), reason="needs /proc")
+def test_browser_rss_bytes_without_browser():
+    """Test RSS sampling works on /proc and finds no browser in the test process."""
+    assert browser_rss_bytes() == 0
+    assert browser_rss_bytes(names=('',), root_pid=os.getppid()) > 0
+
+
+@pytest.mark.unit
+def test_metrics_count_recycles_by_reason():
+    """Test recycle events are exposed as counters."""
+    governor = BrowserGovernor()
+    governor.record_recycle("max_pages")
+    governor.record_recycle("max_pages")
+    governor.record_recycle("renderer_crash")
+
+    metrics = governor.metrics()
+    assert metrics["recycles_total"] == 3
+    assert metrics["recycles_by_reason"] == {"max_pages": 2, "renderer_crash": 1}
+    assert metrics["last_recycle_at"] is not None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_recycles_browser_after_max_pages(mock_playwright, mock_playwright_browser):
+    """Test the browser is relaunched once it has served max_pages pages."""
+    scraper = ScraperService(recycle_after_pages=2, scheduler=fast_scheduler())
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        for i in range(3):
+            await scraper.scrape(f"https://example.com/{i}")
+
+    assert mock_playwright.chromium.launch.await_count == 2
+    mock_playwright_browser.close.assert_awaited()
+    metrics = scraper.browser_metrics()
+    assert metrics["recycles_by_reason"] == {"max_pages": 1}
+    assert metrics["pages_total"] == 3
+    assert metrics["in_flight_pages"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_recycles_browser_after_renderer_crash(mock_playwright, mock_playwright_page):
+    """Test a page 'crash' event makes the next attempt use a new browser."""
+    scraper = ScraperService(scheduler=fast_scheduler())
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        await scraper.scrape("https://example.com/a")
+
+        mock_playwright_page.on.assert_any_call("crash", scraper.governor.record_crash)
+        scraper.governor.record_crash()
+        await scraper.scrape("https://example.com/b")
+
+    assert mock_playwright.chromium.launch.await_count == 2
+    assert scraper.browser_metrics()["recycles_by_reason"] == {"renderer_crash": 1}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_recycle_waits_for_in_flight_pages(mock_playwright, mock_playwright_browser):
+    """Test a recycle drains pages still loading on the old browser first."""
+    scraper = ScraperService(scheduler=fast_scheduler())
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        await scraper._init_browser()
+
+        # One page is still loading when the governor asks for a recycle
+        scraper._inflight_pages = 1
+        scraper._pages_drained.clear()
+        scraper.governor.record_crash()
+        recycle = asyncio.ensure_future(scraper._init_browser())
+        await asyncio.sleep(0.05)
+        assert not recycle.done()
+        mock_playwright_browser.close.assert_not_awaited()
+
+        scraper._inflight_pages = 0
+        scraper._pages_drained.set()
+        await recycle
+
+    mock_playwright_browser.close.assert_awaited_once()
+    assert mock_playwright.chromium.launch.await_count == 2
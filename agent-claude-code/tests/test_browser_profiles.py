@@ -0,0 +1,86 @@
+"""Unit tests for browser launch profiles and the start-up benchmark helpers."""
+
+import urllib.request
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from browser_profiles import BASE_ARGS, BROWSER_PROFILES, get_profile
+from benchmark_browser import format_table, start_fixture_server, summarize
+from scraper import ScraperService
+
+
+@pytest.mark.unit
+def test_fast_profile_extends_base_flags():
+    """Test the fast profile keeps the base flags and disables start-up extras."""
+    fast = get_profile('fast')
+
+    assert fast.args[:len(BASE_ARGS)] == BASE_ARGS
+    for flag in ('--disable-gpu', '--disable-extensions', '--disable-background-networking', '--disable-component-update'):
+        assert flag in fast.args
+    assert fast.viewport['width'] < BROWSER_PROFILES['default'].viewport['width']
+    assert '--disable-web-security' not in fast.args
+
+
+@pytest.mark.unit
+def test_launch_options_with_executable():
+    """Test a custom Chromium binary is passed to launch only when set."""
+    profile = get_profile('default')
+
+    assert profile.launch_options(True) == {'headless': True, 'args': list(BASE_ARGS)}
+    assert profile.launch_options(False, '/opt/headless_shell')['executable_path'] == '/opt/headless_shell'
+
+
+@pytest.mark.unit
+def test_unknown_profile_rejected():
+    """Test an unknown profile name fails at construction time."""
+    with pytest.raises(ValueError, match="Invalid browser profile"):
+        ScraperService(browser_profile='turbo')
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_launches_with_profile(mock_playwright, mock_playwright_browser):
+    """Test the scraper launches Chromium and sizes pages according to its profile."""
+    scraper = ScraperService(browser_profile='fast', browser_executable='/opt/headless_shell')
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        await scraper._init_browser()
+        await scraper._setup_stealth_page()
+
+    launch_kwargs = mock_playwright.chromium.launch.call_args.kwargs
+    assert launch_kwargs['args'] == list(get_profile('fast').args)
+    assert launch_kwargs['executable_path'] == '/opt/headless_shell'
+    assert mock_playwright_browser.new_context.call_args.kwargs['viewport'] == {'width': 1280, 'height': 800}
+
+
+@pytest.mark.unit
+def test_fixture_server_serves_news_page():
+    """Test the benchmark fixture server returns the headline page."""
+    server = start_fixture_server()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            body = response.read().decode('utf-8')
+    finally:
+        server.shutdown()
+
+    assert body.count('<article>') == 60
+
+
+@pytest.mark.unit
+def test_summarize_and_format():
+    """Test runs are reduced to median/min/max and rendered in milliseconds."""
+    results = {'fast': summarize([
+        {'cold_launch': 0.5, 'warm_context': 0.02, 'first_navigation': 0.1},
+        {'cold_launch': 0.7, 'warm_context': 0.04, 'first_navigation': 0.3},
+        {'cold_launch': 0.6, 'warm_context': 0.03, 'first_navigation': 0.2},
+    ])}
+
+    assert results['fast']['cold_launch'] == {'median': 0.6, 'min': 0.5, 'max': 0.7}
+    assert "cold_launch" in format_table(results)
+    assert "600.0" in format_table(results)
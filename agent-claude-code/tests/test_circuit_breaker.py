@@ -0,0 +1,199 @@
+"""Unit tests for error classification, retry policies, the retry budget and the circuit breaker."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from circuit_breaker import (
+    BLOCKED, CLOSED, DNS, HALF_OPEN, OPEN, OTHER, RATE_LIMITED, SERVER_ERROR, TIMEOUT,
+    BotBlockedError, CircuitBreaker, CircuitOpenError, RetryBudget, ServerError, classify_error
+)
+from politeness import PolitenessScheduler, RateLimitedError
+from scraper import ScraperService
+
+
+def fast_scheduler():
+    return PolitenessScheduler(rate_per_second=1000, burst=100, min_interval=0, jitter=0)
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("error, expected", [
+    (PlaywrightTimeoutError("Timeout 30000ms exceeded"), TIMEOUT),
+    (BotBlockedError("Access forbidden - possible anti-bot block"), BLOCKED),
+    (RateLimitedError("Rate limited", retry_after=5), RATE_LIMITED),
+    (ServerError(503), SERVER_ERROR),
+    (RuntimeError("net::ERR_NAME_NOT_RESOLVED at https://nosuch.example/"), DNS),
+    (RuntimeError("Network error"), OTHER),
+])
+def test_classify_error(error, expected):
+    """Test failures are sorted into their error class."""
+    assert classify_error(error) == expected
+
+
+@pytest.mark.unit
+def test_circuit_opens_after_threshold_and_probes(monkeypatch):
+    """Test closed -> open -> half-open probe -> closed."""
+    clock = Clock()
+    monkeypatch.setattr('circuit_breaker.time.monotonic', clock)
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=60)
+    url = "https://broken.example/news"
+
+    breaker.before_request(url)
+    breaker.record_failure(url, BLOCKED)
+    assert breaker.state(url) == CLOSED
+    breaker.record_failure(url, BLOCKED)
+    assert breaker.state(url) == OPEN
+
+    with pytest.raises(CircuitOpenError, match="broken.example"):
+        breaker.before_request(url)
+    breaker.before_request("https://other.example/")
+
+    clock.now += 61
+    assert breaker.state(url) == HALF_OPEN
+    breaker.before_request(url)  # the probe
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(url)  # only one probe at a time
+
+    breaker.record_success(url)
+    assert breaker.state(url) == CLOSED
+    assert breaker.snapshot() == {}
+
+
+@pytest.mark.unit
+def test_failed_probe_doubles_cooldown(monkeypatch):
+    """Test a failed half-open probe reopens the circuit for twice as long."""
+    clock = Clock()
+    monkeypatch.setattr('circuit_breaker.time.monotonic', clock)
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=60, max_cooldown=100)
+    url = "https://broken.example/"
+
+    breaker.record_failure(url, SERVER_ERROR)
+    clock.now += 61
+    breaker.before_request(url)
+    breaker.record_failure(url, SERVER_ERROR)
+
+    assert breaker.snapshot()["broken.example"]["cooldown"] == 100
+    clock.now += 99
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(url)
+
+
+@pytest.mark.unit
+def test_release_frees_probe_slot(monkeypatch):
+    """Test a probe that ended without an outcome does not block the domain forever."""
+    clock = Clock()
+    monkeypatch.setattr('circuit_breaker.time.monotonic', clock)
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=10)
+    url = "https://broken.example/"
+
+    breaker.record_failure(url)
+    clock.now += 11
+    breaker.before_request(url)
+    breaker.release(url)
+
+    breaker.before_request(url)
+
+
+@pytest.mark.unit
+def test_retry_budget_limits_retries(monkeypatch):
+    """Test retries are bounded by the ratio of scrapes plus the time-based allowance."""
+    clock = Clock()
+    monkeypatch.setattr('circuit_breaker.time.monotonic', clock)
+    budget = RetryBudget(ratio=0.5, min_per_minute=6, max_tokens=1)
+
+    assert budget.try_spend() is True
+    assert budget.try_spend() is False
+
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_spend() is True
+
+    clock.now += 10  # 6 per minute -> one more token
+    assert budget.try_spend() is True
+    assert budget.metrics()["denied"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_403_is_not_retried(mock_playwright, mock_playwright_page):
+    """Test a bot block fails after one attempt instead of burning every retry."""
+    scraper = ScraperService(max_retries=3, scheduler=fast_scheduler())
+    mock_response = AsyncMock()
+    mock_response.status = 403
+    mock_playwright_page.goto.return_value = mock_response
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        with pytest.raises(RuntimeError, match="after 1 attempts: Access forbidden"):
+            await scraper.scrape("https://example.com")
+
+    assert mock_playwright_page.goto.await_count == 1
+    assert scraper.retry_metrics()["circuits"]["example.com"]["last_error"] == BLOCKED
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_5xx_uses_all_attempts(mock_playwright, mock_playwright_page):
+    """Test server errors are retried up to max_retries."""
+    scraper = ScraperService(max_retries=3, scheduler=fast_scheduler())
+    mock_response = AsyncMock()
+    mock_response.status = 502
+    mock_playwright_page.goto.return_value = mock_response
+
+    with patch('scraper.async_playwright') as mock_async_pw, \
+            patch.object(scraper.scheduler, 'backoff', return_value=0.0):
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        with pytest.raises(RuntimeError, match="after 3 attempts: Server error: 502"):
+            await scraper.scrape("https://example.com")
+
+    assert mock_playwright_page.goto.await_count == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_stops_retrying_when_budget_is_empty(mock_playwright, mock_playwright_page):
+    """Test an empty retry budget turns a retryable failure into a final one."""
+    scraper = ScraperService(
+        max_retries=3, scheduler=fast_scheduler(),
+        retry_budget=RetryBudget(ratio=0, min_per_minute=0, max_tokens=0)
+    )
+    mock_playwright_page.goto.side_effect = RuntimeError("Network error")
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        with pytest.raises(RuntimeError, match="after 1 attempts"):
+            await scraper.scrape("https://example.com")
+
+    assert scraper.retry_budget.metrics()["denied"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast(mock_playwright, mock_playwright_page):
+    """Test a domain with an open circuit is not loaded at all."""
+    scraper = ScraperService(max_retries=1, circuit_failure_threshold=2, scheduler=fast_scheduler())
+    mock_playwright_page.content.return_value = "<html><body>Please verify you are human</body></html>"
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="Anti-bot detection triggered"):
+                await scraper.scrape("https://example.com/a")
+        with pytest.raises(CircuitOpenError):
+            await scraper.scrape("https://example.com/b")
+
+    assert mock_playwright_page.goto.await_count == 2
+    await scraper.close()
@@ -0,0 +1,91 @@
+"""Unit tests for boilerplate removal by block scoring."""
+
+import numpy as np
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from benchmark_content_scoring import build_boilerplate_page, run_report
+from content_scoring import BlockFeatures, ContentScorer
+from html_cleaner import HtmlCleaner
+from page_extract import PageRecord, render_records_html
+from text_blocks import iter_text_blocks
+
+PAGE = """<html><body>
+<div id="cookie-banner"><p>We use cookies to improve your experience. By continuing to browse the site
+you agree to our use of cookies and to the privacy policy.</p></div>
+<div class="menu"><a href="/">Home</a> <a href="/world">World</a> <a href="/sport">Sport</a></div>
+<div class="feed">
+  <h2><a href="/news/1">Central bank keeps the key rate unchanged</a></h2>
+  <time datetime="2025-10-07T10:15">10:15</time>
+  <p>The regulator said inflation is slowing faster than expected this autumn.</p>
+  <ul><li><a href="/news/2">Storm warning issued for the whole coast this weekend</a></li></ul>
+</div>
+<footer><p>&copy; 2025 Example Media. All rights reserved.</p><a href="/about">About</a></footer>
+</body></html>"""
+
+
+@pytest.mark.unit
+def test_features_are_page_arrays():
+    """Test features hold one array entry per block."""
+    blocks = [block for block in iter_text_blocks(PAGE) if block.lines]
+    features = BlockFeatures.from_blocks(blocks)
+
+    assert isinstance(features.chars, np.ndarray)
+    assert features.chars.shape == (len(blocks),)
+    menu = next(i for i, block in enumerate(blocks) if block.text.startswith("Home"))
+    assert features.link_density[menu] == 1.0
+    assert features.negative_hints[menu] == 1
+
+
+@pytest.mark.unit
+def test_scorer_drops_boilerplate_and_keeps_news():
+    """Test menus, banners and footers are removed; headlines, times and leads stay."""
+    kept, report = ContentScorer().select(list(iter_text_blocks(PAGE)))
+
+    assert [block.text for block in kept] == [
+        "Central bank keeps the key rate unchanged",
+        "10:15",
+        "The regulator said inflation is slowing faster than expected this autumn.",
+        "Storm warning issued for the whole coast this weekend",
+    ]
+    assert report.blocks_total == 8 and report.blocks_kept == 4
+    assert report.chars_after < report.chars_before
+    assert 0 < report.reduction < 1
+
+
+@pytest.mark.unit
+def test_cleaner_with_scoring_reports_and_falls_back():
+    """Test the cleaner uses scored text, and the container text when scoring keeps nothing."""
+    cleaner = HtmlCleaner('html.parser', content_scoring=True)
+
+    result = cleaner.clean_with_reports(PAGE)
+    assert result.text.startswith("Central bank keeps the key rate unchanged\n10:15")
+    assert result.scoring.blocks_kept == 4
+    assert cleaner.clean(PAGE) == result.text
+    assert cleaner.clean_with_reports("<html><body><ul><li>One</li><li>Two</li></ul></body></html>").scoring is None
+    assert cleaner.clean("<html><body><ul><li>One</li><li>Two</li></ul></body></html>") == "One\nTwo"
+
+
+@pytest.mark.unit
+def test_scoring_keeps_rendered_records():
+    """Test records-mode HTML passes through unchanged."""
+    html = render_records_html([
+        PageRecord("Central bank keeps key rate unchanged", "https://example.com/news/1",
+                   "2025-10-07T10:15:00+03:00", "The regulator said inflation is slowing."),
+        PageRecord("Storm warning", "", "", ""),
+    ], "https://example.com")
+
+    assert HtmlCleaner(content_scoring=True).clean(html) == HtmlCleaner(content_scoring=False).clean(html)
+
+
+@pytest.mark.unit
+def test_report_shows_prompt_chars_before_and_after():
+    """Test the report compares container text with scored text."""
+    results = run_report({'page': build_boilerplate_page(48 * 1024)})
+
+    values = results['page']
+    assert values['chars_after'] < values['chars_before']
+    assert values['blocks_kept'] < values['blocks_total']
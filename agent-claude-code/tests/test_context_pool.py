@@ -0,0 +1,232 @@
+"""Unit tests for ContextPool.
+
+Tests pre-warming, hit/miss accounting and context recycling with mocked
+Playwright contexts.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from context_pool import ContextPool, PooledPage
+from scraper import ScraperService
+
+
+def make_factory():
+    """Build a factory producing distinct mocked pooled pages."""
+    created = []
+
+    async def factory():
+        context = AsyncMock()
+        page = AsyncMock()
+        page.context = context
+        entry = PooledPage(context=context, page=page, user_agent=f"UA-{len(created)}")
+        created.append(entry)
+        return entry
+
+    return factory, created
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pool_miss_creates_on_demand_when_empty():
+    """Test acquire from an empty pool creates a context and counts a miss."""
+    factory, created = make_factory()
+    pool = ContextPool(factory, size=0)
+
+    entry = await pool.acquire()
+
+    assert entry is created[0]
+    assert pool.stats()["misses"] == 1
+    assert pool.stats()["hits"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pool_size_zero_closes_context_on_release():
+    """Test a disabled pool closes every context after use."""
+    factory, created = make_factory()
+    pool = ContextPool(factory, size=0)
+
+    entry = await pool.acquire()
+    await pool.release(entry)
+
+    entry.context.close.assert_awaited_once()
+    assert pool.stats()["idle"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pool_refills_in_background_and_hits():
+    """Test the pool pre-warms entries and serves later acquires from them."""
+    factory, created = make_factory()
+    pool = ContextPool(factory, size=2)
+
+    pool.schedule_refill()
+    await asyncio.sleep(0)
+    await pool._refill_task
+
+    assert pool.stats()["idle"] == 2
+
+    entry = await pool.acquire()
+
+    assert entry is created[0]
+    assert pool.stats()["hits"] == 1
+    assert pool.stats()["misses"] == 0
+    await pool.clear()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pool_returns_healthy_page_for_reuse():
+    """Test a successful release resets the page and keeps the context idle."""
+    factory, created = make_factory()
+    pool = ContextPool(factory, size=1)
+
+    entry = await pool.acquire()
+    await pool.clear()  # Stop background refill so the released entry fits
+    await pool.release(entry)
+
+    entry.page.goto.assert_awaited_with("about:blank")
+    entry.context.close.assert_not_awaited()
+    assert pool.stats()["idle"] == 1
+    assert entry.uses == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pool_recycles_on_error():
+    """Test a failed navigation closes the context instead of reusing it."""
+    factory, created = make_factory()
+    pool = ContextPool(factory, size=1)
+
+    entry = await pool.acquire()
+    await pool.clear()
+    await pool.release(entry, failed=True)
+
+    entry.context.close.assert_awaited_once()
+    assert pool.stats()["recycled"] == 1
+    await pool.clear()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pool_recycles_after_max_uses():
+    """Test a context is closed once it reaches max_uses navigations."""
+    factory, created = make_factory()
+    pool = ContextPool(factory, size=1, max_uses=2)
+
+    entry = await pool.acquire()
+    await pool.clear()
+    await pool.release(entry)
+    assert pool.stats()["idle"] == 1
+
+    again = await pool.acquire()
+    assert again is entry
+    await pool.clear()
+    await pool.release(again)
+
+    entry.context.close.assert_awaited_once()
+    assert pool.stats()["recycled"] == 1
+    await pool.clear()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pool_reuses_context_only_for_same_domain():
+    """Test a used context is not handed to another domain and gives way to a fresh one."""
+    factory, created = make_factory()
+    pool = ContextPool(factory, size=1)
+
+    entry = await pool.acquire("a.example.com")
+    await pool.clear()
+    await pool.release(entry)
+
+    other = await pool.acquire("b.example.com")
+    assert other is not entry
+    entry.context.close.assert_awaited_once()  # Evicted so the pool can refill with a fresh context
+    await pool.clear()
+    await pool.release(other)
+
+    assert await pool.acquire("b.example.com") is other
+    assert other.domain == "b.example.com"
+    await pool.clear()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pool_clear_closes_idle_contexts():
+    """Test clear closes all idle contexts."""
+    factory, created = make_factory()
+    pool = ContextPool(factory, size=2)
+
+    pool.schedule_refill()
+    await pool._refill_task
+    await pool.clear()
+
+    assert pool.stats()["idle"] == 0
+    for entry in created:
+        entry.context.close.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_uses_user_agent_from_list_for_pooled_pages(mock_playwright):
+    """Test pooled pages are created with a user agent from USER_AGENTS."""
+    scraper = ScraperService(context_pool_size=1)
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        await scraper._init_browser()
+
+        entry = await scraper._create_pooled_page()
+
+        assert entry.user_agent in ScraperService.USER_AGENTS
+        await scraper.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_releases_lease_when_attach_fails(mock_playwright):
+    """Test a page whose request hooks fail to attach is still released as failed."""
+    scraper = ScraperService(context_pool_size=1)
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        await scraper._init_browser()
+        scraper.request_blocker.attach = AsyncMock(side_effect=RuntimeError("Target page has been closed"))
+        scraper.context_pool.release = AsyncMock()
+
+        with pytest.raises(RuntimeError, match="has been closed"):
+            await scraper._load_page("https://example.com")
+
+        scraper.context_pool.release.assert_awaited_once()
+        assert scraper.context_pool.release.await_args.kwargs == {"failed": True}
+        await scraper.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_releases_lease_when_detach_fails(mock_playwright):
+    """Test a raising detach does not keep the page from going back to the pool."""
+    scraper = ScraperService(context_pool_size=1)
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        await scraper._init_browser()
+        scraper.context_pool.release = AsyncMock()
+        blocking = AsyncMock()
+        blocking.detach = AsyncMock(side_effect=RuntimeError("Target page has been closed"))
+        scraper.request_blocker.attach = AsyncMock(return_value=blocking)
+        scraper.scheduler.acquire = AsyncMock(side_effect=RuntimeError("navigation failed"))
+
+        with pytest.raises(RuntimeError):
+            await scraper._load_page("https://example.com")
+
+        scraper.context_pool.release.assert_awaited_once()
+        assert scraper.context_pool.release.await_args.kwargs == {"failed": True}
+        await scraper.close()
@@ -789,3 +789,33 @@ def test_clear_all():
     finally:
         if os.path.exists(db_path):
             os.unlink(db_path)
+
+
+@pytest.mark.unit
+def test_page_fingerprint_roundtrip(temp_database):
+    """Test page fingerprints are stored and updated per URL."""
+    url = "https://example.com"
+
+    assert temp_database.get_page_fingerprint(url) is None
+
+    temp_database.save_page_fingerprint(url, "abc")
+    assert temp_database.get_page_fingerprint(url) == "abc"
+
+    temp_database.save_page_fingerprint(url, "def")
+    assert temp_database.get_page_fingerprint(url) == "def"
+    assert temp_database.get_page_fingerprint("https://other.com") is None
+
+
+@pytest.mark.unit
+def test_deleting_news_forgets_page_fingerprint(temp_database):
+    """Test clearing news also clears fingerprints so pages are re-extracted."""
+    temp_database.save_news("https://a.com", [{"title": "A"}])
+    temp_database.save_page_fingerprint("https://a.com", "fa")
+    temp_database.save_page_fingerprint("https://b.com", "fb")
+
+    temp_database.delete_news_by_url("https://a.com")
+    assert temp_database.get_page_fingerprint("https://a.com") is None
+    assert temp_database.get_page_fingerprint("https://b.com") == "fb"
+
+    assert temp_database.clear_all() == 0
+    assert temp_database.get_page_fingerprint("https://b.com") is None
@@ -0,0 +1,191 @@
+"""Unit tests for JSON feed capture.
+
+Responses and the HTTP session are mocked; no browser or network is used.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import requests
+
+from feed_capture import FeedCapture, FeedEndpoint, FeedRegistry, find_headline_array, map_records, resolve_path
+from scraper import ScraperService
+
+
+def make_articles(count=6):
+    return [
+        {
+            "id": i,
+            "headline": f"Parliament passes budget amendment number {i}",
+            "lead": f"<p>Deputies approved the {i}th amendment &amp; sent it on.</p>",
+            "publishedAt": 1759831200000 + i
+        }
+        for i in range(count)
+    ]
+
+
+API_PAYLOAD = {
+    "meta": {"page": 1},
+    "menu": [{"name": "World"}, {"name": "Sport"}],
+    "data": {"blocks": [{"type": "top", "items": make_articles()}]}
+}
+
+
+def make_response(data, resource_type="xhr", content_type="application/json; charset=utf-8", url="https://example.com/api/news"):
+    response = MagicMock()
+    response.url = url
+    response.request.resource_type = resource_type
+    response.headers = {"content-type": content_type}
+    response.json = AsyncMock(return_value=data)
+    return response
+
+
+@pytest.mark.unit
+def test_find_headline_array_locates_nested_feed():
+    """Test the article list is found deep in the payload and its fields are detected."""
+    found = find_headline_array(API_PAYLOAD)
+
+    assert found == (("data", "blocks", 0, "items"), "headline", "lead", "publishedAt")
+
+
+@pytest.mark.unit
+def test_find_headline_array_ignores_short_labels():
+    """Test menus and tag lists are not mistaken for headlines."""
+    assert find_headline_array({"menu": [{"title": f"Section {i}"} for i in range(10)]}) is None
+
+
+@pytest.mark.unit
+def test_map_records_cleans_fields():
+    """Test HTML in fields is stripped and millisecond timestamps become ISO dates."""
+    path, title_key, description_key, date_key = find_headline_array(API_PAYLOAD)
+    endpoint = FeedEndpoint("https://example.com/api/news", path, title_key, description_key, date_key)
+
+    items = map_records(resolve_path(API_PAYLOAD, path), endpoint)
+
+    assert len(items) == 6
+    assert items[0].title == "Parliament passes budget amendment number 0"
+    assert items[0].description == "Deputies approved the 0th amendment & sent it on."
+    assert items[0].publication_date.startswith("2025-10-07T10:00:00")
+
+
+@pytest.mark.unit
+def test_map_records_handles_rendered_fields():
+    """Test WordPress-style {"rendered": ...} titles are read."""
+    records = [{"title": {"rendered": f"Local council approves new park plan {i}"}} for i in range(5)]
+    path, title_key, description_key, date_key = find_headline_array(records)
+    items = map_records(records, FeedEndpoint("u", path, title_key, description_key, date_key))
+
+    assert [item.title for item in items][:1] == ["Local council approves new park plan 0"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_feed_capture_filters_and_selects_feed():
+    """Test only XHR/fetch JSON responses are inspected and the best feed wins."""
+    page = MagicMock()
+    capture = FeedCapture()
+    capture.attach(page)
+    page.on.assert_called_once_with('response', capture.on_response)
+
+    capture.on_response(make_response(API_PAYLOAD, resource_type="document"))
+    capture.on_response(make_response(API_PAYLOAD, content_type="text/html"))
+    capture.on_response(make_response({"items": make_articles(5)}, url="https://example.com/api/small"))
+    capture.on_response(make_response(API_PAYLOAD))
+
+    items = await capture.evaluate()
+    capture.detach(page)
+
+    assert len(items) == 6
+    assert capture.endpoint.url == "https://example.com/api/news"
+    page.remove_listener.assert_called_once_with('response', capture.on_response)
+
+
+@pytest.mark.unit
+def test_feed_registry_fetches_known_endpoint():
+    """Test a remembered endpoint is fetched directly for any page of the domain."""
+    registry = FeedRegistry()
+    path, title_key, description_key, date_key = find_headline_array(API_PAYLOAD)
+    registry.remember("https://example.com/", FeedEndpoint(
+        "https://example.com/api/news", path, title_key, description_key, date_key
+    ))
+    response = MagicMock()
+    response.json.return_value = API_PAYLOAD
+
+    with patch.object(registry.session, 'get', return_value=response) as mock_get:
+        items = registry.fetch("https://example.com/world")
+
+    assert len(items) == 6
+    assert mock_get.call_args[0][0] == "https://example.com/api/news"
+    assert registry.fetch("https://other.com/") is None
+
+
+@pytest.mark.unit
+def test_feed_registry_forgets_broken_endpoint():
+    """Test an endpoint that fails or changes shape is dropped."""
+    registry = FeedRegistry()
+    registry.remember("https://example.com/", FeedEndpoint("https://example.com/api/news", ("data",), "headline"))
+
+    with patch.object(registry.session, 'get', side_effect=requests.ConnectionError("down")):
+        assert registry.fetch("https://example.com/") is None
+
+    assert registry.get("https://example.com/") is None
+
+
+@pytest.mark.unit
+def test_feed_registry_ttl_expires(monkeypatch):
+    """Test endpoints older than the TTL are not used."""
+    registry = FeedRegistry(ttl=10)
+    endpoint = FeedEndpoint("https://example.com/api/news", (), "title", learned_at=0.0)
+    registry.remember("https://example.com/", endpoint)
+    monkeypatch.setattr('feed_capture.time.monotonic', lambda: 100.0)
+
+    assert registry.get("https://example.com/") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_page_learns_then_fetches_feed_directly():
+    """Test the first scrape learns the feed and the next one skips the browser."""
+    scraper = ScraperService(capture_feeds=True, max_retries=1)
+
+    async def fake_scrape_html(url, feed_capture=None, timing=None):
+        feed_capture.on_response(make_response(API_PAYLOAD))
+        await feed_capture.evaluate()
+        return "<html><body>app shell</body></html>"
+
+    with patch.object(scraper, '_scrape_html', side_effect=fake_scrape_html) as mock_html:
+        first = await scraper.scrape_page("https://example.com/")
+
+    assert first.html == "<html><body>app shell</body></html>"
+    assert len(first.feed_items) == 6
+    assert first.feed_url == "https://example.com/api/news"
+
+    response = MagicMock()
+    response.json.return_value = API_PAYLOAD
+    with patch.object(scraper, '_scrape_html') as mock_html, \
+            patch.object(scraper.feed_registry.session, 'get', return_value=response):
+        second = await scraper.scrape_page("https://example.com/")
+
+    mock_html.assert_not_called()
+    assert second.html == ""
+    assert len(second.feed_items) == 6
+    await scraper.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_page_without_capture_returns_html():
+    """Test scrape_page is a plain scrape when feed capture is off."""
+    scraper = ScraperService(max_retries=1)
+    assert scraper.feed_registry is None
+
+    with patch.object(scraper, '_scrape_html', AsyncMock(return_value="<html></html>")) as mock_html:
+        result = await scraper.scrape_page("https://example.com/")
+
+    mock_html.assert_awaited_once_with("https://example.com/", timing=result.timing)
+    assert result.html == "<html></html>"
+    assert result.feed_items is None
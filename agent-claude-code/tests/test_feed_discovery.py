@@ -0,0 +1,176 @@
+"""Unit tests for RSS/Atom and news-sitemap discovery.
+
+HTTP is mocked; feeds are parsed from in-memory bytes.
+"""
+
+import io
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from feed_discovery import HEAD_BYTES, FeedDiscovery, FeedResult, find_feed_links, find_news_sitemaps, parse_feed
+from llm_service import NewsItem
+from scraper import ScraperService
+
+
+RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel>
+  <title>Example News</title>
+  <item>
+    <title>Central bank keeps key rate unchanged</title>
+    <description>&lt;p&gt;Inflation is slowing &amp;amp; the regulator waits.&lt;/p&gt;</description>
+    <pubDate>Tue, 07 Oct 2025 10:15:00 +0300</pubDate>
+  </item>
+  <item><title>Storm warning issued for the weekend</title></item>
+</channel></rss>"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example Atom</title>
+  <entry>
+    <title>New metro line opens next month</title>
+    <summary>The line adds six stations.</summary>
+    <published>2025-10-07T08:00:00Z</published>
+  </entry>
+</feed>"""
+
+NEWS_SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+  <url>
+    <loc>https://example.com/news/1</loc>
+    <news:news>
+      <news:publication><news:name>Example</news:name><news:language>en</news:language></news:publication>
+      <news:publication_date>2025-10-07T09:00:00+00:00</news:publication_date>
+      <news:title>Parliament passes the budget</news:title>
+    </news:news>
+  </url>
+</urlset>"""
+
+
+@pytest.mark.unit
+def test_find_feed_links():
+    """Test alternate RSS/Atom links are found and resolved; other links are ignored."""
+    html = """<html><head>
+        <link rel="stylesheet" href="/style.css">
+        <link rel="alternate" type="application/rss+xml" title="News" href="/rss/news.xml">
+        <link type='application/atom+xml' rel='alternate' href='https://cdn.example.com/atom'>
+        <link rel="alternate" hreflang="de" href="/de/">
+    </head></html>"""
+
+    assert find_feed_links(html, "https://example.com/world/") == [
+        "https://example.com/rss/news.xml",
+        "https://cdn.example.com/atom"
+    ]
+
+
+@pytest.mark.unit
+def test_find_news_sitemaps():
+    """Test only news sitemaps are taken from robots.txt."""
+    robots = "User-agent: *\nDisallow: /admin\nSitemap: https://example.com/sitemap.xml\nsitemap: https://example.com/sitemap-news.xml\n"
+
+    assert find_news_sitemaps(robots) == ["https://example.com/sitemap-news.xml"]
+
+
+@pytest.mark.unit
+def test_parse_rss():
+    """Test RSS items map to NewsItems with cleaned description and ISO date."""
+    items = parse_feed(io.BytesIO(RSS))
+
+    assert items == [
+        NewsItem(
+            title="Central bank keeps key rate unchanged",
+            description="Inflation is slowing & the regulator waits.",
+            publication_date="2025-10-07T10:15:00+03:00"
+        ),
+        NewsItem(title="Storm warning issued for the weekend")
+    ]
+
+
+@pytest.mark.unit
+def test_parse_atom_and_news_sitemap():
+    """Test Atom entries and Google News sitemap URLs are parsed."""
+    assert parse_feed(io.BytesIO(ATOM)) == [
+        NewsItem(
+            title="New metro line opens next month",
+            description="The line adds six stations.",
+            publication_date="2025-10-07T08:00:00Z"
+        )
+    ]
+    assert parse_feed(io.BytesIO(NEWS_SITEMAP)) == [
+        NewsItem(title="Parliament passes the budget", publication_date="2025-10-07T09:00:00+00:00")
+    ]
+
+
+@pytest.mark.unit
+def test_parse_feed_respects_max_items():
+    """Test parsing stops after max_items."""
+    assert len(parse_feed(io.BytesIO(RSS), max_items=1)) == 1
+
+
+@pytest.mark.unit
+def test_discover_caches_per_domain():
+    """Test discovery requests are made once per domain and page."""
+    discovery = FeedDiscovery()
+    responses = {
+        "https://example.com/": '<link rel="alternate" type="application/rss+xml" href="/rss">',
+        "https://example.com/robots.txt": "Sitemap: https://example.com/news-sitemap.xml"
+    }
+
+    with patch.object(discovery, '_get_text', side_effect=lambda url, limit=None: responses.get(url)) as mock_get:
+        first = discovery.discover("https://example.com/")
+        second = discovery.discover("https://example.com/")
+
+    assert first == second == ["https://example.com/rss", "https://example.com/news-sitemap.xml"]
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.unit
+def test_section_page_uses_only_linked_feeds():
+    """Test site-wide sitemaps do not stand in for a section page without its own feed."""
+    discovery = FeedDiscovery()
+
+    with patch.object(discovery, '_get_text', return_value="<html></html>") as mock_get:
+        assert discovery.discover("https://example.com/sport/") == []
+
+    mock_get.assert_called_once_with("https://example.com/sport/", limit=HEAD_BYTES)
+
+
+@pytest.mark.unit
+def test_fetch_skips_broken_feeds():
+    """Test a feed with too few items is dropped and the next one is used."""
+    discovery = FeedDiscovery(min_items=2)
+    three = [NewsItem(title=f"Headline {i}") for i in range(3)]
+
+    with patch.object(discovery, 'discover', return_value=["https://example.com/a", "https://example.com/b"]), \
+            patch.object(discovery, 'read_feed', side_effect=[[], three]):
+        result = discovery.fetch("https://example.com/")
+
+    assert result == FeedResult(feed_url="https://example.com/b", items=three)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_page_uses_feed_without_browser():
+    """Test a covering feed replaces the browser scrape."""
+    scraper = ScraperService(discover_feeds=True, max_retries=1)
+    feed = FeedResult(feed_url="https://example.com/rss", items=[NewsItem(title="Headline from RSS")])
+
+    with patch.object(scraper.feed_discovery, 'fetch', return_value=feed), \
+            patch.object(scraper, '_scrape_html', AsyncMock()) as mock_html:
+        result = await scraper.scrape_page("https://example.com/")
+
+    mock_html.assert_not_called()
+    assert result.feed_items == feed.items
+    assert result.feed_url == "https://example.com/rss"
+
+    with patch.object(scraper.feed_discovery, 'fetch', return_value=None), \
+            patch.object(scraper, '_scrape_html', AsyncMock(return_value="<html></html>")):
+        result = await scraper.scrape_page("https://example.com/")
+
+    assert result.html == "<html></html>"
+    assert result.feed_items is None
+    await scraper.close()
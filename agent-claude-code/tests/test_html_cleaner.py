@@ -0,0 +1,95 @@
+"""Unit tests for the HTML cleaner and its parser backends.
+
+Every installed backend must produce exactly the html.parser output on the fixtures.
+"""
+
+import pytest
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from benchmark_html_cleaner import build_news_page, run_benchmark
+from html_cleaner import HtmlCleaner, ParserBackend, available_backends, get_backend
+from page_extract import PageRecord, render_records_html
+
+FAST_BACKENDS = [name for name in available_backends() if name != 'html.parser']
+
+FIXTURES = {
+    'document': """<!DOCTYPE html><html><head><title>Site</title><script>var a = "<div>";</script>
+        <style>p { color: red }</style></head><body><nav><a href="/">Home</a></nav>
+        <h1>Content</h1><!-- comment -->tail text<p>a &amp; b&nbsp;c</p>
+        <form><p>in form</p><input value="q"></form>after form<br>line<svg><text>icon</text></svg>end
+        </body></html>""",
+    'news_container': """<html><body><header>Header text</header>
+        <div class="top-news"><div class="item"><h2>First headline</h2><p>Lead <b>bold</b> rest</p></div>
+        <noscript>enable js</noscript><div class="item"><h2>Second headline</h2></div></div>
+        <div class="news">later container</div></body></html>""",
+    'main_with_comments': "<body><main>a<!-- hidden -->b<script>x()</script>c\n  <p>  spaced  </p></main></body>",
+    'fragment_without_body': "<title>Fragment title</title><h1>Hi</h1><p>text</p><iframe>frame</iframe>",
+    'id_selector': '<html><body><div id="latest-news"><ul><li>One</li><li>Two</li></ul></div></body></html>',
+    'cyrillic_control_chars': "<html><body><main><h2>Новости\x07 дня</h2><p>Текст\tс табуляцией</p></main></body></html>",
+    'records': render_records_html([
+        PageRecord("Central bank keeps key rate unchanged", "https://example.com/news/1",
+                   "2025-10-07T10:15:00+03:00", "The regulator said inflation is slowing."),
+        PageRecord("Storm <warning> & flood", "https://example.com/news/2", "", ""),
+    ], "https://example.com"),
+    'synthetic_page': build_news_page(200 * 1024),
+}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("backend", FAST_BACKENDS)
+@pytest.mark.parametrize("fixture", sorted(FIXTURES))
+def test_backend_output_matches_html_parser(backend, fixture):
+    """Test fast backends produce byte-identical cleaned text."""
+    html = FIXTURES[fixture]
+
+    assert HtmlCleaner(backend).clean(html) == HtmlCleaner('html.parser').clean(html)
+
+
+@pytest.mark.unit
+def test_reference_backend_output():
+    """Test the cleaned text itself (removed elements, comments, entities, normalization)."""
+    text = HtmlCleaner('html.parser').clean(FIXTURES['document'])
+
+    assert text.split('\n') == ["Home", "Content", "tail text", "a & b\xa0c", "after form", "line", "end"]
+
+
+@pytest.mark.unit
+def test_auto_picks_fastest_installed_backend():
+    """Test "auto" uses the first installed backend and unknown names fail fast."""
+    assert get_backend('auto').name == available_backends()[0]
+    with pytest.raises(ValueError, match="Invalid HTML parser"):
+        get_backend('html5lib')
+
+
+@pytest.mark.unit
+def test_backend_must_implement_main_text():
+    """Test a backend without main_text cannot be instantiated."""
+    class NoTextBackend(ParserBackend):
+        name = "none"
+
+    with pytest.raises(TypeError):
+        NoTextBackend()
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not FAST_BACKENDS, reason="no fast parser backend installed")
+def test_backend_error_falls_back_to_html_parser():
+    """Test a failing backend falls back to the reference path."""
+    cleaner = HtmlCleaner(FAST_BACKENDS[0])
+
+    with patch.object(cleaner.backend, 'main_text', side_effect=ValueError("boom")):
+        assert cleaner.clean(FIXTURES['main_with_comments']) == "a\nb\nc\nspaced"
+
+
+@pytest.mark.unit
+def test_benchmark_reports_throughput_and_identity():
+    """Test the benchmark reports MB/s and output identity per backend."""
+    results = run_benchmark({'page': FIXTURES['synthetic_page']}, available_backends(), runs=1)
+
+    for values in results['page'].values():
+        assert values['mb_per_s'] > 0
+        assert values['identical'] is True
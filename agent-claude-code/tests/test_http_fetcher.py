@@ -0,0 +1,211 @@
+"""Unit tests for the HTTP-first fetch path.
+
+HTTP responses are mocked; no network access is needed.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import requests
+
+from http_fetcher import HttpFetcher, StaticFetchResult, count_headline_candidates, decode_html
+from scraper import ScraperService
+
+
+def make_news_html(count):
+    """Build server-rendered HTML with `count` headline links."""
+    links = "".join(
+        f'<a href="/news/{i}">Breaking story number {i} about something important</a>'
+        for i in range(count)
+    )
+    return f"<html><body><h1>Top stories of the day on the site</h1>{links}</body></html>"
+
+
+def make_response(status=200, text="", content_type="text/html; charset=utf-8"):
+    """Build a mocked requests response."""
+    response = Mock()
+    response.status_code = status
+    response.text = text
+    response.headers = {'Content-Type': content_type}
+    return response
+
+
+# ============================================================================
+# Test Candidate Counting and Fetching
+# ============================================================================
+
+@pytest.mark.unit
+def test_count_headline_candidates():
+    """Test long headings and links are counted, short ones are not."""
+    html = (
+        "<h2>A headline that is long enough</h2>"
+        "<h2>Short</h2>"
+        '<a href="/x"><span>Link text that is definitely longer than thirty</span></a>'
+        '<a href="/y">Home</a>'
+    )
+
+    assert count_headline_candidates(html) == 2
+
+
+@pytest.mark.unit
+def test_fetch_marks_server_rendered_page_sufficient():
+    """Test a page with enough headlines is accepted without a browser."""
+    fetcher = HttpFetcher(min_candidates=10)
+    fetcher.session.get = Mock(return_value=make_response(text=make_news_html(15)))
+
+    result = fetcher.fetch("https://example.com")
+
+    assert result.sufficient is True
+    assert result.candidates == 16
+
+
+@pytest.mark.unit
+def test_fetch_marks_js_shell_insufficient():
+    """Test an empty app shell is rejected."""
+    fetcher = HttpFetcher(min_candidates=10)
+    fetcher.session.get = Mock(return_value=make_response(text='<div id="root"></div>'))
+
+    result = fetcher.fetch("https://example.com")
+
+    assert result.sufficient is False
+    assert result.candidates == 0
+
+
+@pytest.mark.unit
+def test_fetch_rejects_non_html_and_errors():
+    """Test non-200 and non-HTML responses are not usable."""
+    fetcher = HttpFetcher()
+
+    fetcher.session.get = Mock(return_value=make_response(status=503))
+    assert fetcher.fetch("https://example.com").sufficient is False
+
+    fetcher.session.get = Mock(return_value=make_response(text="{}", content_type="application/json"))
+    result = fetcher.fetch("https://example.com")
+    assert result.sufficient is False
+    assert result.html == ""
+
+
+@pytest.mark.unit
+def test_fetch_decodes_utf8_page_without_header_charset():
+    """Test a charset-less UTF-8 Cyrillic page is not decoded as ISO-8859-1."""
+    body = f"<html><body><h1>Новости дня: главное за сутки</h1>{make_news_html(12)}</body></html>"
+    response = requests.Response()
+    response.status_code = 200
+    response.headers['Content-Type'] = 'text/html'
+    response._content = body.encode('utf-8')
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    assert response.encoding == 'ISO-8859-1'  # What requests would use for .text
+    fetcher = HttpFetcher()
+    fetcher.session.get = Mock(return_value=response)
+
+    assert fetcher.fetch("https://example.ru").html == body
+
+    meta_page = '<html><head><meta charset="windows-1251"></head><body>Новости</body></html>'
+    response._content = meta_page.encode('cp1251')
+    assert decode_html(response) == meta_page
+
+
+@pytest.mark.unit
+def test_domain_decision_expires():
+    """Test remembered decisions are per domain and respect the TTL."""
+    fetcher = HttpFetcher(decision_ttl=60)
+
+    fetcher.remember("https://example.com/news", HttpFetcher.NEEDS_JS)
+    assert fetcher.get_decision("https://EXAMPLE.com/other") == HttpFetcher.NEEDS_JS
+    assert fetcher.get_decision("https://other.com") is None
+
+    with patch('http_fetcher.time.monotonic', return_value=10**9):
+        assert fetcher.get_decision("https://example.com") is None
+
+
+# ============================================================================
+# Test ScraperService Integration
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_returns_static_html_without_browser():
+    """Test sufficient static HTML is returned and the browser is never launched."""
+    html = make_news_html(15)
+    fetcher = Mock(spec=HttpFetcher)
+    fetcher.get_decision.return_value = None
+    fetcher.fetch.return_value = StaticFetchResult("https://example.com", 200, html, 16, True)
+    scraper = ScraperService(http_first=True, http_fetcher=fetcher)
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        result = await scraper.scrape("https://example.com")
+
+    assert result == html
+    mock_async_pw.assert_not_called()
+    fetcher.remember.assert_called_once_with("https://example.com", HttpFetcher.STATIC)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_escalates_insufficient_html_to_browser(mock_playwright):
+    """Test a JS shell escalates to Playwright and the domain is remembered."""
+    fetcher = Mock(spec=HttpFetcher)
+    fetcher.get_decision.return_value = None
+    fetcher.fetch.return_value = StaticFetchResult("https://example.com", 200, "<div></div>", 0, False)
+    scraper = ScraperService(http_first=True, http_fetcher=fetcher)
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        result = await scraper.scrape("https://example.com")
+
+    assert "Test Page" in result
+    fetcher.remember.assert_called_once_with("https://example.com", HttpFetcher.NEEDS_JS)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_skips_static_fetch_for_js_domains(mock_playwright):
+    """Test domains known to need JS go straight to the browser."""
+    fetcher = Mock(spec=HttpFetcher)
+    fetcher.get_decision.return_value = HttpFetcher.NEEDS_JS
+    scraper = ScraperService(http_first=True, http_fetcher=fetcher)
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        await scraper.scrape("https://example.com")
+
+    fetcher.fetch.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_network_error_falls_back_without_remembering(mock_playwright):
+    """Test transient HTTP errors use the browser but do not mark the domain."""
+    fetcher = Mock(spec=HttpFetcher)
+    fetcher.get_decision.return_value = None
+    fetcher.fetch.side_effect = requests.ConnectionError("reset")
+    scraper = ScraperService(http_first=True, http_fetcher=fetcher)
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        result = await scraper.scrape("https://example.com")
+
+    assert "Test Page" in result
+    fetcher.remember.assert_not_called()
+
+
+@pytest.mark.unit
+def test_fetch_revalidates_with_etag():
+    """Test a cached page is revalidated and a 304 reuses the cached body."""
+    fetcher = HttpFetcher(min_candidates=10)
+    html = make_news_html(15)
+    first = make_response(text=html)
+    first.headers['ETag'] = '"v1"'
+    fetcher.session.get = Mock(side_effect=[first, make_response(status=304)])
+
+    fetcher.fetch("https://example.com")
+    result = fetcher.fetch("https://example.com")
+
+    assert fetcher.session.get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+    assert result.not_modified is True
+    assert result.sufficient is True
+    assert result.html == html
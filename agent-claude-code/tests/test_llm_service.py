@@ -75,6 +75,8 @@ def test_openrouter_service_initialization(mock_api_key):
     assert service.api_url == "https://openrouter.ai/api/v1/chat/completions"
     assert service.max_retries == 3
     assert service.timeout == 120
+    assert service.html_cleaner.scorer is None  # Content scoring and dedup are opt-in
+    assert service.html_cleaner.dedup is False
 
 
 @pytest.mark.unit
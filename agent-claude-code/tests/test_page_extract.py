@@ -0,0 +1,120 @@
+"""Unit tests for in-page record extraction.
+
+The in-page script is mocked; these tests cover the Python side and the
+ScraperService "records" extraction mode.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from page_extract import (
+    PageRecord, EXTRACT_SCRIPT, CONTAINER_SELECTORS, extract_page_records, render_records_html
+)
+from llm_service import OpenRouterService
+from scraper import ScraperService
+
+
+RECORDS = [
+    PageRecord(
+        title="Central bank keeps key rate unchanged",
+        url="https://example.com/news/1",
+        time="2025-10-07T10:15:00+03:00",
+        teaser="The regulator said inflation is slowing faster than expected this autumn."
+    ),
+    PageRecord(title="Storm <warning> & flood alerts for the weekend")
+]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_extract_page_records_parses_payload():
+    """Test the JSON payload is turned into records and invalid entries are dropped."""
+    page = AsyncMock()
+    page.evaluate.return_value = [
+        {"title": "Headline one for the test", "url": "https://e.com/1", "time": "", "teaser": ""},
+        {"title": ""},
+        "garbage"
+    ]
+
+    records = await extract_page_records(page, max_records=50)
+
+    page.evaluate.assert_awaited_once_with(
+        EXTRACT_SCRIPT, {'maxRecords': 50, 'containerSelectors': CONTAINER_SELECTORS}
+    )
+    assert records == [PageRecord(title="Headline one for the test", url="https://e.com/1")]
+
+
+@pytest.mark.unit
+def test_render_records_html_escapes_and_keeps_fields():
+    """Test rendered HTML is escaped and keeps title, time and teaser for the LLM."""
+    html = render_records_html(RECORDS, "https://example.com")
+
+    assert "Storm &lt;warning&gt; &amp; flood" in html
+    assert '<a href="https://example.com/news/1">' in html
+
+    llm = OpenRouterService(api_key="sk-or-v1-" + "0" * 64)
+    text = llm._clean_html(html)
+    assert text.split('\n')[:3] == [
+        "Central bank keeps key rate unchanged",
+        "2025-10-07T10:15:00+03:00",
+        "The regulator said inflation is slowing faster than expected this autumn."
+    ]
+
+
+@pytest.mark.unit
+def test_invalid_extraction_mode_rejected():
+    """Test unknown extraction modes fail fast."""
+    with pytest.raises(ValueError, match="Invalid extraction_mode"):
+        ScraperService(extraction_mode="json")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_records_mode_skips_page_content(mock_playwright, mock_playwright_page):
+    """Test records mode never serializes the full DOM."""
+    scraper = ScraperService(extraction_mode="records")
+
+    with patch('scraper.async_playwright') as mock_async_pw, \
+            patch('scraper.extract_page_records', new_callable=AsyncMock, return_value=RECORDS), \
+            patch('scraper.probe_bot_text', new_callable=AsyncMock, return_value="News site"):
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        result = await scraper.scrape("https://example.com")
+
+    mock_playwright_page.content.assert_not_awaited()
+    assert "Central bank keeps key rate unchanged" in result
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_records_mode_is_not_snapshotted(tmp_path, mock_playwright):
+    """Test rendered records are never stored as the page's snapshot."""
+    scraper = ScraperService(extraction_mode="records", snapshot_dir=str(tmp_path), snapshot_ttl=60)
+
+    with patch('scraper.async_playwright') as mock_async_pw, \
+            patch('scraper.extract_page_records', new_callable=AsyncMock, return_value=RECORDS), \
+            patch('scraper.probe_bot_text', new_callable=AsyncMock, return_value="News site"):
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        result = await scraper.scrape_page("https://example.com")
+
+    assert result.timing.records == len(RECORDS)
+    assert scraper.snapshot_store.get_fresh("https://example.com") is None
+    await scraper.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_records_mode_falls_back_to_html(mock_playwright, mock_playwright_page):
+    """Test a page without records falls back to the full HTML."""
+    scraper = ScraperService(extraction_mode="records")
+
+    with patch('scraper.async_playwright') as mock_async_pw, \
+            patch('scraper.extract_page_records', new_callable=AsyncMock, return_value=[]), \
+            patch('scraper.probe_bot_text', new_callable=AsyncMock, return_value="News site"):
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        result = await scraper.scrape("https://example.com")
+
+    assert "Test Page" in result
@@ -0,0 +1,69 @@
+"""Unit tests for the page content fingerprint."""
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from page_fingerprint import compute_fingerprint, normalize_page_text
+
+
+PAGE = """
+<html><body>
+    <header><span class="clock">12:45</span> Wednesday 07.10.2025</header>
+    <article><h2>Central bank keeps key rate unchanged</h2><span>1 234 views</span></article>
+    <article><h2>New metro line opens in the city</h2><span>15 comments</span></article>
+    <div class="ad-slot"><a href="https://ads.example.com">Buy cheap tickets now</a></div>
+    <script>var now = 1696672000;</script>
+</body></html>
+"""
+
+
+@pytest.mark.unit
+def test_fingerprint_stable_for_same_page():
+    """Test identical pages produce identical fingerprints."""
+    assert compute_fingerprint(PAGE) == compute_fingerprint(PAGE)
+
+
+@pytest.mark.unit
+def test_fingerprint_ignores_timestamps_counters_and_ads():
+    """Test volatile parts of the page do not change the fingerprint."""
+    changed = (
+        PAGE.replace("12:45", "13:02")
+        .replace("07.10.2025", "08.10.2025")
+        .replace("1 234 views", "1 980 views")
+        .replace("15 comments", "42 comments")
+        .replace("Buy cheap tickets now", "Try our new credit card")
+        .replace("1696672000", "1696672999")
+    )
+
+    assert compute_fingerprint(changed) == compute_fingerprint(PAGE)
+
+
+@pytest.mark.unit
+def test_fingerprint_ignores_block_order():
+    """Test rotating blocks (same headlines, different order) are unchanged."""
+    first = "<article><h2>Alpha headline text</h2></article><article><h2>Beta headline text</h2></article>"
+    second = "<article><h2>Beta headline text</h2></article><article><h2>Alpha headline text</h2></article>"
+
+    assert compute_fingerprint(first) == compute_fingerprint(second)
+
+
+@pytest.mark.unit
+def test_fingerprint_changes_when_headline_changes():
+    """Test a new headline produces a different fingerprint."""
+    changed = PAGE.replace("New metro line opens in the city", "Storm warning issued for the weekend")
+
+    assert compute_fingerprint(changed) != compute_fingerprint(PAGE)
+
+
+@pytest.mark.unit
+def test_normalize_page_text_drops_ad_slots_and_scripts():
+    """Test normalized text keeps headlines and drops noise."""
+    text = normalize_page_text(PAGE)
+
+    assert "central bank keeps key rate unchanged" in text
+    assert "buy cheap tickets" not in text
+    assert "var now" not in text
+    assert "header" not in text.split('\n')
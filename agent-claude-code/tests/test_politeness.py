@@ -0,0 +1,97 @@
+"""Unit tests for the per-domain politeness scheduler."""
+
+import pytest
+import asyncio
+import time
+from email.utils import formatdate
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from politeness import PolitenessScheduler, PolitenessTurn, parse_retry_after
+
+
+@pytest.mark.unit
+def test_parse_retry_after_seconds_and_http_date():
+    """Test both Retry-After formats are understood."""
+    assert parse_retry_after("120") == 120.0
+    assert 55 <= parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60
+    assert parse_retry_after(formatdate(time.time() - 60, usegmt=True)) == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_same_domain_requests_are_spaced():
+    """Test two requests to one domain respect the minimum spacing."""
+    scheduler = PolitenessScheduler(min_interval=0.2, jitter=0, rate_per_second=100)
+
+    start = time.monotonic()
+    await scheduler.acquire("https://example.com/a")
+    await scheduler.acquire("https://example.com/b")
+
+    assert time.monotonic() - start >= 0.2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_different_domains_go_back_to_back():
+    """Test concurrent requests to different domains do not wait for each other."""
+    scheduler = PolitenessScheduler(min_interval=5, jitter=0)
+
+    start = time.monotonic()
+    await asyncio.gather(*(scheduler.acquire(f"https://site{i}.com") for i in range(5)))
+
+    assert time.monotonic() - start < 0.1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_token_bucket_limits_sustained_rate():
+    """Test an empty bucket waits for a refill."""
+    scheduler = PolitenessScheduler(rate_per_second=5, burst=1, min_interval=0, jitter=0)
+
+    start = time.monotonic()
+    for _ in range(3):
+        await scheduler.acquire("https://example.com")
+
+    # First token is free, two more at 5 tokens/s
+    assert time.monotonic() - start >= 0.35
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_backoff_delays_only_that_domain():
+    """Test Retry-After backoff delays the domain and is capped."""
+    scheduler = PolitenessScheduler(min_interval=0, jitter=0, max_retry_after=0.2)
+
+    assert scheduler.backoff("https://slow.com", 1, retry_after=3600) == 0.2
+
+    start = time.monotonic()
+    await scheduler.acquire("https://fast.com")
+    assert time.monotonic() - start < 0.05
+
+    await scheduler.acquire("https://slow.com")
+    assert time.monotonic() - start >= 0.2
+
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_turn_waits_once_per_scrape_until_backoff():
+    """Test follow-up requests of one scrape reuse its turn, and a backoff makes the retry wait."""
+    scheduler = PolitenessScheduler(min_interval=0.2, jitter=0, rate_per_second=100)
+    turn = PolitenessTurn()
+
+    start = time.monotonic()
+    await scheduler.acquire("https://example.com/", turn)
+    assert await scheduler.acquire("https://example.com/feed", turn) == 0.0
+    assert time.monotonic() - start < 0.1
+    assert turn.backoff_waited == 0.0
+
+    scheduler.backoff("https://example.com", 1, retry_after=0.3, turn=turn)
+    waited = await scheduler.acquire("https://example.com/", turn)
+    assert waited >= 0.25
+    assert turn.backoff_waited == waited
@@ -0,0 +1,93 @@
+"""Unit tests for the content readiness engine.
+
+The in-page script is mocked; these tests cover argument passing and result
+handling on the Python side.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from readiness import wait_for_content_ready, ReadinessResult, READINESS_SCRIPT, HEADLINE_SELECTOR
+from scraper import ScraperService
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_wait_for_content_ready_passes_config_to_page():
+    """Test the quiet window, cap and selector are passed to the page script."""
+    page = AsyncMock()
+    page.evaluate.return_value = {"elapsedMs": 640, "mutations": 12, "headlineCount": 31, "timedOut": False}
+
+    result = await wait_for_content_ready(page, quiet_ms=300, max_wait_ms=2000)
+
+    page.evaluate.assert_awaited_once_with(
+        READINESS_SCRIPT, {'quietMs': 300, 'maxWaitMs': 2000, 'selector': HEADLINE_SELECTOR}
+    )
+    assert result == ReadinessResult(elapsed_ms=640, mutations=12, headline_count=31, timed_out=False)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_wait_for_content_ready_reports_hard_cap():
+    """Test a page that never goes quiet is reported as timed out."""
+    page = AsyncMock()
+    page.evaluate.return_value = {"elapsedMs": 5000, "mutations": 900, "headlineCount": 4, "timedOut": True}
+
+    result = await wait_for_content_ready(page)
+
+    assert result.timed_out is True
+    assert result.elapsed_ms == 5000
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_wait_for_content_ready_handles_interrupted_script():
+    """Test errors from the page (e.g. navigation) do not fail the scrape."""
+    page = AsyncMock()
+    page.evaluate.side_effect = RuntimeError("Execution context was destroyed")
+
+    result = await wait_for_content_ready(page)
+
+    assert result.timed_out is True
+    assert result.headline_count == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_wait_for_content_ready_guards_against_hung_page():
+    """Test the Python-side guard returns even if the page script never resolves."""
+    page = AsyncMock()
+
+    async def never_resolves(*args):
+        await asyncio.sleep(10)
+
+    page.evaluate.side_effect = never_resolves
+
+    with patch('readiness.asyncio.wait_for', side_effect=asyncio.TimeoutError):
+        result = await wait_for_content_ready(page, max_wait_ms=10)
+
+    assert result.timed_out is True
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_uses_readiness_instead_of_fixed_sleeps(mock_playwright):
+    """Test a scrape waits on the readiness engine rather than multi-second sleeps."""
+    scraper = ScraperService(readiness_quiet_ms=200, readiness_max_wait_ms=1000)
+
+    with patch('scraper.async_playwright') as mock_async_pw, \
+            patch('scraper.wait_for_content_ready', new_callable=AsyncMock) as mock_ready, \
+            patch.object(scraper.scheduler, 'acquire', new_callable=AsyncMock):
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        mock_ready.return_value = ReadinessResult(elapsed_ms=200, headline_count=10)
+
+        await scraper.scrape("https://example.com")
+
+    # One wait after load plus one per scroll step
+    assert mock_ready.await_count == 3
+    assert mock_ready.await_args_list[0].kwargs == {'quiet_ms': 200, 'max_wait_ms': 1000}
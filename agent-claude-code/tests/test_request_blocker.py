@@ -0,0 +1,159 @@
+"""Unit tests for RequestBlocker.
+
+Tests blocking decisions and per-scrape stats with mocked Playwright routes.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from request_blocker import RequestBlocker, ESTIMATED_RESOURCE_BYTES
+from scraper import ScraperService
+
+
+def make_request(url, resource_type):
+    """Build a mocked Playwright request."""
+    request = Mock()
+    request.url = url
+    request.resource_type = resource_type
+    return request
+
+
+# ============================================================================
+# Test Blocking Decisions
+# ============================================================================
+
+@pytest.mark.unit
+def test_blocks_default_resource_types():
+    """Test images, fonts and media are blocked by default."""
+    blocker = RequestBlocker()
+
+    assert blocker.block_reason("https://cdn.example.com/a.jpg", "image") == "image"
+    assert blocker.block_reason("https://cdn.example.com/a.woff2", "font") == "font"
+    assert blocker.block_reason("https://cdn.example.com/a.mp4", "media") == "media"
+    assert blocker.block_reason("https://example.com/app.js", "script") is None
+    assert blocker.block_reason("https://example.com/api/news", "xhr") is None
+
+
+@pytest.mark.unit
+def test_never_blocks_main_document():
+    """Test the document request is loaded even from denied domains."""
+    blocker = RequestBlocker(deny_domains=["example.com"])
+
+    assert blocker.block_reason("https://example.com/", "document") is None
+
+
+@pytest.mark.unit
+def test_blocks_tracker_domains_and_subdomains():
+    """Test built-in tracker domains are blocked including subdomains."""
+    blocker = RequestBlocker()
+
+    assert blocker.block_reason("https://www.google-analytics.com/g/collect", "xhr") == "tracker"
+    assert blocker.block_reason("https://securepubads.g.doubleclick.net/tag.js", "script") == "tracker"
+    assert blocker.block_reason("https://mc.yandex.ru/watch/1", "script") == "tracker"
+    # Similar-looking domain is not a subdomain
+    assert blocker.block_reason("https://notdoubleclick.net/x.js", "script") is None
+
+
+@pytest.mark.unit
+def test_tracker_blocking_can_be_disabled():
+    """Test block_trackers=False lets tracker scripts through."""
+    blocker = RequestBlocker(block_trackers=False)
+
+    assert blocker.block_reason("https://www.google-analytics.com/analytics.js", "script") is None
+
+
+@pytest.mark.unit
+def test_allow_list_overrides_deny_and_type_rules():
+    """Test allow-listed domains are never blocked."""
+    blocker = RequestBlocker(allow_domains=["images.example.com", "doubleclick.net"])
+
+    assert blocker.block_reason("https://images.example.com/pic.png", "image") is None
+    assert blocker.block_reason("https://ad.doubleclick.net/x.js", "script") is None
+
+
+@pytest.mark.unit
+def test_deny_list_blocks_any_resource_type():
+    """Test deny-listed domains are blocked regardless of resource type."""
+    blocker = RequestBlocker(deny_domains=["widgets.example.org"], blocked_resource_types=[])
+
+    assert blocker.block_reason("https://widgets.example.org/w.js", "script") == "deny-list"
+    assert blocker.block_reason("https://cdn.example.com/a.jpg", "image") is None
+
+
+# ============================================================================
+# Test Route Handling and Stats
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_session_aborts_blocked_and_continues_allowed():
+    """Test the route handler aborts blocked requests and counts stats."""
+    blocker = RequestBlocker()
+    page = AsyncMock()
+    session = await blocker.attach(page)
+
+    page.route.assert_awaited_once_with('**/*', session.handle)
+
+    blocked_route = AsyncMock()
+    await session.handle(blocked_route, make_request("https://example.com/a.jpg", "image"))
+    allowed_route = AsyncMock()
+    await session.handle(allowed_route, make_request("https://example.com/", "document"))
+
+    blocked_route.abort.assert_awaited_once()
+    blocked_route.continue_.assert_not_awaited()
+    allowed_route.continue_.assert_awaited_once()
+
+    stats = session.stats.to_dict()
+    assert stats["blocked_requests"] == 1
+    assert stats["allowed_requests"] == 1
+    assert stats["blocked_by_reason"] == {"image": 1}
+    assert stats["estimated_bytes_saved"] == ESTIMATED_RESOURCE_BYTES["image"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_session_detach_unroutes_page():
+    """Test detach removes the route handler."""
+    blocker = RequestBlocker()
+    page = AsyncMock()
+    session = await blocker.attach(page)
+
+    await session.detach()
+
+    page.unroute.assert_awaited_once_with('**/*', session.handle)
+
+
+# ============================================================================
+# Test ScraperService Integration
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_attaches_blocker_to_page(mock_playwright, mock_playwright_page):
+    """Test scraping routes page requests through the blocker and detaches afterwards."""
+    scraper = ScraperService()
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        await scraper.scrape("https://example.com")
+
+    mock_playwright_page.route.assert_awaited_once()
+    mock_playwright_page.unroute.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_without_blocking_does_not_route(mock_playwright, mock_playwright_page):
+    """Test block_resources=False leaves requests untouched."""
+    scraper = ScraperService(block_resources=False)
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        await scraper.scrape("https://example.com")
+
+    assert scraper.request_blocker is None
+    mock_playwright_page.route.assert_not_awaited()
@@ -0,0 +1,104 @@
+"""Unit tests for scrape timing records and histograms."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from politeness import PolitenessScheduler
+from scrape_timing import ScrapeTiming, TimingHistograms, TrafficMeter
+from scraper import ScraperService
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+
+def fast_scheduler():
+    return PolitenessScheduler(rate_per_second=1000, burst=100, min_interval=0, jitter=0)
+
+
+@pytest.mark.unit
+def test_timing_sums_phases_across_attempts():
+    """Test phases of retried attempts add up and retries are derived from attempts."""
+    timing = ScrapeTiming("https://example.com/")
+    timing.merge_phases({"navigation": 1.5, "content": 0.1})
+    timing.merge_phases({"navigation": 2.0})
+    timing.attempts = 2
+
+    assert timing.phases == {"navigation": 3.5, "content": 0.1}
+    assert timing.retries == 1
+    assert timing.dominant_phase() == "navigation"
+    assert timing.to_dict()["retries"] == 1
+
+
+@pytest.mark.unit
+def test_traffic_meter_counts_responses():
+    """Test responses are counted and Content-Length bytes summed."""
+    meter = TrafficMeter()
+    for headers in ({"content-length": "1000"}, {}, {"content-length": "bogus"}):
+        response = MagicMock()
+        response.headers = headers
+        meter.on_response(response)
+
+    assert meter.requests == 3
+    assert meter.bytes == 1000
+
+
+@pytest.mark.unit
+def test_histograms_per_domain_and_phase():
+    """Test histograms bucket per domain and report the dominant phase."""
+    histograms = TimingHistograms(buckets=(0.5, 1.0, 5.0))
+    for navigation in (0.2, 0.7, 3.0):
+        timing = ScrapeTiming("https://a.com/news", phases={"navigation": navigation, "scroll": 0.3})
+        timing.total = navigation + 0.3
+        histograms.record(timing)
+    histograms.record(ScrapeTiming("https://b.com/", phases={"readiness": 4.0}, total=4.0))
+
+    summary = histograms.summary("a.com")["a.com"]
+    assert summary["navigation"]["count"] == 3
+    assert summary["navigation"]["buckets"] == {"0.5": 1, "1.0": 1, "5.0": 1, "+Inf": 0}
+    assert summary["navigation"]["p50"] == 1.0
+    assert summary["total"]["count"] == 3
+    assert histograms.dominant_phases() == {"a.com": "navigation", "b.com": "readiness"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_page_returns_timing(mock_playwright):
+    """Test a browser scrape returns a timing record covering every phase."""
+    scraper = ScraperService(scheduler=fast_scheduler())
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        result = await scraper.scrape_page("https://example.com/")
+
+    timing = result.timing
+    assert timing.source == "browser"
+    assert timing.attempts == 1
+    for phase in ("browser_acquire", "context_setup", "politeness", "navigation", "load_state",
+                  "bot_check", "readiness", "scroll", "content"):
+        assert phase in timing.phases
+    assert timing.total >= sum(timing.phases.values()) - 1e-6
+    assert scraper.timing_summary()["example.com"]["total"]["count"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_timing_counts_retries_and_backoff(mock_playwright, mock_playwright_page):
+    """Test failed attempts and scheduled backoff are part of the record."""
+    scheduler = fast_scheduler()
+    scraper = ScraperService(scheduler=scheduler, max_retries=2)
+    mock_playwright_page.goto.side_effect = [PlaywrightTimeoutError("Timeout"), AsyncMock(status=200)]
+
+    scheduler.max_backoff = 0.2
+
+    with patch('scraper.async_playwright') as mock_async_pw, \
+            patch('politeness.random.uniform', return_value=0.0):
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        result = await scraper.scrape_page("https://example.com/")
+
+    assert result.timing.attempts == 2
+    assert result.timing.retries == 1
+    # The wait actually spent before the retry, not just the delay scheduled
+    assert 0.15 <= result.timing.backoff_seconds < 1.0
+    assert scraper.timing_summary("example.com")["example.com"]["navigation"]["count"] == 1
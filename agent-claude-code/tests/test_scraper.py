@@ -5,6 +5,7 @@ Coverage: >80% of scraper.py
 """
 
 import pytest
+import time
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
@@ -13,6 +14,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from scraper import ScraperService
+from politeness import PolitenessScheduler
+from http_fetcher import HttpFetcher, StaticFetchResult
 
 
 # ============================================================================
@@ -199,6 +202,7 @@ async def test_scrape_http_429_rate_limit(mock_playwright, mock_playwright_page)
     # Mock 429 response
     mock_response = AsyncMock()
     mock_response.status = 429
+    mock_response.headers = {'retry-after': '1'}
     mock_playwright_page.goto.return_value = mock_response
 
     with patch('scraper.async_playwright') as mock_async_pw:
@@ -325,43 +329,65 @@ async def test_scrape_retry_success_on_second_attempt(mock_playwright, mock_play
 
 
 # ============================================================================
-# Test Random Delays
+# Test Politeness Scheduling
 # ============================================================================
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_random_delay():
-    """Test _random_delay adds delay within specified range."""
-    import time
-    scraper = ScraperService()
+async def test_scrape_waits_on_politeness_scheduler(mock_playwright):
+    """Test each navigation first takes a slot from the domain scheduler."""
+    scheduler = PolitenessScheduler()
+    scraper = ScraperService(scheduler=scheduler)
 
-    start_time = time.time()
-    await scraper._random_delay(0.1, 0.2)
-    elapsed_time = time.time() - start_time
+    with patch('scraper.async_playwright') as mock_async_pw, \
+            patch.object(scheduler, 'acquire', new_callable=AsyncMock) as mock_acquire:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        await scraper.scrape("https://example.com")
 
-    # Check delay was within range (with some tolerance)
-    assert 0.08 <= elapsed_time <= 0.25
+    mock_acquire.assert_awaited_once()
+    assert mock_acquire.await_args.args[0] == "https://example.com"
 
 
-# ============================================================================
-# Test Exponential Backoff
-# ============================================================================
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_waits_once_for_static_fetch_and_browser(mock_playwright):
+    """Test the browser load after an insufficient static fetch does not wait for the domain again."""
+    fetcher = Mock(spec=HttpFetcher)
+    fetcher.get_decision.return_value = None
+    fetcher.fetch.return_value = StaticFetchResult("https://example.com", 200, "<div></div>", 0, False)
+    scheduler = PolitenessScheduler(min_interval=5, jitter=0)
+    scraper = ScraperService(http_first=True, http_fetcher=fetcher, scheduler=scheduler)
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        start = time.monotonic()
+        result = await scraper.scrape_page("https://example.com")
+
+    assert result.timing.source == "browser"
+    assert time.monotonic() - start < 2
+    fetcher.fetch.assert_called_once()
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_exponential_backoff():
-    """Test _exponential_backoff increases wait time."""
-    import time
-    scraper = ScraperService()
+async def test_scrape_429_backs_off_domain_with_retry_after(mock_playwright, mock_playwright_page):
+    """Test a 429 pushes the domain back by its Retry-After even on the last attempt."""
+    scheduler = PolitenessScheduler()
+    scraper = ScraperService(max_retries=1, scheduler=scheduler)
 
-    # Test backoff for attempt 1 (should be ~2 seconds + jitter)
-    start_time = time.time()
-    await scraper._exponential_backoff(1)
-    elapsed_time = time.time() - start_time
+    mock_response = AsyncMock()
+    mock_response.status = 429
+    mock_response.headers = {'retry-after': '120'}
+    mock_playwright_page.goto.return_value = mock_response
+
+    with patch('scraper.async_playwright') as mock_async_pw, \
+            patch.object(scheduler, 'backoff', wraps=scheduler.backoff) as mock_backoff:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        with pytest.raises(RuntimeError, match="Rate limited"):
+            await scraper.scrape("https://example.com")
 
-    # Should wait at least 2 seconds (2^1)
-    assert elapsed_time >= 2.0
-    assert elapsed_time <= 4.0  # 2 seconds + max 1 second jitter + tolerance
+    mock_backoff.assert_called_once()
+    assert mock_backoff.call_args.args[:3] == ("https://example.com", 1, 120.0)
 
 
 # ============================================================================
@@ -389,6 +415,40 @@ async def test_scraper_close():
     assert scraper.playwright is None
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_init_browser_reuses_connected_browser(mock_playwright):
+    """Test a live browser is reused instead of launching a new one."""
+    scraper = ScraperService()
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+
+        await scraper._init_browser()
+        await scraper._init_browser()
+
+        assert mock_playwright.chromium.launch.await_count == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_init_browser_restarts_crashed_browser(mock_playwright, mock_playwright_browser):
+    """Test a disconnected (crashed) browser is relaunched on the next attempt."""
+    scraper = ScraperService()
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+
+        await scraper._init_browser()
+        mock_playwright_browser.is_connected.return_value = False
+        await scraper._init_browser()
+
+        assert mock_playwright.chromium.launch.await_count == 2
+        mock_playwright_browser.close.assert_awaited()
+        # Playwright driver itself is kept alive across browser restarts
+        assert mock_async_pw.return_value.start.await_count == 1
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_scraper_close_when_not_initialized():
@@ -455,3 +515,198 @@ async def test_scrape_extracts_full_page_content(mock_playwright, mock_playwrigh
 
         assert html_content == expected_html
         mock_playwright_page.content.assert_called()
+
+
+# ============================================================================
+# Test Batch Scraping
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_many_yields_in_completion_order():
+    """Test scrape_many yields results as soon as each URL finishes."""
+    import asyncio
+    scraper = ScraperService()
+    delays = {"https://a.com/": 0.05, "https://b.com/": 0.01, "https://c.com/": 0.03}
+
+    async def fake_scrape(url, *args, **kwargs):
+        await asyncio.sleep(delays[url])
+        return f"<html>{url}</html>"
+
+    with patch.object(scraper, '_scrape_html', side_effect=fake_scrape):
+        results = [r async for r in scraper.scrape_many(list(delays), concurrency=3)]
+
+    assert [r.url for r in results] == ["https://b.com/", "https://c.com/", "https://a.com/"]
+    assert all(r.ok for r in results)
+    assert results[0].html == "<html>https://b.com/</html>"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_many_reports_failures_without_cancelling_batch():
+    """Test a failing URL is reported and the other URLs still complete."""
+    scraper = ScraperService()
+
+    async def fake_scrape(url, *args, **kwargs):
+        if "bad" in url:
+            raise RuntimeError("boom")
+        return "<html></html>"
+
+    urls = ["https://good.com/1", "https://bad.com/", "https://good.com/2"]
+    with patch.object(scraper, '_scrape_html', side_effect=fake_scrape):
+        results = {r.url: r async for r in scraper.scrape_many(urls)}
+
+    assert len(results) == 3
+    assert results["https://bad.com/"].ok is False
+    assert isinstance(results["https://bad.com/"].error, RuntimeError)
+    assert results["https://good.com/1"].ok and results["https://good.com/2"].ok
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_many_respects_global_and_per_domain_limits():
+    """Test concurrency never exceeds the global or per-domain limits."""
+    import asyncio
+    from urllib.parse import urlparse
+    scraper = ScraperService()
+    active = {"total": 0, "max_total": 0}
+    per_domain = {}
+    max_per_domain = {}
+
+    async def fake_scrape(url, *args, **kwargs):
+        domain = urlparse(url).netloc
+        active["total"] += 1
+        per_domain[domain] = per_domain.get(domain, 0) + 1
+        active["max_total"] = max(active["max_total"], active["total"])
+        max_per_domain[domain] = max(max_per_domain.get(domain, 0), per_domain[domain])
+        await asyncio.sleep(0.01)
+        active["total"] -= 1
+        per_domain[domain] -= 1
+        return "<html></html>"
+
+    urls = [f"https://site{i % 3}.com/page{i}" for i in range(12)]
+    with patch.object(scraper, '_scrape_html', side_effect=fake_scrape):
+        results = [r async for r in scraper.scrape_many(urls, concurrency=4, per_domain_limit=1)]
+
+    assert len(results) == 12
+    assert active["max_total"] <= 3  # Only 3 domains, one page each
+    assert all(count <= 1 for count in max_per_domain.values())
+
+    with patch.object(scraper, '_scrape_html', side_effect=fake_scrape):
+        active["max_total"] = 0
+        results = [r async for r in scraper.scrape_many(urls, concurrency=2, per_domain_limit=4)]
+
+    assert active["max_total"] <= 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_many_cancels_pending_when_consumer_stops():
+    """Test pending scrapes are cancelled if the caller stops iterating."""
+    import asyncio
+    scraper = ScraperService()
+    cancelled = []
+
+    async def fake_scrape(url, *args, **kwargs):
+        try:
+            await asyncio.sleep(0 if url.endswith("fast") else 10)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+        return "<html></html>"
+
+    urls = ["https://a.com/fast", "https://b.com/slow", "https://c.com/slow"]
+    with patch.object(scraper, '_scrape_html', side_effect=fake_scrape):
+        batch = scraper.scrape_many(urls, concurrency=3)
+        first = await batch.__anext__()
+        await batch.aclose()
+        await asyncio.sleep(0)
+
+    assert first.url == "https://a.com/fast"
+    assert sorted(cancelled) == ["https://b.com/slow", "https://c.com/slow"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_many_records_timing_for_every_url():
+    """Test batch results carry their timing and reach the timing histograms."""
+    scraper = ScraperService()
+
+    async def fake_scrape(url, *args, **kwargs):
+        if "bad" in url:
+            raise RuntimeError("boom")
+        return "<html></html>"
+
+    urls = ["https://good.com/", "https://bad.com/", "not-a-url"]
+    with patch.object(scraper, '_scrape_html', side_effect=fake_scrape):
+        results = {r.url: r async for r in scraper.scrape_many(urls)}
+
+    assert all(r.timing is not None and r.timing.url == r.url for r in results.values())
+    assert results["https://good.com/"].ok
+    assert results["https://bad.com/"].timing.total > 0
+    assert isinstance(results["not-a-url"].error, ValueError)
+    summary = scraper.timing_summary()
+    assert summary["good.com"]["total"]["count"] == 1
+    assert summary["bad.com"]["total"]["count"] == 1
+
+
+# ============================================================================
+# Test Navigation Wait Strategy
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_navigates_once_at_domcontentloaded(mock_playwright, mock_playwright_page):
+    """Test the page is loaded with a single goto committing at domcontentloaded."""
+    scraper = ScraperService()
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        await scraper.scrape("https://example.com")
+
+    navigations = [c for c in mock_playwright_page.goto.await_args_list if c.args[0] == "https://example.com"]
+    assert len(navigations) == 1
+    assert navigations[0].kwargs['wait_until'] == 'domcontentloaded'
+    states = [c.args[0] for c in mock_playwright_page.wait_for_load_state.await_args_list]
+    assert states == ['load', 'networkidle']
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_does_not_reload_when_networkidle_times_out(mock_playwright, mock_playwright_page):
+    """Test a page that never goes idle is captured as-is instead of being reloaded."""
+    scraper = ScraperService()
+
+    async def load_state(state, timeout=None):
+        if state == 'networkidle':
+            raise PlaywrightTimeoutError("networkidle timeout")
+
+    mock_playwright_page.wait_for_load_state.side_effect = load_state
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        html_content = await scraper.scrape("https://example.com")
+
+    assert html_content
+    assert mock_playwright_page.goto.await_args_list[0].kwargs['wait_until'] == 'domcontentloaded'
+    assert sum(1 for c in mock_playwright_page.goto.await_args_list if c.args[0] == "https://example.com") == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_load_milestones_respect_shared_deadline():
+    """Test milestone waits never exceed the remaining navigation budget."""
+    import time
+    scraper = ScraperService(timeout=30000)
+    page = AsyncMock()
+
+    await scraper._wait_for_load_milestones(page, time.monotonic() + 2.0)
+
+    load_timeout = page.wait_for_load_state.await_args_list[0].kwargs['timeout']
+    idle_timeout = page.wait_for_load_state.await_args_list[1].kwargs['timeout']
+    assert load_timeout <= 2000
+    assert idle_timeout <= 2000
+
+    page.reset_mock()
+    await scraper._wait_for_load_milestones(page, time.monotonic() - 1)
+    page.wait_for_load_state.assert_not_awaited()
@@ -0,0 +1,108 @@
+"""Unit tests for ScraperRuntime.
+
+Tests the background event loop thread and the shared ScraperService.
+"""
+
+import pytest
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from scraper_runtime import ScraperRuntime
+
+
+@pytest.mark.unit
+def test_runtime_starts_lazily():
+    """Test the loop thread is not started until first use."""
+    runtime = ScraperRuntime({'timeout': 10000, 'headless': True, 'max_retries': 1})
+
+    assert runtime.is_running is False
+    assert runtime.scraper is None
+
+
+@pytest.mark.unit
+def test_runtime_runs_coroutines_on_single_background_loop():
+    """Test all submitted coroutines run on the same background thread and loop."""
+    runtime = ScraperRuntime({'timeout': 10000, 'headless': True, 'max_retries': 1})
+
+    async def where_am_i():
+        return threading.current_thread().name, id(asyncio.get_running_loop())
+
+    try:
+        first = runtime.run(where_am_i())
+        second = runtime.run(where_am_i())
+
+        assert first == second
+        assert first[0] == "scraper-runtime"
+        assert threading.current_thread().name != "scraper-runtime"
+    finally:
+        runtime.close()
+
+    assert runtime.is_running is False
+
+
+@pytest.mark.unit
+def test_runtime_reuses_scraper_across_requests():
+    """Test consecutive scrapes share one ScraperService instance."""
+    runtime = ScraperRuntime({'timeout': 10000, 'headless': True, 'max_retries': 1})
+
+    with patch('scraper_runtime.ScraperService._scrape_html', new_callable=AsyncMock) as mock_scrape:
+        mock_scrape.return_value = "<html></html>"
+        try:
+            runtime.scrape("https://example.com/a")
+            scraper = runtime.scraper
+            runtime.scrape("https://example.com/b")
+
+            assert runtime.scraper is scraper
+            assert mock_scrape.await_count == 2
+        finally:
+            runtime.close()
+
+
+@pytest.mark.unit
+def test_runtime_propagates_scrape_errors():
+    """Test exceptions raised on the loop thread surface in the caller."""
+    runtime = ScraperRuntime({'timeout': 10000, 'headless': True, 'max_retries': 1})
+
+    with patch('scraper_runtime.ScraperService._scrape_html', new_callable=AsyncMock) as mock_scrape:
+        mock_scrape.side_effect = TimeoutError("too slow")
+        try:
+            with pytest.raises(TimeoutError, match="too slow"):
+                runtime.scrape("https://example.com")
+
+            # Runtime stays usable after a failed request
+            assert runtime.is_running is True
+        finally:
+            runtime.close()
+
+
+@pytest.mark.unit
+def test_runtime_close_is_idempotent():
+    """Test closing a runtime that never started does nothing."""
+    runtime = ScraperRuntime({})
+
+    runtime.close()
+    runtime.close()
+
+    assert runtime.is_running is False
+
+
+@pytest.mark.unit
+def test_runtime_scrape_many_bridges_results_to_caller_thread():
+    """Test the sync scrape_many facade yields every batch result."""
+    runtime = ScraperRuntime({'timeout': 10000, 'headless': True, 'max_retries': 1})
+    urls = ["https://a.com/", "https://b.com/"]
+
+    with patch('scraper_runtime.ScraperService._scrape_html', new_callable=AsyncMock) as mock_scrape:
+        mock_scrape.return_value = "<html></html>"
+        try:
+            results = list(runtime.scrape_many(urls, concurrency=2))
+        finally:
+            runtime.close()
+
+    assert sorted(r.url for r in results) == urls
+    assert all(r.ok for r in results)
@@ -0,0 +1,98 @@
+"""Unit tests for the HTML snapshot store."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from snapshot_store import SnapshotStore
+from scraper import ScraperService
+
+
+HTML = "<html><body>" + "<h2>Some headline text for compression</h2>" * 200 + "</body></html>"
+
+
+@pytest.mark.unit
+def test_put_and_get_fresh_roundtrip(tmp_path):
+    """Test a stored snapshot is returned compressed on disk and intact on read."""
+    store = SnapshotStore(str(tmp_path), ttl_seconds=60)
+
+    snapshot = store.put("https://example.com", HTML)
+
+    assert snapshot.stored_size < snapshot.raw_size
+    assert store.get_fresh("https://example.com") == HTML
+    assert store.get_fresh("https://other.com") is None
+    store.close()
+
+
+@pytest.mark.unit
+def test_store_creates_nothing_until_first_write(tmp_path):
+    """Test lookups on an empty store do not create files."""
+    root = tmp_path / "snapshots"
+    store = SnapshotStore(str(root))
+
+    assert store.get_fresh("https://example.com") is None
+    assert not root.exists()
+
+
+@pytest.mark.unit
+def test_identical_pages_share_one_blob(tmp_path):
+    """Test content addressing stores identical HTML once."""
+    store = SnapshotStore(str(tmp_path))
+
+    first = store.put("https://a.com", HTML)
+    second = store.put("https://b.com", HTML)
+
+    assert first.digest == second.digest
+    assert len(list((tmp_path / "blobs").rglob("*.zst"))) == 1
+    assert len(store.history("https://a.com")) == 1
+    store.close()
+
+
+@pytest.mark.unit
+def test_get_fresh_respects_ttl(tmp_path):
+    """Test expired snapshots are not returned but remain in history."""
+    store = SnapshotStore(str(tmp_path), ttl_seconds=60)
+
+    with patch('snapshot_store.time.time', return_value=1000.0):
+        store.put("https://example.com", HTML)
+    with patch('snapshot_store.time.time', return_value=1000.0 + 61):
+        assert store.get_fresh("https://example.com") is None
+
+    assert len(store.history("https://example.com")) == 1
+    assert SnapshotStore(str(tmp_path), ttl_seconds=0).get_fresh("https://example.com") is None
+    store.close()
+
+
+@pytest.mark.unit
+def test_eviction_keeps_store_within_size_bound(tmp_path):
+    """Test the least recently fetched blobs are evicted first."""
+    store = SnapshotStore(str(tmp_path), max_bytes=1)
+
+    store.put("https://old.com", HTML + "old")
+    store.put("https://new.com", HTML + "new")
+
+    assert store.latest("https://old.com") is None
+    assert store.get_fresh("https://new.com") == HTML + "new"
+    assert len(list((tmp_path / "blobs").rglob("*.zst"))) == 1
+    store.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_reuses_fresh_snapshot(tmp_path, mock_playwright):
+    """Test a second scrape inside the TTL is served from disk without the browser."""
+    scraper = ScraperService(snapshot_dir=str(tmp_path), snapshot_ttl=60)
+
+    with patch('scraper.async_playwright') as mock_async_pw:
+        mock_async_pw.return_value.start = AsyncMock(return_value=mock_playwright)
+        with patch.object(scraper.scheduler, 'acquire', new_callable=AsyncMock):
+            first = await scraper.scrape("https://example.com")
+        with patch.object(scraper, '_scrape_live', new_callable=AsyncMock) as mock_live:
+            second = await scraper.scrape("https://example.com")
+
+    assert second == first
+    mock_live.assert_not_awaited()
+    await scraper.close()
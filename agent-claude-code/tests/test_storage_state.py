@@ -0,0 +1,114 @@
+"""Unit tests for per-domain storage state persistence."""
+
+import os
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from context_pool import PooledPage
+from scraper import ScraperService
+from storage_state import StorageStateStore, filter_state, local_storage_script
+
+CHROME = "Mozilla/5.0 (X11; Linux x86_64) Chrome/120.0.0.0"
+FIREFOX = "Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0"
+
+
+def make_state():
+    return {
+        "cookies": [
+            {"name": "consent", "value": "yes", "domain": ".example.com", "path": "/", "expires": -1},
+            {"name": "cf_clearance", "value": "abc", "domain": "www.example.com", "path": "/",
+             "expires": time.time() + 3600},
+            {"name": "old", "value": "x", "domain": "example.com", "path": "/", "expires": 1000},
+            {"name": "ads", "value": "1", "domain": ".tracker.net", "path": "/", "expires": -1},
+        ],
+        "origins": [
+            {"origin": "https://www.example.com", "localStorage": [{"name": "gdpr", "value": "1"}]},
+            {"origin": "https://tracker.net", "localStorage": [{"name": "id", "value": "2"}]},
+        ],
+    }
+
+
+@pytest.mark.unit
+def test_filter_state_keeps_domain_and_drops_expired():
+    """Test only unexpired cookies and origins of the scraped host are kept."""
+    state = filter_state(make_state(), "www.example.com")
+
+    assert [c["name"] for c in state["cookies"]] == ["consent", "cf_clearance"]
+    assert [o["origin"] for o in state["origins"]] == ["https://www.example.com"]
+
+
+@pytest.mark.unit
+def test_store_isolates_user_agents(tmp_path):
+    """Test state saved for one user agent is not returned for another."""
+    store = StorageStateStore(str(tmp_path))
+    store.save(CHROME, "https://www.example.com/news", make_state())
+
+    loaded = store.load(CHROME, "https://www.example.com/world")
+    assert len(loaded["cookies"]) == 2
+    assert store.load(FIREFOX, "https://www.example.com/world") is None
+    assert store.load(CHROME, "https://other.org/") is None
+
+
+@pytest.mark.unit
+def test_store_expires_entries(tmp_path):
+    """Test state older than the TTL is discarded."""
+    store = StorageStateStore(str(tmp_path), ttl_seconds=60)
+    store.save(CHROME, "https://www.example.com/", make_state())
+    path = next(tmp_path.glob('*/*.json'))
+    os.utime(path, (time.time() - 120, time.time() - 120))
+
+    assert store.load(CHROME, "https://www.example.com/") is None
+    assert not path.exists()
+
+
+@pytest.mark.unit
+def test_store_evicts_oldest_over_size_bound(tmp_path):
+    """Test the least recently saved domains are evicted to fit max_bytes."""
+    store = StorageStateStore(str(tmp_path), max_bytes=600)
+    for i in range(4):
+        store.save(CHROME, f"https://www.example{i}.com/", {"cookies": [
+            {"name": "c", "value": "v" * 200, "domain": f"www.example{i}.com", "path": "/", "expires": -1}
+        ]})
+        path = tmp_path / next(tmp_path.iterdir()).name / f"www.example{i}.com.json"
+        os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+
+    assert store.load(CHROME, "https://www.example0.com/") is None
+    assert store.load(CHROME, "https://www.example3.com/") is not None
+
+
+@pytest.mark.unit
+def test_local_storage_script_is_origin_guarded():
+    """Test the seed script only touches its own origin and keeps existing keys."""
+    script = local_storage_script(make_state()["origins"][0])
+
+    assert 'location.origin !== seed.origin' in script
+    assert '"https://www.example.com"' in script
+    assert 'localStorage.getItem(name) === null' in script
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scraper_restores_and_saves_state(tmp_path):
+    """Test a lease gets the saved cookies and seed script once, and new state is saved."""
+    scraper = ScraperService(storage_state_dir=str(tmp_path))
+    scraper.storage_state_store.save(CHROME, "https://www.example.com/", make_state())
+    context = MagicMock()
+    context.add_cookies = AsyncMock()
+    context.add_init_script = AsyncMock()
+    context.storage_state = AsyncMock(return_value=make_state())
+    lease = PooledPage(context=context, page=MagicMock(), user_agent=CHROME)
+
+    await scraper._restore_storage_state(lease, "https://www.example.com/")
+    await scraper._restore_storage_state(lease, "https://www.example.com/")
+    await scraper._save_storage_state(lease, "https://www.example.com/")
+
+    assert [c["name"] for c in context.add_cookies.await_args[0][0]] == ["consent", "cf_clearance"]
+    context.add_init_script.assert_awaited_once()
+    assert lease.seeded_origins == {"https://www.example.com"}
+    context.storage_state.assert_awaited_once()
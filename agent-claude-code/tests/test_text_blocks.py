@@ -0,0 +1,87 @@
+"""Unit tests for the streaming text block extractor."""
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from html_cleaner import HtmlCleaner
+from text_blocks import iter_text_blocks
+
+PAGE = """<!DOCTYPE html><html><head><title>Site</title><script>var t = "<p>no</p>";</script></head>
+<body><nav><a href="/">Home</a> <a href="/world">World</a></nav>
+<main class="feed"><article class="news-item"><h2><a href="/news/1">Central bank keeps the rate</a></h2>
+<p>The regulator said <b>inflation</b> is slowing.<!-- ad --> <time datetime="2025-10-07T10:15">10:15</time></p>
+</article><li>Unclosed item<li>Second item</main></body></html>"""
+
+
+def chunked(html, size):
+    """Chunk iterator that records how many chunks were read."""
+    chunked.read = 0
+    for start in range(0, len(html), size):
+        chunked.read += 1
+        yield html[start:start + size]
+
+
+@pytest.mark.unit
+def test_blocks_carry_path_heading_level_and_link_density():
+    """Test block boundaries, tag paths, headings, links, times and skipped content."""
+    blocks = list(iter_text_blocks(PAGE))
+
+    assert [block.text for block in blocks] == [
+        "Site", "Home World", "Central bank keeps the rate",
+        "The regulator said inflation is slowing. 10:15", "Unclosed item", "Second item",
+    ]
+    nav, heading, lead = blocks[1], blocks[2], blocks[3]
+    assert nav.tag_path == "html > body > nav"
+    assert nav.link_density == 1.0
+    assert nav.links == [("Home", "/"), ("World", "/world")]
+    assert heading.tag_path == "html > body > main.feed > article.news-item > h2"
+    assert heading.heading_level == 2
+    assert heading.links == [("Central bank keeps the rate", "/news/1")]
+    assert lead.heading_level == 0 and lead.link_density == 0.0
+    assert lead.lines == ["The regulator said", "inflation", "is slowing.", "10:15"]
+    assert lead.times == ["2025-10-07T10:15"]
+    # Unclosed <li> nests like BeautifulSoup's html.parser tree
+    assert blocks[5].tag_path.endswith("main.feed > li > li")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("size", [1, 7, 64])
+def test_chunk_boundaries_do_not_change_blocks(size):
+    """Test text, entities and tags split across chunks give the same blocks."""
+    html = PAGE.replace("inflation", "inflation &amp; prices")
+
+    expected = [(block.tag_path, block.lines) for block in iter_text_blocks(html)]
+
+    assert [(block.tag_path, block.lines) for block in iter_text_blocks(chunked(html, size))] == expected
+
+
+@pytest.mark.unit
+def test_reading_stops_once_budget_is_filled():
+    """Test max_chars stops reading the source instead of parsing the whole page."""
+    html = "<html><body>" + "".join(f"<p>Paragraph number {i}</p>" for i in range(10000)) + "</body></html>"
+
+    blocks = list(iter_text_blocks(chunked(html, 1024), max_chars=500))
+
+    assert sum(block.chars for block in blocks) >= 500
+    assert len(blocks) < 40
+    assert chunked.read < 5
+
+
+@pytest.mark.unit
+def test_streaming_backend_stops_after_main_container(monkeypatch):
+    """Test the streaming cleaner returns the main text without reading the rest of the page."""
+    html = "<html><body><main><h1>Top story</h1><p>Lead</p></main>" + "<p>tail</p>" * 100000 + "</body></html>"
+    consumed = []
+
+    def counting_blocks(*args, **kwargs):
+        for block in iter_text_blocks(*args, **kwargs):
+            consumed.append(block)
+            yield block
+
+    monkeypatch.setattr('html_cleaner.iter_text_blocks', counting_blocks)
+
+    assert HtmlCleaner('streaming').clean(html) == "Top story\nLead"
+    assert len(consumed) == 3
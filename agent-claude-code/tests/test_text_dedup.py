@@ -0,0 +1,55 @@
+"""Unit tests for order-preserving text deduplication."""
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from html_cleaner import HtmlCleaner
+from text_dedup import dedup_texts
+
+HEADLINE = "Central bank keeps the key rate unchanged"
+TEASER = "Central bank keeps the key rate unchanged. The regulator said inflation is slowing."
+
+
+@pytest.mark.unit
+def test_exact_duplicates_ignore_case_and_punctuation():
+    """Test normalized-hash duplicates are dropped and the first occurrence is kept."""
+    kept, report = dedup_texts([HEADLINE, "Storm warning issued for the coast", "CENTRAL BANK keeps the key-rate unchanged!"])
+
+    assert kept == [HEADLINE, "Storm warning issued for the coast"]
+    assert report.to_dict() == {
+        "texts_before": 3, "texts_after": 2, "duplicate_chars": len("CENTRAL BANK keeps the key-rate unchanged!")
+    }
+
+
+@pytest.mark.unit
+def test_containment_drops_parts_and_supersets_replace():
+    """Test a headline inside its teaser block is removed whichever comes first."""
+    kept, report = dedup_texts([HEADLINE, "10:15", TEASER, "The regulator said inflation", "Inflation is slowing in the regions"])
+
+    assert kept == ["10:15", TEASER, "Inflation is slowing in the regions"]
+    assert report.duplicate_chars == len(HEADLINE) + len("The regulator said inflation")
+
+
+@pytest.mark.unit
+def test_short_texts_are_kept_and_words_must_match_whole():
+    """Test repeated times/tags stay, and containment only matches whole words."""
+    kept, _ = dedup_texts(["10:15", "Economy", "10:15", "Economy", "Rate decision due tomorrow", "Rate decision due tomorrowland"])
+
+    assert kept == ["10:15", "Economy", "10:15", "Economy", "Rate decision due tomorrow", "Rate decision due tomorrowland"]
+
+
+@pytest.mark.unit
+def test_cleaner_dedups_before_truncation():
+    """Test the cleaner removes repeated teasers so distinct stories fit the budget."""
+    repeated = "".join(f"<p>{TEASER}</p>" for _ in range(50))
+    html = f"<html><body><main>{repeated}<p>Storm warning issued for the whole coast</p></main></body></html>"
+    cleaner = HtmlCleaner('html.parser', max_chars=500, dedup=True)
+
+    result = cleaner.clean_with_reports(html)
+    assert result.text == f"{TEASER}\nStorm warning issued for the whole coast"
+    assert result.dedup.duplicate_chars == 49 * len(TEASER)
+    assert HtmlCleaner('html.parser', max_chars=500).clean_with_reports(html).dedup is None
+    assert "truncated" in HtmlCleaner('html.parser', max_chars=500).clean(html)
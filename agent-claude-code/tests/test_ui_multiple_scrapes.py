@@ -70,3 +70,85 @@ def test_scraper_config_preserved():
     assert window.scraper_config['timeout'] == 45000
     assert window.scraper_config['headless'] == False
     assert window.scraper_config['max_retries'] == 5
+
+
+@pytest.mark.unit
+def test_ui_scrapes_share_runtime():
+    """Test consecutive scrape requests go through the same warm runtime."""
+    from unittest.mock import patch
+
+    scraper = ScraperService(timeout=10000, max_retries=1)
+    api_key = "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"
+    llm = OpenRouterService(api_key=api_key)
+    db = DatabaseService(':memory:')
+    db.initialize()
+    exporter = CSVExporter()
+
+    window = MainWindow(scraper, llm, db, exporter)
+
+    with patch.object(window.scraper_runtime, 'scrape', return_value="<html></html>") as mock_scrape, \
+            patch.object(llm, 'extract_news', return_value=[]):
+        window.handle_scrape("https://example.com")
+        window.handle_scrape("https://example.com")
+
+    assert mock_scrape.call_count == 2
+    window.close()
+
+
+@pytest.mark.unit
+def test_ui_skips_llm_for_unchanged_page():
+    """Test a re-scrape with the same content ends before LLM extraction."""
+    from unittest.mock import patch
+    from llm_service import NewsItem
+
+    scraper = ScraperService(timeout=10000, max_retries=1)
+    api_key = "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"
+    llm = OpenRouterService(api_key=api_key)
+    db = DatabaseService(':memory:')
+    db.initialize()
+    exporter = CSVExporter()
+
+    window = MainWindow(scraper, llm, db, exporter)
+    first = "<html><body><h2>Headline one</h2><span>10:15</span></body></html>"
+    second = "<html><body><h2>Headline one</h2><span>10:20</span></body></html>"
+
+    with patch.object(window.scraper_runtime, 'scrape', side_effect=[first, second]), \
+            patch.object(llm, 'extract_news', return_value=[NewsItem(title="Headline one")]) as mock_extract:
+        window.handle_scrape("https://example.com")
+        status = window.handle_scrape("https://example.com")
+
+    assert mock_extract.call_count == 1
+    assert "Unchanged" in status
+    assert db.count_news("https://example.com") == 1
+    window.close()
+
+
+@pytest.mark.unit
+def test_ui_saves_feed_items_without_llm():
+    """Test headlines from a captured JSON feed are saved without LLM extraction."""
+    from unittest.mock import patch
+    from llm_service import NewsItem
+    from scraper import ScrapeResult
+
+    scraper = ScraperService(timeout=10000, max_retries=1, capture_feeds=True)
+    api_key = "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"
+    llm = OpenRouterService(api_key=api_key)
+    db = DatabaseService(':memory:')
+    db.initialize()
+    exporter = CSVExporter()
+
+    window = MainWindow(scraper, llm, db, exporter)
+    page = ScrapeResult(
+        url="https://example.com",
+        feed_items=[NewsItem(title="Headline one from the feed"), NewsItem(title="Headline two from the feed")],
+        feed_url="https://example.com/api/news"
+    )
+
+    with patch.object(window.scraper_runtime, 'scrape_page', return_value=page), \
+            patch.object(llm, 'extract_news') as mock_extract:
+        status = window.handle_scrape("https://example.com")
+
+    mock_extract.assert_not_called()
+    assert "structured feed" in status
+    assert db.count_news("https://example.com") == 2
+    window.close()
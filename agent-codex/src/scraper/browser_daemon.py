@@ -0,0 +1,122 @@
+import asyncio
+import atexit
+import logging
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class BrowserDaemon:
+    # One event loop thread owning Playwright and a single Chromium instance.
+    # Sync callers submit coroutines; the browser survives between scrapes and
+    # is relaunched only if it disconnects.
+    def __init__(self, headless: bool = True) -> None:
+        self.headless = headless
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._playwright = None
+        self._browser = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+        self._start_lock = threading.Lock()
+        self.launches = 0
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if not self.is_running:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="browser-daemon", daemon=True
+                )
+                self._thread.start()
+                self.logger.debug("Browser daemon loop started")
+            return self._loop
+
+    async def browser(self):
+        from playwright.async_api import async_playwright  # lazy import
+
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+        async with self._browser_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+            if self._browser is not None:
+                self.logger.warning("Browser disconnected; relaunching")
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.headless
+            )
+            self.launches += 1
+            self.logger.info(
+                "Browser launched (headless=%s, launches=%s)",
+                self.headless,
+                self.launches,
+            )
+            return self._browser
+
+    def run(
+        self,
+        fn: Callable[..., Awaitable[Any]],
+        *args: Any,
+        timeout_s: Optional[float] = None,
+    ) -> Any:
+        # Calls fn(browser, *args) on the daemon loop and blocks for the result
+        loop = self._ensure_loop()
+
+        async def call() -> Any:
+            return await fn(await self.browser(), *args)
+
+        future = asyncio.run_coroutine_threadsafe(call(), loop)
+        try:
+            return future.result(timeout=timeout_s)
+        except FutureTimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Browser task timed out after {timeout_s}s")
+
+    async def _shutdown(self) -> None:
+        try:
+            if self._browser is not None:
+                await self._browser.close()
+        finally:
+            self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    def close(self) -> None:
+        if not self.is_running:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(
+                timeout=15
+            )
+        except Exception as e:  # noqa: BLE001
+            self.logger.warning("Browser daemon shutdown error: %s", e)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._thread = None
+        self._loop = None
+        self._browser_lock = None
+        self.logger.debug("Browser daemon stopped")
+
+
+_daemons: Dict[bool, BrowserDaemon] = {}
+_daemons_lock = threading.Lock()
+
+
+def shared_daemon(headless: bool = True) -> BrowserDaemon:
+    with _daemons_lock:
+        if headless not in _daemons:
+            _daemons[headless] = BrowserDaemon(headless=headless)
+        return _daemons[headless]
+
+
+@atexit.register
+def _close_daemons() -> None:
+    for daemon in list(_daemons.values()):
+        daemon.close()
@@ -0,0 +1,167 @@
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.services.text_blocks import iter_text_blocks
+
+STATIC = "static"
+NEEDS_JS = "needs_js"
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/123.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+
+# <meta charset="..."> or <meta http-equiv="Content-Type" content="...; charset=...">
+_META_CHARSET = re.compile(
+    rb"<meta[^>]+charset\s*=\s*[\"']?\s*([A-Za-z0-9_.:-]+)", re.IGNORECASE
+)
+_HEADER_CHARSET = re.compile(r"charset\s*=", re.IGNORECASE)
+META_SNIFF_BYTES = 4096
+
+
+def decode_html(resp: requests.Response) -> str:
+    # requests uses ISO-8859-1 for text/html without a header charset, which garbles
+    # UTF-8 Cyrillic pages: use the <meta> charset, else UTF-8, else a guess
+    if _HEADER_CHARSET.search(resp.headers.get("Content-Type", "")):
+        return resp.text
+    content = resp.content
+    match = _META_CHARSET.search(content[:META_SNIFF_BYTES])
+    if match:
+        try:
+            return content.decode(match.group(1).decode("ascii"), errors="replace")
+        except LookupError:
+            pass
+    try:
+        return content.decode("utf-8")
+    except UnicodeDecodeError:
+        return content.decode(resp.apparent_encoding or "utf-8", errors="replace")
+
+
+def count_candidates(html: str) -> int:
+    # Same thresholds as the pipeline's candidate list: h1-h3 > 20 chars, links > 30.
+    # Streams the text blocks instead of building a tree; only per-heading lengths
+    # are kept.
+    heading_lengths: Dict[int, int] = {}
+    links = 0
+    for block in iter_text_blocks(html):
+        for node in block.path:
+            if node.tag in ("h1", "h2", "h3") and block.lines:
+                length = sum(len(line) + 1 for line in block.lines)
+                heading_lengths[node.serial] = (
+                    heading_lengths.get(node.serial, -1) + length
+                )
+        links += sum(1 for text, _ in block.links if len(text) > 30)
+    return sum(1 for length in heading_lengths.values() if length > 20) + links
+
+
+@dataclass
+class StaticPage:
+    url: str
+    status: int
+    html: str = ""
+    candidates: int = 0
+
+
+class StaticFetcher:
+    def __init__(
+        self,
+        timeout_s: float = 15.0,
+        min_candidates: int = 10,
+        decision_ttl_s: float = 6 * 3600,
+    ) -> None:
+        self.timeout_s = timeout_s
+        self.min_candidates = min_candidates
+        self.decision_ttl_s = decision_ttl_s
+        # Keep-alive pool shared by all scrapes; requests handles gzip/deflate
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(DEFAULT_HEADERS)
+        self._decisions: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def decision(self, url: str) -> Optional[str]:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            entry = self._decisions.get(host)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[1] > self.decision_ttl_s:
+                del self._decisions[host]
+                return None
+            return entry[0]
+
+    def remember(self, url: str, decision: str) -> None:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            self._decisions[host] = (decision, time.monotonic())
+        self.logger.debug("Domain %s marked %s", host, decision)
+
+    def fetch(self, url: str) -> StaticPage:
+        resp = self.session.get(url, timeout=self.timeout_s)
+        page = StaticPage(url=url, status=resp.status_code)
+        ctype = resp.headers.get("Content-Type", "").lower()
+        if resp.status_code == 200 and "html" in ctype:
+            page.html = decode_html(resp)
+            page.candidates = count_candidates(page.html)
+        return page
+
+    # Server-rendered HTML if it has enough headline candidates, else None (use browser)
+    def try_static(self, url: str) -> Optional[str]:
+        if self.decision(url) == NEEDS_JS:
+            return None
+        t0 = time.time()
+        try:
+            page = self.fetch(url)
+        except requests.RequestException as e:
+            # Transient network error says nothing about the site; don't remember it
+            self.logger.info("Static fetch failed for %s: %s", url, e)
+            return None
+        if page.candidates >= self.min_candidates:
+            self.remember(url, STATIC)
+            self.logger.info(
+                "Static fetch ok: %s candidates=%s duration=%.2fs",
+                url,
+                page.candidates,
+                time.time() - t0,
+            )
+            return page.html
+        if page.status in (200, 403):
+            self.remember(url, NEEDS_JS)
+        self.logger.info(
+            "Static fetch insufficient: %s status=%s candidates=%s -> browser",
+            url,
+            page.status,
+            page.candidates,
+        )
+        return None
+
+
+_shared_fetcher: Optional[StaticFetcher] = None
+_shared_fetcher_lock = threading.Lock()
+
+
+# One fetcher per process so per-domain "needs JS" decisions and the keep-alive
+# pool survive across scrapers
+def shared_static_fetcher() -> StaticFetcher:
+    global _shared_fetcher
+    with _shared_fetcher_lock:
+        if _shared_fetcher is None:
+            _shared_fetcher = StaticFetcher()
+        return _shared_fetcher
@@ -0,0 +1,73 @@
+import html as html_lib
+import logging
+from typing import Dict, List
+
+# Same thresholds as pipeline._candidate_list: h1-h3 > 20 chars, links > 30 chars
+EXTRACT_SCRIPT = """
+({ maxItems }) => {
+    const clean = (t) => (t || '').replace(/\\s+/g, ' ').trim();
+    const skip = 'script, style, noscript';
+    const seen = new Set();
+    const out = [];
+    const add = (el, minLength) => {
+        if (el.closest(skip)) return;
+        const title = clean(el.textContent);
+        if (title.length <= minLength || seen.has(title)) return;
+        seen.add(title);
+        const link = el.tagName === 'A'
+            ? el
+            : (el.querySelector('a[href]') || el.closest('a[href]'));
+        const block = el.closest(
+            'article, li, [class*="news"], [class*="item"], [class*="card"]'
+        ) || el.parentElement;
+        const timeEl = block ? block.querySelector('time') : null;
+        const teaserEl = block
+            ? Array.from(block.querySelectorAll('p')).find((p) => {
+                const t = clean(p.textContent);
+                return t.length > 40 && t !== title;
+            })
+            : null;
+        out.push({
+            title: title.slice(0, 500),
+            url: link && link.href ? link.href : '',
+            time: timeEl
+                ? (timeEl.getAttribute('datetime') || clean(timeEl.textContent))
+                : '',
+            teaser: teaserEl ? clean(teaserEl.textContent).slice(0, 500) : '',
+        });
+    };
+    for (const el of document.querySelectorAll('h1, h2, h3')) {
+        if (out.length >= maxItems) break;
+        add(el, 20);
+    }
+    for (const el of document.querySelectorAll('a')) {
+        if (out.length >= maxItems) break;
+        if (el.querySelector('h1, h2, h3')) continue;
+        add(el, 30);
+    }
+    return out;
+}
+"""
+
+
+async def extract_records(page, max_items: int = 120) -> List[Dict[str, str]]:
+    data = await page.evaluate(EXTRACT_SCRIPT, {"maxItems": max_items})
+    records = [r for r in (data or []) if isinstance(r, dict) and r.get("title")]
+    logging.getLogger(__name__).debug("In-page records=%s", len(records))
+    return records
+
+
+def render_records_html(records: List[Dict[str, str]]) -> str:
+    # Compact stand-in for page.content(), kept for snapshots and the HTML path
+    esc = html_lib.escape
+    parts = ["<html><body>"]
+    for r in records:
+        parts.append(f'<article data-url="{esc(r.get("url", ""))}">')
+        parts.append(f"<h2>{esc(r['title'])}</h2>")
+        if r.get("time"):
+            parts.append(f"<time>{esc(r['time'])}</time>")
+        if r.get("teaser"):
+            parts.append(f"<p>{esc(r['teaser'])}</p>")
+        parts.append("</article>")
+    parts.append("</body></html>")
+    return "\n".join(parts)
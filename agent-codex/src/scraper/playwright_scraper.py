@@ -1,9 +1,14 @@
-import asyncio
 import logging
 from dataclasses import dataclass
+from typing import Dict, List, Optional
 
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from src.scraper.browser_daemon import BrowserDaemon, shared_daemon
+from src.scraper.http_fetch import StaticFetcher, shared_static_fetcher
+from src.scraper.page_records import extract_records, render_records_html
+from src.scraper.request_blocking import RequestBlocker
+from src.scraper.snapshot_store import SnapshotStore
 
 DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -11,39 +16,147 @@ DEFAULT_USER_AGENT = (
     "Chrome/123.0.0.0 Safari/537.36"
 )
 
+HEADLINE_SELECTOR = "h1, h2, h3, article"
+
+# Scrolls down in steps while tracking added nodes; stops when the bottom is
+# reached and the DOM stayed quiet, enough headlines exist, or the budget ends
+SCROLL_SCRIPT = """
+async ({ step, pauseMs, quietMs, budgetMs, targetHeadlines, selector }) => {
+    const start = performance.now();
+    const sleep = (ms) => new Promise((r) => setTimeout(r, ms));
+    const headlines = () => document.querySelectorAll(selector).length;
+    const height = () => (document.body ? document.body.scrollHeight : 0);
+    let lastChange = start;
+    let addedNodes = 0;
+    const observer = new MutationObserver((records) => {
+        for (const r of records) addedNodes += r.addedNodes.length;
+        lastChange = performance.now();
+    });
+    observer.observe(document.body || document.documentElement, {
+        childList: true,
+        subtree: true,
+    });
+
+    let y = 0;
+    let steps = 0;
+    let reason = "budget";
+    try {
+        while (performance.now() - start < budgetMs) {
+            if (targetHeadlines > 0 && headlines() >= targetHeadlines) {
+                reason = "target";
+                break;
+            }
+            if (y < height()) {
+                y = Math.min(y + step, height());
+                window.scrollTo(0, y);
+                steps += 1;
+                await sleep(pauseMs);
+            } else if (performance.now() - lastChange >= quietMs) {
+                reason = "quiet";
+                break;
+            } else {
+                await sleep(Math.min(pauseMs, quietMs));
+            }
+        }
+    } finally {
+        observer.disconnect();
+    }
+    return {
+        steps,
+        finalHeight: height(),
+        headlines: headlines(),
+        addedNodes,
+        elapsedMs: Math.round(performance.now() - start),
+        reason,
+    };
+}
+"""
+
 
 @dataclass
 class ScrapeResult:
     url: str
     html: str
+    # Headline records collected in the page (None when only HTML is available)
+    records: Optional[List[Dict[str, str]]] = None
 
 
 class PlaywrightScraper:
-    def __init__(self, headless: bool = True, timeout_ms: int = 30000) -> None:
+    def __init__(
+        self,
+        headless: bool = True,
+        timeout_ms: int = 30000,
+        blocker: Optional[RequestBlocker] = None,
+        block_requests: bool = True,
+        static_fetcher: Optional[StaticFetcher] = None,
+        http_first: bool = True,
+        snapshots: Optional[SnapshotStore] = None,
+        daemon: Optional[BrowserDaemon] = None,
+        extract_in_page: bool = False,
+    ) -> None:
         self.headless = headless
         self.timeout_ms = timeout_ms
+        # Images/fonts/media/trackers are blocked unless block_requests=False
+        self.blocker = (blocker or RequestBlocker()) if block_requests else None
+        # Static HTML is tried before the browser unless http_first=False; by default
+        # the process-wide fetcher, so per-domain "needs JS" decisions survive
+        # across runs
+        self.static_fetcher = (
+            (static_fetcher or shared_static_fetcher()) if http_first else None
+        )
+        # Fresh snapshots are served from disk; every live fetch is stored
+        self.snapshots = snapshots
+        # Browser stays alive across scrape() calls; started on first use
+        self.daemon = daemon or shared_daemon(headless)
+        # Opt-in: collect headline records in the page instead of serializing the DOM
+        self.extract_in_page = extract_in_page
         self.logger = logging.getLogger(__name__)
 
+    def scrape(self, url: str) -> ScrapeResult:
+        if self.snapshots is not None:
+            html = self.snapshots.get_fresh(url)
+            if html is not None:
+                return ScrapeResult(url=url, html=html)
+        result = self._scrape_live(url)
+        # Records are a rendered summary, not the page: never store them as its
+        # HTML snapshot
+        if self.snapshots is not None and result.records is None:
+            try:
+                self.snapshots.put(url, result.html)
+            except Exception as e:
+                self.logger.warning("Snapshot store failed for %s: %s", url, e)
+        return result
+
+    def _scrape_live(self, url: str) -> ScrapeResult:
+        if self.static_fetcher is not None:
+            html = self.static_fetcher.try_static(url)
+            if html is not None:
+                return ScrapeResult(url=url, html=html)
+        return self._scrape_browser(url)
+
     @retry(
         wait=wait_exponential(multiplier=1, min=1, max=10), stop=stop_after_attempt(3)
     )
-    def scrape(self, url: str) -> ScrapeResult:
+    def _scrape_browser(self, url: str) -> ScrapeResult:
         self.logger.info("Scraping start: %s (headless=%s)", url, self.headless)
-        html = asyncio.run(self._scrape_async(url))
-        self.logger.info("Scraping done: %s, html_len=%s", url, len(html))
-        return ScrapeResult(url=url, html=html)
-
-    async def _scrape_async(self, url: str) -> str:
-        from playwright.async_api import async_playwright  # lazy import
-
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            context = await browser.new_context(
-                user_agent=DEFAULT_USER_AGENT,
-                locale="ru-RU",
-                viewport={"width": 1366, "height": 850},
-            )
+        result = self.daemon.run(
+            self._scrape_async, url, timeout_s=self.timeout_ms / 1000 * 3 + 30
+        )
+        self.logger.info(
+            "Scraping done: %s, html_len=%s records=%s",
+            url,
+            len(result.html),
+            len(result.records) if result.records is not None else None,
+        )
+        return result
 
+    async def _scrape_async(self, browser, url: str) -> ScrapeResult:
+        context = await browser.new_context(
+            user_agent=DEFAULT_USER_AGENT,
+            locale="ru-RU",
+            viewport={"width": 1366, "height": 850},
+        )
+        try:
             # Patch navigator.webdriver to reduce detection
             await context.add_init_script(
                 "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
@@ -58,6 +171,7 @@ class PlaywrightScraper:
                 "Upgrade-Insecure-Requests": "1",
             }
             await page.set_extra_http_headers(headers)
+            stats = await self.blocker.install(page) if self.blocker else None
 
             # Navigate and wait for network idle
             await page.goto(url, wait_until="domcontentloaded")
@@ -69,25 +183,54 @@ class PlaywrightScraper:
             except Exception:
                 pass
 
-            html = await page.content()
+            records = await extract_records(page) if self.extract_in_page else None
+            if records:
+                html = render_records_html(records)
+            else:
+                records = None
+                html = await page.content()
+            if stats is not None:
+                self.logger.info(
+                    "Blocked %s/%s requests (~%s KB saved) reasons=%s",
+                    stats.blocked,
+                    stats.blocked + stats.allowed,
+                    stats.est_bytes_saved // 1024,
+                    stats.by_reason,
+                )
+            return ScrapeResult(url=url, html=html, records=records)
+        finally:
+            # Only the context is per scrape; the browser is kept by the daemon
             await context.close()
-            await browser.close()
-            return html
 
     async def _progressive_scroll(
-        self, page, step: int = 1200, pause_ms: int = 250
-    ) -> None:
-        height = await page.evaluate("() => document.body.scrollHeight")
-        cur = 0
-        sc = 0
-        while cur < height:
-            await page.evaluate(f"window.scrollTo(0, {cur});")
-            await page.wait_for_timeout(pause_ms)
-            cur += step
-            sc += 1
-            new_height = await page.evaluate("() => document.body.scrollHeight")
-            if new_height > height:
-                height = new_height
+        self,
+        page,
+        step: int = 1200,
+        pause_ms: int = 100,
+        quiet_ms: int = 400,
+        budget_ms: int = 4000,
+        target_headlines: int = 60,
+    ) -> dict:
+        # Whole scroll loop runs in the page: one round trip instead of three per step
+        stats = await page.evaluate(
+            SCROLL_SCRIPT,
+            {
+                "step": step,
+                "pauseMs": pause_ms,
+                "quietMs": quiet_ms,
+                "budgetMs": budget_ms,
+                "targetHeadlines": target_headlines,
+                "selector": HEADLINE_SELECTOR,
+            },
+        )
         logging.getLogger(__name__).debug(
-            "Scrolled %s steps, final_height=%s", sc, height
+            "Scrolled %s steps in %sms, final_height=%s headlines=%s "
+            "added_nodes=%s stop=%s",
+            stats.get("steps"),
+            stats.get("elapsedMs"),
+            stats.get("finalHeight"),
+            stats.get("headlines"),
+            stats.get("addedNodes"),
+            stats.get("reason"),
         )
+        return stats
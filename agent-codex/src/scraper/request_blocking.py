@@ -0,0 +1,104 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+DEFAULT_BLOCKED_TYPES = frozenset({"image", "media", "font"})
+
+# Ad / analytics hosts seen on news homepages; subdomains match as well
+AD_TRACKER_DOMAINS = frozenset(
+    {
+        "doubleclick.net",
+        "googlesyndication.com",
+        "googleadservices.com",
+        "googletagmanager.com",
+        "googletagservices.com",
+        "google-analytics.com",
+        "adnxs.com",
+        "amazon-adsystem.com",
+        "criteo.com",
+        "criteo.net",
+        "taboola.com",
+        "outbrain.com",
+        "pubmatic.com",
+        "rubiconproject.com",
+        "smartadserver.com",
+        "adfox.ru",
+        "adriver.ru",
+        "an.yandex.ru",
+        "yandexadexchange.net",
+        "mc.yandex.ru",
+        "top-fwz1.mail.ru",
+        "tns-counter.ru",
+        "mediametrics.ru",
+        "counter.yadro.ru",
+        "scorecardresearch.com",
+        "chartbeat.com",
+        "hotjar.com",
+        "connect.facebook.net",
+    }
+)
+
+# Typical transfer sizes, used to estimate what blocking saved
+ESTIMATED_BYTES = {
+    "image": 60_000,
+    "media": 500_000,
+    "font": 40_000,
+    "script": 50_000,
+    "stylesheet": 20_000,
+}
+DEFAULT_ESTIMATED_BYTES = 10_000
+
+
+def _matches(host: str, domains: Iterable[str]) -> bool:
+    return any(host == d or host.endswith("." + d) for d in domains)
+
+
+@dataclass
+class BlockStats:
+    allowed: int = 0
+    blocked: int = 0
+    est_bytes_saved: int = 0
+    by_reason: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class RequestBlocker:
+    blocked_types: Iterable[str] = DEFAULT_BLOCKED_TYPES
+    allow_domains: Iterable[str] = ()
+    deny_domains: Iterable[str] = ()
+    block_trackers: bool = True
+
+    def reason(self, url: str, resource_type: str) -> Optional[str]:
+        if resource_type == "document":
+            return None
+        host = (urlparse(url).hostname or "").lower()
+        if _matches(host, self.allow_domains):
+            return None
+        if _matches(host, self.deny_domains):
+            return "deny-list"
+        if self.block_trackers and _matches(host, AD_TRACKER_DOMAINS):
+            return "tracker"
+        if resource_type in self.blocked_types:
+            return resource_type
+        return None
+
+    async def install(self, page) -> BlockStats:
+        stats = BlockStats()
+
+        async def handler(route, request) -> None:
+            why = self.reason(request.url, request.resource_type)
+            if why is None:
+                stats.allowed += 1
+                await route.continue_()
+                return
+            stats.blocked += 1
+            stats.by_reason[why] = stats.by_reason.get(why, 0) + 1
+            stats.est_bytes_saved += ESTIMATED_BYTES.get(
+                request.resource_type, DEFAULT_ESTIMATED_BYTES
+            )
+            await route.abort("blockedbyclient")
+
+        await page.route("**/*", handler)
+        logging.getLogger(__name__).debug("Request blocking installed")
+        return stats
@@ -0,0 +1,181 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import zstandard
+
+DEFAULT_SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", os.path.join("data", "snapshots"))
+
+
+@dataclass
+class Snapshot:
+    url: str
+    fetched_at: float
+    digest: str
+    raw_size: int
+    stored_size: int
+
+
+class SnapshotStore:
+    # Content-addressed zstd blobs + SQLite index (url, fetched_at) -> digest.
+    # Nothing touches the disk until the first put().
+    def __init__(
+        self,
+        root_dir: str = DEFAULT_SNAPSHOT_DIR,
+        ttl_s: float = 120,
+        max_bytes: int = 200 * 1024 * 1024,
+        level: int = 3,
+    ) -> None:
+        self.root = Path(root_dir)
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+        self.level = level
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def _blob(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / f"{digest}.html.zst"
+
+    def _connect(self, create: bool) -> Optional[sqlite3.Connection]:
+        index = self.root / "index.db"
+        if self._conn is None:
+            if not create and not index.exists():
+                return None
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(index), check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    url TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    digest TEXT NOT NULL,
+                    raw_size INTEGER NOT NULL,
+                    stored_size INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_snap_url_time
+                    ON snapshots(url, fetched_at);
+                CREATE INDEX IF NOT EXISTS idx_snap_digest ON snapshots(digest);
+                """
+            )
+        return self._conn
+
+    def put(self, url: str, html: str) -> Snapshot:
+        raw = html.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._blob(digest)
+        with self._lock:
+            conn = self._connect(create=True)
+            if path.exists():
+                stored = path.stat().st_size
+            else:
+                data = zstandard.ZstdCompressor(level=self.level).compress(raw)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # Write-then-rename: readers never see a partial blob
+                fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(data)
+                os.replace(tmp, path)
+                stored = len(data)
+            snap = Snapshot(url, time.time(), digest, len(raw), stored)
+            conn.execute(
+                "INSERT INTO snapshots (url, fetched_at, digest, raw_size, stored_size)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    snap.url,
+                    snap.fetched_at,
+                    snap.digest,
+                    snap.raw_size,
+                    snap.stored_size,
+                ),
+            )
+            self._evict(conn)
+            conn.commit()
+        self.logger.debug(
+            "Snapshot stored: %s %s->%s bytes (%s)", url, len(raw), stored, digest[:12]
+        )
+        return snap
+
+    def latest(self, url: str, max_age_s: Optional[float] = None) -> Optional[Snapshot]:
+        with self._lock:
+            conn = self._connect(create=False)
+            if conn is None:
+                return None
+            since = time.time() - max_age_s if max_age_s is not None else 0
+            row = conn.execute(
+                "SELECT * FROM snapshots WHERE url = ? AND fetched_at >= ?"
+                " ORDER BY fetched_at DESC LIMIT 1",
+                (url, since),
+            ).fetchone()
+        if row is None:
+            return None
+        return Snapshot(
+            row["url"],
+            row["fetched_at"],
+            row["digest"],
+            row["raw_size"],
+            row["stored_size"],
+        )
+
+    def load(self, digest: str) -> Optional[str]:
+        try:
+            data = self._blob(digest).read_bytes()
+        except FileNotFoundError:
+            return None
+        return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+
+    def get_fresh(self, url: str) -> Optional[str]:
+        if self.ttl_s <= 0:
+            return None
+        snap = self.latest(url, self.ttl_s)
+        if snap is None:
+            return None
+        html = self.load(snap.digest)
+        if html is not None:
+            self.logger.info(
+                "Snapshot hit: %s age=%.0fs", url, time.time() - snap.fetched_at
+            )
+        return html
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        rows = conn.execute(
+            "SELECT digest, MAX(stored_size) AS size, MAX(fetched_at) AS last"
+            " FROM snapshots GROUP BY digest ORDER BY last ASC"
+        ).fetchall()
+        total = sum(r["size"] for r in rows)
+        # Oldest first; the newest blob always stays
+        for r in rows[:-1]:
+            if total <= self.max_bytes:
+                break
+            self._blob(r["digest"]).unlink(missing_ok=True)
+            conn.execute("DELETE FROM snapshots WHERE digest = ?", (r["digest"],))
+            total -= r["size"]
+            self.logger.debug("Snapshot evicted: %s", r["digest"][:12])
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_default_store: Optional[SnapshotStore] = None
+
+
+def default_snapshot_store() -> SnapshotStore:
+    global _default_store
+    if _default_store is None:
+        _default_store = SnapshotStore(
+            ttl_s=float(os.getenv("SNAPSHOT_TTL_S", "120")),
+            max_bytes=int(os.getenv("SNAPSHOT_MAX_MB", "200")) * 1024 * 1024,
+        )
+    return _default_store
@@ -0,0 +1,117 @@
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Set, Tuple
+
+# Texts shorter than this (normalized) are always kept: repeated times or tags
+# belong to different stories
+MIN_DEDUP_CHARS = 20
+# Word n-gram used to find containment candidates without comparing every pair
+GRAM_WORDS = 3
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_text(text: str) -> str:
+    # Case, punctuation and whitespace differences do not make a new story
+    return _NON_WORD.sub(" ", text.casefold()).strip()
+
+
+def _digest(norm: str) -> bytes:
+    return hashlib.blake2b(norm.encode("utf-8"), digest_size=8).digest()
+
+
+def _grams(words: List[str]) -> List[Tuple[str, ...]]:
+    return [
+        tuple(words[i : i + GRAM_WORDS]) for i in range(len(words) - GRAM_WORDS + 1)
+    ]
+
+
+@dataclass
+class DedupResult:
+    texts: List[str]
+    removed: int = 0  # Texts dropped as duplicates
+    duplicate_chars: int = 0  # Characters of the dropped texts
+
+
+@dataclass
+class _Kept:
+    text: str
+    padded: str  # " normalized " for whole-word containment checks
+    alive: bool = True
+
+
+@dataclass
+class _Index:
+    kept: List[_Kept] = field(default_factory=list)
+    digests: Set[bytes] = field(default_factory=set)
+    # Any word n-gram of a kept text -> kept ids (finds kept texts containing a new one)
+    any_gram: Dict[Tuple[str, ...], Set[int]] = field(default_factory=dict)
+    # First word n-gram of a kept text -> kept ids (finds kept texts a new one contains)
+    first_gram: Dict[Tuple[str, ...], Set[int]] = field(default_factory=dict)
+    # Kept texts with fewer than GRAM_WORDS words are compared one by one
+    few_words: List[int] = field(default_factory=list)
+
+    def containing(self, padded: str, grams: List[Tuple[str, ...]]) -> bool:
+        ids = self.any_gram.get(grams[0], ()) if grams else range(len(self.kept))
+        return any(self.kept[i].alive and padded in self.kept[i].padded for i in ids)
+
+    def contained_in(self, padded: str, grams: List[Tuple[str, ...]]) -> List[int]:
+        ids = set(self.few_words)
+        for gram in set(grams):
+            ids.update(self.first_gram.get(gram, ()))
+        return [
+            i
+            for i in sorted(ids)
+            if self.kept[i].alive and self.kept[i].padded in padded
+        ]
+
+    def add(
+        self, text: str, padded: str, digest: bytes, grams: List[Tuple[str, ...]]
+    ) -> int:
+        kept_id = len(self.kept)
+        self.kept.append(_Kept(text, padded))
+        self.digests.add(digest)
+        for gram in grams:
+            self.any_gram.setdefault(gram, set()).add(kept_id)
+        if grams:
+            self.first_gram.setdefault(grams[0], set()).add(kept_id)
+        else:
+            self.few_words.append(kept_id)
+        return kept_id
+
+
+def dedup_texts(texts: List[str], min_chars: int = MIN_DEDUP_CHARS) -> DedupResult:
+    # Order-preserving: exact duplicates (normalized-text hash) and texts contained
+    # in a kept text are dropped; a text that contains earlier kept texts (an article
+    # after its headline) replaces them.
+    index = _Index()
+    removed = duplicate_chars = 0
+    order: List[int] = []
+    short: Dict[int, str] = {}
+    for text in texts:
+        norm = normalize_text(text)
+        if len(norm) < min_chars:
+            short[len(order)] = text
+            order.append(-1)
+            continue
+        digest = _digest(norm)
+        grams = _grams(norm.split())
+        padded = f" {norm} "
+        if digest in index.digests or index.containing(padded, grams):
+            removed += 1
+            duplicate_chars += len(text)
+            continue
+        for i in index.contained_in(padded, grams):
+            index.kept[i].alive = False
+            removed += 1
+            duplicate_chars += len(index.kept[i].text)
+        order.append(index.add(text, padded, digest, grams))
+
+    out = []
+    for position, kept_id in enumerate(order):
+        if kept_id < 0:
+            out.append(short[position])
+        elif index.kept[kept_id].alive:
+            out.append(index.kept[kept_id].text)
+    return DedupResult(texts=out, removed=removed, duplicate_chars=duplicate_chars)
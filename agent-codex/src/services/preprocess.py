@@ -0,0 +1,191 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from src.services.dedup import dedup_texts, normalize_text
+from src.services.text_blocks import PathNode, iter_text_blocks
+
+HEADINGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+CANDIDATE_HEADINGS = {"h1", "h2", "h3"}
+# Same block lookup as page_records.EXTRACT_SCRIPT for link/time metadata
+BLOCK_TAGS = {"article", "li"}
+BLOCK_CLASS_PARTS = ("news", "item", "card")
+
+
+def _kind(node: PathNode) -> Optional[str]:
+    # Elements whose whole text goes to the reduced text
+    if node.tag == "article":
+        return "article"
+    if node.tag in HEADINGS:
+        return "heading"
+    if node.tag in ("div", "section") and "news" in node.classes:
+        return "block"
+    return None
+
+
+def _record_serial(parents: Tuple[PathNode, ...]) -> Optional[int]:
+    # Nearest news-item ancestor, else the parent (whose first <time> is the
+    # candidate's time)
+    for parent in reversed(parents):
+        if parent.tag in BLOCK_TAGS or any(
+            p in parent.classes for p in BLOCK_CLASS_PARTS
+        ):
+            return parent.serial
+    return parents[-1].serial if parents else None
+
+
+class _Element:
+    __slots__ = ("kind", "node", "parents", "parts", "size", "href")
+
+    def __init__(
+        self, kind: str, node: PathNode, parents: Tuple[PathNode, ...]
+    ) -> None:
+        self.kind = kind
+        self.node = node
+        self.parents = parents
+        self.parts: List[str] = []
+        self.size = 0
+        self.href: Optional[str] = None  # First link inside the element
+
+    def text(self) -> str:
+        return " ".join(self.parts)
+
+
+@dataclass
+class PreprocessedPage:
+    # Prompt text: article, heading, link and news-block texts (> 40 chars), capped
+    reduced_text: str
+    # Headline candidates: h1-h3 (> 20 chars) first, then links (> 30 chars),
+    # distinct titles
+    candidates: List[Dict[str, str]] = field(default_factory=list)
+    # Characters of repeated texts dropped from the reduced text (nested matches,
+    # repeated teasers)
+    duplicate_chars: int = 0
+
+    def candidate_list(self, with_times: bool = False) -> str:
+        lines = []
+        for c in self.candidates:
+            line = f"- {c['title']}"
+            if with_times and c.get("time"):
+                line += f" [{c['time']}]"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def preprocess_html(
+    html: str,
+    max_items: int = 40,
+    max_chars: int = 18000,
+    metadata: bool = False,
+) -> PreprocessedPage:
+    # One streaming pass over the text blocks (no document tree) for both the reduced
+    # text and the candidates. Element texts and each reduced-text group are capped at
+    # max_chars, and reading stops once the articles alone fill the prompt and the
+    # headline candidates are complete, so memory grows with the budget, not the page.
+    groups: Dict[str, List[Tuple[int, str]]] = {
+        "article": [],
+        "heading": [],
+        "link": [],
+        "block": [],
+    }
+    sizes = dict.fromkeys(groups, 0)
+    # Candidates as (order, title, url, record serial)
+    headlines: List[Tuple[int, str, str, Optional[int]]] = []
+    links: List[Tuple[int, str, str, Optional[int]]] = []
+    open_elements: Dict[int, _Element] = {}
+    first_times: Dict[int, str] = {}
+    link_order = 0
+
+    def add(group: str, order: int, text: str) -> None:
+        if len(text) > 40 and sizes[group] < max_chars:
+            groups[group].append((order, text))
+            sizes[group] += len(text) + 1
+
+    def finish(element: _Element) -> None:
+        text = element.text()
+        if not text:
+            return
+        add(element.kind, element.node.serial, text)
+        if (
+            element.node.tag in CANDIDATE_HEADINGS
+            and len(text) > 20
+            and len(headlines) < max_items
+        ):
+            parent_link = next(
+                (p for p in reversed(element.parents) if p.tag == "a" and p.href), None
+            )
+            url = (
+                element.href
+                if element.href is not None
+                else (parent_link.href if parent_link else "")
+            )
+            headlines.append(
+                (element.node.serial, text, url, _record_serial(element.parents))
+            )
+
+    for block in iter_text_blocks(html):
+        serials = {node.serial for node in block.path}
+        for serial in [s for s in open_elements if s not in serials]:
+            finish(open_elements.pop(serial))
+        for index, node in enumerate(block.path):
+            kind = _kind(node)
+            if kind and node.serial not in open_elements:
+                open_elements[node.serial] = _Element(kind, node, block.path[:index])
+
+        for element in open_elements.values():
+            for line in block.lines:
+                if element.size < max_chars:
+                    element.parts.append(line)
+                    element.size += len(line) + 1
+            if element.href is None:
+                element.href = next((href for _, href in block.links if href), None)
+        if metadata:
+            for value in block.times:
+                for node in block.path:
+                    first_times.setdefault(node.serial, value)
+        for text, href in block.links:
+            link_order += 1
+            if not text:
+                continue
+            add("link", link_order, text)
+            if len(text) > 30 and len(links) < max_items:
+                links.append((link_order, text, href, _record_serial(block.path)))
+
+        if sizes["article"] >= max_chars and len(headlines) >= max_items:
+            break
+    for element in sorted(open_elements.values(), key=lambda e: e.node.serial):
+        finish(element)
+
+    # A headline inside its article, heading and link is one story: dedup before the cap
+    deduped = dedup_texts(
+        [
+            text
+            for group in ("article", "heading", "link", "block")
+            for _, text in sorted(groups[group])
+        ]
+    )
+    reduced = "\n".join(deduped.texts)[:max_chars]
+    candidates = []
+    seen = set()
+    for _, title, url, record in sorted(headlines) + links:
+        key = normalize_text(title)
+        if key in seen:
+            continue
+        seen.add(key)
+        candidate = {"title": title}
+        if metadata:
+            candidate.update({"url": url, "time": first_times.get(record, "")})
+        candidates.append(candidate)
+    candidates = candidates[:max_items]
+
+    logging.getLogger(__name__).debug(
+        "Preprocessed page reduced_len=%s candidates=%s duplicate_chars=%s",
+        len(reduced),
+        len(candidates),
+        deduped.duplicate_chars,
+    )
+    return PreprocessedPage(
+        reduced_text=reduced,
+        candidates=candidates,
+        duplicate_chars=deduped.duplicate_chars,
+    )
@@ -0,0 +1,77 @@
+import pytest
+
+from src.scraper.browser_daemon import BrowserDaemon
+from src.scraper.playwright_scraper import PlaywrightScraper, ScrapeResult
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.browsers = []
+        self.stopped = False
+        self.chromium = self
+
+    async def launch(self, headless=True):
+        self.browsers.append(FakeBrowser())
+        return self.browsers[-1]
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def fake_pw(monkeypatch):
+    pw = FakePlaywright()
+    monkeypatch.setattr("playwright.async_api.async_playwright", lambda: pw)
+    return pw
+
+
+async def _title(browser, url):
+    return f"{id(browser)}:{url}"
+
+
+def test_browser_is_reused_across_calls(fake_pw):
+    d = BrowserDaemon()
+    first = d.run(_title, "a")
+    second = d.run(_title, "b")
+    assert first.split(":")[0] == second.split(":")[0]
+    assert d.launches == 1
+    d.close()
+    assert fake_pw.browsers[0].closed and fake_pw.stopped
+    assert not d.is_running
+
+
+def test_disconnected_browser_is_relaunched(fake_pw):
+    d = BrowserDaemon()
+    d.run(_title, "a")
+    fake_pw.browsers[0].connected = False
+    d.run(_title, "b")
+    assert d.launches == 2
+    d.close()
+
+
+def test_scraper_runs_on_daemon(monkeypatch):
+    calls = []
+
+    class FakeDaemon:
+        def run(self, fn, url, timeout_s=None):
+            calls.append(url)
+            return ScrapeResult(url, "<html></html>")
+
+    s = PlaywrightScraper(http_first=False, daemon=FakeDaemon())
+    assert s.scrape("https://a.ru/").html == "<html></html>"
+    assert calls == ["https://a.ru/"]
@@ -0,0 +1,53 @@
+from src.services.dedup import _Index, dedup_texts
+
+
+def test_exact_duplicates_are_dropped_in_order():
+    result = dedup_texts(
+        [
+            "Центробанк сохранил ставку без изменений",
+            "Шторм и ливни ожидаются в выходные дни",
+            "ЦЕНТРОБАНК сохранил ставку — без изменений!",
+        ]
+    )
+    assert result.texts == [
+        "Центробанк сохранил ставку без изменений",
+        "Шторм и ливни ожидаются в выходные дни",
+    ]
+    assert result.removed == 1
+    assert result.duplicate_chars == len("ЦЕНТРОБАНК сохранил ставку — без изменений!")
+
+
+def test_contained_texts_are_dropped_and_supersets_replace():
+    article = (
+        "Центробанк сохранил ставку без изменений. "
+        "Регулятор отметил замедление инфляции"
+    )
+    result = dedup_texts(
+        [
+            "Центробанк сохранил ставку без изменений",  # replaced by the article
+            article,
+            "Регулятор отметил замедление инфляции",  # inside the article
+            "Регулятор отметил замедление",  # also inside the article
+            "Регулятор отметил замедление инфляций в регионах",  # different words: kept
+        ]
+    )
+    assert result.texts == [article, "Регулятор отметил замедление инфляций в регионах"]
+    assert result.removed == 3
+
+
+def test_short_texts_are_always_kept():
+    result = dedup_texts(["10:15", "Экономика", "10:15", "Экономика"])
+    assert result.texts == ["10:15", "Экономика", "10:15", "Экономика"]
+    assert result.duplicate_chars == 0
+
+
+def test_index_add_registers_kept_text():
+    index = _Index()
+    assert (
+        index.add("a b c d", " a b c d ", b"1", [("a", "b", "c"), ("b", "c", "d")]) == 0
+    )
+    assert index.add("x y", " x y ", b"2", []) == 1
+    assert index.digests == {b"1", b"2"}
+    assert index.first_gram == {("a", "b", "c"): {0}}
+    assert index.few_words == [1]
+    assert index.containing(" b c d ", [("b", "c", "d")])
@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+
+import requests
+
+from src.scraper.http_fetch import (
+    NEEDS_JS,
+    STATIC,
+    StaticFetcher,
+    count_candidates,
+    decode_html,
+    shared_static_fetcher,
+)
+from src.scraper.playwright_scraper import PlaywrightScraper, ScrapeResult
+
+
+def _html(n):
+    links = "".join(
+        f'<a href="/n/{i}">Очень важная новость номер {i} про события дня</a>'
+        for i in range(n)
+    )
+    return f"<html><body>{links}</body></html>"
+
+
+def _fetcher(status=200, text="", ctype="text/html"):
+    f = StaticFetcher(min_candidates=10)
+    f.session.get = lambda url, timeout: SimpleNamespace(
+        status_code=status,
+        text=text,
+        content=text.encode("utf-8"),
+        headers={"Content-Type": ctype},
+    )
+    return f
+
+
+def _response(body: bytes, ctype: str = "text/html") -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.headers["Content-Type"] = ctype
+    resp._content = body
+    resp.encoding = requests.utils.get_encoding_from_headers(resp.headers)
+    return resp
+
+
+def test_count_candidates_thresholds():
+    html = "<h2>Short</h2><h2>A headline long enough to count</h2><a>Home</a>" + _html(
+        2
+    )
+    assert count_candidates(html) == 3
+
+
+def test_try_static_accepts_server_rendered_page():
+    f = _fetcher(text=_html(12))
+    assert f.try_static("https://news.ru/") is not None
+    assert f.decision("https://news.ru/other") == STATIC
+
+
+def test_decode_html_without_header_charset():
+    html = _html(12)
+    resp = _response(html.encode("utf-8"))
+    assert resp.encoding == "ISO-8859-1"  # What resp.text would decode with
+    assert decode_html(resp) == html
+    f = StaticFetcher()
+    f.session.get = lambda url, timeout: resp
+    assert f.fetch("https://news.ru/").html == html
+
+    meta = '<meta charset="windows-1251"><p>Новости</p>'
+    assert decode_html(_response(meta.encode("cp1251"))) == meta
+    assert decode_html(_response(b"caf\xe9", "text/html; charset=latin-1")) == "café"
+
+
+def test_try_static_rejects_js_shell_and_remembers():
+    f = _fetcher(text='<div id="app"></div>')
+    assert f.try_static("https://spa.ru/") is None
+    assert f.decision("https://spa.ru/") == NEEDS_JS
+    f.session.get = lambda *a, **k: (_ for _ in ()).throw(AssertionError("no fetch"))
+    assert f.try_static("https://spa.ru/") is None
+
+
+def test_try_static_network_error_not_remembered():
+    f = StaticFetcher()
+
+    def boom(url, timeout):
+        raise requests.ConnectionError("reset")
+
+    f.session.get = boom
+    assert f.try_static("https://down.ru/") is None
+    assert f.decision("https://down.ru/") is None
+
+
+def test_scraper_escalates_to_browser(monkeypatch):
+    s = PlaywrightScraper(static_fetcher=_fetcher(text="<div></div>"))
+    monkeypatch.setattr(
+        PlaywrightScraper,
+        "_scrape_browser",
+        lambda self, url: ScrapeResult(url, "browser"),
+    )
+    assert s.scrape("https://spa2.ru/").html == "browser"
+
+
+def test_scraper_shares_process_fetcher_and_opt_out():
+    assert PlaywrightScraper().static_fetcher is shared_static_fetcher()
+    assert PlaywrightScraper().static_fetcher is PlaywrightScraper().static_fetcher
+    assert PlaywrightScraper(http_first=False).static_fetcher is None
@@ -0,0 +1,58 @@
+import asyncio
+
+from src.scraper.page_records import (
+    EXTRACT_SCRIPT,
+    extract_records,
+    render_records_html,
+)
+from src.services.pipeline import _candidate_list, _record_candidate_list
+
+RECORDS = [
+    {
+        "title": "Центробанк сохранил ключевую ставку",
+        "url": "https://a.ru/1",
+        "time": "2025-10-07T10:15",
+        "teaser": "Регулятор отметил замедление инфляции осенью этого года.",
+    },
+    {
+        "title": "Shторм <и> ливни в выходные по всей стране",
+        "url": "",
+        "time": "",
+        "teaser": "",
+    },
+]
+
+
+class FakePage:
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = []
+
+    async def evaluate(self, script, arg=None):
+        self.calls.append((script, arg))
+        return self.payload
+
+    async def content(self):
+        raise AssertionError("full DOM must not be serialized")
+
+
+def test_extract_records_single_call_and_filters():
+    page = FakePage(RECORDS + [{"title": ""}, "x"])
+    records = asyncio.run(extract_records(page, max_items=10))
+    assert page.calls == [(EXTRACT_SCRIPT, {"maxItems": 10})]
+    assert records == RECORDS
+
+
+def test_record_candidates_match_html_path():
+    html = render_records_html(RECORDS)
+    assert "&lt;и&gt;" in html
+    from_records = _record_candidate_list(RECORDS)
+    assert (
+        from_records.splitlines()[0]
+        == "- Центробанк сохранил ключевую ставку [2025-10-07T10:15]"
+    )
+    # Snapshot/HTML path on the rendered document yields the same headlines
+    assert _candidate_list(html).splitlines()[:2] == [
+        "- Центробанк сохранил ключевую ставку",
+        "- Shторм <и> ливни в выходные по всей стране",
+    ]
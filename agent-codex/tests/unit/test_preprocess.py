@@ -0,0 +1,139 @@
+from src.services import pipeline as pl
+from src.services import preprocess as pp
+from src.services.preprocess import PreprocessedPage, preprocess_html
+
+HTML = """
+<html><head>
+<script>var headline = "Script headline that must never show up";</script>
+</head>
+<body>
+  <article class="story">
+    <h2>Центробанк сохранил ключевую ставку без изменений</h2>
+    <a href="/news/1">Регулятор отметил замедление инфляции этой осенью</a>
+    <time datetime="2025-10-07T10:15">10:15</time>
+  </article>
+  <section class="top-news"><h3>Short one</h3>
+    <noscript>Enable JavaScript to read the news</noscript></section>
+  <div class="news-list">
+    <a href="/news/2"><h2>Шторм и ливни ожидаются в выходные</h2></a>
+  </div>
+  <h5>A long fifth-level heading that passes the forty char limit</h5>
+</body></html>
+"""
+
+
+def test_preprocess_builds_reduced_text_and_candidates():
+    page = preprocess_html(HTML)
+    assert isinstance(page, PreprocessedPage)
+    assert "Script headline" not in page.reduced_text
+    assert "Enable JavaScript" not in page.reduced_text
+    # Same grouping as the old selector order: articles, headings, links, news blocks;
+    # the heading and link inside the article are not repeated
+    lines = page.reduced_text.splitlines()
+    assert lines[0].startswith(
+        "Центробанк сохранил ключевую ставку без изменений Регулятор"
+    )
+    assert lines[1:] == ["A long fifth-level heading that passes the forty char limit"]
+    assert page.duplicate_chars == len(
+        "Центробанк сохранил ключевую ставку без изменений"
+    ) + len("Регулятор отметил замедление инфляции этой осенью")
+    # Headline and its link give one candidate
+    assert page.candidate_list().splitlines() == [
+        "- Центробанк сохранил ключевую ставку без изменений",
+        "- Шторм и ливни ожидаются в выходные",
+        "- Регулятор отметил замедление инфляции этой осенью",
+    ]
+
+
+def test_preprocess_metadata_and_limits():
+    page = preprocess_html(HTML, max_items=2, metadata=True)
+    assert page.candidates == [
+        {
+            "title": "Центробанк сохранил ключевую ставку без изменений",
+            "url": "",
+            "time": "2025-10-07T10:15",
+        },
+        {"title": "Шторм и ливни ожидаются в выходные", "url": "/news/2", "time": ""},
+    ]
+    assert (
+        page.candidate_list(with_times=True)
+        .splitlines()[0]
+        .endswith("[2025-10-07T10:15]")
+    )
+    assert len(preprocess_html(HTML, max_chars=50).reduced_text) == 50
+
+
+def test_preprocess_stops_reading_once_budget_and_candidates_are_filled(monkeypatch):
+    story = (
+        "<article><h2>{i} Headline long enough to be a candidate</h2><p>"
+        + "Текст новости. " * 10
+        + "</p></article>"
+    )
+    html = (
+        "<html><body>"
+        + "".join(story.format(i=i) for i in range(2000))
+        + "</body></html>"
+    )
+    read = []
+    real = pp.iter_text_blocks
+
+    def counting_blocks(*args, **kwargs):
+        for block in real(*args, **kwargs):
+            read.append(block)
+            yield block
+
+    monkeypatch.setattr(pp, "iter_text_blocks", counting_blocks)
+    page = preprocess_html(html, max_items=5, max_chars=2000)
+    assert len(page.reduced_text) == 2000
+    assert [c["title"][:2] for c in page.candidates] == ["0 ", "1 ", "2 ", "3 ", "4 "]
+    assert len(read) < 40
+
+
+def test_pipeline_parses_page_once(monkeypatch):
+    parses = []
+    real = pp.iter_text_blocks
+
+    def counting_blocks(*args, **kwargs):
+        parses.append(1)
+        return real(*args, **kwargs)
+
+    class Result:
+        html = HTML
+
+    monkeypatch.setattr(pp, "iter_text_blocks", counting_blocks)
+    monkeypatch.setattr(pl.PlaywrightScraper, "scrape", lambda self, url: Result())
+    prompts = []
+    monkeypatch.setattr(
+        pl, "extract_news_from_html", lambda text: prompts.append(text) or []
+    )
+
+    class Db:
+        def upsert_news(self, url, items):
+            return 0
+
+    pl.run_pipeline("https://example.com", Db())
+    assert len(parses) == 1
+    assert prompts == [pl._candidate_list(HTML)]
+
+
+def test_pipeline_falls_back_to_reduced_text(monkeypatch):
+    html = (
+        "<html><body><article>"
+        + "Длинный текст новости без заголовков и ссылок. " * 2
+        + "</article></body></html>"
+    )
+
+    result = type("Result", (), {"html": html})()
+    monkeypatch.setattr(pl.PlaywrightScraper, "scrape", lambda self, url: result)
+    prompts = []
+    monkeypatch.setattr(
+        pl, "extract_news_from_html", lambda text: prompts.append(text) or []
+    )
+
+    class Db:
+        def upsert_news(self, url, items):
+            return 0
+
+    pl.run_pipeline("https://example.com", Db())
+    assert prompts == [pl._reduce_html(html)]
+    assert prompts[0]
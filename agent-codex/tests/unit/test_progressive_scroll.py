@@ -0,0 +1,41 @@
+import asyncio
+
+from src.scraper.playwright_scraper import (
+    HEADLINE_SELECTOR,
+    SCROLL_SCRIPT,
+    PlaywrightScraper,
+)
+
+
+class FakePage:
+    def __init__(self):
+        self.calls = []
+
+    async def evaluate(self, script, arg=None):
+        self.calls.append((script, arg))
+        return {
+            "steps": 7,
+            "finalHeight": 8400,
+            "headlines": 60,
+            "addedNodes": 35,
+            "elapsedMs": 910,
+            "reason": "target",
+        }
+
+    async def wait_for_timeout(self, ms):
+        raise AssertionError("scroll must not sleep from Python")
+
+
+def test_progressive_scroll_single_round_trip():
+    page = FakePage()
+    s = PlaywrightScraper(http_first=False)
+    stats = asyncio.run(
+        s._progressive_scroll(page, budget_ms=2000, target_headlines=40)
+    )
+    assert len(page.calls) == 1
+    script, arg = page.calls[0]
+    assert script == SCROLL_SCRIPT
+    assert arg["budgetMs"] == 2000
+    assert arg["targetHeadlines"] == 40
+    assert arg["selector"] == HEADLINE_SELECTOR
+    assert stats["reason"] == "target"
@@ -0,0 +1,61 @@
+import asyncio
+from types import SimpleNamespace
+
+from src.scraper.playwright_scraper import PlaywrightScraper
+from src.scraper.request_blocking import RequestBlocker
+
+
+def test_reason_blocks_heavy_types_and_trackers():
+    b = RequestBlocker()
+    assert b.reason("https://cdn.site.ru/a.jpg", "image") == "image"
+    assert b.reason("https://cdn.site.ru/f.woff2", "font") == "font"
+    assert b.reason("https://www.google-analytics.com/collect", "xhr") == "tracker"
+    assert b.reason("https://site.ru/app.js", "script") is None
+    assert b.reason("https://mc.yandex.ru/", "document") is None
+
+
+def test_reason_allow_and_deny_lists():
+    b = RequestBlocker(allow_domains=["img.site.ru"], deny_domains=["widgets.io"])
+    assert b.reason("https://img.site.ru/p.png", "image") is None
+    assert b.reason("https://a.widgets.io/w.js", "script") == "deny-list"
+
+
+def test_install_counts_blocked_and_allowed():
+    class FakeRoute:
+        def __init__(self):
+            self.action = None
+
+        async def continue_(self):
+            self.action = "continue"
+
+        async def abort(self, code):
+            self.action = "abort"
+
+    class FakePage:
+        async def route(self, pattern, handler):
+            self.handler = handler
+
+    async def scenario():
+        page = FakePage()
+        stats = await RequestBlocker().install(page)
+        r1, r2 = FakeRoute(), FakeRoute()
+        await page.handler(
+            r1, SimpleNamespace(url="https://x.ru/a.png", resource_type="image")
+        )
+        await page.handler(
+            r2, SimpleNamespace(url="https://x.ru/", resource_type="document")
+        )
+        return stats, r1, r2
+
+    stats, r1, r2 = asyncio.run(scenario())
+    assert (r1.action, r2.action) == ("abort", "continue")
+    assert stats.blocked == 1 and stats.allowed == 1
+    assert stats.by_reason == {"image": 1}
+
+
+def test_scraper_blocker_per_instance_and_opt_out():
+    a, b = PlaywrightScraper(), PlaywrightScraper()
+    assert isinstance(a.blocker, RequestBlocker) and a.blocker is not b.blocker
+    custom = RequestBlocker(allow_domains=["img.site.ru"])
+    assert PlaywrightScraper(blocker=custom).blocker is custom
+    assert PlaywrightScraper(block_requests=False).blocker is None
@@ -0,0 +1,65 @@
+from src.scraper.playwright_scraper import PlaywrightScraper, ScrapeResult
+from src.scraper.snapshot_store import SnapshotStore
+
+HTML = (
+    "<html><body>"
+    + "<h2>Заголовок новости для проверки сжатия</h2>" * 100
+    + "</body></html>"
+)
+
+
+def test_put_get_fresh_and_dedup(tmp_path):
+    store = SnapshotStore(str(tmp_path), ttl_s=60)
+    a = store.put("https://a.ru/", HTML)
+    b = store.put("https://b.ru/", HTML)
+    assert a.digest == b.digest
+    assert a.stored_size < a.raw_size
+    assert store.get_fresh("https://a.ru/") == HTML
+    assert len(list(tmp_path.rglob("*.zst"))) == 1
+
+
+def test_no_disk_until_put_and_ttl_zero(tmp_path):
+    root = tmp_path / "snap"
+    assert SnapshotStore(str(root)).get_fresh("https://a.ru/") is None
+    assert not root.exists()
+    store = SnapshotStore(str(root), ttl_s=0)
+    store.put("https://a.ru/", HTML)
+    assert store.get_fresh("https://a.ru/") is None
+
+
+def test_eviction_by_size(tmp_path):
+    store = SnapshotStore(str(tmp_path), max_bytes=1)
+    store.put("https://old.ru/", HTML + "1")
+    store.put("https://new.ru/", HTML + "2")
+    assert store.latest("https://old.ru/") is None
+    assert store.get_fresh("https://new.ru/") == HTML + "2"
+
+
+def test_scraper_uses_snapshot_before_browser(tmp_path, monkeypatch):
+    calls = []
+
+    def live(self, url):
+        calls.append(url)
+        return ScrapeResult(url, HTML)
+
+    monkeypatch.setattr(PlaywrightScraper, "_scrape_live", live)
+    s = PlaywrightScraper(snapshots=SnapshotStore(str(tmp_path), ttl_s=60))
+    assert s.scrape("https://a.ru/").html == HTML
+    assert s.scrape("https://a.ru/").html == HTML
+    assert calls == ["https://a.ru/"]
+
+
+def test_scraper_does_not_store_records_as_snapshot(tmp_path, monkeypatch):
+    records = [
+        {"title": "Заголовок новости для проверки", "url": "", "time": "", "teaser": ""}
+    ]
+    monkeypatch.setattr(
+        PlaywrightScraper,
+        "_scrape_live",
+        lambda self, url: ScrapeResult(url, "<ul></ul>", records),
+    )
+    store = SnapshotStore(str(tmp_path), ttl_s=60)
+    s = PlaywrightScraper(snapshots=store, extract_in_page=True)
+    assert s.scrape("https://a.ru/").records == records
+    assert store.get_fresh("https://a.ru/") is None
+    assert PlaywrightScraper().extract_in_page is False
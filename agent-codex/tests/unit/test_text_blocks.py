@@ -0,0 +1,50 @@
+from src.services.text_blocks import iter_text_blocks
+
+HTML = """<html><head><title>Site</title><script>var t = "<p>no</p>";</script></head>
+<body><nav><a href="/">Home</a> <a href="/world">World</a></nav>
+<main><article class="news-item">
+<h2><a href="/news/1">Central bank keeps the rate</a></h2>
+<p>Inflation &amp; prices<!-- ad --> <time datetime="2025-10-07T10:15">10:15</time></p>
+</article></main></body></html>"""
+
+
+def _chunks(html, size):
+    for i in range(0, len(html), size):
+        yield html[i : i + size]
+
+
+def test_blocks_have_path_heading_level_and_link_density():
+    blocks = list(iter_text_blocks(HTML))
+    assert [b.text for b in blocks] == [
+        "Site",
+        "Home World",
+        "Central bank keeps the rate",
+        "Inflation & prices 10:15",
+    ]
+    nav, heading, lead = blocks[1:]
+    assert nav.link_density == 1.0
+    assert nav.links == [("Home", "/"), ("World", "/world")]
+    assert heading.tag_path == "html > body > main > article.news-item > h2"
+    assert heading.heading_level == 2
+    assert lead.heading_level == 0
+    assert lead.times == ["2025-10-07T10:15"]
+
+
+def test_chunked_source_gives_same_blocks_and_stops_at_budget():
+    expected = [(b.tag_path, b.lines) for b in iter_text_blocks(HTML)]
+    for size in (1, 5, 50):
+        assert [
+            (b.tag_path, b.lines) for b in iter_text_blocks(_chunks(HTML, size))
+        ] == expected
+
+    page = "<body>" + "<p>Paragraph text</p>" * 5000 + "</body>"
+    read = []
+
+    def source():
+        for chunk in _chunks(page, 512):
+            read.append(chunk)
+            yield chunk
+
+    blocks = list(iter_text_blocks(source(), max_chars=100))
+    assert sum(b.chars for b in blocks) >= 100
+    assert len(read) < 3
@@ -1,21 +1,137 @@
+import codecs
+import re
+import time
+from urllib.parse import urlparse
 
+import requests
+from requests.adapters import HTTPAdapter
 from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+
+from src.text_blocks import iter_text_blocks
+
+MIN_HEADLINE_CANDIDATES = 10
+DOMAIN_DECISION_TTL = 6 * 3600
+# Text budget per page; reading the response stops once it and the candidate check are satisfied
+MAX_TEXT_CHARS = 80000
+READ_CHUNK_SIZE = 64 * 1024
+# <meta charset="..."> or <meta http-equiv="Content-Type" content="...; charset=...">
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([A-Za-z0-9_.:-]+)', re.IGNORECASE)
+
+# Pooled keep-alive connections reused across scrapes (gzip/deflate handled by requests)
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+_session.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+})
+
+# domain -> (needs_js, decided_at)
+_domain_decisions = {}
+
+
+def _read_page(chunks):
+    """
+    Streams the page's text blocks and returns (text, headline candidates).
+    Only the text budget and per-heading lengths are kept in memory; reading
+    stops once the budget is full and enough candidates were seen.
+    """
+    parts, size = [], 0
+    heading_lengths = {}
+    links = 0
+    for block in iter_text_blocks(chunks, skipped_tags=('script', 'style')):
+        if size < MAX_TEXT_CHARS:
+            text = block.text
+            if text:
+                parts.append(text)
+                size += len(text) + 1
+        for node in block.path:
+            if node.tag in ('h1', 'h2', 'h3'):
+                heading_lengths[node.serial] = heading_lengths.get(node.serial, 0) + block.chars
+        links += sum(1 for text, _ in block.links if len(text) > 30)
+        candidates = links + sum(1 for length in heading_lengths.values() if length > 20)
+        if size >= MAX_TEXT_CHARS and candidates >= MIN_HEADLINE_CANDIDATES:
+            break
+    candidates = links + sum(1 for length in heading_lengths.values() if length > 20)
+    return ' '.join(parts)[:MAX_TEXT_CHARS], candidates
+
+
+def _decoded_chunks(response):
+    """
+    Decodes the streamed body. requests assumes ISO-8859-1 for text/html
+    without a charset in the Content-Type header, which garbles UTF-8 pages;
+    for those the <meta> charset of the first chunk is used, else UTF-8.
+    """
+    chunks = response.iter_content(READ_CHUNK_SIZE)
+    first = next(chunks, b'')
+    if 'charset' in response.headers.get('Content-Type', '').lower():
+        encoding = response.encoding
+    else:
+        match = META_CHARSET_RE.search(first[:4096])
+        encoding = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+    except LookupError:
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    yield decoder.decode(first)
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+    yield decoder.decode(b'', final=True)
+
+
+def _needs_js(domain: str):
+    decision = _domain_decisions.get(domain)
+    if decision is None or time.monotonic() - decision[1] > DOMAIN_DECISION_TTL:
+        return None
+    return decision[0]
+
+
+def _fetch_static(url: str):
+    """
+    Fetches the URL over plain HTTP and returns the page text if it already
+    contains enough headlines, otherwise None (the browser is needed).
+    The response is read as a stream and never parsed into a tree.
+    """
+    domain = urlparse(url).netloc.lower()
+    if _needs_js(domain):
+        return None
+    try:
+        response = _session.get(url, timeout=15, stream=True)
+    except requests.RequestException:
+        return None
+
+    try:
+        if response.status_code != 200 or 'html' not in response.headers.get('Content-Type', ''):
+            return None
+        text, candidates = _read_page(_decoded_chunks(response))
+    except requests.RequestException:
+        return None
+    finally:
+        # Drops the rest of the body when reading stopped early
+        response.close()
+
+    needs_js = candidates < MIN_HEADLINE_CANDIDATES
+    _domain_decisions[domain] = (needs_js, time.monotonic())
+    return None if needs_js else text
+
 
 def scrape_url(url: str) -> str:
     """
     Scrapes a given URL and returns the sanitized text content.
+    Server-rendered pages are read over plain HTTP; the browser is only
+    launched for pages that need JavaScript.
     """
+    text = _fetch_static(url)
+    if text is not None:
+        return text
+
     with sync_playwright() as p:
         browser = p.chromium.launch()
         page = browser.new_page()
         page.goto(url)
         page.wait_for_load_state('load')
-        html_content = page.content()
+        # Visible text straight from the page (skips scripts/styles), no DOM serialization
+        text = page.evaluate("() => document.body ? document.body.innerText : ''")
         browser.close()
 
-        soup = BeautifulSoup(html_content, 'lxml')
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        return soup.get_text(separator=' ', strip=True)
+        return ' '.join(text.split())[:MAX_TEXT_CHARS]
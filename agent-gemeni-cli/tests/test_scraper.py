@@ -7,3 +7,60 @@ def test_scrape_url():
     html_content = scrape_url(url)
     assert isinstance(html_content, str)
     assert len(html_content) > 0
+
+def test_scrape_url_uses_static_html_when_sufficient(monkeypatch):
+    """Tests that server-rendered pages are returned without launching a browser."""
+    from types import SimpleNamespace
+    from src import scraper
+
+    links = "".join(f'<a href="/{i}">A long enough headline for candidate number {i}</a>' for i in range(12))
+    html = f"<html><body>{links}<script>var x = 1;</script></body></html>"
+    response = SimpleNamespace(status_code=200, headers={'Content-Type': 'text/html'}, encoding='ISO-8859-1',
+                               iter_content=lambda chunk_size: iter([html.encode('utf-8')]), close=lambda: None)
+    monkeypatch.setattr(scraper._session, 'get', lambda url, timeout, stream: response)
+    monkeypatch.setattr(scraper, 'sync_playwright', None)
+
+    text = scrape_url("https://static.example.com/")
+    assert "candidate number 11" in text
+    assert "var x" not in text
+
+def test_static_fetch_stops_reading_once_budget_is_filled(monkeypatch):
+    """Tests that a long static page is read only until the text budget and candidate check are met."""
+    from types import SimpleNamespace
+    from src import scraper
+
+    read = []
+
+    def chunks(chunk_size):
+        for i in range(100000):
+            read.append(i)
+            yield f'<h2><a href="/{i}">A long enough headline for candidate number {i}</a></h2>'.encode('utf-8')
+
+    response = SimpleNamespace(status_code=200, headers={'Content-Type': 'text/html; charset=utf-8'}, encoding='utf-8',
+                               iter_content=chunks, close=lambda: None)
+    monkeypatch.setattr(scraper._session, 'get', lambda url, timeout, stream: response)
+    monkeypatch.setattr(scraper, 'MAX_TEXT_CHARS', 1000)
+
+    text = scraper._fetch_static("https://long.example.com/")
+    assert len(text) == 1000
+    assert len(read) < 100
+
+def test_static_fetch_decodes_utf8_without_header_charset(monkeypatch):
+    """Tests that a charset-less UTF-8 Cyrillic page is not decoded as ISO-8859-1 (requests' default)."""
+    from types import SimpleNamespace
+    from src import scraper
+
+    links = "".join(f'<a href="/{i}">Новости дня: важная новость номер {i} для проверки</a>' for i in range(12))
+    body = f"<html><body>{links}</body></html>".encode('utf-8')
+    # Split inside a multi-byte character to check the incremental decoding
+    parts = [body[:42], body[42:]]
+    response = SimpleNamespace(status_code=200, headers={'Content-Type': 'text/html'}, encoding='ISO-8859-1',
+                               iter_content=lambda chunk_size: iter(parts), close=lambda: None)
+    monkeypatch.setattr(scraper._session, 'get', lambda url, timeout, stream: response)
+
+    text = scraper._fetch_static("https://cyrillic.example.ru/")
+    assert "Новости дня: важная новость номер 11" in text
+
+    meta_page = '<meta charset="windows-1251"><p>Новости</p>'.encode('cp1251')
+    response.iter_content = lambda chunk_size: iter([meta_page])
+    assert ''.join(scraper._decoded_chunks(response)) == '<meta charset="windows-1251"><p>Новости</p>'
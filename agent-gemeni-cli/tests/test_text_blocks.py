@@ -0,0 +1,21 @@
+from src.text_blocks import iter_text_blocks
+
+HTML = """<html><body><nav><a href="/">Home</a> <a href="/world">World</a></nav>
+<main><h2><a href="/news/1">Central bank keeps the rate</a></h2><p>Inflation &amp; prices<script>x()</script> slow</p></main>
+</body></html>"""
+
+def test_iter_text_blocks():
+    """Tests block text, tag path, heading level and link density."""
+    nav, heading, lead = iter_text_blocks(HTML)
+    assert nav.text == "Home World"
+    assert nav.link_density == 1.0
+    assert heading.tag_path == "html > body > main > h2"
+    assert heading.heading_level == 2
+    assert heading.links == [("Central bank keeps the rate", "/news/1")]
+    assert lead.text == "Inflation & prices slow"
+    assert lead.heading_level == 0
+
+def test_iter_text_blocks_from_chunks():
+    """Tests that chunk boundaries do not split strings."""
+    chunks = (HTML[i:i + 3] for i in range(0, len(HTML), 3))
+    assert [b.lines for b in iter_text_blocks(chunks)] == [b.lines for b in iter_text_blocks(HTML)]